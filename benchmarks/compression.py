@@ -0,0 +1,175 @@
+"""
+Measures the effect of `stripe.enable_compression` on bandwidth and latency.
+
+A local server returns a list page with `limit=100` sized JSON body, encoded
+as requested through `Accept-Encoding`. Each HTTP client fetches it
+repeatedly with compression off and on, and the bytes on the wire and the
+per-request latency are reported. The server can optionally throttle its
+output to approximate a real network link.
+
+    python benchmarks/compression.py [--requests N] [--bandwidth-kbps K]
+"""
+import argparse
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import stripe
+from stripe import _http_client
+
+
+def make_list_page(n):
+    return {
+        "object": "list",
+        "url": "/v1/charges",
+        "has_more": True,
+        "data": [
+            {
+                "id": "ch_%024d" % i,
+                "object": "charge",
+                "amount": 1000 + i,
+                "currency": "usd",
+                "description": "Charge for order %d" % i,
+                "metadata": {"order_id": str(i), "source": "benchmark"},
+                "billing_details": {
+                    "address": {
+                        "city": "San Francisco",
+                        "country": "US",
+                        "line1": "510 Townsend St",
+                        "postal_code": "94103",
+                        "state": "CA",
+                    },
+                    "email": "customer%d@example.com" % i,
+                    "name": "Customer %d" % i,
+                },
+                "outcome": {
+                    "network_status": "approved_by_network",
+                    "risk_level": "normal",
+                    "seller_message": "Payment complete.",
+                    "type": "authorized",
+                },
+                "paid": True,
+                "status": "succeeded",
+            }
+            for i in range(n)
+        ],
+    }
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = json.dumps(make_list_page(100)).encode("utf-8")
+    gzipped = gzip.compress(body)
+    bandwidth = None  # bytes per second, or None for unthrottled
+    sent = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = self.gzipped
+            encoding = "gzip"
+        else:
+            body = self.body
+            encoding = None
+
+        with Handler.lock:
+            Handler.sent += len(body)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+
+        if self.bandwidth:
+            for start in range(0, len(body), 16 * 1024):
+                end = start + 16 * 1024
+                self.wfile.write(body[start:end])
+                time.sleep(len(body[start:end]) / self.bandwidth)
+        else:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def available_clients():
+    clients = [_http_client.Urllib2Client]
+    if _http_client.requests is not None:
+        clients.append(_http_client.RequestsClient)
+    if _http_client.pycurl is not None:
+        clients.append(_http_client.PycurlClient)
+    return clients
+
+
+def run(client_class, url, n, compress):
+    stripe.enable_compression = compress
+    requestor = stripe._api_requestor._APIRequestor()
+    headers = requestor.request_headers("get", {"api_key": "sk_test_123"})
+
+    client = client_class()
+    client.request("get", url, headers)  # warm the connection up
+
+    Handler.sent = 0
+    timings = []
+    for _ in range(n):
+        start = time.perf_counter()
+        body, code, _ = client.request("get", url, headers)
+        timings.append(time.perf_counter() - start)
+        assert code == 200
+        json.loads(body)
+    client.close()
+
+    timings.sort()
+    return {
+        "bytes_per_request": Handler.sent / n,
+        "p50_ms": timings[len(timings) // 2] * 1000,
+        "p99_ms": timings[int(len(timings) * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--bandwidth-kbps",
+        type=int,
+        default=None,
+        help="throttle the server to this many kilobytes per second",
+    )
+    args = parser.parse_args()
+
+    if args.bandwidth_kbps:
+        Handler.bandwidth = args.bandwidth_kbps * 1024
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = "http://127.0.0.1:%d/v1/charges?limit=100" % server.server_port
+
+    print(
+        "%-16s %-12s %12s %10s %10s"
+        % ("client", "compression", "bytes/req", "p50 ms", "p99 ms")
+    )
+    for client_class in available_clients():
+        for compress in (False, True):
+            result = run(client_class, url, args.requests, compress)
+            print(
+                "%-16s %-12s %12d %10.2f %10.2f"
+                % (
+                    client_class.name,
+                    "on" if compress else "off",
+                    result["bytes_per_request"],
+                    result["p50_ms"],
+                    result["p99_ms"],
+                )
+            )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Compares exporting a list to NDJSON by iterating through `StripeObject`s and
+serialising each with `_to_dict_recursive`, with
+`StripeClient.export_to_file`. An in-process HTTP client serves the pages,
+so the time measured is what the bindings spend. Peak memory is traced
+in a second run.
+
+    python benchmarks/file_export.py [--pages N] [--page-size N]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import stripe
+from json_parsing import make_charge
+
+
+class PagesClient(stripe.HTTPClient):
+    name = "pages"
+
+    def __init__(self, bodies):
+        super().__init__()
+        self._bodies = {}
+        for i, body in enumerate(bodies):
+            after = "" if i == 0 else "ch_%d" % (i * len(body["data"]) - 1)
+            self._bodies[after] = json.dumps(body).encode("utf-8")
+
+    def request(self, method, url, headers, post_data=None, **kwargs):
+        after = ""
+        if "starting_after=" in url:
+            after = url.split("starting_after=")[1].split("&")[0]
+        return self._bodies[after], 200, {}
+
+    def close(self):
+        pass
+
+
+def make_bodies(pages, page_size):
+    bodies = []
+    for p in range(pages):
+        data = []
+        for i in range(page_size):
+            item = make_charge(i)
+            item["id"] = "ch_%d" % (p * page_size + i)
+            data.append(item)
+        bodies.append(
+            {
+                "object": "list",
+                "url": "/v1/charges",
+                "has_more": p < pages - 1,
+                "data": data,
+            }
+        )
+    return bodies
+
+
+def with_objects(client, path, page_size):
+    charges = client.charges.list({"limit": page_size})
+    with open(path, "w", encoding="utf-8") as f:
+        for charge in charges.auto_paging_iter():
+            f.write(json.dumps(charge._to_dict_recursive()) + "\n")
+
+
+def with_export(client, path, page_size):
+    client.export_to_file(
+        client.charges.list, path, params={"limit": page_size}, prefetch=0
+    )
+
+
+def measure(fn, client, path, page_size):
+    started = time.perf_counter()
+    fn(client, path, page_size)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    fn(client, path, page_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    client = stripe.StripeClient(
+        "sk_test_123",
+        http_client=PagesClient(make_bodies(args.pages, args.page_size)),
+        max_network_retries=0,
+    )
+    print("%d charges" % (args.pages * args.page_size))
+    print(
+        "%-22s %10s %12s %10s" % ("method", "seconds", "objects/s", "peak MB")
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "charges.ndjson")
+        for name, fn in [
+            ("StripeObjects", with_objects),
+            ("export_to_file", with_export),
+        ]:
+            elapsed, peak = measure(fn, client, path, args.page_size)
+            print(
+                "%-22s %10.3f %12.0f %10.1f"
+                % (
+                    name,
+                    elapsed,
+                    args.pages * args.page_size / elapsed,
+                    peak / 1e6,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
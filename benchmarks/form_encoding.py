@@ -0,0 +1,122 @@
+"""
+Compares the single-pass form encoder with the previous way of encoding
+request parameters: `_api_encode`, then `urlencode`, then unescaping square
+brackets.
+
+Parameters shaped like a small customer update, a `PaymentIntent` with
+metadata, and a Checkout Session with many line items are each encoded
+repeatedly, and the time per encoding is reported.
+
+    python benchmarks/form_encoding.py [--iterations N]
+"""
+import argparse
+import datetime
+import timeit
+from urllib.parse import urlencode
+
+from stripe._encode import _api_encode, _api_encode_form
+
+
+def previous_encode(params):
+    encoded = urlencode(list(_api_encode(params)))
+    return encoded.replace("%5B", "[").replace("%5D", "]")
+
+
+def make_customer_update():
+    return {
+        "email": "jenny.rosen@example.com",
+        "name": "Jenny Rosen",
+        "metadata": {"order_id": "6735"},
+    }
+
+
+def make_payment_intent():
+    return {
+        "amount": 2000,
+        "currency": "usd",
+        "customer": "cus_NffrFeUfNV2Hib",
+        "description": "Order #6735 & gift wrap",
+        "payment_method_types": ["card", "link"],
+        "automatic_payment_methods": {"enabled": False},
+        "metadata": dict(("key_%d" % i, "value %d" % i) for i in range(20)),
+        "shipping": {
+            "name": "Jenny Rosen",
+            "address": {
+                "line1": "510 Townsend St",
+                "city": "San Francisco",
+                "state": "CA",
+                "postal_code": "94103",
+                "country": "US",
+            },
+        },
+        "expand": ["latest_charge", "customer"],
+    }
+
+
+def make_checkout_session(line_items):
+    return {
+        "mode": "payment",
+        "success_url": "https://example.com/success?session={CHECKOUT_ID}",
+        "cancel_url": "https://example.com/cancel",
+        "customer_email": "jenny.rosen@example.com",
+        "expires_at": datetime.datetime.now(datetime.timezone.utc)
+        + datetime.timedelta(hours=1),
+        "line_items": [
+            {
+                "price_data": {
+                    "currency": "usd",
+                    "unit_amount": 1000 + i,
+                    "product_data": {
+                        "name": "Item %d" % i,
+                        "description": "A fine item, size M/L",
+                        "metadata": {"sku": "SKU-%05d" % i},
+                    },
+                },
+                "quantity": 1 + i % 3,
+                "adjustable_quantity": {"enabled": True, "maximum": 10},
+            }
+            for i in range(line_items)
+        ],
+        "metadata": {"cart_id": "cart_8a7f", "source": "web"},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    cases = [
+        ("customer update", make_customer_update()),
+        ("payment intent", make_payment_intent()),
+        ("checkout, 100 items", make_checkout_session(100)),
+    ]
+
+    print(
+        "%-20s %8s %14s %14s %8s"
+        % ("params", "bytes", "previous us", "single-pass us", "speedup")
+    )
+    for name, params in cases:
+        encoded = _api_encode_form(params)
+        assert encoded == previous_encode(params)
+
+        previous = timeit.timeit(
+            lambda: previous_encode(params), number=args.iterations
+        )
+        single_pass = timeit.timeit(
+            lambda: _api_encode_form(params), number=args.iterations
+        )
+        print(
+            "%-20s %8d %14.1f %14.1f %7.1fx"
+            % (
+                name,
+                len(encoded),
+                previous / args.iterations * 1e6,
+                single_pass / args.iterations * 1e6,
+                previous / single_pass,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
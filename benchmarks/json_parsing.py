@@ -0,0 +1,140 @@
+"""
+Compares parsing response bodies with each JSON backend against the
+previous way of parsing them: decoding the bytes received into a string,
+then `json.loads` with `OrderedDict` as the `object_pairs_hook`.
+
+Bodies shaped like a single `Charge` and a list of 100 of them are each
+parsed repeatedly, and the throughput of each way is reported. Backends that
+aren't installed are skipped.
+
+    python benchmarks/json_parsing.py [--iterations N]
+"""
+import argparse
+import json
+import timeit
+from collections import OrderedDict
+
+import stripe
+from stripe import _json
+
+
+def previous_loads(body):
+    return json.loads(body.decode("utf-8"), object_pairs_hook=OrderedDict)
+
+
+def make_charge(i):
+    return {
+        "id": "ch_3MmlLrLkdIwHu7ix0snN0B1%02d" % (i % 100),
+        "object": "charge",
+        "amount": 1099 + i,
+        "amount_captured": 1099 + i,
+        "amount_refunded": 0,
+        "balance_transaction": "txn_3MmlLrLkdIwHu7ix0uke3Ezy",
+        "billing_details": {
+            "address": {
+                "city": "San Francisco",
+                "country": "US",
+                "line1": "510 Townsend St",
+                "line2": None,
+                "postal_code": "94103",
+                "state": "CA",
+            },
+            "email": "jenny.rosen@example.com",
+            "name": "Jenny Rosen",
+            "phone": None,
+        },
+        "captured": True,
+        "created": 1679090539 + i,
+        "currency": "usd",
+        "description": "Order #%d — gift wrap" % i,
+        "livemode": False,
+        "metadata": {"order_id": str(6735 + i), "channel": "web"},
+        "paid": True,
+        "payment_method_details": {
+            "card": {
+                "brand": "visa",
+                "checks": {
+                    "address_line1_check": "pass",
+                    "address_postal_code_check": "pass",
+                    "cvc_check": "pass",
+                },
+                "country": "US",
+                "exp_month": 3,
+                "exp_year": 2026,
+                "fingerprint": "mToisGZ01V71BCos",
+                "funding": "credit",
+                "last4": "4242",
+                "network": "visa",
+            },
+            "type": "card",
+        },
+        "refunded": False,
+        "status": "succeeded",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    cases = [
+        ("charge", make_charge(0)),
+        (
+            "list of 100 charges",
+            {
+                "object": "list",
+                "data": [make_charge(i) for i in range(100)],
+                "has_more": True,
+                "url": "/v1/charges",
+            },
+        ),
+    ]
+
+    backends = ["json"]
+    for name in ("orjson", "ujson"):
+        if getattr(_json, name) is not None:
+            backends.append(name)
+
+    print(
+        "%-20s %9s %-8s %10s %8s"
+        % ("body", "bytes", "backend", "MB/s", "speedup")
+    )
+    for case, data in cases:
+        body = json.dumps(data).encode("utf-8")
+        iterations = max(1, args.iterations // (len(body) // 2000 + 1))
+
+        previous = timeit.timeit(
+            lambda: previous_loads(body), number=iterations
+        )
+        print(
+            "%-20s %9d %-8s %10.1f %8s"
+            % (
+                case,
+                len(body),
+                "previous",
+                len(body) * iterations / previous / 1e6,
+                "",
+            )
+        )
+
+        for backend in backends:
+            stripe.json_backend = backend
+            assert _json.loads(body) == previous_loads(body)
+            seconds = timeit.timeit(
+                lambda: _json.loads(body), number=iterations
+            )
+            print(
+                "%-20s %9d %-8s %10.1f %7.1fx"
+                % (
+                    "",
+                    len(body),
+                    backend,
+                    len(body) * iterations / seconds / 1e6,
+                    previous / seconds,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
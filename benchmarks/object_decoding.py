@@ -0,0 +1,267 @@
+"""
+Measures how quickly responses are converted into `StripeObject`s, from the
+parsed JSON of a large `Invoice` (with 100 lines) and a `PaymentIntent` with
+its latest `Charge` expanded, to pages of 100 of each.
+
+    python benchmarks/object_decoding.py [--iterations N]
+"""
+import argparse
+import timeit
+
+import stripe
+from json_parsing import make_charge
+
+
+def make_price(i):
+    return {
+        "id": "price_1MoBy5LkdIwHu7ixZhnattbh%02d" % (i % 100),
+        "object": "price",
+        "active": True,
+        "billing_scheme": "per_unit",
+        "created": 1679431181,
+        "currency": "usd",
+        "custom_unit_amount": None,
+        "livemode": False,
+        "lookup_key": None,
+        "metadata": {},
+        "nickname": None,
+        "product": "prod_NZKdYqrwEYx6iK",
+        "recurring": {
+            "aggregate_usage": None,
+            "interval": "month",
+            "interval_count": 1,
+            "trial_period_days": None,
+            "usage_type": "licensed",
+        },
+        "tax_behavior": "unspecified",
+        "tiers_mode": None,
+        "transform_quantity": None,
+        "type": "recurring",
+        "unit_amount": 1000 + i,
+        "unit_amount_decimal": str(1000 + i),
+    }
+
+
+def make_line(i):
+    return {
+        "id": "il_1MtHbELkdIwHu7ixl4OzzPMv%02d" % (i % 100),
+        "object": "line_item",
+        "amount": 1000 + i,
+        "amount_excluding_tax": 1000 + i,
+        "currency": "usd",
+        "description": "1 × Gold Special (at $10.00 / month)",
+        "discount_amounts": [
+            {"amount": 100, "discount": "di_1MtHbELkdIwHu7ix3ZYjNfTN"}
+        ],
+        "discountable": True,
+        "discounts": [],
+        "livemode": False,
+        "metadata": {"seat": str(i)},
+        "period": {"end": 1683057960, "start": 1680379560},
+        "plan": None,
+        "price": make_price(i),
+        "proration": False,
+        "proration_details": {"credited_items": None},
+        "quantity": 1,
+        "subscription": "sub_1MtHbELkdIwHu7ixeSTMYhr8",
+        "subscription_item": "si_NeZmXmahbAxhzT",
+        "tax_amounts": [
+            {
+                "amount": 85,
+                "inclusive": False,
+                "tax_rate": "txr_1MtHbELkdIwHu7ixgdJnJXB5",
+                "taxability_reason": "standard_rated",
+                "taxable_amount": 1000 + i,
+            }
+        ],
+        "tax_rates": [],
+        "type": "subscription",
+        "unit_amount_excluding_tax": str(1000 + i),
+    }
+
+
+def make_invoice(i, lines=100):
+    address = {
+        "city": "San Francisco",
+        "country": "US",
+        "line1": "510 Townsend St",
+        "line2": None,
+        "postal_code": "94103",
+        "state": "CA",
+    }
+    return {
+        "id": "in_1MtHbELkdIwHu7ixl4OzzPMv%02d" % (i % 100),
+        "object": "invoice",
+        "account_country": "US",
+        "account_name": "Stripe Docs",
+        "amount_due": 100000,
+        "amount_paid": 0,
+        "amount_remaining": 100000,
+        "attempt_count": 0,
+        "attempted": False,
+        "auto_advance": False,
+        "automatic_tax": {"enabled": True, "liability": None, "status": None},
+        "billing_reason": "subscription_cycle",
+        "collection_method": "charge_automatically",
+        "created": 1680644467,
+        "currency": "usd",
+        "custom_fields": None,
+        "customer": "cus_NeZwdNtLEOXuvB",
+        "customer_address": address,
+        "customer_email": "jennyrosen@example.com",
+        "customer_name": "Jenny Rosen",
+        "customer_shipping": {"address": address, "name": "Jenny Rosen"},
+        "customer_tax_exempt": "none",
+        "customer_tax_ids": [{"type": "eu_vat", "value": "DE123456789"}],
+        "discounts": [],
+        "hosted_invoice_url": None,
+        "issuer": {"type": "self"},
+        "lines": {
+            "object": "list",
+            "data": [make_line(j) for j in range(lines)],
+            "has_more": False,
+            "total_count": lines,
+            "url": "/v1/invoices/in_1MtHbELkdIwHu7ixl4OzzPMv/lines",
+        },
+        "livemode": False,
+        "metadata": {"order_id": "6735"},
+        "payment_settings": {
+            "default_mandate": None,
+            "payment_method_options": {
+                "card": {"request_three_d_secure": "automatic"},
+                "customer_balance": {
+                    "bank_transfer": {
+                        "eu_bank_transfer": {"country": "DE"},
+                        "type": "eu_bank_transfer",
+                    },
+                    "funding_type": "bank_transfer",
+                },
+            },
+            "payment_method_types": ["card", "customer_balance"],
+        },
+        "period_end": 1680644467,
+        "period_start": 1680644467,
+        "rendering": {"amount_tax_display": None, "pdf": {"page_size": "a4"}},
+        "shipping_details": {"address": address, "name": "Jenny Rosen"},
+        "status": "draft",
+        "status_transitions": {
+            "finalized_at": None,
+            "marked_uncollectible_at": None,
+            "paid_at": None,
+            "voided_at": None,
+        },
+        "subscription": "sub_1MtHbELkdIwHu7ixeSTMYhr8",
+        "subscription_details": {"metadata": {}},
+        "subtotal": 100000,
+        "tax": 8500,
+        "total": 108500,
+        "total_discount_amounts": [
+            {"amount": 100, "discount": "di_1MtHbELkdIwHu7ix3ZYjNfTN"}
+        ],
+        "total_tax_amounts": [
+            {
+                "amount": 8500,
+                "inclusive": False,
+                "tax_rate": "txr_1MtHbELkdIwHu7ixgdJnJXB5",
+                "taxability_reason": "standard_rated",
+                "taxable_amount": 100000,
+            }
+        ],
+    }
+
+
+def make_payment_intent(i):
+    return {
+        "id": "pi_3MtwBwLkdIwHu7ix28a3tqPa%02d" % (i % 100),
+        "object": "payment_intent",
+        "amount": 2000 + i,
+        "amount_capturable": 0,
+        "amount_details": {"tip": {"amount": 100}},
+        "amount_received": 2000 + i,
+        "automatic_payment_methods": {
+            "allow_redirects": "always",
+            "enabled": True,
+        },
+        "capture_method": "automatic",
+        "client_secret": "pi_3MtwBwLkdIwHu7ix28a3tqPa_secret_YrKJUKribcBjcG8H",
+        "confirmation_method": "automatic",
+        "created": 1680800504,
+        "currency": "usd",
+        "customer": "cus_NeZwdNtLEOXuvB",
+        "description": None,
+        "last_payment_error": None,
+        "latest_charge": make_charge(i),
+        "livemode": False,
+        "metadata": {"order_id": str(6735 + i)},
+        "next_action": None,
+        "payment_method": "pm_1MtwBwLkdIwHu7ixTVaTcGT9",
+        "payment_method_configuration_details": {
+            "id": "pmc_1MtwBwLkdIwHu7ixCmLcGQEy",
+            "parent": None,
+        },
+        "payment_method_options": {
+            "card": {
+                "installments": None,
+                "mandate_options": None,
+                "network": None,
+                "request_three_d_secure": "automatic",
+            },
+            "link": {"persistent_token": None},
+        },
+        "payment_method_types": ["card", "link"],
+        "processing": None,
+        "receipt_email": None,
+        "setup_future_usage": None,
+        "shipping": None,
+        "statement_descriptor": None,
+        "status": "succeeded",
+        "transfer_data": None,
+    }
+
+
+def page(data):
+    return {"object": "list", "data": data, "has_more": True, "url": "/v1"}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    cases = [
+        ("invoice, 100 lines", make_invoice(0), 1),
+        ("payment intent", make_payment_intent(0), 1),
+        (
+            "100 invoices, 10 lines",
+            page([make_invoice(i, lines=10) for i in range(100)]),
+            100,
+        ),
+        (
+            "100 payment intents",
+            page([make_payment_intent(i) for i in range(100)]),
+            100,
+        ),
+    ]
+
+    requestor = stripe._APIRequestor()
+    print("%-24s %12s %14s" % ("response", "ms", "objects/s"))
+    for case, data, objects in cases:
+        iterations = max(1, args.iterations // objects)
+        seconds = timeit.timeit(
+            lambda: stripe.util._convert_to_stripe_object(
+                resp=data, requestor=requestor, api_mode="V1"
+            ),
+            number=iterations,
+        )
+        print(
+            "%-24s %12.3f %14.0f"
+            % (
+                case,
+                seconds / iterations * 1e3,
+                objects * iterations / seconds,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
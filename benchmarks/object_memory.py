@@ -0,0 +1,108 @@
+"""
+Measures the memory held by the results of an export: pages of `Charge`s
+parsed and converted the way responses to requests are, then kept until the
+end, as when they're all collected into one list.
+
+Each setting is measured on its own, and the memory still allocated once
+every page has been converted is reported, along with its peak along the
+way.
+
+    python benchmarks/object_memory.py [--pages N] [--page-size N]
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+import stripe
+from json_parsing import make_charge
+
+SETTINGS = [
+    ("default", {}),
+    ("response_retention=data", {"response_retention": "data"}),
+    ("response_retention=headers", {"response_retention": "headers"}),
+    (
+        "lazy_objects, headers",
+        {"lazy_objects": True, "response_retention": "headers"},
+    ),
+]
+
+
+def make_bodies(pages, page_size):
+    return [
+        json.dumps(
+            {
+                "object": "list",
+                "data": [
+                    make_charge(page * page_size + i) for i in range(page_size)
+                ],
+                "has_more": page < pages - 1,
+                "url": "/v1/charges",
+            }
+        )
+        for page in range(pages)
+    ]
+
+
+def export(requestor, bodies, options):
+    # Encoding each body stands in for receiving it, so that the bytes are
+    # allocated, and counted, along with what's made from them.
+    return [
+        requestor._convert_response(
+            requestor._interpret_response(body.encode("utf-8"), 200, {}),
+            None,
+            options,
+            "V1",
+        )
+        for body in bodies
+    ]
+
+
+def measure(requestor, bodies, options=None):
+    gc.collect()
+    tracemalloc.start()
+    pages = export(requestor, bodies, options)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(pages) == len(bodies)
+    return current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    bodies = make_bodies(args.pages, args.page_size)
+    requestor = stripe._APIRequestor()
+    print(
+        "%d charges, %.1f MB of JSON"
+        % (args.pages * args.page_size, sum(map(len, bodies)) / 1e6)
+    )
+    print("%-28s %10s %10s %8s" % ("setting", "held MB", "peak MB", "saved"))
+
+    baseline = None
+    for name, settings in SETTINGS + [("raw", None)]:
+        previous = {k: getattr(stripe, k) for k in settings or {}}
+        for k, v in (settings or {}).items():
+            setattr(stripe, k, v)
+        try:
+            current, peak = measure(
+                requestor, bodies, {"raw": True} if settings is None else None
+            )
+        finally:
+            for k, v in previous.items():
+                setattr(stripe, k, v)
+
+        if baseline is None:
+            baseline = current
+        print(
+            "%-28s %10.1f %10.1f %7.0f%%"
+            % (name, current / 1e6, peak / 1e6, 100 - 100 * current / baseline)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -56,6 +56,10 @@ class TypingImportsChecker:
         "Set",
         "Callable",
         "Generator",
+        "AsyncIterable",
+        "AsyncIterator",
+        "Deque",
+        "Iterable",
     ]
 
     def __init__(self, tree: ast.AST):
@@ -38,6 +38,20 @@ proxy: Optional[str] = None
 default_http_client: Optional["HTTPClient"] = None
 app_info: Optional[AppInfo] = None
 enable_telemetry: bool = True
+# Ask for compressed responses, which the HTTP clients decode transparently
+enable_compression: bool = False
+# Let identical GET requests made at the same time share one API call
+coalesce_requests: bool = False
+# Cache responses for resources that rarely change, such as prices
+response_cache: Optional["ResponseCache"] = None
+# Parses responses: "json" (the standard library), "orjson", "ujson", or
+# "auto" for the fastest of those that's installed
+json_backend: Literal["json", "orjson", "ujson", "auto"] = "json"
+# Convert the objects nested in responses only when they're first accessed
+lazy_objects: bool = False
+# What responses keep once they've been converted into objects: "full",
+# "data" (the parsed data, but not the body) or "headers" (neither)
+response_retention: Literal["full", "data", "headers"] = "full"
 max_network_retries: int = 0
 ca_bundle_path: str = os.path.join(
     os.path.dirname(__file__), "data", "ca-certificates.crt"
@@ -89,6 +103,7 @@ from stripe._search_result_object import (
 )
 from stripe._stripe_object import StripeObject as StripeObject
 from stripe._request_options import RequestOptions as RequestOptions
+from stripe._request_options import RequestTimeout as RequestTimeout
 from stripe._createable_api_resource import (
     CreateableAPIResource as CreateableAPIResource,
 )
@@ -135,11 +150,15 @@ from stripe._stripe_response import StripeResponseBase as StripeResponseBase
 from stripe._stripe_response import (
     StripeStreamResponse as StripeStreamResponse,
 )
+from stripe._stripe_response import (
+    StripeStreamResponseAsync as StripeStreamResponseAsync,
+)
 
 # Error types
 from stripe._error import StripeError as StripeError
 from stripe._error import APIError as APIError
 from stripe._error import APIConnectionError as APIConnectionError
+from stripe._error import CircuitBreakerOpenError as CircuitBreakerOpenError
 from stripe._error import StripeErrorWithParamCode as StripeErrorWithParamCode
 from stripe._error import CardError as CardError
 from stripe._error import IdempotencyError as IdempotencyError
@@ -157,7 +176,27 @@ from stripe._http_client import (
     PycurlClient as PycurlClient,
     RequestsClient as RequestsClient,
     UrlFetchClient as UrlFetchClient,
+    HTTPXClient as HTTPXClient,
+    AIOHTTPClient as AIOHTTPClient,
     new_default_http_client as new_default_http_client,
+    new_default_http_client_async as new_default_http_client_async,
+)
+from stripe._rate_limiter import RateLimiter as RateLimiter
+from stripe._circuit_breaker import CircuitBreaker as CircuitBreaker
+from stripe._hedging import HedgingPolicy as HedgingPolicy
+from stripe._batch import BatchResult as BatchResult
+from stripe._response_cache import (
+    ResponseCache as ResponseCache,
+    MemoryResponseCache as MemoryResponseCache,
+    SQLiteResponseCache as SQLiteResponseCache,
+)
+from stripe._raw_page import RawPage as RawPage
+from stripe._page_cursor import PageCursor as PageCursor
+from stripe._file_export import ExportStats as ExportStats
+from stripe._checkpoint_store import (
+    CheckpointStore as CheckpointStore,
+    FileCheckpointStore as FileCheckpointStore,
+    SQLiteCheckpointStore as SQLiteCheckpointStore,
 )
 
 # Util
@@ -838,6 +838,31 @@ class AccountPersonService(StripeService):
             ),
         )
 
+    async def delete_async(
+        self,
+        account: str,
+        person: str,
+        params: "AccountPersonService.DeleteParams" = {},
+        options: RequestOptions = {},
+    ) -> Person:
+        """
+        Deletes an existing person's relationship to the account's legal entity. Any person with a relationship for an account can be deleted through the API, except if the person is the account_opener. If your integration is using the executive parameter, you cannot delete the only verified executive on file.
+        """
+        return cast(
+            Person,
+            await self._request_async(
+                "delete",
+                "/v1/accounts/{account}/persons/{person}".format(
+                    account=sanitize_id(account),
+                    person=sanitize_id(person),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         account: str,
@@ -863,6 +888,31 @@ class AccountPersonService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        account: str,
+        person: str,
+        params: "AccountPersonService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Person:
+        """
+        Retrieves an existing person.
+        """
+        return cast(
+            Person,
+            await self._request_async(
+                "get",
+                "/v1/accounts/{account}/persons/{person}".format(
+                    account=sanitize_id(account),
+                    person=sanitize_id(person),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         account: str,
@@ -888,6 +938,31 @@ class AccountPersonService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        account: str,
+        person: str,
+        params: "AccountPersonService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> Person:
+        """
+        Updates an existing person.
+        """
+        return cast(
+            Person,
+            await self._request_async(
+                "post",
+                "/v1/accounts/{account}/persons/{person}".format(
+                    account=sanitize_id(account),
+                    person=sanitize_id(person),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def list(
         self,
         account: str,
@@ -911,6 +986,29 @@ class AccountPersonService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        account: str,
+        params: "AccountPersonService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Person]:
+        """
+        Returns a list of people associated with the account's legal entity. The people are returned sorted by creation date, with the most recent people appearing first.
+        """
+        return cast(
+            ListObject[Person],
+            await self._request_async(
+                "get",
+                "/v1/accounts/{account}/persons".format(
+                    account=sanitize_id(account),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         account: str,
@@ -933,3 +1031,26 @@ class AccountPersonService(StripeService):
                 options=options,
             ),
         )
+
+    async def create_async(
+        self,
+        account: str,
+        params: "AccountPersonService.CreateParams" = {},
+        options: RequestOptions = {},
+    ) -> Person:
+        """
+        Creates a new person.
+        """
+        return cast(
+            Person,
+            await self._request_async(
+                "post",
+                "/v1/accounts/{account}/persons".format(
+                    account=sanitize_id(account),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
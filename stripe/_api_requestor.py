@@ -3,6 +3,7 @@ import json
 import platform
 from typing import (
     Any,
+    AsyncIterable,
     Dict,
     List,
     Mapping,
@@ -28,18 +29,27 @@ from stripe._version import VERSION
 import stripe._error as error
 import stripe.oauth_error as oauth_error
 from stripe._multipart_data_generator import MultipartDataGenerator
-from urllib.parse import urlencode
-from stripe._encode import (
-    _api_encode,
+from stripe._encode import _api_encode  # noqa: F401
+from stripe._encode import _api_encode_form
+from stripe._stripe_response import (
+    StripeResponse,
+    StripeStreamResponse,
+    StripeStreamResponseAsync,
 )
-from stripe._stripe_response import StripeResponse, StripeStreamResponse
 from stripe._request_options import RequestOptions, merge_options
 from stripe._requestor_options import (
     RequestorOptions,
     _GlobalRequestorOptions,
 )
-from stripe._http_client import HTTPClient, new_default_http_client
+from stripe._http_client import (
+    HTTPClient,
+    _accept_encoding,
+    new_default_http_client,
+)
 from stripe._app_info import AppInfo
+from stripe._single_flight import _SingleFlight
+from stripe._raw_page import _raw_result
+from stripe._response_cache import ResponseCache
 
 from stripe._base_address import BaseAddress
 from stripe._api_mode import ApiMode
@@ -52,6 +62,9 @@ HttpVerb = Literal["get", "post", "delete"]
 # Lazily initialized
 _default_proxy: Optional[str] = None
 
+# Identical GETs in flight at once, when `stripe.coalesce_requests` is set
+_in_flight_gets = _SingleFlight()
+
 
 class _APIRequestor(object):
     _instance: ClassVar["_APIRequestor|None"] = None
@@ -60,9 +73,13 @@ class _APIRequestor(object):
         self,
         options: RequestorOptions = RequestorOptions(),
         client: Optional[HTTPClient] = None,
+        response_cache: Optional[ResponseCache] = None,
+        raw: bool = False,
     ):
         self._options = options
         self._client = client
+        self._response_cache = response_cache
+        self._raw = raw
 
     # In the case of client=None, we should use the current value of stripe.default_http_client
     # or lazily initialize it. Since stripe.default_http_client can change throughout the lifetime of
@@ -96,6 +113,11 @@ class _APIRequestor(object):
             return stripe.default_http_client
         return client
 
+    def _get_response_cache(self) -> Optional[ResponseCache]:
+        if self._response_cache is not None:
+            return self._response_cache
+        return stripe.response_cache
+
     def _replace_options(
         self, options: Optional[RequestOptions]
     ) -> "_APIRequestor":
@@ -105,7 +127,10 @@ class _APIRequestor(object):
             if key in options and options[key] is not None:
                 new_options[key] = options[key]
         return _APIRequestor(
-            options=RequestorOptions(**new_options), client=self._client
+            options=RequestorOptions(**new_options),
+            client=self._client,
+            response_cache=self._response_cache,
+            raw=self._raw,
         )
 
     @property
@@ -163,24 +188,128 @@ class _APIRequestor(object):
         _usage: Optional[List[str]] = None,
     ) -> "StripeObject":
         requestor = self._replace_options(options)
-        rbody, rcode, rheaders = requestor.request_raw(
-            method.lower(),
-            url,
-            params,
-            is_streaming=False,
-            api_mode=api_mode,
-            base_address=base_address,
-            options=options,
-            _usage=_usage,
+        cache = requestor._get_response_cache()
+        key = (
+            requestor._request_key(method, url, params, options, base_address)
+            if stripe.coalesce_requests or cache is not None
+            else None
+        )
+
+        def request_raw() -> Tuple[object, int, Mapping[str, str]]:
+            response = requestor.request_raw(
+                method.lower(),
+                url,
+                params,
+                is_streaming=False,
+                api_mode=api_mode,
+                base_address=base_address,
+                options=options,
+                _usage=_usage,
+            )
+            if cache is not None:
+                cache._store(url, key, response)
+            return response
+
+        response: Optional[Tuple[object, int, Mapping[str, str]]] = (
+            cache._lookup(url, key) if cache is not None else None
         )
+        if response is None:
+            in_flight_key = requestor._in_flight_key(key, options)
+            if in_flight_key is not None:
+                response = _in_flight_gets.do(in_flight_key, request_raw)
+            else:
+                response = request_raw()
+        rbody, rcode, rheaders = response
+        # Each caller parses the body itself, so that callers sharing a
+        # response get objects (and errors) of their own.
         resp = requestor._interpret_response(rbody, rcode, rheaders)
 
-        return _convert_to_stripe_object(
+        return requestor._convert_response(resp, params, options, api_mode)
+
+    def _convert_response(
+        self,
+        resp: StripeResponse,
+        params: Optional[Mapping[str, Any]],
+        options: Optional[RequestOptions],
+        api_mode: ApiMode,
+    ) -> "StripeObject":
+        options = options or {}
+        raw = options.get("raw")
+        if raw is None:
+            raw = self._raw
+        fields = options.get("fields")
+        if fields is not None and not raw:
+            raise ValueError("fields can only be used with raw=True")
+        if raw:
+            return cast(
+                "StripeObject",
+                _raw_result(
+                    resp.data,
+                    fields=fields,
+                    requestor=self,
+                    params=params,
+                    options=options,
+                    api_mode=api_mode,
+                ),
+            )
+
+        obj = _convert_to_stripe_object(
             resp=resp,
             params=params,
-            requestor=requestor,
+            requestor=self,
             api_mode=api_mode,
         )
+        resp._release(stripe.response_retention)
+        return obj
+
+    def _request_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        options: Optional[RequestOptions],
+        base_address: BaseAddress,
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        What identifies a request whose response can be shared with
+        identical ones, whether in flight at the same time or cached, or
+        None if it has to be made on its own.
+        """
+        if method.lower() != "get":
+            return None
+        headers = (options or {}).get("headers") or {}
+        return (
+            self._options.base_addresses.get(base_address),
+            url,
+            _api_encode_form(params or {}),
+            self.api_key,
+            self.stripe_account,
+            self.stripe_version,
+            tuple(sorted(headers.items())),
+        )
+
+    def _in_flight_key(
+        self,
+        key: Optional[Tuple[Any, ...]],
+        options: Optional[RequestOptions],
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        What identifies a request that can share an identical one in flight,
+        which also has to be retried the same way, or None if it has to be
+        made on its own. Requests with a timeout or deadline of their own
+        aren't shared, since waiting on another caller's request would leave
+        them bound by that caller's.
+        """
+        if key is None or not stripe.coalesce_requests:
+            return None
+        options = options or {}
+        if options.get("timeout") is not None:
+            return None
+        if options.get("deadline") is not None:
+            return None
+        return key + (
+            merge_options(self._options, options).get("max_network_retries"),
+        )
 
     def request_stream(
         self,
@@ -212,6 +341,84 @@ class _APIRequestor(object):
         )
         return resp
 
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        options: Optional[RequestOptions] = None,
+        *,
+        base_address: BaseAddress,
+        api_mode: ApiMode,
+        _usage: Optional[List[str]] = None,
+    ) -> "StripeObject":
+        requestor = self._replace_options(options)
+        cache = requestor._get_response_cache()
+        key = (
+            requestor._request_key(method, url, params, options, base_address)
+            if stripe.coalesce_requests or cache is not None
+            else None
+        )
+
+        async def request_raw() -> Tuple[object, int, Mapping[str, str]]:
+            response = await requestor.request_raw_async(
+                method.lower(),
+                url,
+                params,
+                is_streaming=False,
+                api_mode=api_mode,
+                base_address=base_address,
+                options=options,
+                _usage=_usage,
+            )
+            if cache is not None:
+                cache._store(url, key, response)
+            return response
+
+        response: Optional[Tuple[object, int, Mapping[str, str]]] = (
+            cache._lookup(url, key) if cache is not None else None
+        )
+        if response is None:
+            in_flight_key = requestor._in_flight_key(key, options)
+            if in_flight_key is not None:
+                response = await _in_flight_gets.do_async(
+                    in_flight_key, request_raw
+                )
+            else:
+                response = await request_raw()
+        rbody, rcode, rheaders = response
+        resp = requestor._interpret_response(rbody, rcode, rheaders)
+
+        return requestor._convert_response(resp, params, options, api_mode)
+
+    async def request_stream_async(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        options: Optional[RequestOptions] = None,
+        *,
+        base_address: BaseAddress,
+        api_mode: ApiMode,
+        _usage: Optional[List[str]] = None,
+    ) -> StripeStreamResponseAsync:
+        stream, rcode, rheaders = await self.request_raw_async(
+            method.lower(),
+            url,
+            params,
+            is_streaming=True,
+            api_mode=api_mode,
+            base_address=base_address,
+            options=options,
+            _usage=_usage,
+        )
+        resp = await self._interpret_streaming_response_async(
+            cast(AsyncIterable[bytes], stream),
+            rcode,
+            rheaders,
+        )
+        return resp
+
     def handle_error_response(self, rbody, rcode, resp, rheaders) -> NoReturn:
         try:
             error_data = resp["error"]
@@ -367,6 +574,9 @@ class _APIRequestor(object):
         if stripe_version:
             headers["Stripe-Version"] = stripe_version
 
+        if stripe.enable_compression:
+            headers["Accept-Encoding"] = _accept_encoding()
+
         return headers
 
     def _args_for_request_with_retries(
@@ -379,6 +589,7 @@ class _APIRequestor(object):
         base_address: BaseAddress,
         api_mode: ApiMode,
         _usage: Optional[List[str]] = None,
+        is_async: bool = False,
     ):
         """
         Mechanism for issuing an API call
@@ -399,12 +610,7 @@ class _APIRequestor(object):
             url,
         )
 
-        encoded_params = urlencode(list(_api_encode(params or {})))
-
-        # Don't use strict form encoding by changing the square bracket control
-        # characters back to their literals. This is fine by the server, and
-        # makes these parameter strings easier to read.
-        encoded_params = encoded_params.replace("%5B", "[").replace("%5D", "]")
+        encoded_params = _api_encode_form(params or {})
 
         encoded_body = encoded_params
 
@@ -417,6 +623,7 @@ class _APIRequestor(object):
 
         headers = self.request_headers(method, request_options)
 
+        post_data: Any
         if method == "get" or method == "delete":
             if params:
                 query = encoded_params
@@ -431,7 +638,13 @@ class _APIRequestor(object):
             if api_mode == "V1FILES":
                 generator = MultipartDataGenerator()
                 generator.add_params(params or {})
-                post_data = generator.get_post_data()
+                if not is_async and self._get_http_client()._streams_uploads:
+                    # Files are read as the body is sent, rather than all
+                    # being copied into memory first.
+                    post_data = generator.get_post_body()
+                    headers["Content-Length"] = str(len(post_data))
+                else:
+                    post_data = generator.get_post_data()
                 headers[
                     "Content-Type"
                 ] = "multipart/form-data; boundary=%s" % (generator.boundary,)
@@ -457,6 +670,8 @@ class _APIRequestor(object):
             headers,
             post_data,
             max_network_retries,
+            request_options.get("timeout"),
+            request_options.get("deadline"),
             _usage,
             # For logging
             encoded_params,
@@ -481,6 +696,8 @@ class _APIRequestor(object):
             headers,
             post_data,
             max_network_retries,
+            timeout,
+            deadline,
             _usage,
             encoded_params,
             api_version,
@@ -510,6 +727,8 @@ class _APIRequestor(object):
                 headers,
                 post_data,
                 max_network_retries=max_network_retries,
+                timeout=timeout,
+                deadline=deadline,
                 _usage=_usage,
             )
         else:
@@ -523,6 +742,90 @@ class _APIRequestor(object):
                 headers,
                 post_data,
                 max_network_retries=max_network_retries,
+                timeout=timeout,
+                deadline=deadline,
+                _usage=_usage,
+            )
+
+        log_info("Stripe API response", path=abs_url, response_code=rcode)
+        log_debug("API response body", body=rcontent)
+
+        if "Request-Id" in rheaders:
+            request_id = rheaders["Request-Id"]
+            log_debug(
+                "Dashboard link for request",
+                link=dashboard_link(request_id),
+            )
+
+        return rcontent, rcode, rheaders
+
+    async def request_raw_async(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        options: Optional[RequestOptions] = None,
+        is_streaming: bool = False,
+        *,
+        base_address: BaseAddress,
+        api_mode: ApiMode,
+        _usage: Optional[List[str]] = None,
+    ) -> Tuple[object, int, Mapping[str, str]]:
+        (
+            method,
+            abs_url,
+            headers,
+            post_data,
+            max_network_retries,
+            timeout,
+            deadline,
+            _usage,
+            encoded_params,
+            api_version,
+        ) = self._args_for_request_with_retries(
+            method,
+            url,
+            params,
+            options,
+            base_address=base_address,
+            api_mode=api_mode,
+            _usage=_usage,
+            is_async=True,
+        )
+
+        log_info("Request to Stripe api", method=method, url=abs_url)
+        log_debug(
+            "Post details", post_data=encoded_params, api_version=api_version
+        )
+
+        if is_streaming:
+            (
+                rcontent,
+                rcode,
+                rheaders,
+            ) = await self._get_http_client().request_stream_with_retries_async(
+                method,
+                abs_url,
+                headers,
+                post_data,
+                max_network_retries=max_network_retries,
+                timeout=timeout,
+                deadline=deadline,
+                _usage=_usage,
+            )
+        else:
+            (
+                rcontent,
+                rcode,
+                rheaders,
+            ) = await self._get_http_client().request_with_retries_async(
+                method,
+                abs_url,
+                headers,
+                post_data,
+                max_network_retries=max_network_retries,
+                timeout=timeout,
+                deadline=deadline,
                 _usage=_usage,
             )
 
@@ -548,16 +851,19 @@ class _APIRequestor(object):
         rheaders: Mapping[str, str],
     ) -> StripeResponse:
         try:
-            if hasattr(rbody, "decode"):
-                # TODO: should be able to remove this cast once self._client.request_with_retries
-                # returns a more specific type.
-                rbody = cast(bytes, rbody).decode("utf-8")
+            # TODO: should be able to remove this cast once self._client.request_with_retries
+            # returns a more specific type.
             resp = StripeResponse(
-                cast(str, rbody),
+                cast(Union[bytes, str], rbody),
                 rcode,
                 rheaders,
             )
         except Exception:
+            if hasattr(rbody, "decode"):
+                try:
+                    rbody = cast(bytes, rbody).decode("utf-8")
+                except UnicodeDecodeError:
+                    pass
             raise error.APIError(
                 "Invalid response body from API: %s "
                 "(HTTP response code was %d)" % (rbody, rcode),
@@ -566,7 +872,7 @@ class _APIRequestor(object):
                 rheaders,
             )
         if self._should_handle_code_as_error(rcode):
-            self.handle_error_response(rbody, rcode, resp.data, rheaders)
+            self.handle_error_response(resp.body, rcode, resp.data, rheaders)
         return resp
 
     def _interpret_streaming_response(
@@ -597,3 +903,19 @@ class _APIRequestor(object):
             )
         else:
             return StripeStreamResponse(stream, rcode, rheaders)
+
+    async def _interpret_streaming_response_async(
+        self,
+        stream: AsyncIterable[bytes],
+        rcode: int,
+        rheaders: Mapping[str, str],
+    ) -> StripeStreamResponseAsync:
+        if self._should_handle_code_as_error(rcode):
+            json_content = b"".join([chunk async for chunk in stream])
+            self._interpret_response(json_content, rcode, rheaders)
+            # _interpret_response is guaranteed to throw since we've checked self._should_handle_code_as_error
+            raise RuntimeError(
+                "_interpret_response should have raised an error"
+            )
+        else:
+            return StripeStreamResponseAsync(stream, rcode, rheaders)
@@ -91,6 +91,28 @@ class BalanceTransactionService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "BalanceTransactionService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[BalanceTransaction]:
+        """
+        Returns a list of transactions that have contributed to the Stripe account balance (e.g., charges, transfers, and so forth). The transactions are returned in sorted order, with the most recent transactions appearing first.
+
+        Note that this endpoint was previously called “Balance history” and used the path /v1/balance/history.
+        """
+        return cast(
+            ListObject[BalanceTransaction],
+            await self._request_async(
+                "get",
+                "/v1/balance_transactions",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         id: str,
@@ -113,3 +135,26 @@ class BalanceTransactionService(StripeService):
                 options=options,
             ),
         )
+
+    async def retrieve_async(
+        self,
+        id: str,
+        params: "BalanceTransactionService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> BalanceTransaction:
+        """
+        Retrieves the balance transaction with the given ID.
+
+        Note that this endpoint previously used the path /v1/balance/history/:id.
+        """
+        return cast(
+            BalanceTransaction,
+            await self._request_async(
+                "get",
+                "/v1/balance_transactions/{id}".format(id=sanitize_id(id)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
@@ -0,0 +1,112 @@
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from stripe._error import StripeError
+
+T = TypeVar("T")
+
+
+class BatchResult(Generic[T]):
+    """
+    The outcome of one call in a batch: what it returned if it succeeded, or
+    the `StripeError` it raised. Calls that weren't made because the batch
+    stopped at an earlier error are `skipped`.
+    """
+
+    index: int
+    result: Optional[T]
+    error: Optional[StripeError]
+    skipped: bool
+
+    def __init__(
+        self,
+        index: int,
+        result: Optional[T] = None,
+        error: Optional[StripeError] = None,
+        skipped: bool = False,
+    ):
+        self.index = index
+        self.result = result
+        self.error = error
+        self.skipped = skipped
+
+    @property
+    def ok(self) -> bool:
+        return not self.skipped and self.error is None
+
+    def __repr__(self) -> str:
+        if self.skipped:
+            outcome = "skipped"
+        elif self.error is not None:
+            outcome = "error=%r" % (self.error,)
+        else:
+            outcome = "result=%r" % (self.result,)
+        return "<BatchResult index=%d %s>" % (self.index, outcome)
+
+
+def _run_batch(
+    calls: Iterable[Callable[[], T]],
+    max_in_flight: int,
+    stop_on_error: bool,
+    on_progress: Optional[Callable[[int, int, BatchResult[T]], Any]],
+) -> List[BatchResult[T]]:
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    calls = list(calls)
+    results: List[Optional[BatchResult[T]]] = [None] * len(calls)
+    if not calls:
+        return []
+
+    completed = 0
+    next_index = 0
+    stopped = False
+    pending: Dict["Future[T]", int] = {}
+    with ThreadPoolExecutor(
+        max_workers=min(max_in_flight, len(calls)),
+        thread_name_prefix="stripe-batch",
+    ) as executor:
+        while True:
+            # Calls are only handed to the pool as others finish, so that
+            # the ones after an error can still be skipped.
+            while (
+                not stopped
+                and next_index < len(calls)
+                and len(pending) < max_in_flight
+            ):
+                pending[executor.submit(calls[next_index])] = next_index
+                next_index += 1
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=pending.__getitem__):
+                index = pending.pop(future)
+                try:
+                    item = BatchResult(index, result=future.result())
+                except StripeError as e:
+                    item = BatchResult(index, error=e)
+                    stopped = stopped or stop_on_error
+                results[index] = item
+
+                completed += 1
+                if on_progress is not None:
+                    on_progress(completed, len(calls), item)
+
+    for index in range(next_index, len(calls)):
+        results[index] = BatchResult(index, skipped=True)
+    return [item for item in results if item is not None]
@@ -382,6 +382,26 @@ class ChargeService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "ChargeService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Charge]:
+        """
+        Returns a list of charges you've previously created. The charges are returned in sorted order, with the most recent charges appearing first.
+        """
+        return cast(
+            ListObject[Charge],
+            await self._request_async(
+                "get",
+                "/v1/charges",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "ChargeService.CreateParams" = {},
@@ -404,6 +424,28 @@ class ChargeService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "ChargeService.CreateParams" = {},
+        options: RequestOptions = {},
+    ) -> Charge:
+        """
+        This method is no longer recommended—use the [Payment Intents API](https://stripe.com/docs/api/payment_intents)
+        to initiate a new payment instead. Confirmation of the PaymentIntent creates the Charge
+        object used to request payment.
+        """
+        return cast(
+            Charge,
+            await self._request_async(
+                "post",
+                "/v1/charges",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         charge: str,
@@ -425,6 +467,27 @@ class ChargeService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        charge: str,
+        params: "ChargeService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Charge:
+        """
+        Retrieves the details of a charge that has previously been created. Supply the unique charge ID that was returned from your previous request, and Stripe will return the corresponding charge information. The same information is returned when creating or refunding the charge.
+        """
+        return cast(
+            Charge,
+            await self._request_async(
+                "get",
+                "/v1/charges/{charge}".format(charge=sanitize_id(charge)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         charge: str,
@@ -446,6 +509,27 @@ class ChargeService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        charge: str,
+        params: "ChargeService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> Charge:
+        """
+        Updates the specified charge by setting the values of the parameters passed. Any parameters not provided will be left unchanged.
+        """
+        return cast(
+            Charge,
+            await self._request_async(
+                "post",
+                "/v1/charges/{charge}".format(charge=sanitize_id(charge)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def search(
         self,
         params: "ChargeService.SearchParams",
@@ -469,6 +553,29 @@ class ChargeService(StripeService):
             ),
         )
 
+    async def search_async(
+        self,
+        params: "ChargeService.SearchParams",
+        options: RequestOptions = {},
+    ) -> SearchResultObject[Charge]:
+        """
+        Search for charges you've previously created using Stripe's [Search Query Language](https://stripe.com/docs/search#search-query-language).
+        Don't use search in read-after-write flows where strict consistency is necessary. Under normal operating
+        conditions, data is searchable in less than a minute. Occasionally, propagation of new or updated data can be up
+        to an hour behind during outages. Search functionality is not available to merchants in India.
+        """
+        return cast(
+            SearchResultObject[Charge],
+            await self._request_async(
+                "get",
+                "/v1/charges/search",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def capture(
         self,
         charge: str,
@@ -495,3 +602,30 @@ class ChargeService(StripeService):
                 options=options,
             ),
         )
+
+    async def capture_async(
+        self,
+        charge: str,
+        params: "ChargeService.CaptureParams" = {},
+        options: RequestOptions = {},
+    ) -> Charge:
+        """
+        Capture the payment of an existing, uncaptured charge that was created with the capture option set to false.
+
+        Uncaptured payments expire a set number of days after they are created ([7 by default](https://stripe.com/docs/charges/placing-a-hold)), after which they are marked as refunded and capture attempts will fail.
+
+        Don't use this method to capture a PaymentIntent-initiated charge. Use [Capture a PaymentIntent](https://stripe.com/docs/api/payment_intents/capture).
+        """
+        return cast(
+            Charge,
+            await self._request_async(
+                "post",
+                "/v1/charges/{charge}/capture".format(
+                    charge=sanitize_id(charge),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
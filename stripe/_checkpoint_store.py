@@ -0,0 +1,215 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import AsyncIterator, Iterator, Optional, TypeVar
+from typing_extensions import Protocol
+from urllib.parse import quote
+
+from stripe._page_cursor import PageCursor
+
+
+class _Page(Protocol):
+    @property
+    def cursor(self) -> Optional[PageCursor]:
+        ...
+
+
+P = TypeVar("P", bound=_Page)
+
+
+class CheckpointStore(object):
+    """
+    Keeps a `PageCursor` for each of a number of iterations, identified by
+    a key of your choosing, so that an iteration that stopped, for example
+    when its process crashed or was redeployed, can resume where it left
+    off rather than from the first page.
+
+    `auto_paging_iter(checkpoint=store, checkpoint_key=key)` saves the
+    cursor of each page once all of its objects have been iterated
+    through, and deletes it once the last page has been, so an object
+    may be seen again after resuming but is never skipped.
+
+    `FileCheckpointStore` keeps cursors in a directory and
+    `SQLiteCheckpointStore` in an SQLite database. Other stores subclass
+    this one and implement `load`, `save` and `delete`.
+    """
+
+    def load(self, key: str) -> Optional[PageCursor]:
+        """
+        The cursor saved for `key`, or None if there isn't one.
+        """
+        raise NotImplementedError(
+            "CheckpointStore subclasses must implement `load`"
+        )
+
+    def save(self, key: str, cursor: PageCursor) -> None:
+        raise NotImplementedError(
+            "CheckpointStore subclasses must implement `save`"
+        )
+
+    def delete(self, key: str) -> None:
+        """
+        Forgets the cursor saved for `key`, if there is one.
+        """
+        raise NotImplementedError(
+            "CheckpointStore subclasses must implement `delete`"
+        )
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    A `CheckpointStore` keeping each cursor as a JSON file in `directory`,
+    which is created if it doesn't exist. Files are replaced atomically, so
+    a crash while saving leaves the previous cursor.
+    """
+
+    directory: str
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, quote(key, safe="") + ".json")
+
+    def load(self, key: str) -> Optional[PageCursor]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return PageCursor.from_json(f.read())
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, cursor: PageCursor) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(cursor.to_json())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    A `CheckpointStore` keeping cursors in an SQLite database at `path`,
+    which worker processes on the same machine can share.
+    """
+
+    path: str
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection can't be used by a process forked after it was
+        # opened, so each process opens its own.
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path,
+                timeout=10,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS stripe_checkpoints ("
+                "key TEXT PRIMARY KEY, "
+                "cursor TEXT NOT NULL, "
+                "saved_at REAL NOT NULL)"
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def load(self, key: str) -> Optional[PageCursor]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT cursor FROM stripe_checkpoints WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        return None if row is None else PageCursor.from_json(row[0])
+
+    def save(self, key: str, cursor: PageCursor) -> None:
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO stripe_checkpoints VALUES (?, ?, ?)",
+                (key, cursor.to_json(), time.time()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM stripe_checkpoints WHERE key = ?", (key,)
+            )
+
+
+def _check_checkpoint(
+    checkpoint: Optional[CheckpointStore], checkpoint_key: Optional[str]
+) -> None:
+    if (checkpoint is None) != (checkpoint_key is None):
+        raise ValueError(
+            "checkpoint and checkpoint_key must be passed together"
+        )
+
+
+def _checkpointed(
+    pages: Iterator[P], store: Optional[CheckpointStore], key: Optional[str]
+) -> Iterator[P]:
+    """
+    Yields `pages`, saving the cursor of each once the next one is asked
+    for, which is after its objects have been iterated through, and
+    deleting it after the last.
+    """
+    if store is None or key is None:
+        yield from pages
+        return
+
+    for page in pages:
+        yield page
+        cursor = page.cursor
+        if cursor is not None:
+            store.save(key, cursor)
+    store.delete(key)
+
+
+async def _checkpointed_async(
+    pages: AsyncIterator[P],
+    store: Optional[CheckpointStore],
+    key: Optional[str],
+) -> AsyncIterator[P]:
+    """
+    Like `_checkpointed`. Saving is synchronous, as cursors are small.
+    """
+    async for page in pages:
+        yield page
+        if store is None or key is None:
+            continue
+        cursor = page.cursor
+        if cursor is not None:
+            store.save(key, cursor)
+    if store is not None and key is not None:
+        store.delete(key)
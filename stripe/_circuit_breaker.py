@@ -0,0 +1,245 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from typing_extensions import Literal, TypedDict
+from urllib.parse import urlsplit
+
+from stripe._error import CircuitBreakerOpenError
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class _Circuit(object):
+    def __init__(self, window_size: int):
+        self.state: CircuitState = "closed"
+        # Bumped on every change of state, so that outcomes of requests
+        # started in an earlier state are ignored.
+        self.generation = 0
+        self.outcomes: Deque[bool] = deque(maxlen=window_size)
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.changed_at = time.monotonic()
+        self.probes_in_flight = 0
+
+
+class CircuitBreaker(object):
+    """
+    An opt-in circuit breaker for an `HTTPClient`, with a circuit for each
+    base address (e.g. `https://api.stripe.com`), shared by every thread
+    using the client.
+
+    A circuit starts closed. It opens after `failure_threshold` consecutive
+    connection errors, or once at least `min_requests` of the last
+    `window_size` requests were made and the share that failed (with a
+    connection error or a 5xx) reaches `error_rate_threshold`. While a
+    circuit is open, requests to its base address fail fast with a
+    `CircuitBreakerOpenError` instead of being made, and retries stop.
+
+    After `recovery_timeout` seconds the circuit goes half-open and lets up
+    to `half_open_max_calls` requests through at a time: the first to
+    succeed closes the circuit and the first to fail opens it again.
+    """
+
+    class CircuitStats(TypedDict):
+        state: CircuitState
+        consecutive_failures: int
+        error_rate: float
+        window_requests: int
+        opened_at: Optional[float]
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        error_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_requests: int = 10,
+        recovery_timeout: float = 30,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[
+            Callable[[str, CircuitState, CircuitState], None]
+        ] = None,
+    ):
+        """
+        :param on_state_change: called with the base address, old state and
+          new state whenever a circuit changes state.
+        """
+        if min(failure_threshold, window_size, half_open_max_calls) < 1:
+            raise ValueError(
+                "failure_threshold, window_size and half_open_max_calls "
+                "must be at least 1"
+            )
+        if not 0 < error_rate_threshold <= 1:
+            raise ValueError("error_rate_threshold must be between 0 and 1")
+
+        self._failure_threshold = failure_threshold
+        self._error_rate_threshold = error_rate_threshold
+        self._window_size = window_size
+        self._min_requests = min(min_requests, window_size)
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._on_state_change = on_state_change
+
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def base_address(url: str) -> str:
+        parts = urlsplit(url)
+        return "%s://%s" % (parts.scheme, parts.netloc)
+
+    def state(self, base_address: str) -> CircuitState:
+        """
+        The state of the circuit for `base_address`, e.g.
+        `"https://api.stripe.com"`.
+        """
+        with self._lock:
+            circuit = self._circuits.get(base_address)
+            if circuit is None:
+                return "closed"
+            if self._should_half_open(circuit):
+                return "half_open"
+            return circuit.state
+
+    def stats(self) -> Dict[str, "CircuitBreaker.CircuitStats"]:
+        """
+        A snapshot of every circuit, by base address, for dashboards.
+        `opened_at` is a `time.time()` timestamp.
+        """
+        with self._lock:
+            wall_offset = time.time() - time.monotonic()
+            return {
+                base_address: CircuitBreaker.CircuitStats(
+                    state=(
+                        "half_open"
+                        if self._should_half_open(circuit)
+                        else circuit.state
+                    ),
+                    consecutive_failures=circuit.consecutive_failures,
+                    error_rate=self._error_rate(circuit),
+                    window_requests=len(circuit.outcomes),
+                    opened_at=(
+                        circuit.opened_at + wall_offset
+                        if circuit.opened_at is not None
+                        else None
+                    ),
+                )
+                for base_address, circuit in self._circuits.items()
+            }
+
+    def _should_half_open(self, circuit: _Circuit) -> bool:
+        # A half-open circuit whose probes never reported back (e.g. because
+        # they raised something unexpected) is re-armed the same way.
+        return (
+            circuit.state != "closed"
+            and time.monotonic() - circuit.changed_at >= self._recovery_timeout
+        )
+
+    @staticmethod
+    def _error_rate(circuit: _Circuit) -> float:
+        if not circuit.outcomes:
+            return 0.0
+        return sum(circuit.outcomes) / len(circuit.outcomes)
+
+    def _transition(
+        self,
+        base_address: str,
+        circuit: _Circuit,
+        state: CircuitState,
+        changes: List[Tuple[str, CircuitState, CircuitState]],
+    ) -> None:
+        if state != circuit.state:
+            changes.append((base_address, circuit.state, state))
+        circuit.state = state
+        circuit.generation += 1
+        circuit.probes_in_flight = 0
+        circuit.changed_at = time.monotonic()
+        if state == "open":
+            circuit.opened_at = circuit.changed_at
+        elif state == "closed":
+            circuit.opened_at = None
+            circuit.outcomes.clear()
+            circuit.consecutive_failures = 0
+
+    def _notify(
+        self, changes: List[Tuple[str, CircuitState, CircuitState]]
+    ) -> None:
+        if self._on_state_change is not None:
+            for base_address, old, new in changes:
+                self._on_state_change(base_address, old, new)
+
+    def before_request(self, url: str) -> Tuple[str, int]:
+        """
+        Called before each attempt at a request to `url`. Raises a
+        `CircuitBreakerOpenError` if it mustn't be made, and otherwise
+        returns a ticket to pass to `record` with its outcome.
+        """
+        base_address = self.base_address(url)
+        changes: List[Tuple[str, CircuitState, CircuitState]] = []
+        try:
+            with self._lock:
+                circuit = self._circuits.get(base_address)
+                if circuit is None:
+                    circuit = self._circuits[base_address] = _Circuit(
+                        self._window_size
+                    )
+                if self._should_half_open(circuit):
+                    self._transition(
+                        base_address, circuit, "half_open", changes
+                    )
+
+                if circuit.state == "closed":
+                    return (base_address, circuit.generation)
+                if (
+                    circuit.state == "half_open"
+                    and circuit.probes_in_flight < self._half_open_max_calls
+                ):
+                    circuit.probes_in_flight += 1
+                    return (base_address, circuit.generation)
+        finally:
+            self._notify(changes)
+
+        raise CircuitBreakerOpenError(
+            "Not sending the request because too many recent requests to "
+            "%s failed. The circuit breaker will let requests through again "
+            "once it has recovered." % base_address,
+            base_address=base_address,
+        )
+
+    def record(self, ticket: Tuple[str, int], status: Optional[int]) -> None:
+        """
+        Records the outcome of a request made with `ticket`: its HTTP status,
+        or None if it failed with a connection error.
+        """
+        base_address, generation = ticket
+        failed = status is None or status >= 500
+        changes: List[Tuple[str, CircuitState, CircuitState]] = []
+        with self._lock:
+            circuit = self._circuits[base_address]
+            if generation != circuit.generation:
+                return
+
+            if circuit.state == "half_open":
+                self._transition(
+                    base_address,
+                    circuit,
+                    "open" if failed else "closed",
+                    changes,
+                )
+            elif circuit.state == "closed":
+                circuit.outcomes.append(failed)
+                if status is None:
+                    circuit.consecutive_failures += 1
+                else:
+                    circuit.consecutive_failures = 0
+
+                if (
+                    circuit.consecutive_failures >= self._failure_threshold
+                    or (
+                        len(circuit.outcomes) >= self._min_requests
+                        and self._error_rate(circuit)
+                        >= self._error_rate_threshold
+                    )
+                ):
+                    self._transition(base_address, circuit, "open", changes)
+        self._notify(changes)
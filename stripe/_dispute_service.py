@@ -215,6 +215,26 @@ class DisputeService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "DisputeService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Dispute]:
+        """
+        Returns a list of your disputes.
+        """
+        return cast(
+            ListObject[Dispute],
+            await self._request_async(
+                "get",
+                "/v1/disputes",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         dispute: str,
@@ -236,6 +256,27 @@ class DisputeService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        dispute: str,
+        params: "DisputeService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Dispute:
+        """
+        Retrieves the dispute with the given ID.
+        """
+        return cast(
+            Dispute,
+            await self._request_async(
+                "get",
+                "/v1/disputes/{dispute}".format(dispute=sanitize_id(dispute)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         dispute: str,
@@ -259,6 +300,29 @@ class DisputeService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        dispute: str,
+        params: "DisputeService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> Dispute:
+        """
+        When you get a dispute, contacting your customer is always the best first step. If that doesn't work, you can submit evidence to help us resolve the dispute in your favor. You can do this in your [dashboard](https://dashboard.stripe.com/disputes), but if you prefer, you can use the API to submit evidence programmatically.
+
+        Depending on your dispute type, different evidence fields will give you a better chance of winning your dispute. To figure out which evidence fields to provide, see our [guide to dispute types](https://stripe.com/docs/disputes/categories).
+        """
+        return cast(
+            Dispute,
+            await self._request_async(
+                "post",
+                "/v1/disputes/{dispute}".format(dispute=sanitize_id(dispute)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def close(
         self,
         dispute: str,
@@ -283,3 +347,28 @@ class DisputeService(StripeService):
                 options=options,
             ),
         )
+
+    async def close_async(
+        self,
+        dispute: str,
+        params: "DisputeService.CloseParams" = {},
+        options: RequestOptions = {},
+    ) -> Dispute:
+        """
+        Closing the dispute for a charge indicates that you do not have any evidence to submit and are essentially dismissing the dispute, acknowledging it as lost.
+
+        The status of the dispute will change from needs_response to lost. Closing a dispute is irreversible.
+        """
+        return cast(
+            Dispute,
+            await self._request_async(
+                "post",
+                "/v1/disputes/{dispute}/close".format(
+                    dispute=sanitize_id(dispute),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
@@ -1,8 +1,10 @@
 import calendar
 import datetime
+import re
 import time
 from collections import OrderedDict
-from typing import Generator, Tuple, Any
+from typing import Generator, List, Mapping, Optional, Tuple, Any
+from urllib.parse import quote_plus
 
 
 def _encode_datetime(dttime: datetime.datetime):
@@ -43,3 +45,61 @@ def _api_encode(data) -> Generator[Tuple[str, Any], None, None]:
             yield (key, _encode_datetime(value))
         else:
             yield (key, value)
+
+
+# Strings made only of these characters come out of `quote_plus` unchanged.
+_is_form_safe = re.compile(r"[A-Za-z0-9_.~\[\]-]*").fullmatch
+
+
+def _form_quote(value: Any) -> str:
+    if isinstance(value, str):
+        s = value
+    elif isinstance(value, bytes):
+        return quote_plus(value, safe="[]")
+    else:
+        s = str(value)
+    if _is_form_safe(s):
+        return s
+    return quote_plus(s, safe="[]")
+
+
+def _api_encode_form(data: Mapping[str, Any]) -> str:
+    """
+    Form-encodes `data` for a request body or query string, in a single pass.
+
+    The result is the same as `urlencode(list(_api_encode(data)))`, except
+    that square brackets are left unescaped. This is fine by the server, and
+    makes these parameter strings easier to read.
+    """
+    parts: List[str] = []
+    _form_encode_into(parts, None, data)
+    return "&".join(parts)
+
+
+def _form_encode_into(
+    parts: List[str], prefix: Optional[str], data: Mapping[str, Any]
+) -> None:
+    # Quoting works character by character, so each key is quoted once and
+    # nested names are built from their already quoted parents.
+    for key, value in data.items():
+        if value is None:
+            continue
+        name = _form_quote(key)
+        if prefix is not None:
+            name = "%s[%s]" % (prefix, name)
+
+        if hasattr(value, "stripe_id"):
+            parts.append("%s=%s" % (name, _form_quote(value.stripe_id)))
+        elif isinstance(value, list) or isinstance(value, tuple):
+            for i, sv in enumerate(value):
+                item = "%s[%d]" % (name, i)
+                if isinstance(sv, dict):
+                    _form_encode_into(parts, item, sv)
+                else:
+                    parts.append("%s=%s" % (item, _form_quote(sv)))
+        elif isinstance(value, dict):
+            _form_encode_into(parts, name, value)
+        elif isinstance(value, datetime.datetime):
+            parts.append("%s=%d" % (name, _encode_datetime(value)))
+        else:
+            parts.append("%s=%s" % (name, _form_quote(value)))
@@ -107,6 +107,19 @@ class APIConnectionError(StripeError):
         self.should_retry = should_retry
 
 
+class CircuitBreakerOpenError(APIConnectionError):
+    """
+    Raised instead of making a request while the `CircuitBreaker` for its
+    base address is open.
+    """
+
+    base_address: str
+
+    def __init__(self, message, base_address):
+        super(CircuitBreakerOpenError, self).__init__(message)
+        self.base_address = base_address
+
+
 class StripeErrorWithParamCode(StripeError):
     def __repr__(self):
         return (
@@ -85,6 +85,26 @@ class EventService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "EventService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Event]:
+        """
+        List events, going back up to 30 days. Each event data is rendered according to Stripe API version at its creation time, specified in [event object](https://stripe.com/docs/api/events/object) api_version attribute (not according to your current Stripe API version or Stripe-Version header).
+        """
+        return cast(
+            ListObject[Event],
+            await self._request_async(
+                "get",
+                "/v1/events",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         id: str,
@@ -105,3 +125,24 @@ class EventService(StripeService):
                 options=options,
             ),
         )
+
+    async def retrieve_async(
+        self,
+        id: str,
+        params: "EventService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Event:
+        """
+        Retrieves the details of an event. Supply the unique identifier of the event, which you might have received in a webhook.
+        """
+        return cast(
+            Event,
+            await self._request_async(
+                "get",
+                "/v1/events/{id}".format(id=sanitize_id(id)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
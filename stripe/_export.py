@@ -0,0 +1,195 @@
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+)
+
+
+class _Window(object):
+    """
+    A range of creation times, from `gte` up to but not including `lt`,
+    whose objects are listed newest first, a page at a time.
+    """
+
+    __slots__ = ("gte", "lt", "starting_after", "pages", "fetching", "done")
+
+    def __init__(self, gte: int, lt: int):
+        self.gte = gte
+        self.lt = lt
+        self.starting_after: Optional[str] = None
+        # Fetched pages waiting for the windows before this one to finish,
+        # when objects are exported in order
+        self.pages: Deque[List[Any]] = deque()
+        self.fetching = False
+        self.done = False
+
+    def __repr__(self) -> str:
+        return "<_Window [%d, %d) starting_after=%s>" % (
+            self.gte,
+            self.lt,
+            self.starting_after,
+        )
+
+
+def _split(gte: int, lt: int, windows: int) -> List[_Window]:
+    # Newest first, like the objects in each window
+    edges = sorted({gte + (lt - gte) * i // windows for i in range(windows)})
+    edges.append(lt)
+    return [
+        _Window(edges[i], edges[i + 1])
+        for i in reversed(range(len(edges) - 1))
+    ]
+
+
+def _export_list(
+    list_method: Callable[..., Any],
+    params: Optional[Mapping[str, Any]],
+    created_gte: int,
+    created_lt: int,
+    windows: int,
+    max_in_flight: int,
+    ordered: bool,
+    min_window: int,
+    max_buffered: int,
+) -> Iterator[Any]:
+    if windows < 1:
+        raise ValueError("windows must be at least 1")
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    if max_buffered < 0:
+        raise ValueError("max_buffered must not be negative")
+    return _export_windows(
+        list_method,
+        dict(params or {}),
+        _split(created_gte, created_lt, windows)
+        if created_lt > created_gte
+        else [],
+        max_in_flight,
+        ordered,
+        min_window,
+        max_buffered,
+    )
+
+
+def _export_windows(
+    list_method: Callable[..., Any],
+    params: Dict[str, Any],
+    segments: List[_Window],
+    max_in_flight: int,
+    ordered: bool,
+    min_window: int,
+    max_buffered: int,
+) -> Iterator[Any]:
+    params.setdefault("limit", 100)
+
+    def fetch(window: _Window) -> Any:
+        request = dict(params, created={"gte": window.gte, "lt": window.lt})
+        if window.starting_after is not None:
+            request["starting_after"] = window.starting_after
+        return list_method(request)
+
+    # `segments` holds every window that isn't done, in the order their
+    # objects are exported in.
+    pending: Dict["Future[Any]", _Window] = {}
+    # Pages held back by windows behind the front one, when ordered
+    buffered = 0
+
+    def submit() -> None:
+        # Pages fetched, or being fetched, by windows behind the front one
+        behind = (
+            buffered
+            + sum(
+                1 for window in pending.values() if window is not segments[0]
+            )
+            if ordered
+            else 0
+        )
+        for window in segments:
+            if len(pending) >= max_in_flight:
+                return
+            if window.fetching or window.done:
+                continue
+            if ordered and window is not segments[0]:
+                # Its pages are held back until the windows before it are
+                # done, so it fetches one at a time while there's room for
+                # them, rather than buffering the rest of the export behind
+                # a slow window.
+                if window.pages or behind >= max_buffered:
+                    continue
+                behind += 1
+            window.fetching = True
+            pending[executor.submit(fetch, window)] = window
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_in_flight, thread_name_prefix="stripe-export"
+    )
+    try:
+        while True:
+            submit()
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                window = pending.pop(future)
+                window.fetching = False
+                page = future.result()
+                data = list(page.data)
+
+                if not page.has_more or not data:
+                    window.done = True
+                else:
+                    last = data[-1]
+                    window.starting_after = last["id"]
+                    oldest = last["created"]
+                    waiting = sum(
+                        1
+                        for other in segments
+                        if not other.done and not other.fetching
+                    )
+                    if (
+                        waiting + len(pending) < max_in_flight
+                        and oldest - window.gte >= 2 * min_window
+                    ):
+                        # The window is dense and there's room for more
+                        # requests: what's left of it, besides objects
+                        # created the same second as the last one, becomes
+                        # two new windows that are paged through
+                        # concurrently.
+                        older = _split(window.gte, oldest, 2)
+                        window.gte = oldest
+                        window.lt = oldest + 1
+                        index = segments.index(window) + 1
+                        segments[index:index] = older
+
+                if not ordered:
+                    if window.done:
+                        segments.remove(window)
+                    yield from data
+                    continue
+
+                window.pages.append(data)
+                buffered += 1
+                while segments and (segments[0].pages or segments[0].done):
+                    front = segments[0]
+                    while front.pages:
+                        buffered -= 1
+                        yield from front.pages.popleft()
+                    if front.done:
+                        segments.pop(0)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,159 @@
+import csv
+import gzip
+import io
+import json
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+)
+
+from stripe._prefetch import _check_prefetch
+from stripe._raw_page import RawPage
+
+_FORMATS = ("ndjson", "csv")
+
+_dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+class ExportStats(object):
+    """
+    How much an export to a file has written so far, and how long it's
+    taken. `bytes` counts what was written before any compression.
+    """
+
+    objects: int
+    pages: int
+    bytes: int
+    seconds: float
+
+    def __init__(self):
+        self.objects = 0
+        self.pages = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    @property
+    def objects_per_second(self) -> float:
+        return self.objects / self.seconds if self.seconds else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            "<ExportStats objects=%d pages=%d bytes=%d seconds=%.3f "
+            "objects_per_second=%.1f>"
+            % (
+                self.objects,
+                self.pages,
+                self.bytes,
+                self.seconds,
+                self.objects_per_second,
+            )
+        )
+
+
+def _lookup(item: Any, path: List[str]) -> Any:
+    for key in path:
+        if not isinstance(item, dict):
+            return None
+        item = item.get(key)
+    return item
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    # Numbers and booleans as they'd be in JSON, and nested objects and
+    # lists as JSON itself
+    return _dumps(value)
+
+
+def _encode_ndjson(data: List[Dict[str, Any]]) -> bytes:
+    return "".join([_dumps(item) + "\n" for item in data]).encode("utf-8")
+
+
+def _encode_csv(rows: Iterable[Iterable[str]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _csv_encoder(
+    fields: List[str],
+) -> Callable[[List[Dict[str, Any]]], bytes]:
+    paths = [field.split(".") for field in fields]
+
+    def encode(data: List[Dict[str, Any]]) -> bytes:
+        return _encode_csv(
+            [_cell(_lookup(item, path)) for path in paths] for item in data
+        )
+
+    return encode
+
+
+def _export_to_file(
+    list_method: Callable[..., Any],
+    path: str,
+    params: Optional[Mapping[str, Any]],
+    format: str,
+    fields: Optional[List[str]],
+    compress: bool,
+    prefetch: int,
+    on_progress: Optional[Callable[[ExportStats], Any]],
+) -> ExportStats:
+    if format not in _FORMATS:
+        raise ValueError(
+            'Unknown export format %r. Use "ndjson" or "csv".' % (format,)
+        )
+    if format == "csv" and not fields:
+        raise ValueError("fields are required to export to CSV")
+    _check_prefetch(prefetch)
+
+    stats = ExportStats()
+    started = time.monotonic()
+
+    options: Dict[str, Any] = {"raw": True}
+    if fields:
+        # Only the fields that are written are kept from each response.
+        options["fields"] = list(fields)
+    first = list_method(dict(params or {}), options)
+    if not isinstance(first, RawPage):
+        raise TypeError(
+            "list_method must be a StripeClient list or search method, "
+            "e.g. client.charges.list"
+        )
+
+    if format == "csv":
+        assert fields is not None
+        encode = _csv_encoder(fields)
+        header = _encode_csv([fields])
+    else:
+        encode = _encode_ndjson
+        header = b""
+
+    with gzip.open(path, "wb") if compress else open(path, "wb") as f:
+        if header:
+            f.write(header)
+            stats.bytes += len(header)
+        for page in first._pages(prefetch):
+            chunk = encode(page.data)
+            f.write(chunk)
+            stats.objects += len(page.data)
+            stats.pages += 1
+            stats.bytes += len(chunk)
+            stats.seconds = time.monotonic() - started
+            if on_progress is not None:
+                on_progress(stats)
+
+    stats.seconds = time.monotonic() - started
+    return stats
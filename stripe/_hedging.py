@@ -0,0 +1,152 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Optional, TypeVar
+from typing_extensions import TypedDict
+
+T = TypeVar("T")
+
+
+class HedgingPolicy(object):
+    """
+    Opt-in hedging of `GET` requests for an `HTTPClient`. When a `GET` hasn't
+    been answered within the `percentile`th percentile of recent `GET`
+    latencies, an identical request is sent, and whichever is answered
+    first is used. The other is cancelled if it hasn't started yet, and its
+    response is otherwise discarded.
+
+    Hedges are paid for out of a budget shared by every client using the
+    policy: each `GET` earns `budget_ratio` of a hedge, up to
+    `budget_burst` saved up, so hedging can add at most that share of
+    extra load, however slow the API gets.
+
+    Requests are sent from a pool of up to `max_workers` threads owned by
+    the policy. Streamed requests are never hedged, and async requests are
+    only hedged when running under asyncio.
+    """
+
+    class Stats(TypedDict):
+        delay: float
+        requests: int
+        hedges: int
+        hedge_wins: int
+        budget: float
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.01,
+        max_delay: float = 5,
+        min_samples: int = 20,
+        window_size: int = 1000,
+        budget_ratio: float = 0.05,
+        budget_burst: float = 10,
+        max_workers: int = 64,
+    ):
+        """
+        :param initial_delay: the delay used until `min_samples` latencies
+          have been seen.
+        :param min_delay: the delay is never shorter than this.
+        :param max_delay: the delay is never longer than this.
+        :param window_size: how many recent latencies the percentile is
+          taken over.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= budget_ratio <= 1:
+            raise ValueError("budget_ratio must be between 0 and 1")
+
+        self._percentile = percentile
+        self._initial_delay = initial_delay
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._min_samples = min_samples
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._budget_ratio = budget_ratio
+        self._budget_burst = budget_burst
+        self._budget = 0.0
+        self._max_workers = max_workers
+
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def delay(self) -> float:
+        """
+        How long to wait for a `GET` before hedging it, in seconds.
+        """
+        with self._lock:
+            return self._delay()
+
+    def _delay(self) -> float:
+        if len(self._latencies) < self._min_samples:
+            delay = self._initial_delay
+        else:
+            latencies = sorted(self._latencies)
+            index = int(len(latencies) * self._percentile / 100)
+            delay = latencies[min(index, len(latencies) - 1)]
+        return min(self._max_delay, max(self._min_delay, delay))
+
+    def stats(self) -> "HedgingPolicy.Stats":
+        with self._lock:
+            return HedgingPolicy.Stats(
+                delay=self._delay(),
+                requests=self._requests,
+                hedges=self._hedges,
+                hedge_wins=self._hedge_wins,
+                budget=self._budget,
+            )
+
+    def record_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def _start_request(self) -> None:
+        with self._lock:
+            self._requests += 1
+            self._budget = min(
+                self._budget_burst, self._budget + self._budget_ratio
+            )
+
+    def _try_hedge(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self._hedges += 1
+            return True
+
+    def _record_hedge_win(self) -> None:
+        with self._lock:
+            self._hedge_wins += 1
+
+    def _submit(
+        self, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> "Future[T]":
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="stripe-hedging",
+                )
+            executor = self._executor
+        return executor.submit(self._timed, fn, *args, **kwargs)
+
+    def _timed(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        start = time.monotonic()
+        result = fn(*args, **kwargs)
+        self.record_latency(time.monotonic() - start)
+        return result
+
+    def close(self) -> None:
+        """
+        Shuts down the policy's threads once requests in flight finish.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -1,26 +1,45 @@
+import io
 from io import BytesIO
 import sys
+import asyncio
+import ssl
 import textwrap
+import base64
 import email
 import time
 import random
+import queue
+import select
+import socket
 import threading
+import zlib
+from concurrent import futures
+from collections import deque
 import json
+import http.client as httpclient
 from http.client import HTTPResponse
 
 # Used for global variables
 import stripe  # noqa: IMP101
 from stripe import _util
 from stripe._request_metrics import RequestMetrics
-from stripe._error import APIConnectionError
+from stripe._rate_limiter import RateLimiter
+from stripe._circuit_breaker import CircuitBreaker
+from stripe._hedging import HedgingPolicy
+from stripe._error import APIConnectionError, CircuitBreakerOpenError
+from stripe._request_options import RequestTimeout
+from stripe._multipart_data_generator import _MultipartBody
 
 from typing import (
     Any,
+    AsyncIterable,
+    Callable,
+    Deque,
     Dict,
     List,
     Mapping,
-    MutableMapping,
     Optional,
+    Set,
     Tuple,
     ClassVar,
     Union,
@@ -39,7 +58,6 @@ from typing_extensions import (
 # - Fall back to urllib2 with a warning if needed
 try:
     import urllib.request as urllibrequest
-    import urllib.error as urlliberror
 except ImportError:
     # Try to load in urllib2, but don't sweat it if it's not available.
     pass
@@ -51,6 +69,7 @@ except ImportError:
 
 try:
     import requests
+    import requests.adapters
     from requests import Session as RequestsSession
 except ImportError:
     requests = None
@@ -85,14 +104,277 @@ try:
 except ImportError:
     urlfetch = None
 
+# - httpx is the preferred async HTTP library
+# - Fall back to aiohttp if it's there
+try:
+    import httpx
+    from httpx import Timeout as HTTPXTimeout
+except ImportError:
+    httpx = None
+
+try:
+    import brotli  # pyright: ignore
+except ImportError:
+    try:
+        import brotlicffi as brotli  # pyright: ignore
+    except ImportError:
+        brotli = None
+
+try:
+    import aiohttp
+    from aiohttp import ClientTimeout as AIOHTTPTimeout
+except ImportError:
+    aiohttp = None
+
 # proxy support for the pycurl client
-from urllib.parse import urlparse, ParseResult
+from urllib.parse import unquote, urlparse, urlsplit, ParseResult
 
 
 def _now_ms():
     return int(round(time.time() * 1000))
 
 
+def _accept_encoding() -> str:
+    """
+    The `Accept-Encoding` header value for the content encodings that every
+    client can decode.
+    """
+    encodings = ["gzip", "deflate"]
+    if brotli is not None:
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+class _ContentDecoder(object):
+    """
+    Incrementally decodes a response body according to its
+    `Content-Encoding`, applying each listed encoding in reverse.
+    """
+
+    def __init__(self, encodings: List[str]):
+        self._decoders = [self._new_decoder(e) for e in reversed(encodings)]
+        self._deflate_fallback = [e == "deflate" for e in reversed(encodings)]
+        self._started = [False] * len(self._decoders)
+
+    @classmethod
+    def for_headers(
+        cls, headers: Mapping[str, str]
+    ) -> Optional["_ContentDecoder"]:
+        """
+        Returns a decoder for a response with `headers` (lower-cased
+        names), or None if its body isn't encoded in a way we understand.
+        """
+        value = headers.get("content-encoding", "")
+        encodings = [
+            e.strip().lower()
+            for e in value.split(",")
+            if e.strip() and e.strip().lower() != "identity"
+        ]
+        supported = ("gzip", "x-gzip", "deflate") + (
+            ("br",) if brotli is not None else ()
+        )
+        if not encodings or any(e not in supported for e in encodings):
+            return None
+        return cls(encodings)
+
+    @staticmethod
+    def _new_decoder(encoding: str) -> Any:
+        if encoding in ("gzip", "x-gzip"):
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if encoding == "deflate":
+            return zlib.decompressobj()
+        assert brotli is not None
+        return brotli.Decompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        for i, decoder in enumerate(self._decoders):
+            if not data:
+                break
+            if self._deflate_fallback[i] and not self._started[i]:
+                # Some servers send raw deflate data without the zlib
+                # wrapper that "deflate" is supposed to mean.
+                try:
+                    data = decoder.decompress(data)
+                except zlib.error:
+                    decoder = self._decoders[i] = zlib.decompressobj(
+                        -zlib.MAX_WBITS
+                    )
+                    data = decoder.decompress(data)
+            elif hasattr(decoder, "decompress"):
+                data = decoder.decompress(data)
+            else:
+                data = decoder.process(data)
+            self._started[i] = True
+        return data
+
+    def flush(self) -> bytes:
+        data = b""
+        for decoder in self._decoders:
+            if data:
+                data = (
+                    decoder.decompress(data)
+                    if hasattr(decoder, "decompress")
+                    else decoder.process(data)
+                )
+            if hasattr(decoder, "flush"):
+                data += decoder.flush()
+        return data
+
+
+class _Timeout(object):
+    """
+    The timeouts for one attempt at a request, in seconds. `connect` and
+    `read` of None leave the client's own timeouts in place. `total` is
+    what's left of the request's deadline, if it has one.
+    """
+
+    def __init__(
+        self,
+        connect: Optional[float] = None,
+        read: Optional[float] = None,
+        total: Optional[float] = None,
+    ):
+        self.total = total
+        self.connect = self.cap(connect)
+        self.read = self.cap(read)
+
+    def cap(self, seconds: Optional[float]) -> Optional[float]:
+        """
+        `seconds`, cut down to what's left of the deadline.
+        """
+        if self.total is None:
+            return seconds
+        return min(seconds, self.total) if seconds is not None else self.total
+
+    @classmethod
+    def for_attempt(
+        cls,
+        timeout: Optional[Union[float, RequestTimeout]],
+        deadline_at: Optional[float],
+    ) -> Optional["_Timeout"]:
+        """
+        The timeouts for an attempt starting now, given the request's
+        `timeout` option and the `time.monotonic()` time its deadline falls
+        at. Raises an `APIConnectionError` if the deadline has passed.
+        """
+        total = None
+        if deadline_at is not None:
+            total = deadline_at - time.monotonic()
+            if total <= 0:
+                raise APIConnectionError(
+                    "The request's deadline passed before it could be made."
+                )
+        if timeout is None and total is None:
+            return None
+        if isinstance(timeout, dict):
+            return cls(timeout.get("connect"), timeout.get("read"), total)
+        return cls(timeout, timeout, total)
+
+    def split(
+        self,
+        default: Union[
+            Optional[float], Tuple[Optional[float], Optional[float]]
+        ],
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        `(connect, read)`, filled in from a client's `default` timeout, which
+        may itself be one number or a `(connect, read)` pair.
+        """
+        if isinstance(default, tuple):
+            default_connect, default_read = default
+        else:
+            default_connect = default_read = default
+        return (
+            self.connect if self.connect is not None else default_connect,
+            self.read if self.read is not None else default_read,
+        )
+
+
+class _SSLSocket(ssl.SSLSocket):
+    def close(self):
+        # With TLS 1.3 the resumable session ticket only arrives after the
+        # handshake, so look at the session again before letting go.
+        if isinstance(self.context, _SSLContext):
+            self.context._remember_session(self)
+        super(_SSLSocket, self).close()
+
+
+class _SSLContext(ssl.SSLContext):
+    """
+    An `ssl.SSLContext` shared by every connection the library opens. CA
+    bundles are only parsed the first time they're loaded, however many
+    connections ask for them, and the last TLS session seen for each host is
+    offered when connecting to it again so the handshake can be resumed.
+    """
+
+    sslsocket_class = _SSLSocket
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super(_SSLContext, self).__init__()
+        self._lock = threading.Lock()
+        self._verify_locations: Set[Tuple[Any, Any, Any]] = set()
+        self._sessions: Dict[str, ssl.SSLSession] = {}
+
+    def load_verify_locations(self, cafile=None, capath=None, cadata=None):
+        key = (cafile, capath, cadata)
+        with self._lock:
+            if key in self._verify_locations:
+                return
+            super(_SSLContext, self).load_verify_locations(
+                cafile, capath, cadata
+            )
+            self._verify_locations.add(key)
+
+    def wrap_socket(
+        self, sock, *args, server_hostname=None, session=None, **kwargs
+    ):
+        if session is None and server_hostname:
+            with self._lock:
+                session = self._sessions.get(server_hostname)
+        ssl_sock = super(_SSLContext, self).wrap_socket(
+            sock,
+            *args,
+            server_hostname=server_hostname,
+            session=session,
+            **kwargs,
+        )
+        self._remember_session(ssl_sock)
+        return ssl_sock
+
+    def _remember_session(self, ssl_sock: ssl.SSLSocket) -> None:
+        try:
+            session = ssl_sock.session
+        except (OSError, ValueError):
+            return
+        if session is not None and ssl_sock.server_hostname:
+            with self._lock:
+                self._sessions[ssl_sock.server_hostname] = session
+
+
+_ssl_contexts: Dict[Tuple[bool, str], ssl.SSLContext] = {}
+_ssl_contexts_lock = threading.Lock()
+
+
+def _shared_ssl_context(verify_ssl_certs: bool = True) -> ssl.SSLContext:
+    """
+    Returns the process-wide SSL context for connections to Stripe, which
+    verifies certificates against `stripe.ca_bundle_path` unless
+    `verify_ssl_certs` is false.
+    """
+    key = (verify_ssl_certs, stripe.ca_bundle_path)
+    with _ssl_contexts_lock:
+        context = _ssl_contexts.get(key)
+        if context is None:
+            context = _SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            if verify_ssl_certs:
+                context.load_verify_locations(cafile=stripe.ca_bundle_path)
+            else:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            _ssl_contexts[key] = context
+        return context
+
+
 def new_default_http_client(*args: Any, **kwargs: Any) -> "HTTPClient":
     if urlfetch:
         impl = UrlFetchClient
@@ -103,9 +385,38 @@ def new_default_http_client(*args: Any, **kwargs: Any) -> "HTTPClient":
     else:
         impl = Urllib2Client
 
+    if "async_fallback_client" not in kwargs:
+        kwargs["async_fallback_client"] = new_http_client_async_fallback(
+            **{
+                k: v
+                for k, v in kwargs.items()
+                if k in ("verify_ssl_certs", "proxy")
+            }
+        )
+
+    return impl(*args, **kwargs)
+
+
+def new_default_http_client_async(*args: Any, **kwargs: Any) -> "HTTPClient":
+    if httpx:
+        impl = HTTPXClient
+    elif aiohttp:
+        impl = AIOHTTPClient
+    else:
+        impl = NoImportFoundAsyncClient
+
     return impl(*args, **kwargs)
 
 
+def new_http_client_async_fallback(*args: Any, **kwargs: Any) -> "HTTPClient":
+    """
+    Returns the client that a synchronous `HTTPClient` hands its `*_async`
+    calls to, so that a single client can serve both the sync and the async
+    request paths.
+    """
+    return new_default_http_client_async(*args, **kwargs)
+
+
 class HTTPClientBase(object):
 
     name: ClassVar[str]
@@ -117,14 +428,33 @@ class HTTPClientBase(object):
     MAX_DELAY = 2
     INITIAL_DELAY = 0.5
     MAX_RETRY_AFTER = 60
+    # Whether the synchronous `request` methods accept a streamed multipart
+    # body as `post_data`, as well as bytes and strings.
+    _streams_uploads: ClassVar[bool] = False
     _proxy: Optional[_Proxy]
     _verify_ssl_certs: bool
+    _async_fallback_client: Optional["HTTPClient"]
+    _rate_limiter: Optional[RateLimiter]
+    _circuit_breaker: Optional[CircuitBreaker]
+    _hedging: Optional[HedgingPolicy]
 
     def __init__(
         self,
         verify_ssl_certs: bool = True,
         proxy: Optional[Union[str, _Proxy]] = None,
+        async_fallback_client: Optional["HTTPClient"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
     ):
+        """
+        :param rate_limiter: paces the requests made through this client,
+          across all the threads that share it. See `RateLimiter`.
+        :param circuit_breaker: stops requests to a base address that keeps
+          failing. See `CircuitBreaker`.
+        :param hedging: sends a second copy of `GET` requests that are slow
+          to be answered. See `HedgingPolicy`.
+        """
         self._verify_ssl_certs = verify_ssl_certs
         if proxy:
             if isinstance(proxy, str):
@@ -142,6 +472,10 @@ class HTTPClientBase(object):
                     " keys."
                 )
         self._proxy = proxy.copy() if proxy else None
+        self._async_fallback_client = async_fallback_client
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._hedging = hedging
 
         self._thread_local = threading.local()
 
@@ -182,6 +516,10 @@ class HTTPClientBase(object):
         if status_code == 409:
             return True
 
+        # Retry when rate limited, if we're pacing ourselves to avoid that.
+        if status_code == 429 and self._rate_limiter is not None:
+            return True
+
         # Retry on 500, 503, and other internal errors.
         #
         # Note that we expect the stripe-should-retry header to be false
@@ -229,6 +567,25 @@ class HTTPClientBase(object):
 
         return sleep_seconds
 
+    def _retry_fits_deadline(
+        self,
+        deadline_at: Optional[float],
+        attempt_seconds: float,
+        sleep_seconds: float,
+    ) -> bool:
+        # Another attempt is only worth it if the deadline leaves room for
+        # the backoff and for an attempt as long as the last one.
+        if deadline_at is None:
+            return True
+        remaining = deadline_at - time.monotonic()
+        if sleep_seconds + attempt_seconds < remaining:
+            return True
+        _util.log_info(
+            "Not retrying: %.2f seconds are left before the request's "
+            "deadline" % max(remaining, 0)
+        )
+        return False
+
     def _add_jitter_time(self, sleep_seconds: float):
         # Randomize the value in [(sleep_seconds/ 2) to (sleep_seconds)]
         # Also separated method here to isolate randomness for tests
@@ -259,6 +616,33 @@ class HTTPClientBase(object):
                 request_id, request_duration_ms, usage=usage
             )
 
+    def _before_circuit(self, url: str) -> Optional[Tuple[str, int]]:
+        if self._circuit_breaker is None:
+            return None
+        return self._circuit_breaker.before_request(url)
+
+    def _record_circuit(
+        self,
+        ticket: Optional[Tuple[str, int]],
+        response: Optional[Tuple[Any, int, Mapping[str, str]]],
+    ) -> None:
+        if self._circuit_breaker is None or ticket is None:
+            return
+        self._circuit_breaker.record(
+            ticket, response[1] if response is not None else None
+        )
+
+    def _record_rate_limit(
+        self,
+        ticket: Optional[Tuple[str, int]],
+        response: Optional[Tuple[Any, int, Mapping[str, str]]],
+    ) -> None:
+        if self._rate_limiter is None or ticket is None or response is None:
+            return
+        self._rate_limiter.record(
+            ticket, response[1], self._retry_after_header(response)
+        )
+
 
 class HTTPClient(HTTPClientBase):
     # TODO: more specific types here would be helpful
@@ -271,6 +655,8 @@ class HTTPClient(HTTPClientBase):
         max_network_retries: Optional[int] = None,
         *,
         _usage: Optional[List[str]] = None,
+        timeout: Optional[Union[float, RequestTimeout]] = None,
+        deadline: Optional[float] = None,
     ) -> Tuple[str, int, Mapping[str, str]]:
         return self._request_with_retries_internal(
             method,
@@ -280,6 +666,8 @@ class HTTPClient(HTTPClientBase):
             is_streaming=False,
             max_network_retries=max_network_retries,
             _usage=_usage,
+            timeout=timeout,
+            deadline=deadline,
         )
 
     def request_stream_with_retries(
@@ -291,6 +679,8 @@ class HTTPClient(HTTPClientBase):
         max_network_retries=None,
         *,
         _usage: Optional[List[str]] = None,
+        timeout: Optional[Union[float, RequestTimeout]] = None,
+        deadline: Optional[float] = None,
     ) -> Tuple[Any, int, Mapping[str, str]]:
         return self._request_with_retries_internal(
             method,
@@ -300,6 +690,8 @@ class HTTPClient(HTTPClientBase):
             is_streaming=True,
             max_network_retries=max_network_retries,
             _usage=_usage,
+            timeout=timeout,
+            deadline=deadline,
         )
 
     def _request_with_retries_internal(
@@ -312,36 +704,76 @@ class HTTPClient(HTTPClientBase):
         max_network_retries: Optional[int],
         *,
         _usage: Optional[List[str]] = None,
+        timeout: Optional[Union[float, RequestTimeout]] = None,
+        deadline: Optional[float] = None,
     ) -> Tuple[Any, int, Mapping[str, str]]:
         headers = self._add_telemetry_header(headers)
+        deadline_at = (
+            time.monotonic() + deadline if deadline is not None else None
+        )
 
         num_retries = 0
 
         while True:
+            # Checked first, so a request past its deadline gives up
+            # without holding up the circuit breaker or rate limiter.
+            attempt_timeout = _Timeout.for_attempt(timeout, deadline_at)
+            circuit_ticket = self._before_circuit(url)
+            ticket = (
+                self._rate_limiter.acquire(method)
+                if self._rate_limiter is not None
+                else None
+            )
             request_start = _now_ms()
+            attempt_start = time.monotonic()
 
             try:
-                if is_streaming:
-                    response = self.request_stream(
-                        method, url, headers, post_data
+                if self._hedging is not None and (
+                    not is_streaming and method.lower() == "get"
+                ):
+                    response = self._request_hedged(
+                        self._hedging,
+                        method,
+                        url,
+                        headers,
+                        post_data,
+                        attempt_timeout,
                     )
                 else:
-                    response = self.request(method, url, headers, post_data)
+                    response = self._request_once(
+                        method,
+                        url,
+                        headers,
+                        post_data,
+                        is_streaming,
+                        attempt_timeout,
+                    )
                 connection_error = None
             except APIConnectionError as e:
                 connection_error = e
                 response = None
 
-            if self._should_retry(
+            self._record_rate_limit(ticket, response)
+            self._record_circuit(circuit_ticket, response)
+
+            should_retry = self._should_retry(
                 response, connection_error, num_retries, max_network_retries
-            ):
+            )
+            sleep_time = 0.0
+            if should_retry:
+                sleep_time = self._sleep_time_seconds(
+                    num_retries + 1, response
+                )
+                should_retry = self._retry_fits_deadline(
+                    deadline_at, time.monotonic() - attempt_start, sleep_time
+                )
+            if should_retry:
                 if connection_error:
                     _util.log_info(
                         "Encountered a retryable error %s"
                         % connection_error.user_message
                     )
                 num_retries += 1
-                sleep_time = self._sleep_time_seconds(num_retries, response)
                 _util.log_info(
                     (
                         "Initiating retry %i for request %s %s after "
@@ -361,6 +793,70 @@ class HTTPClient(HTTPClientBase):
                     assert connection_error is not None
                     raise connection_error
 
+    def _request_once(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data: Any,
+        is_streaming: bool,
+        timeout: Optional[_Timeout],
+    ) -> Tuple[Any, int, Mapping[str, str]]:
+        # `timeout` is only passed when needed, so that custom clients whose
+        # `request` doesn't take it keep working.
+        if is_streaming:
+            if timeout is None:
+                return self.request_stream(method, url, headers, post_data)
+            return self.request_stream(
+                method, url, headers, post_data, timeout=timeout
+            )
+        if timeout is None:
+            return self.request(method, url, headers, post_data)
+        return self.request(method, url, headers, post_data, timeout=timeout)
+
+    def _request_hedged(
+        self,
+        hedging: HedgingPolicy,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data: Any,
+        timeout: Optional[_Timeout],
+    ) -> Tuple[str, int, Mapping[str, str]]:
+        hedging._start_request()
+        primary = hedging._submit(
+            self._request_once, method, url, headers, post_data, False, timeout
+        )
+        done, _ = futures.wait([primary], timeout=hedging.delay())
+        if done or not hedging._try_hedge():
+            return primary.result()
+
+        _util.log_info("Hedging slow request %s %s" % (method, url))
+        hedge = hedging._submit(
+            self._request_once, method, url, headers, post_data, False, timeout
+        )
+        pending = {primary, hedge}
+        error: Optional[APIConnectionError] = None
+        while pending:
+            done, pending = futures.wait(
+                pending, return_when=futures.FIRST_COMPLETED
+            )
+            for future in done:
+                try:
+                    response = future.result()
+                except APIConnectionError as e:
+                    # The other request may still succeed.
+                    error = error or e
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                if future is hedge:
+                    hedging._record_hedge_win()
+                return response
+
+        assert error is not None
+        raise error
+
     def request(
         self,
         method: str,
@@ -368,8 +864,13 @@ class HTTPClient(HTTPClientBase):
         headers: Optional[Mapping[str, str]],
         post_data: Any = None,
         *,
-        _usage: Optional[List[str]] = None
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[_Timeout] = None
     ) -> Tuple[str, int, Mapping[str, str]]:
+        """
+        Makes a single attempt at a request. `timeout` is only passed when
+        the request has its own timeouts or a deadline.
+        """
         raise NotImplementedError(
             "HTTPClient subclasses must implement `request`"
         )
@@ -381,7 +882,8 @@ class HTTPClient(HTTPClientBase):
         headers: Optional[Mapping[str, str]],
         post_data: Any = None,
         *,
-        _usage: Optional[List[str]] = None
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[_Timeout] = None
     ) -> Tuple[Any, int, Mapping[str, str]]:
         raise NotImplementedError(
             "HTTPClient subclasses must implement `request_stream`"
@@ -392,133 +894,665 @@ class HTTPClient(HTTPClientBase):
             "HTTPClient subclasses must implement `close`"
         )
 
+    def warm_up(self, url: str) -> None:
+        """
+        Opens a connection to `url` ahead of time, so that the first real
+        request to it doesn't have to wait for DNS, TCP and TLS set up. This
+        is done with a `HEAD` request, which leaves the connection pooled for
+        clients that pool connections. Failures are only logged: the next
+        request will simply connect as usual.
+        """
+        try:
+            self.request("head", url, {})
+        except (APIConnectionError, NotImplementedError) as e:
+            _util.log_info("Could not warm up connection to %s: %s" % (url, e))
 
-class RequestsClient(HTTPClient):
-    name = "requests"
-
-    def __init__(
-        self,
-        timeout: int = 80,
-        session: Optional["RequestsSession"] = None,
-        verify_ssl_certs: bool = True,
-        proxy: Optional[Union[str, HTTPClient._Proxy]] = None,
-        **kwargs
-    ):
-        super(RequestsClient, self).__init__(
-            verify_ssl_certs=verify_ssl_certs, proxy=proxy
-        )
-        self._session = session
-        self._timeout = timeout
-
-        assert requests is not None
-        self.requests = requests
-
-    def request(
+    async def request_with_retries_async(
         self,
         method: str,
         url: str,
-        headers: Optional[Mapping[str, str]],
+        headers: Mapping[str, str],
         post_data=None,
-    ) -> Tuple[bytes, int, Mapping[str, str]]:
-        return self._request_internal(
-            method, url, headers, post_data, is_streaming=False
+        max_network_retries: Optional[int] = None,
+        *,
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[Union[float, RequestTimeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[Any, int, Any]:
+        return await self._request_with_retries_internal_async(
+            method,
+            url,
+            headers,
+            post_data,
+            is_streaming=False,
+            max_network_retries=max_network_retries,
+            _usage=_usage,
+            timeout=timeout,
+            deadline=deadline,
         )
 
-    def request_stream(
+    async def request_stream_with_retries_async(
         self,
         method: str,
         url: str,
-        headers: Optional[Mapping[str, str]],
+        headers: Mapping[str, str],
         post_data=None,
-    ) -> Tuple[Any, int, Mapping[str, str]]:
-        return self._request_internal(
-            method, url, headers, post_data, is_streaming=True
+        max_network_retries=None,
+        *,
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[Union[float, RequestTimeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[AsyncIterable[bytes], int, Any]:
+        return await self._request_with_retries_internal_async(
+            method,
+            url,
+            headers,
+            post_data,
+            is_streaming=True,
+            max_network_retries=max_network_retries,
+            _usage=_usage,
+            timeout=timeout,
+            deadline=deadline,
         )
 
     @overload
-    def _request_internal(
+    async def _request_with_retries_internal_async(
         self,
         method: str,
         url: str,
-        headers: Optional[Mapping[str, str]],
+        headers: Mapping[str, str],
         post_data,
-        is_streaming: Literal[True],
+        is_streaming: Literal[False],
+        max_network_retries: Optional[int],
+        *,
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[Union[float, RequestTimeout]] = None,
+        deadline: Optional[float] = None,
     ) -> Tuple[Any, int, Mapping[str, str]]:
         ...
 
     @overload
-    def _request_internal(
+    async def _request_with_retries_internal_async(
         self,
         method: str,
         url: str,
-        headers: Optional[Mapping[str, str]],
+        headers: Mapping[str, str],
         post_data,
-        is_streaming: Literal[False],
-    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        is_streaming: Literal[True],
+        max_network_retries: Optional[int],
+        *,
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[Union[float, RequestTimeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[AsyncIterable[bytes], int, Mapping[str, str]]:
         ...
 
-    def _request_internal(
+    async def _request_with_retries_internal_async(
         self,
         method: str,
         url: str,
-        headers: Optional[Mapping[str, str]],
+        headers: Mapping[str, str],
         post_data,
         is_streaming: bool,
-    ) -> Tuple[Union[bytes, Any], int, Mapping[str, str]]:
-        kwargs = {}
-        if self._verify_ssl_certs:
-            kwargs["verify"] = stripe.ca_bundle_path
-        else:
-            kwargs["verify"] = False
-
-        if self._proxy:
-            kwargs["proxies"] = self._proxy
+        max_network_retries: Optional[int],
+        *,
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[Union[float, RequestTimeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[Any, int, Mapping[str, str]]:
+        headers = self._add_telemetry_header(headers)
+        deadline_at = (
+            time.monotonic() + deadline if deadline is not None else None
+        )
 
-        if is_streaming:
-            kwargs["stream"] = True
+        num_retries = 0
 
-        if getattr(self._thread_local, "session", None) is None:
-            self._thread_local.session = (
-                self._session or self.requests.Session()
+        while True:
+            # Checked first, so a request past its deadline gives up
+            # without holding up the circuit breaker or rate limiter.
+            attempt_timeout = _Timeout.for_attempt(timeout, deadline_at)
+            circuit_ticket = self._before_circuit(url)
+            ticket = (
+                await self._rate_limiter.acquire_async(method)
+                if self._rate_limiter is not None
+                else None
             )
+            request_start = _now_ms()
+            attempt_start = time.monotonic()
 
-        try:
             try:
-                result = cast(
-                    "RequestsSession", self._thread_local.session
-                ).request(
-                    method,
-                    url,
-                    headers=headers,
-                    data=post_data,
-                    timeout=self._timeout,
-                    **kwargs,
+                if self._hedging is not None and (
+                    not is_streaming and method.lower() == "get"
+                ):
+                    response = await self._request_hedged_async(
+                        self._hedging,
+                        method,
+                        url,
+                        headers,
+                        post_data,
+                        attempt_timeout,
+                    )
+                else:
+                    response = await self._request_once_async(
+                        method,
+                        url,
+                        headers,
+                        post_data,
+                        is_streaming,
+                        attempt_timeout,
+                    )
+                connection_error = None
+            except APIConnectionError as e:
+                connection_error = e
+                response = None
+
+            self._record_rate_limit(ticket, response)
+            self._record_circuit(circuit_ticket, response)
+
+            should_retry = self._should_retry(
+                response, connection_error, num_retries, max_network_retries
+            )
+            sleep_time = 0.0
+            if should_retry:
+                sleep_time = self._sleep_time_seconds(
+                    num_retries + 1, response
                 )
-            except TypeError as e:
-                raise TypeError(
-                    "Warning: It looks like your installed version of the "
-                    '"requests" library is not compatible with Stripe\'s '
-                    "usage thereof. (HINT: The most likely cause is that "
-                    'your "requests" library is out of date. You can fix '
-                    'that by running "pip install -U requests".) The '
-                    "underlying error was: %s" % (e,)
+                should_retry = self._retry_fits_deadline(
+                    deadline_at, time.monotonic() - attempt_start, sleep_time
                 )
-
-            if is_streaming:
-                content = result.raw
+            if should_retry:
+                if connection_error:
+                    _util.log_info(
+                        "Encountered a retryable error %s"
+                        % connection_error.user_message
+                    )
+                num_retries += 1
+                _util.log_info(
+                    (
+                        "Initiating retry %i for request %s %s after "
+                        "sleeping %.2f seconds."
+                        % (num_retries, method, url, sleep_time)
+                    )
+                )
+                await self.sleep_async(sleep_time)
             else:
-                # This causes the content to actually be read, which could cause
-                # e.g. a socket timeout. TODO: The other fetch methods probably
-                # are susceptible to the same and should be updated.
-                content = result.content
+                if response is not None:
+                    self._record_request_metrics(
+                        response, request_start, usage=_usage
+                    )
 
-            status_code = result.status_code
-        except Exception as e:
-            # Would catch just requests.exceptions.RequestException, but can
-            # also raise ValueError, RuntimeError, etc.
-            self._handle_request_error(e)
+                    return response
+                else:
+                    assert connection_error is not None
+                    raise connection_error
 
-        return content, status_code, result.headers
+    async def _request_once_async(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data: Any,
+        is_streaming: bool,
+        timeout: Optional[_Timeout],
+    ) -> Tuple[Any, int, Mapping[str, str]]:
+        # As with `_request_once`, `timeout` is only passed when needed.
+        if is_streaming:
+            if timeout is None:
+                return await self.request_stream_async(
+                    method, url, headers, post_data
+                )
+            return await self.request_stream_async(
+                method, url, headers, post_data, timeout=timeout
+            )
+        if timeout is None:
+            return await self.request_async(method, url, headers, post_data)
+        return await self.request_async(
+            method, url, headers, post_data, timeout=timeout
+        )
+
+    async def _request_hedged_async(
+        self,
+        hedging: HedgingPolicy,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data: Any,
+        timeout: Optional[_Timeout],
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Hedging relies on asyncio tasks, so e.g. trio goes unhedged.
+            return await self._request_once_async(
+                method, url, headers, post_data, False, timeout
+            )
+
+        async def timed_request() -> Tuple[bytes, int, Mapping[str, str]]:
+            start = time.monotonic()
+            response = await self._request_once_async(
+                method, url, headers, post_data, False, timeout
+            )
+            hedging.record_latency(time.monotonic() - start)
+            return response
+
+        hedging._start_request()
+        primary = asyncio.ensure_future(timed_request())
+        pending = {primary}
+        error: Optional[APIConnectionError] = None
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedging.delay())
+            if done or not hedging._try_hedge():
+                return await primary
+
+            _util.log_info("Hedging slow request %s %s" % (method, url))
+            hedge = asyncio.ensure_future(timed_request())
+            pending.add(hedge)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    try:
+                        response = task.result()
+                    except APIConnectionError as e:
+                        error = error or e
+                        continue
+                    if task is hedge:
+                        hedging._record_hedge_win()
+                    return response
+        finally:
+            # Whatever is still running lost, or we were cancelled.
+            for task in pending:
+                task.cancel()
+
+        assert error is not None
+        raise error
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data: Any = None,
+        *,
+        timeout: Optional[_Timeout] = None
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        if self._async_fallback_client is not None:
+            # Custom fallback clients may not take `timeout`.
+            if timeout is None:
+                return await self._async_fallback_client.request_async(
+                    method, url, headers, post_data
+                )
+            return await self._async_fallback_client.request_async(
+                method, url, headers, post_data, timeout=timeout
+            )
+        raise NotImplementedError(
+            "HTTPClient subclasses must implement `request_async`"
+        )
+
+    async def request_stream_async(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data: Any = None,
+        *,
+        timeout: Optional[_Timeout] = None
+    ) -> Tuple[AsyncIterable[bytes], int, Mapping[str, str]]:
+        if self._async_fallback_client is not None:
+            if timeout is None:
+                return await self._async_fallback_client.request_stream_async(
+                    method, url, headers, post_data
+                )
+            return await self._async_fallback_client.request_stream_async(
+                method, url, headers, post_data, timeout=timeout
+            )
+        raise NotImplementedError(
+            "HTTPClient subclasses must implement `request_stream_async`"
+        )
+
+    async def close_async(self):
+        if self._async_fallback_client is not None:
+            return await self._async_fallback_client.close_async()
+        raise NotImplementedError(
+            "HTTPClient subclasses must implement `close_async`"
+        )
+
+    async def sleep_async(self, secs: float):
+        await asyncio.sleep(secs)
+
+
+class RequestsClient(HTTPClient):
+    name = "requests"
+    _streams_uploads = True
+
+    class HostPoolStats(TypedDict):
+        maxsize: int
+        in_use: int
+        idle: int
+        num_connections: int
+        num_requests: int
+
+    class PoolStats(TypedDict):
+        in_flight: int
+        peak_in_flight: int
+        hosts: Dict[str, "RequestsClient.HostPoolStats"]
+
+    def __init__(
+        self,
+        timeout: int = 80,
+        session: Optional["RequestsSession"] = None,
+        verify_ssl_certs: bool = True,
+        proxy: Optional[Union[str, HTTPClient._Proxy]] = None,
+        async_fallback_client: Optional[HTTPClient] = None,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        pool_keepalive_expiry: Optional[float] = None,
+        pool_limits: Optional[Mapping[str, int]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        **kwargs
+    ):
+        """
+        All threads using this client share a single session, and with it a
+        single pool of connections per host.
+
+        :param pool_maxsize: the number of connections kept open per host.
+        :param pool_block: when every pooled connection to a host is in use,
+          wait for one to be released instead of opening an extra,
+          short-lived connection.
+        :param pool_keepalive_expiry: close idle connections to a host once
+          it has gone unused for this many seconds.
+        :param pool_limits: overrides `pool_maxsize` for specific base
+          addresses, e.g. `{stripe.upload_api_base: 2}`.
+
+        The pool options are ignored when a `session` is supplied, since
+        its adapters are already configured by the caller.
+        """
+        super(RequestsClient, self).__init__(
+            verify_ssl_certs=verify_ssl_certs,
+            proxy=proxy,
+            async_fallback_client=async_fallback_client,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+        )
+        self._session = session
+        self._timeout = timeout
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._pool_keepalive_expiry = pool_keepalive_expiry
+        self._pool_limits = dict(pool_limits or {})
+
+        self._shared_session: Optional["RequestsSession"] = None
+        self._pool_lock = threading.Lock()
+        self._hosts_last_used: Dict[str, float] = {}
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+        assert requests is not None
+        self.requests = requests
+
+    def _get_session(self) -> "RequestsSession":
+        if self._shared_session is None:
+            with self._pool_lock:
+                if self._shared_session is None:
+                    self._shared_session = (
+                        self._session or self._new_pooled_session()
+                    )
+        return self._shared_session
+
+    def _new_pooled_session(self) -> "RequestsSession":
+        session = self.requests.Session()
+        for prefix in ("https://", "http://"):
+            session.mount(prefix, self._new_adapter(10, self._pool_maxsize))
+        # requests picks the adapter with the longest matching prefix, so
+        # these take precedence over the defaults above.
+        for prefix, maxsize in self._pool_limits.items():
+            session.mount(prefix, self._new_adapter(1, maxsize))
+        return session
+
+    def _new_adapter(self, pool_connections: int, pool_maxsize: int):
+        adapter = self.requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=self._pool_block,
+        )
+        # Rebuild the pool manager so that its connections use the shared
+        # SSL context rather than each loading the CA bundle.
+        adapter.init_poolmanager(
+            pool_connections,
+            pool_maxsize,
+            block=self._pool_block,
+            ssl_context=_shared_ssl_context(self._verify_ssl_certs),
+        )
+        return adapter
+
+    def _expire_idle_connections(self, session, url: str) -> None:
+        parsed = urlsplit(url)
+        host = self._pool_name(
+            parsed.scheme,
+            parsed.hostname,
+            parsed.port or (443 if parsed.scheme == "https" else 80),
+        )
+        now = time.monotonic()
+        with self._pool_lock:
+            last_used = self._hosts_last_used.get(host)
+            self._hosts_last_used[host] = now
+        assert self._pool_keepalive_expiry is not None
+        if last_used is None or now - last_used <= self._pool_keepalive_expiry:
+            return
+
+        # Base addresses can share an adapter, so only the pools for this
+        # host are cleared.
+        for key, pool in self._iter_adapter_pools(session.get_adapter(url)):
+            if (
+                self._pool_name(key.key_scheme, key.key_host, pool.port)
+                != host
+            ):
+                continue
+            # Swap every idle connection in the pool's queue for an empty
+            # slot; connections checked out by other threads are left alone.
+            idle = []
+            while True:
+                try:
+                    idle.append(pool.pool.get_nowait())
+                except queue.Empty:
+                    break
+            for conn in idle:
+                if conn is not None:
+                    conn.close()
+                pool.pool.put_nowait(None)
+
+    @staticmethod
+    def _pool_name(scheme: str, host: Optional[str], port: int) -> str:
+        return "%s://%s:%s" % (scheme, host, port)
+
+    def _iter_adapter_pools(self, adapter):
+        managers = [getattr(adapter, "poolmanager", None)]
+        managers.extend(getattr(adapter, "proxy_manager", {}).values())
+        for manager in managers:
+            if manager is None:
+                continue
+            for key in manager.pools.keys():
+                pool = manager.pools.get(key)
+                if pool is not None and pool.pool is not None:
+                    yield key, pool
+
+    def pool_stats(self) -> "RequestsClient.PoolStats":
+        """
+        Returns a snapshot of connection pool occupancy, keyed by
+        `scheme://host:port`, along with the number of requests currently
+        in flight through this client.
+        """
+        hosts: Dict[str, RequestsClient.HostPoolStats] = {}
+        session = self._shared_session
+        adapters = list(session.adapters.values()) if session else []
+        for adapter in adapters:
+            for key, pool in self._iter_adapter_pools(adapter):
+                name = self._pool_name(key.key_scheme, key.key_host, pool.port)
+                available = list(pool.pool.queue)
+                idle = sum(1 for conn in available if conn is not None)
+                stats = hosts.setdefault(
+                    name,
+                    {
+                        "maxsize": 0,
+                        "in_use": 0,
+                        "idle": 0,
+                        "num_connections": 0,
+                        "num_requests": 0,
+                    },
+                )
+                stats["maxsize"] += pool.pool.maxsize
+                stats["in_use"] += pool.pool.maxsize - len(available)
+                stats["idle"] += idle
+                stats["num_connections"] += pool.num_connections
+                stats["num_requests"] += pool.num_requests
+
+        with self._pool_lock:
+            return {
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "hosts": hosts,
+            }
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        return self._request_internal(
+            method,
+            url,
+            headers,
+            post_data,
+            is_streaming=False,
+            timeout=timeout,
+        )
+
+    def request_stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[Any, int, Mapping[str, str]]:
+        return self._request_internal(
+            method,
+            url,
+            headers,
+            post_data,
+            is_streaming=True,
+            timeout=timeout,
+        )
+
+    @overload
+    def _request_internal(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        post_data,
+        is_streaming: Literal[True],
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[Any, int, Mapping[str, str]]:
+        ...
+
+    @overload
+    def _request_internal(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        post_data,
+        is_streaming: Literal[False],
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        ...
+
+    def _request_internal(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        post_data,
+        is_streaming: bool,
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[Union[bytes, Any], int, Mapping[str, str]]:
+        kwargs = {}
+        if self._verify_ssl_certs:
+            kwargs["verify"] = stripe.ca_bundle_path
+        else:
+            kwargs["verify"] = False
+
+        if self._proxy:
+            kwargs["proxies"] = self._proxy
+
+        if is_streaming:
+            kwargs["stream"] = True
+
+        session = self._get_session()
+        if self._pool_keepalive_expiry is not None:
+            self._expire_idle_connections(session, url)
+
+        with self._pool_lock:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            try:
+                result = session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=post_data,
+                    timeout=(
+                        timeout.split(self._timeout)
+                        if timeout is not None
+                        else self._timeout
+                    ),
+                    **kwargs,
+                )
+            except TypeError as e:
+                raise TypeError(
+                    "Warning: It looks like your installed version of the "
+                    '"requests" library is not compatible with Stripe\'s '
+                    "usage thereof. (HINT: The most likely cause is that "
+                    'your "requests" library is out of date. You can fix '
+                    'that by running "pip install -U requests".) The '
+                    "underlying error was: %s" % (e,)
+                )
+
+            if is_streaming:
+                content = result.raw
+                # requests only decodes `content`; have urllib3 decode the
+                # raw stream too, in case the body was sent compressed.
+                content.decode_content = True
+            else:
+                # This causes the content to actually be read, which could cause
+                # e.g. a socket timeout. TODO: The other fetch methods probably
+                # are susceptible to the same and should be updated.
+                content = result.content
+
+            status_code = result.status_code
+        except Exception as e:
+            # Would catch just requests.exceptions.RequestException, but can
+            # also raise ValueError, RuntimeError, etc.
+            self._handle_request_error(e)
+        finally:
+            with self._pool_lock:
+                self._in_flight -= 1
+
+        return content, status_code, result.headers
 
     def _handle_request_error(self, e) -> NoReturn:
         # Catch SSL error first as it belongs to ConnectionError,
@@ -574,8 +1608,11 @@ class RequestsClient(HTTPClient):
         raise APIConnectionError(msg, should_retry=should_retry)
 
     def close(self):
-        if getattr(self._thread_local, "session", None) is not None:
-            self._thread_local.session.close()
+        with self._pool_lock:
+            session, self._shared_session = self._shared_session, None
+            self._hosts_last_used.clear()
+        if session is not None:
+            session.close()
 
 
 class UrlFetchClient(HTTPClient):
@@ -586,9 +1623,18 @@ class UrlFetchClient(HTTPClient):
         verify_ssl_certs: bool = True,
         proxy: Optional[HTTPClient._Proxy] = None,
         deadline: int = 55,
+        async_fallback_client: Optional[HTTPClient] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
     ):
         super(UrlFetchClient, self).__init__(
-            verify_ssl_certs=verify_ssl_certs, proxy=proxy
+            verify_ssl_certs=verify_ssl_certs,
+            proxy=proxy,
+            async_fallback_client=async_fallback_client,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
         )
 
         # no proxy support in urlfetch. for a patch, see:
@@ -609,17 +1655,39 @@ class UrlFetchClient(HTTPClient):
         self.urlfetch = urlfetch
 
     def request(
-        self, method: str, url: str, headers: Mapping[str, str], post_data=None
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
     ) -> Tuple[str, int, Mapping[str, str]]:
         return self._request_internal(
-            method, url, headers, post_data, is_streaming=False
+            method,
+            url,
+            headers,
+            post_data,
+            is_streaming=False,
+            timeout=timeout,
         )
 
     def request_stream(
-        self, method: str, url: str, headers: Mapping[str, str], post_data=None
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
     ) -> Tuple[BytesIO, int, Mapping[str, str]]:
         return self._request_internal(
-            method, url, headers, post_data, is_streaming=True
+            method,
+            url,
+            headers,
+            post_data,
+            is_streaming=True,
+            timeout=timeout,
         )
 
     @overload
@@ -630,6 +1698,8 @@ class UrlFetchClient(HTTPClient):
         headers: Mapping[str, str],
         post_data,
         is_streaming: Literal[True],
+        *,
+        timeout: Optional[_Timeout] = None,
     ) -> Tuple[BytesIO, int, Any]:
         ...
 
@@ -641,6 +1711,8 @@ class UrlFetchClient(HTTPClient):
         headers: Mapping[str, str],
         post_data,
         is_streaming: Literal[False],
+        *,
+        timeout: Optional[_Timeout] = None,
     ) -> Tuple[str, int, Any]:
         ...
 
@@ -651,6 +1723,8 @@ class UrlFetchClient(HTTPClient):
         headers: Mapping[str, str],
         post_data,
         is_streaming,
+        *,
+        timeout: Optional[_Timeout] = None,
     ):
         try:
             result = self.urlfetch.fetch(
@@ -661,7 +1735,12 @@ class UrlFetchClient(HTTPClient):
                 # However, that's ok because the CA bundle they use recognizes
                 # api.stripe.com.
                 validate_certificate=self._verify_ssl_certs,
-                deadline=self._deadline,
+                # urlfetch only has an overall deadline for the request.
+                deadline=(
+                    timeout.total
+                    if timeout is not None and timeout.total is not None
+                    else self._deadline
+                ),
                 payload=post_data,
             )
         except self.urlfetch.Error as e:
@@ -704,27 +1783,218 @@ class UrlFetchClient(HTTPClient):
         pass
 
 
+class _PycurlStream(io.RawIOBase):
+    """
+    A streamed `PycurlClient` response body. The transfer is driven by a
+    `pycurl.CurlMulti` as the body is read, so chunks are handed out as they
+    arrive. At most `max_buffer_size` bytes are buffered ahead of the reader:
+    beyond that the transfer is paused until the reader catches up.
+    """
+
+    def __init__(self, client: "PycurlClient", curl, max_buffer_size: int):
+        super(_PycurlStream, self).__init__()
+        self._client = client
+        self._pycurl = client.pycurl
+        self._curl = curl
+        self._max_buffer_size = max_buffer_size
+        self._multi = None
+
+        self._chunks: Deque[bytes] = deque()
+        self._buffered = 0
+        self._paused = False
+        self._done = False
+        self._error = None
+        self._rcode: Optional[int] = None
+
+        self._status_line = b""
+        self._header_lines: List[bytes] = []
+        self._headers_done = False
+
+    def _header(self, line: bytes) -> None:
+        if line.startswith(b"HTTP/"):
+            # A new response, e.g. the final one after a `100 Continue`.
+            self._status_line = line
+            self._header_lines = []
+        elif line.strip():
+            self._header_lines.append(line)
+        else:
+            status = self._status_line.split(None, 2)[1:2]
+            if not status or not status[0].startswith(b"1"):
+                self._headers_done = True
+
+    def _write(self, data: bytes) -> Optional[int]:
+        if self._buffered >= self._max_buffer_size:
+            # libcurl hands the same data back once the transfer resumes.
+            self._paused = True
+            return self._pycurl.WRITEFUNC_PAUSE
+        self._chunks.append(data)
+        self._buffered += len(data)
+        return None
+
+    def _start(self) -> Tuple[int, bytes, List[bytes]]:
+        """
+        Starts the transfer and drives it until the response headers have
+        arrived, raising an `APIConnectionError` if it fails before then.
+        Returns the status code, status line and header lines.
+        """
+        multi = self._multi = self._pycurl.CurlMulti()
+        multi.add_handle(self._curl)
+        self._perform()
+        while not self._headers_done and not self._done:
+            multi.select(1.0)
+            self._perform()
+
+        if self._error is not None and not self._headers_done:
+            error = self._error
+            self.close()
+            self._client._handle_request_error(error)
+        if self._rcode is None:
+            self._rcode = self._curl.getinfo(self._pycurl.RESPONSE_CODE)
+        assert self._rcode is not None
+        return self._rcode, self._status_line, self._header_lines
+
+    def _perform(self) -> None:
+        assert self._multi is not None
+        try:
+            while True:
+                ret, _ = self._multi.perform()
+                if ret != self._pycurl.E_CALL_MULTI_PERFORM:
+                    break
+
+            _, succeeded, failed = self._multi.info_read()
+        except self._pycurl.error as e:
+            self._done = True
+            self._error = e
+        else:
+            if succeeded:
+                self._done = True
+            for _, errno, errmsg in failed:
+                self._done = True
+                self._error = self._pycurl.error(errno, errmsg)
+        if self._done:
+            self._release()
+
+    def _fill(self, size: int) -> None:
+        # Short reads are fine; never wait on more than the buffer can hold.
+        size = min(size, self._max_buffer_size)
+        while self._buffered < size and not self._done:
+            if self._paused:
+                self._paused = False
+                # Unpausing can deliver buffered data straight away.
+                self._curl.pause(self._pycurl.PAUSE_CONT)
+                continue
+            assert self._multi is not None
+            self._multi.select(1.0)
+            self._perform()
+
+    def _take(self, size: int) -> bytes:
+        out: List[bytes] = []
+        taken = 0
+        while self._chunks and taken < size:
+            chunk = self._chunks.popleft()
+            if taken + len(chunk) > size:
+                keep = size - taken
+                self._chunks.appendleft(chunk[keep:])
+                chunk = chunk[:keep]
+            out.append(chunk)
+            taken += len(chunk)
+        self._buffered -= taken
+
+        if not taken and self._error is not None:
+            error, self._error = self._error, None
+            self._client._handle_request_error(error)
+        return b"".join(out)
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            return self.readall()
+        self._fill(max(size, 1))
+        return self._take(size)
+
+    def readall(self) -> bytes:
+        out: List[bytes] = []
+        while True:
+            data = self.read(self._max_buffer_size)
+            if not data:
+                return b"".join(out)
+            out.append(data)
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def _release(self) -> None:
+        if self._multi is not None:
+            self._multi.remove_handle(self._curl)
+            self._multi.close()
+            self._multi = None
+            # A short body can complete before `_start` returns, so keep
+            # the status code around once the handle is gone.
+            if self._rcode is None:
+                self._rcode = self._curl.getinfo(self._pycurl.RESPONSE_CODE)
+            self._curl.close()
+
+    def close(self) -> None:
+        self._done = True
+        self._release()
+        super(_PycurlStream, self).close()
+
+
 class PycurlClient(HTTPClient):
     class _ParsedProxy(TypedDict, total=False):
         http: Optional[ParseResult]
         https: Optional[ParseResult]
 
     name = "pycurl"
+    _streams_uploads = True
     _parsed_proxy: Optional[_ParsedProxy]
 
+    _SHARED_LOCK_DATA: ClassVar[Tuple[str, ...]] = (
+        "LOCK_DATA_DNS",
+        "LOCK_DATA_SSL_SESSION",
+        "LOCK_DATA_CONNECT",
+    )
+
     def __init__(
         self,
         verify_ssl_certs: bool = True,
         proxy: Optional[HTTPClient._Proxy] = None,
+        async_fallback_client: Optional[HTTPClient] = None,
+        stream_buffer_size: int = 1024 * 1024,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
     ):
+        """
+        :param stream_buffer_size: the number of bytes of a streamed response
+          body buffered ahead of the reader; the transfer pauses when the
+          buffer is full and resumes as it's read.
+        """
         super(PycurlClient, self).__init__(
-            verify_ssl_certs=verify_ssl_certs, proxy=proxy
+            verify_ssl_certs=verify_ssl_certs,
+            proxy=proxy,
+            async_fallback_client=async_fallback_client,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
         )
 
         assert pycurl is not None
         self.pycurl = pycurl
-        # Initialize this within the object so that we can reuse connections.
-        self._curl = pycurl.Curl()
+        self._stream_buffer_size = stream_buffer_size
+
+        # Curl handles are not safe to share between threads, so each thread
+        # gets its own (see `_get_curl`). The handles all attach to this
+        # share object so that they still reuse each other's DNS lookups, TLS
+        # sessions, and (where libcurl supports it) open connections.
+        self._share = pycurl.CurlShare()
+        for lock_data in self._SHARED_LOCK_DATA:
+            if hasattr(pycurl, lock_data):
+                self._share.setopt(pycurl.SH_SHARE, getattr(pycurl, lock_data))
 
         self._parsed_proxy = {}
         # need to urlparse the proxy, since PyCurl
@@ -744,17 +2014,39 @@ class PycurlClient(HTTPClient):
         return dict((k.lower(), v) for k, v in dict(headers).items())
 
     def request(
-        self, method, url, headers: Mapping[str, str], post_data=None
+        self,
+        method,
+        url,
+        headers: Mapping[str, str],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
     ) -> Tuple[str, int, Mapping[str, str]]:
         return self._request_internal(
-            method, url, headers, post_data, is_streaming=False
+            method,
+            url,
+            headers,
+            post_data,
+            is_streaming=False,
+            timeout=timeout,
         )
 
     def request_stream(
-        self, method, url, headers: Mapping[str, str], post_data=None
-    ) -> Tuple[BytesIO, int, Mapping[str, str]]:
+        self,
+        method,
+        url,
+        headers: Mapping[str, str],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple["_PycurlStream", int, Mapping[str, str]]:
         return self._request_internal(
-            method, url, headers, post_data, is_streaming=True
+            method,
+            url,
+            headers,
+            post_data,
+            is_streaming=True,
+            timeout=timeout,
         )
 
     @overload
@@ -765,7 +2057,9 @@ class PycurlClient(HTTPClient):
         headers: Mapping[str, str],
         post_data,
         is_streaming: Literal[True],
-    ) -> Tuple[BytesIO, int, Any]:
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple["_PycurlStream", int, Any]:
         ...
 
     @overload
@@ -776,6 +2070,8 @@ class PycurlClient(HTTPClient):
         headers: Mapping[str, str],
         post_data,
         is_streaming: Literal[False],
+        *,
+        timeout: Optional[_Timeout] = None,
     ) -> Tuple[str, int, Mapping[str, str]]:
         ...
 
@@ -786,67 +2082,421 @@ class PycurlClient(HTTPClient):
         headers: Mapping[str, str],
         post_data,
         is_streaming,
-    ) -> Tuple[Union[str, BytesIO], int, Mapping[str, str]]:
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[Union[str, "_PycurlStream"], int, Mapping[str, str]]:
+        if is_streaming:
+            return self._request_stream_internal(
+                method, url, headers, post_data, timeout=timeout
+            )
+
+        curl = self._get_curl()
         b = _util.io.BytesIO()
         rheaders = _util.io.BytesIO()
 
-        # Pycurl's design is a little weird: although we set per-request
-        # options on this object, it's also capable of maintaining established
-        # connections. Here we call reset() between uses to make sure it's in a
-        # pristine state, but notably reset() doesn't reset connections, so we
-        # still get to take advantage of those by virtue of re-using the same
-        # object.
-        self._curl.reset()
+        self._setup_curl(
+            curl,
+            method,
+            url,
+            headers,
+            post_data,
+            b.write,
+            rheaders.write,
+            timeout=timeout,
+        )
 
-        proxy = self._get_proxy(url)
-        if proxy:
-            if proxy.hostname:
-                self._curl.setopt(self.pycurl.PROXY, proxy.hostname)
-            if proxy.port:
-                self._curl.setopt(self.pycurl.PROXYPORT, proxy.port)
+        try:
+            curl.perform()
+        except self.pycurl.error as e:
+            self._handle_request_error(e)
+
+        return self._build_response(curl, b, rheaders)
+
+    def _request_stream_internal(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data,
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple["_PycurlStream", int, Mapping[str, str]]:
+        # The transfer outlives this call, so it gets a handle of its own
+        # rather than tying up this thread's.
+        curl = self._new_curl()
+        stream = _PycurlStream(self, curl, self._stream_buffer_size)
+        self._setup_curl(
+            curl,
+            method,
+            url,
+            headers,
+            post_data,
+            stream._write,
+            stream._header,
+            timeout=timeout,
+        )
+        # Keeps a proxy's CONNECT response out of the headers, where pycurl
+        # has the option.
+        suppress = getattr(self.pycurl, "SUPPRESS_CONNECT_HEADERS", None)
+        if self._get_proxy(url) and suppress is not None:
+            curl.setopt(suppress, 1)
+
+        rcode, status_line, header_lines = stream._start()
+        rheaders = self.parse_headers(
+            (status_line + b"".join(header_lines)).decode("utf-8")
+        )
+        return stream, rcode, rheaders
+
+    def request_many_with_retries(
+        self,
+        requests: List[Tuple[str, str, Mapping[str, str], Any]],
+        max_network_retries: Optional[int] = None,
+        *,
+        max_concurrency: Optional[int] = None,
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[Union[float, RequestTimeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> List[Union[Tuple[str, int, Mapping[str, str]], APIConnectionError]]:
+        """
+        Performs `requests`, a list of `(method, url, headers, post_data)`
+        tuples, concurrently on the calling thread using a
+        `pycurl.CurlMulti`. Each request is retried following the same rules
+        as `request_with_retries`, and `timeout` and `deadline` apply to each
+        of them as they do there, with deadlines counted from this call.
+
+        Results are returned in input order. A request that ultimately fails
+        with a connection error has its `APIConnectionError` in place of the
+        response tuple.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        deadline_at = (
+            time.monotonic() + deadline if deadline is not None else None
+        )
+
+        results: List[
+            Optional[
+                Union[Tuple[str, int, Mapping[str, str]], APIConnectionError]
+            ]
+        ] = [None] * len(requests)
+        # (ready_at, index, num_retries), in the order they were queued.
+        waiting: List[Tuple[float, int, int]] = [
+            (0.0, i, 0) for i in range(len(requests))
+        ]
+        idle_handles: List[Any] = []
+        active: Dict[Any, "PycurlClient._MultiRequest"] = {}
+        # Rate limiter tickets taken for waiting requests, by index.
+        tickets: Dict[int, Tuple[Tuple[str, int], int]] = {}
+        limit = max_concurrency or len(requests)
+
+        multi = self.pycurl.CurlMulti()
+        try:
+            while waiting or active:
+                now = time.monotonic()
+                for entry in list(waiting):
+                    if len(active) >= limit:
+                        break
+                    ready_at, index, num_retries = entry
+                    if ready_at > now:
+                        continue
+                    waiting.remove(entry)
+
+                    try:
+                        attempt_timeout = _Timeout.for_attempt(
+                            timeout, deadline_at
+                        )
+                    except APIConnectionError as e:
+                        tickets.pop(index, None)
+                        results[index] = e
+                        continue
+                    method, url, headers, post_data = requests[index]
+                    if self._rate_limiter is not None:
+                        reserved = tickets.get(index)
+                        if reserved is None or (
+                            self._rate_limiter._paused_since(reserved[1])
+                        ):
+                            wait, ticket, pauses = self._rate_limiter._reserve(
+                                method
+                            )
+                            tickets[index] = (ticket, pauses)
+                            if wait > 0:
+                                waiting.append(
+                                    (now + wait, index, num_retries)
+                                )
+                                continue
+                    try:
+                        circuit_ticket = self._before_circuit(url)
+                    except CircuitBreakerOpenError as e:
+                        tickets.pop(index, None)
+                        results[index] = e
+                        continue
+                    curl = (
+                        idle_handles.pop()
+                        if idle_handles
+                        else self._new_curl()
+                    )
+                    pending = PycurlClient._MultiRequest(
+                        index=index,
+                        num_retries=num_retries,
+                        body=io.BytesIO(),
+                        headers=io.BytesIO(),
+                        start=_now_ms(),
+                        attempt_start=time.monotonic(),
+                        ticket=(
+                            tickets.pop(index)[0] if index in tickets else None
+                        ),
+                        circuit_ticket=circuit_ticket,
+                    )
+                    self._setup_curl(
+                        curl,
+                        method,
+                        url,
+                        self._add_telemetry_header(headers),
+                        post_data,
+                        pending["body"].write,
+                        pending["headers"].write,
+                        timeout=attempt_timeout,
+                    )
+                    active[curl] = pending
+                    multi.add_handle(curl)
+
+                if active:
+                    while True:
+                        ret, _ = multi.perform()
+                        if ret != self.pycurl.E_CALL_MULTI_PERFORM:
+                            break
+
+                    while True:
+                        num_queued, succeeded, failed = multi.info_read()
+                        finished = [(curl, None) for curl in succeeded] + [
+                            (curl, self.pycurl.error(errno, errmsg))
+                            for curl, errno, errmsg in failed
+                        ]
+                        for curl, error in finished:
+                            multi.remove_handle(curl)
+                            idle_handles.append(curl)
+                            retry_at = self._finish_multi_request(
+                                curl,
+                                active.pop(curl),
+                                requests,
+                                results,
+                                error,
+                                max_network_retries,
+                                deadline_at,
+                                _usage,
+                            )
+                            if retry_at is not None:
+                                waiting.append(retry_at)
+                        if num_queued == 0:
+                            break
+
+                    if active:
+                        multi.select(1.0)
+                elif waiting:
+                    time.sleep(
+                        max(
+                            0.0,
+                            min(entry[0] for entry in waiting)
+                            - time.monotonic(),
+                        )
+                    )
+        finally:
+            for curl in active:
+                multi.remove_handle(curl)
+            for curl in idle_handles + list(active):
+                curl.close()
+            multi.close()
+
+        return cast(
+            List[
+                Union[Tuple[str, int, Mapping[str, str]], APIConnectionError]
+            ],
+            results,
+        )
+
+    class _MultiRequest(TypedDict):
+        index: int
+        num_retries: int
+        body: BytesIO
+        headers: BytesIO
+        start: int
+        attempt_start: float
+        ticket: Optional[Tuple[str, int]]
+        circuit_ticket: Optional[Tuple[str, int]]
+
+    def _finish_multi_request(
+        self,
+        curl,
+        pending: "PycurlClient._MultiRequest",
+        requests: List[Tuple[str, str, Mapping[str, str], Any]],
+        results: List[Any],
+        error,
+        max_network_retries: Optional[int],
+        deadline_at: Optional[float],
+        usage: Optional[List[str]],
+    ) -> Optional[Tuple[float, int, int]]:
+        response = None
+        connection_error = None
+        try:
+            if error is not None:
+                self._handle_request_error(error)
+            response = self._build_response(
+                curl, pending["body"], pending["headers"]
+            )
+        except APIConnectionError as e:
+            connection_error = e
+
+        self._record_rate_limit(pending["ticket"], response)
+        self._record_circuit(pending["circuit_ticket"], response)
+        num_retries = pending["num_retries"]
+        should_retry = self._should_retry(
+            response, connection_error, num_retries, max_network_retries
+        )
+        sleep_time = 0.0
+        if should_retry:
+            sleep_time = self._sleep_time_seconds(num_retries + 1, response)
+            should_retry = self._retry_fits_deadline(
+                deadline_at,
+                time.monotonic() - pending["attempt_start"],
+                sleep_time,
+            )
+        if should_retry:
+            method, url, _, _ = requests[pending["index"]]
+            if connection_error:
+                _util.log_info(
+                    "Encountered a retryable error %s"
+                    % connection_error.user_message
+                )
+            num_retries += 1
+            _util.log_info(
+                (
+                    "Initiating retry %i for request %s %s after "
+                    "sleeping %.2f seconds."
+                    % (num_retries, method, url, sleep_time)
+                )
+            )
+            return (
+                time.monotonic() + sleep_time,
+                pending["index"],
+                num_retries,
+            )
+
+        if response is not None:
+            self._record_request_metrics(
+                response, pending["start"], usage=usage
+            )
+            results[pending["index"]] = response
+        else:
+            results[pending["index"]] = connection_error
+        return None
+
+    def _new_curl(self):
+        curl = self.pycurl.Curl()
+        curl.setopt(self.pycurl.SHARE, self._share)
+        return curl
+
+    def _get_curl(self):
+        curl = getattr(self._thread_local, "curl", None)
+        if curl is None:
+            # Pycurl's design is a little weird: although we set per-request
+            # options on this object, it's also capable of maintaining
+            # established connections. We call reset() between uses to make
+            # sure it's in a pristine state, but notably reset() doesn't
+            # reset connections, so we still get to take advantage of those
+            # by virtue of re-using the same object for this thread.
+            curl = self._thread_local.curl = self._new_curl()
+        return curl
+
+    def _setup_curl(
+        self,
+        curl,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data,
+        write_function: Callable[[bytes], Any],
+        header_function: Callable[[bytes], Any],
+        timeout: Optional[_Timeout] = None,
+    ) -> None:
+        # reset() leaves the handle attached to the share object.
+        curl.reset()
+
+        proxy = self._get_proxy(url)
+        if proxy:
+            if proxy.hostname:
+                curl.setopt(self.pycurl.PROXY, proxy.hostname)
+            if proxy.port:
+                curl.setopt(self.pycurl.PROXYPORT, proxy.port)
             if proxy.username or proxy.password:
-                self._curl.setopt(
+                curl.setopt(
                     self.pycurl.PROXYUSERPWD,
                     "%s:%s" % (proxy.username, proxy.password),
                 )
 
         if method == "get":
-            self._curl.setopt(self.pycurl.HTTPGET, 1)
+            curl.setopt(self.pycurl.HTTPGET, 1)
+        elif method == "head":
+            curl.setopt(self.pycurl.NOBODY, 1)
         elif method == "post":
-            self._curl.setopt(self.pycurl.POST, 1)
-            self._curl.setopt(self.pycurl.POSTFIELDS, post_data)
+            curl.setopt(self.pycurl.POST, 1)
+            if isinstance(post_data, _MultipartBody):
+                curl.setopt(self.pycurl.POSTFIELDSIZE_LARGE, len(post_data))
+                curl.setopt(self.pycurl.READFUNCTION, post_data.reader())
+                # Don't wait on a `100 Continue` before sending a large body.
+                headers = dict(headers, Expect="")
+            else:
+                curl.setopt(self.pycurl.POSTFIELDS, post_data)
         else:
-            self._curl.setopt(self.pycurl.CUSTOMREQUEST, method.upper())
+            curl.setopt(self.pycurl.CUSTOMREQUEST, method.upper())
 
         # pycurl doesn't like unicode URLs
-        self._curl.setopt(self.pycurl.URL, url)
-
-        self._curl.setopt(self.pycurl.WRITEFUNCTION, b.write)
-        self._curl.setopt(self.pycurl.HEADERFUNCTION, rheaders.write)
-        self._curl.setopt(self.pycurl.NOSIGNAL, 1)
-        self._curl.setopt(self.pycurl.CONNECTTIMEOUT, 30)
-        self._curl.setopt(self.pycurl.TIMEOUT, 80)
-        self._curl.setopt(
+        curl.setopt(self.pycurl.URL, url)
+
+        headers = dict(headers)
+        accept_encoding = [
+            k for k in headers.keys() if k.lower() == "accept-encoding"
+        ]
+        if accept_encoding:
+            # Hand compression to libcurl, which advertises the encodings it
+            # was built with and decodes the body as it arrives.
+            for k in accept_encoding:
+                del headers[k]
+            curl.setopt(self.pycurl.ACCEPT_ENCODING, "")
+
+        curl.setopt(self.pycurl.WRITEFUNCTION, write_function)
+        curl.setopt(self.pycurl.HEADERFUNCTION, header_function)
+        curl.setopt(self.pycurl.NOSIGNAL, 1)
+        curl.setopt(self.pycurl.CONNECTTIMEOUT, 30)
+        curl.setopt(self.pycurl.TIMEOUT, 80)
+        if timeout is not None:
+            if timeout.connect is not None:
+                curl.setopt(
+                    self.pycurl.CONNECTTIMEOUT_MS, int(timeout.connect * 1000)
+                )
+            if timeout.read is not None:
+                # libcurl has no read timeout as such, but aborting once
+                # nothing at all arrives for that long amounts to one.
+                curl.setopt(self.pycurl.LOW_SPEED_LIMIT, 1)
+                curl.setopt(
+                    self.pycurl.LOW_SPEED_TIME, max(1, int(timeout.read))
+                )
+            if timeout.total is not None:
+                curl.setopt(self.pycurl.TIMEOUT_MS, int(timeout.total * 1000))
+        curl.setopt(
             self.pycurl.HTTPHEADER,
             ["%s: %s" % (k, v) for k, v in iter(dict(headers).items())],
         )
         if self._verify_ssl_certs:
-            self._curl.setopt(self.pycurl.CAINFO, stripe.ca_bundle_path)
+            curl.setopt(self.pycurl.CAINFO, stripe.ca_bundle_path)
         else:
-            self._curl.setopt(self.pycurl.SSL_VERIFYHOST, False)
-
-        try:
-            self._curl.perform()
-        except self.pycurl.error as e:
-            self._handle_request_error(e)
+            curl.setopt(self.pycurl.SSL_VERIFYHOST, False)
 
-        if is_streaming:
-            b.seek(0)
-            rcontent = b
-        else:
-            rcontent = b.getvalue().decode("utf-8")
+    def _build_response(
+        self, curl, b: BytesIO, rheaders: BytesIO
+    ) -> Tuple[str, int, Mapping[str, str]]:
+        rcontent = b.getvalue().decode("utf-8")
 
-        rcode = self._curl.getinfo(self.pycurl.RESPONSE_CODE)
+        rcode = curl.getinfo(self.pycurl.RESPONSE_CODE)
         headers = self.parse_headers(rheaders.getvalue().decode("utf-8"))
 
         return rcontent, rcode, headers
@@ -895,42 +2545,190 @@ class PycurlClient(HTTPClient):
         return None
 
     def close(self):
-        pass
+        curl = getattr(self._thread_local, "curl", None)
+        if curl is not None:
+            curl.close()
+            self._thread_local.curl = None
+
+
+class _HTTPConnectionPool(object):
+    """
+    A thread-safe pool of idle keep-alive `http.client` connections, keyed by
+    scheme, host, port and proxy.
+    """
+
+    _Key = Tuple[str, str, int, Optional[str]]
+
+    def __init__(self, maxsize: int = 10):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._idle: Dict[
+            "_HTTPConnectionPool._Key", List[httpclient.HTTPConnection]
+        ] = {}
+
+    def get(
+        self,
+        key: "_HTTPConnectionPool._Key",
+        new_connection: Callable[[], httpclient.HTTPConnection],
+    ) -> Tuple[httpclient.HTTPConnection, bool]:
+        """
+        Returns an idle connection for `key` if there's a usable one, and a
+        fresh one from `new_connection` otherwise, along with whether the
+        connection is being reused.
+        """
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                conn = idle.pop() if idle else None
+            if conn is None:
+                return new_connection(), False
+            if not self._is_dropped(conn):
+                return conn, True
+            conn.close()
+
+    def put(
+        self, key: "_HTTPConnectionPool._Key", conn: httpclient.HTTPConnection
+    ) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+    @staticmethod
+    def _is_dropped(conn: httpclient.HTTPConnection) -> bool:
+        # An idle keep-alive connection has nothing to read, so a readable
+        # socket means the server has closed it (or sent something
+        # unexpected) and it can't be reused.
+        sock = conn.sock
+        if sock is None:
+            return True
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+
+class _PooledHTTPResponse(object):
+    """
+    Wraps a streamed `http.client.HTTPResponse`, decoding its body as it's
+    read if it was sent compressed, and hands its connection back to the
+    pool once the body has been read to the end.
+    """
+
+    def __init__(
+        self,
+        response: HTTPResponse,
+        release: Callable[[bool], None],
+        decoder: Optional[_ContentDecoder] = None,
+    ):
+        self._response = response
+        self._release = release
+        self._released = False
+        self._decoder = decoder
+        self._decoded = b""
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        if self._decoder is None:
+            data = self._response.read(amt)
+            if self._response.isclosed():
+                self._release_connection(reusable=True)
+            return data
+
+        while not self._released and (amt is None or len(self._decoded) < amt):
+            data = self._response.read(amt)
+            self._decoded += self._decoder.decompress(data)
+            if not data or self._response.isclosed():
+                self._decoded += self._decoder.flush()
+                self._release_connection(reusable=True)
+
+        if amt is None:
+            data, self._decoded = self._decoded, b""
+        else:
+            data, self._decoded = self._decoded[:amt], self._decoded[amt:]
+        return data
+
+    def close(self) -> None:
+        # A connection with unread body left on it can't be reused.
+        reusable = self._response.isclosed()
+        self._response.close()
+        self._release_connection(reusable=reusable)
+
+    def _release_connection(self, reusable: bool) -> None:
+        if not self._released:
+            self._released = True
+            self._release(reusable)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
 
 
 class Urllib2Client(HTTPClient):
     name = "urllib.request"
+    _streams_uploads = True
 
     def __init__(
         self,
         verify_ssl_certs: bool = True,
         proxy: Optional[HTTPClient._Proxy] = None,
+        async_fallback_client: Optional[HTTPClient] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
     ):
         super(Urllib2Client, self).__init__(
-            verify_ssl_certs=verify_ssl_certs, proxy=proxy
+            verify_ssl_certs=verify_ssl_certs,
+            proxy=proxy,
+            async_fallback_client=async_fallback_client,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
         )
-        # prepare and cache proxy tied opener here
-        self._opener = None
-        if self._proxy:
-            # We have to cast _Proxy to Dict[str, str] because pyright is not smart enough to
-            # realize that all the value types are str.
-            proxy_handler = urllibrequest.ProxyHandler(
-                cast(Dict[str, str], self._proxy)
-            )
-            self._opener = urllibrequest.build_opener(proxy_handler)
+        self._pool = _HTTPConnectionPool()
 
     def request(
-        self, method: str, url: str, headers: Mapping[str, str], post_data=None
-    ) -> Tuple[str, int, Mapping[str, str]]:
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
         return self._request_internal(
-            method, url, headers, post_data, is_streaming=False
+            method,
+            url,
+            headers,
+            post_data,
+            is_streaming=False,
+            timeout=timeout,
         )
 
     def request_stream(
-        self, method: str, url: str, headers: Mapping[str, str], post_data=None
-    ) -> Tuple[HTTPResponse, int, Mapping[str, str]]:
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[_PooledHTTPResponse, int, Mapping[str, str]]:
         return self._request_internal(
-            method, url, headers, post_data, is_streaming=True
+            method,
+            url,
+            headers,
+            post_data,
+            is_streaming=True,
+            timeout=timeout,
         )
 
     @overload
@@ -941,7 +2739,9 @@ class Urllib2Client(HTTPClient):
         headers: Mapping[str, str],
         post_data,
         is_streaming: Literal[False],
-    ) -> Tuple[str, int, Any]:
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[bytes, int, Any]:
         ...
 
     @overload
@@ -952,7 +2752,9 @@ class Urllib2Client(HTTPClient):
         headers: Mapping[str, str],
         post_data,
         is_streaming: Literal[True],
-    ) -> Tuple[HTTPResponse, int, Any]:
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[_PooledHTTPResponse, int, Any]:
         ...
 
     def _request_internal(
@@ -962,41 +2764,142 @@ class Urllib2Client(HTTPClient):
         headers: Mapping[str, str],
         post_data,
         is_streaming,
+        *,
+        timeout: Optional[_Timeout] = None,
     ):
         if isinstance(post_data, str):
             post_data = post_data.encode("utf-8")
 
-        req = urllibrequest.Request(
-            url, post_data, cast(MutableMapping[str, str], headers)
-        )
-
-        if method not in ("get", "post"):
-            req.get_method = lambda: method.upper()
-
         try:
-            # use the custom proxy tied opener, if any.
-            # otherwise, fall to the default urllib opener.
-            response = (
-                self._opener.open(req)
-                if self._opener
-                else urllibrequest.urlopen(req)
+            parsed = urlsplit(url)
+            scheme = parsed.scheme
+            host = parsed.hostname or ""
+            port = parsed.port or (443 if scheme == "https" else 80)
+        except ValueError as e:
+            self._handle_request_error(e)
+
+        # Everything after the authority, exactly as given.
+        authority = "%s://%s" % (scheme, parsed.netloc)
+        path = url.replace(authority, "", 1) or "/"
+        request_headers = dict(headers)
+
+        proxy = self._get_proxy(scheme, host)
+        proxy_headers = {}
+        if proxy and (proxy.username or proxy.password):
+            credentials = "%s:%s" % (
+                unquote(proxy.username or ""),
+                unquote(proxy.password or ""),
             )
+            proxy_headers["Proxy-Authorization"] = "Basic %s" % (
+                base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+            )
+        if proxy and scheme == "http":
+            # Plain HTTP goes straight to the proxy with an absolute URL;
+            # HTTPS is tunnelled through it with CONNECT instead.
+            path = url
+            request_headers.update(proxy_headers)
 
-            if is_streaming:
-                rcontent = response
+        if proxy:
+            connect_host, connect_port = proxy.hostname or "", proxy.port or 80
+        else:
+            connect_host, connect_port = host, port
+
+        def new_connection() -> httpclient.HTTPConnection:
+            conn: httpclient.HTTPConnection
+            if scheme == "https":
+                conn = httpclient.HTTPSConnection(
+                    connect_host,
+                    connect_port,
+                    context=self._get_ssl_context(),
+                )
+                if proxy:
+                    conn.set_tunnel(host, port, headers=proxy_headers)
             else:
-                rcontent = response.read()
-
-            rcode = response.code
-            headers = dict(response.info())
-        except urlliberror.HTTPError as e:
-            rcode = e.code
-            rcontent = e.read()
-            headers = dict(e.info())
-        except (urlliberror.URLError, ValueError) as e:
+                conn = httpclient.HTTPConnection(connect_host, connect_port)
+            return conn
+
+        # Pooled connections keep whatever timeouts they were last given, so
+        # they're set for every request, even when it doesn't have any.
+        connect_timeout, read_timeout = (
+            timeout.split(socket.getdefaulttimeout())
+            if timeout is not None
+            else (socket.getdefaulttimeout(), socket.getdefaulttimeout())
+        )
+        key = (scheme, host, port, proxy.geturl() if proxy else None)
+        while True:
+            conn, reused = self._pool.get(key, new_connection)
+            try:
+                conn.timeout = connect_timeout
+                if conn.sock is None:
+                    conn.connect()
+                assert conn.sock is not None
+                conn.sock.settimeout(read_timeout)
+                conn.request(
+                    method.upper(),
+                    path,
+                    body=post_data,
+                    headers=request_headers,
+                )
+            except (ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                # The server closed an idle connection after we checked it,
+                # so it refused the request as it was being written, and
+                # another connection can be tried.
+                if reused:
+                    continue
+                self._handle_request_error(e)
+            except (OSError, httpclient.HTTPException, ValueError) as e:
+                conn.close()
+                self._handle_request_error(e)
+            break
+
+        try:
+            # Once the request has been written, the server may have acted
+            # on it, so failing to get the response is left to the retry
+            # policy rather than retried here.
+            response = conn.getresponse()
+        except (OSError, httpclient.HTTPException, ValueError) as e:
+            conn.close()
             self._handle_request_error(e)
-        lh = dict((k.lower(), v) for k, v in iter(dict(headers).items()))
-        return rcontent, rcode, lh
+
+        def release(reusable: bool) -> None:
+            if reusable and not response.will_close:
+                self._pool.put(key, conn)
+            else:
+                conn.close()
+
+        lh = dict((k.lower(), v) for k, v in response.getheaders())
+        decoder = _ContentDecoder.for_headers(lh)
+
+        rcontent: Union[bytes, _PooledHTTPResponse]
+        if is_streaming:
+            rcontent = _PooledHTTPResponse(response, release, decoder)
+        else:
+            try:
+                body = response.read()
+                if decoder is not None:
+                    body = decoder.decompress(body) + decoder.flush()
+            except (OSError, httpclient.HTTPException, zlib.error) as e:
+                conn.close()
+                self._handle_request_error(e)
+            release(reusable=True)
+            rcontent = body
+
+        return rcontent, response.status, lh
+
+    def _get_proxy(self, scheme: str, host: str) -> Optional[ParseResult]:
+        if self._proxy:
+            proxy = cast(Optional[str], self._proxy.get(scheme))
+        elif urllibrequest.proxy_bypass(host):
+            proxy = None
+        else:
+            # Like urllib's default opener, fall back to the proxies
+            # configured in the environment.
+            proxy = urllibrequest.getproxies().get(scheme)
+        return urlparse(proxy) if proxy else None
+
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        return _shared_ssl_context(self._verify_ssl_certs)
 
     def _handle_request_error(self, e) -> NoReturn:
         msg = (
@@ -1006,5 +2909,473 @@ class Urllib2Client(HTTPClient):
         msg = textwrap.fill(msg) + "\n\n(Network error: " + str(e) + ")"
         raise APIConnectionError(msg)
 
+    def close(self):
+        self._pool.clear()
+
+
+class HTTPXClient(HTTPClient):
+    name = "httpx"
+
+    def __init__(
+        self,
+        timeout: Optional[Union[float, "HTTPXTimeout"]] = 80,
+        verify_ssl_certs: bool = True,
+        proxy: Optional[Union[str, HTTPClient._Proxy]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        **kwargs
+    ):
+        super(HTTPXClient, self).__init__(
+            verify_ssl_certs=verify_ssl_certs,
+            proxy=proxy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+        )
+
+        if httpx is None:
+            raise ImportError(
+                "Unexpected: tried to initialize HTTPXClient but the httpx "
+                "module is not present."
+            )
+
+        self.httpx = httpx
+        self._timeout = timeout
+
+        # Building the client loads the CA bundle, which is wasted work for
+        # the many processes that only ever use this as an async fallback and
+        # never make an async request, so this is initialized lazily.
+        self._client_async: Optional[Any] = None
+
+    def _get_client_async(self) -> Any:
+        if self._client_async is not None:
+            return self._client_async
+
+        kwargs: Dict[str, Any] = {}
+        if self._verify_ssl_certs:
+            kwargs["verify"] = _shared_ssl_context()
+        else:
+            kwargs["verify"] = False
+
+        if self._proxy:
+            kwargs["mounts"] = {
+                "%s://"
+                % scheme: self.httpx.AsyncHTTPTransport(
+                    proxy=self.httpx.Proxy(cast(str, url)),
+                    verify=kwargs["verify"],
+                )
+                for scheme, url in self._proxy.items()
+                if url
+            }
+
+        self._client_async = self.httpx.AsyncClient(**kwargs)
+        return self._client_async
+
+    def _get_request_args_kwargs(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data,
+        timeout: Optional[_Timeout],
+    ):
+        kwargs: Dict[str, Any] = {
+            "headers": headers,
+            "timeout": self._get_timeout(timeout),
+        }
+        if post_data is not None:
+            kwargs["content"] = post_data
+        return [method.upper(), url], kwargs
+
+    def _get_timeout(self, timeout: Optional[_Timeout]):
+        if timeout is None:
+            return self._timeout
+        default = self.httpx.Timeout(self._timeout)
+        connect, read = timeout.split((default.connect, default.read))
+        return self.httpx.Timeout(
+            connect=connect,
+            read=read,
+            write=timeout.cap(default.write),
+            pool=timeout.cap(default.pool),
+        )
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        args, kwargs = self._get_request_args_kwargs(
+            method, url, headers, post_data, timeout
+        )
+        try:
+            response = await self._get_client_async().request(*args, **kwargs)
+        except Exception as e:
+            self._handle_request_error(e)
+
+        content = response.content
+        status_code = response.status_code
+        response_headers = response.headers
+        return content, status_code, response_headers
+
+    async def request_stream_async(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[AsyncIterable[bytes], int, Mapping[str, str]]:
+        args, kwargs = self._get_request_args_kwargs(
+            method, url, headers, post_data, timeout
+        )
+        client = self._get_client_async()
+        try:
+            response = await client.send(
+                request=client.build_request(*args, **kwargs),
+                stream=True,
+            )
+        except Exception as e:
+            self._handle_request_error(e)
+
+        async def content():
+            try:
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+            finally:
+                await response.aclose()
+
+        return content(), response.status_code, response.headers
+
+    def _handle_request_error(self, e) -> NoReturn:
+        # Retry only timeout and connect errors; similar to urllib3 Retry
+        if isinstance(
+            e, (self.httpx.TimeoutException, self.httpx.ConnectError)
+        ):
+            msg = (
+                "Unexpected error communicating with Stripe.  "
+                "If this problem persists, let us know at "
+                "support@stripe.com."
+            )
+            err = "%s: %s" % (type(e).__name__, str(e))
+            should_retry = True
+        elif isinstance(e, self.httpx.HTTPError):
+            msg = (
+                "Unexpected error communicating with Stripe.  "
+                "If this problem persists, let us know at "
+                "support@stripe.com."
+            )
+            err = "%s: %s" % (type(e).__name__, str(e))
+            should_retry = False
+        else:
+            msg = (
+                "Unexpected error communicating with Stripe. "
+                "It looks like there's probably a configuration "
+                "issue locally.  If this problem persists, let us "
+                "know at support@stripe.com."
+            )
+            err = "A %s was raised" % (type(e).__name__,)
+            if str(e):
+                err += " with error message %s" % (str(e),)
+            else:
+                err += " with no error message"
+            should_retry = False
+
+        msg = textwrap.fill(msg) + "\n\n(Network error: %s)" % (err,)
+        raise APIConnectionError(msg, should_retry=should_retry)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        post_data: Any = None,
+        *,
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[_Timeout] = None
+    ) -> Tuple[str, int, Mapping[str, str]]:
+        raise NotImplementedError(
+            "HTTPXClient does not support synchronous requests. Use "
+            "`request_async` instead, or pick a synchronous client such as "
+            "RequestsClient."
+        )
+
+    def request_stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        post_data: Any = None,
+        *,
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[_Timeout] = None
+    ) -> Tuple[Any, int, Mapping[str, str]]:
+        raise NotImplementedError(
+            "HTTPXClient does not support synchronous requests. Use "
+            "`request_stream_async` instead, or pick a synchronous client "
+            "such as RequestsClient."
+        )
+
+    def close(self):
+        pass
+
+    async def close_async(self):
+        if self._client_async is not None:
+            await self._client_async.aclose()
+
+
+class AIOHTTPClient(HTTPClient):
+    name = "aiohttp"
+
+    def __init__(
+        self,
+        timeout: Optional[Union[float, "AIOHTTPTimeout"]] = 80,
+        verify_ssl_certs: bool = True,
+        proxy: Optional[Union[str, HTTPClient._Proxy]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        **kwargs
+    ):
+        super(AIOHTTPClient, self).__init__(
+            verify_ssl_certs=verify_ssl_certs,
+            proxy=proxy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+        )
+
+        if aiohttp is None:
+            raise ImportError(
+                "Unexpected: tried to initialize AIOHTTPClient but the "
+                "aiohttp module is not present."
+            )
+
+        self.aiohttp = aiohttp
+        if isinstance(timeout, (int, float)):
+            timeout = self.aiohttp.ClientTimeout(total=timeout)
+        self._timeout = timeout
+
+        if self._verify_ssl_certs:
+            self._ssl: Union[ssl.SSLContext, bool] = _shared_ssl_context()
+        else:
+            self._ssl = False
+
+        # aiohttp sessions must be created from within a running event loop,
+        # so this is initialized lazily on the first request.
+        self._session: Optional[Any] = None
+
+    def _get_session(self) -> Any:
+        if self._session is None or self._session.closed:
+            self._session = self.aiohttp.ClientSession(
+                connector=self.aiohttp.TCPConnector(ssl=self._ssl),
+                timeout=self._timeout,
+            )
+        return self._session
+
+    def _get_request_args_kwargs(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data,
+        timeout: Optional[_Timeout],
+    ):
+        kwargs: Dict[str, Any] = {"headers": headers, "data": post_data}
+        if timeout is not None:
+            default = self._timeout or self.aiohttp.ClientTimeout()
+            connect, read = timeout.split(
+                (default.sock_connect, default.sock_read)
+            )
+            kwargs["timeout"] = self.aiohttp.ClientTimeout(
+                total=timeout.cap(default.total),
+                connect=default.connect,
+                sock_connect=connect,
+                sock_read=read,
+            )
+        if self._proxy:
+            if self._proxy["http"] != self._proxy["https"]:
+                raise ValueError(
+                    "AIOHTTPClient does not support different proxies for "
+                    "HTTP and HTTPS."
+                )
+            kwargs["proxy"] = self._proxy["https"]
+        return [method.upper(), url], kwargs
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        (
+            content,
+            status_code,
+            response_headers,
+        ) = await self.request_stream_async(
+            method, url, headers, post_data, timeout=timeout
+        )
+
+        return (
+            b"".join([chunk async for chunk in content]),
+            status_code,
+            response_headers,
+        )
+
+    async def request_stream_async(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data=None,
+        *,
+        timeout: Optional[_Timeout] = None,
+    ) -> Tuple[AsyncIterable[bytes], int, Mapping[str, str]]:
+        args, kwargs = self._get_request_args_kwargs(
+            method, url, headers, post_data, timeout
+        )
+        try:
+            response = await self._get_session().request(*args, **kwargs)
+        except Exception as e:
+            self._handle_request_error(e)
+
+        async def content():
+            try:
+                async for chunk in response.content.iter_any():
+                    yield chunk
+            except Exception as e:
+                self._handle_request_error(e)
+            finally:
+                response.release()
+
+        return content(), response.status, response.headers
+
+    def _handle_request_error(self, e) -> NoReturn:
+        if isinstance(
+            e,
+            (
+                self.aiohttp.ClientConnectionError,
+                asyncio.TimeoutError,
+            ),
+        ) and not isinstance(e, self.aiohttp.ClientSSLError):
+            msg = (
+                "Unexpected error communicating with Stripe.  "
+                "If this problem persists, let us know at "
+                "support@stripe.com."
+            )
+            err = "%s: %s" % (type(e).__name__, str(e))
+            should_retry = True
+        elif isinstance(e, self.aiohttp.ClientError):
+            msg = (
+                "Unexpected error communicating with Stripe.  "
+                "If this problem persists, let us know at "
+                "support@stripe.com."
+            )
+            err = "%s: %s" % (type(e).__name__, str(e))
+            should_retry = False
+        else:
+            msg = (
+                "Unexpected error communicating with Stripe. "
+                "It looks like there's probably a configuration "
+                "issue locally.  If this problem persists, let us "
+                "know at support@stripe.com."
+            )
+            err = "A %s was raised" % (type(e).__name__,)
+            if str(e):
+                err += " with error message %s" % (str(e),)
+            else:
+                err += " with no error message"
+            should_retry = False
+
+        msg = textwrap.fill(msg) + "\n\n(Network error: %s)" % (err,)
+        raise APIConnectionError(msg, should_retry=should_retry)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        post_data: Any = None,
+        *,
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[_Timeout] = None
+    ) -> Tuple[str, int, Mapping[str, str]]:
+        raise NotImplementedError(
+            "AIOHTTPClient does not support synchronous requests. Use "
+            "`request_async` instead, or pick a synchronous client such as "
+            "RequestsClient."
+        )
+
+    def request_stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        post_data: Any = None,
+        *,
+        _usage: Optional[List[str]] = None,
+        timeout: Optional[_Timeout] = None
+    ) -> Tuple[Any, int, Mapping[str, str]]:
+        raise NotImplementedError(
+            "AIOHTTPClient does not support synchronous requests. Use "
+            "`request_stream_async` instead, or pick a synchronous client "
+            "such as RequestsClient."
+        )
+
+    def close(self):
+        pass
+
+    async def close_async(self):
+        if self._session is not None:
+            await self._session.close()
+
+
+class NoImportFoundAsyncClient(HTTPClient):
+    name = "noimportfound"
+
+    @staticmethod
+    def raise_async_client_import_error() -> NoReturn:
+        raise ImportError(
+            (
+                "Import httpx not found. To make async http requests, "
+                "you must either install httpx or aiohttp, or define your "
+                "own async http client by subclassing stripe.HTTPClient "
+                "and setting stripe.default_http_client to an instance of it."
+            )
+        )
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data: Any = None,
+        *,
+        timeout: Optional[_Timeout] = None
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        self.raise_async_client_import_error()
+
+    async def request_stream_async(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        post_data: Any = None,
+        *,
+        timeout: Optional[_Timeout] = None
+    ) -> Tuple[AsyncIterable[bytes], int, Mapping[str, str]]:
+        self.raise_async_client_import_error()
+
+    async def close_async(self):
+        self.raise_async_client_import_error()
+
     def close(self):
         pass
@@ -327,6 +327,29 @@ class InvoiceItemService(StripeService):
             ),
         )
 
+    async def delete_async(
+        self,
+        invoiceitem: str,
+        params: "InvoiceItemService.DeleteParams" = {},
+        options: RequestOptions = {},
+    ) -> InvoiceItem:
+        """
+        Deletes an invoice item, removing it from an invoice. Deleting invoice items is only possible when they're not attached to invoices, or if it's attached to a draft invoice.
+        """
+        return cast(
+            InvoiceItem,
+            await self._request_async(
+                "delete",
+                "/v1/invoiceitems/{invoiceitem}".format(
+                    invoiceitem=sanitize_id(invoiceitem),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         invoiceitem: str,
@@ -350,6 +373,29 @@ class InvoiceItemService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        invoiceitem: str,
+        params: "InvoiceItemService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> InvoiceItem:
+        """
+        Retrieves the invoice item with the given ID.
+        """
+        return cast(
+            InvoiceItem,
+            await self._request_async(
+                "get",
+                "/v1/invoiceitems/{invoiceitem}".format(
+                    invoiceitem=sanitize_id(invoiceitem),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         invoiceitem: str,
@@ -373,6 +419,29 @@ class InvoiceItemService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        invoiceitem: str,
+        params: "InvoiceItemService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> InvoiceItem:
+        """
+        Updates the amount or description of an invoice item on an upcoming invoice. Updating an invoice item is only possible before the invoice it's attached to is closed.
+        """
+        return cast(
+            InvoiceItem,
+            await self._request_async(
+                "post",
+                "/v1/invoiceitems/{invoiceitem}".format(
+                    invoiceitem=sanitize_id(invoiceitem),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def list(
         self,
         params: "InvoiceItemService.ListParams" = {},
@@ -393,6 +462,26 @@ class InvoiceItemService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "InvoiceItemService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[InvoiceItem]:
+        """
+        Returns a list of your invoice items. Invoice items are returned sorted by creation date, with the most recently created invoice items appearing first.
+        """
+        return cast(
+            ListObject[InvoiceItem],
+            await self._request_async(
+                "get",
+                "/v1/invoiceitems",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "InvoiceItemService.CreateParams",
@@ -412,3 +501,23 @@ class InvoiceItemService(StripeService):
                 options=options,
             ),
         )
+
+    async def create_async(
+        self,
+        params: "InvoiceItemService.CreateParams",
+        options: RequestOptions = {},
+    ) -> InvoiceItem:
+        """
+        Creates an item to be added to a draft invoice (up to 250 items per invoice). If no invoice is specified, the item will be on the next invoice created for the customer specified.
+        """
+        return cast(
+            InvoiceItem,
+            await self._request_async(
+                "post",
+                "/v1/invoiceitems",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
@@ -50,3 +50,26 @@ class InvoiceLineItemService(StripeService):
                 options=options,
             ),
         )
+
+    async def list_async(
+        self,
+        invoice: str,
+        params: "InvoiceLineItemService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[InvoiceLineItem]:
+        """
+        When retrieving an invoice, you'll get a lines property containing the total count of line items and the first handful of those items. There is also a URL where you can retrieve the full (paginated) list of line items.
+        """
+        return cast(
+            ListObject[InvoiceLineItem],
+            await self._request_async(
+                "get",
+                "/v1/invoices/{invoice}/lines".format(
+                    invoice=sanitize_id(invoice),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
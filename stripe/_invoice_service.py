@@ -1914,6 +1914,27 @@ class InvoiceService(StripeService):
             ),
         )
 
+    async def delete_async(
+        self,
+        invoice: str,
+        params: "InvoiceService.DeleteParams" = {},
+        options: RequestOptions = {},
+    ) -> Invoice:
+        """
+        Permanently deletes a one-off invoice draft. This cannot be undone. Attempts to delete invoices that are no longer in a draft state will fail; once an invoice has been finalized or if an invoice is for a subscription, it must be [voided](https://stripe.com/docs/api#void_invoice).
+        """
+        return cast(
+            Invoice,
+            await self._request_async(
+                "delete",
+                "/v1/invoices/{invoice}".format(invoice=sanitize_id(invoice)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         invoice: str,
@@ -1935,6 +1956,27 @@ class InvoiceService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        invoice: str,
+        params: "InvoiceService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Invoice:
+        """
+        Retrieves the invoice with the given ID.
+        """
+        return cast(
+            Invoice,
+            await self._request_async(
+                "get",
+                "/v1/invoices/{invoice}".format(invoice=sanitize_id(invoice)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         invoice: str,
@@ -1961,6 +2003,32 @@ class InvoiceService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        invoice: str,
+        params: "InvoiceService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> Invoice:
+        """
+        Draft invoices are fully editable. Once an invoice is [finalized](https://stripe.com/docs/billing/invoices/workflow#finalized),
+        monetary values, as well as collection_method, become uneditable.
+
+        If you would like to stop the Stripe Billing engine from automatically finalizing, reattempting payments on,
+        sending reminders for, or [automatically reconciling](https://stripe.com/docs/billing/invoices/reconciliation) invoices, pass
+        auto_advance=false.
+        """
+        return cast(
+            Invoice,
+            await self._request_async(
+                "post",
+                "/v1/invoices/{invoice}".format(invoice=sanitize_id(invoice)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def list(
         self,
         params: "InvoiceService.ListParams" = {},
@@ -1981,6 +2049,26 @@ class InvoiceService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "InvoiceService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Invoice]:
+        """
+        You can list all invoices, or list the invoices for a specific customer. The invoices are returned sorted by creation date, with the most recently created invoices appearing first.
+        """
+        return cast(
+            ListObject[Invoice],
+            await self._request_async(
+                "get",
+                "/v1/invoices",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "InvoiceService.CreateParams" = {},
@@ -2001,6 +2089,26 @@ class InvoiceService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "InvoiceService.CreateParams" = {},
+        options: RequestOptions = {},
+    ) -> Invoice:
+        """
+        This endpoint creates a draft invoice for a given customer. The invoice remains a draft until you [finalize the invoice, which allows you to [pay](#pay_invoice) or <a href="#send_invoice">send](https://stripe.com/docs/api#finalize_invoice) the invoice to your customers.
+        """
+        return cast(
+            Invoice,
+            await self._request_async(
+                "post",
+                "/v1/invoices",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def search(
         self,
         params: "InvoiceService.SearchParams",
@@ -2024,6 +2132,29 @@ class InvoiceService(StripeService):
             ),
         )
 
+    async def search_async(
+        self,
+        params: "InvoiceService.SearchParams",
+        options: RequestOptions = {},
+    ) -> SearchResultObject[Invoice]:
+        """
+        Search for invoices you've previously created using Stripe's [Search Query Language](https://stripe.com/docs/search#search-query-language).
+        Don't use search in read-after-write flows where strict consistency is necessary. Under normal operating
+        conditions, data is searchable in less than a minute. Occasionally, propagation of new or updated data can be up
+        to an hour behind during outages. Search functionality is not available to merchants in India.
+        """
+        return cast(
+            SearchResultObject[Invoice],
+            await self._request_async(
+                "get",
+                "/v1/invoices/search",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def upcoming(
         self,
         params: "InvoiceService.UpcomingParams" = {},
@@ -2048,6 +2179,30 @@ class InvoiceService(StripeService):
             ),
         )
 
+    async def upcoming_async(
+        self,
+        params: "InvoiceService.UpcomingParams" = {},
+        options: RequestOptions = {},
+    ) -> Invoice:
+        """
+        At any time, you can preview the upcoming invoice for a customer. This will show you all the charges that are pending, including subscription renewal charges, invoice item charges, etc. It will also show you any discounts that are applicable to the invoice.
+
+        Note that when you are viewing an upcoming invoice, you are simply viewing a preview – the invoice has not yet been created. As such, the upcoming invoice will not show up in invoice listing calls, and you cannot use the API to pay or edit the invoice. If you want to change the amount that your customer will be billed, you can add, remove, or update pending invoice items, or update the customer's discount.
+
+        You can preview the effects of updating a subscription, including a preview of what proration will take place. To ensure that the actual proration is calculated exactly the same as the previewed proration, you should pass a proration_date parameter when doing the actual subscription update. The value passed in should be the same as the subscription_proration_date returned on the upcoming invoice resource. The recommended way to get only the prorations being previewed is to consider only proration line items where period[start] is equal to the subscription_proration_date on the upcoming invoice resource.
+        """
+        return cast(
+            Invoice,
+            await self._request_async(
+                "get",
+                "/v1/invoices/upcoming",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def finalize_invoice(
         self,
         invoice: str,
@@ -2071,6 +2226,29 @@ class InvoiceService(StripeService):
             ),
         )
 
+    async def finalize_invoice_async(
+        self,
+        invoice: str,
+        params: "InvoiceService.FinalizeInvoiceParams" = {},
+        options: RequestOptions = {},
+    ) -> Invoice:
+        """
+        Stripe automatically finalizes drafts before sending and attempting payment on invoices. However, if you'd like to finalize a draft invoice manually, you can do so using this method.
+        """
+        return cast(
+            Invoice,
+            await self._request_async(
+                "post",
+                "/v1/invoices/{invoice}/finalize".format(
+                    invoice=sanitize_id(invoice),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def mark_uncollectible(
         self,
         invoice: str,
@@ -2094,6 +2272,29 @@ class InvoiceService(StripeService):
             ),
         )
 
+    async def mark_uncollectible_async(
+        self,
+        invoice: str,
+        params: "InvoiceService.MarkUncollectibleParams" = {},
+        options: RequestOptions = {},
+    ) -> Invoice:
+        """
+        Marking an invoice as uncollectible is useful for keeping track of bad debts that can be written off for accounting purposes.
+        """
+        return cast(
+            Invoice,
+            await self._request_async(
+                "post",
+                "/v1/invoices/{invoice}/mark_uncollectible".format(
+                    invoice=sanitize_id(invoice),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def pay(
         self,
         invoice: str,
@@ -2117,6 +2318,29 @@ class InvoiceService(StripeService):
             ),
         )
 
+    async def pay_async(
+        self,
+        invoice: str,
+        params: "InvoiceService.PayParams" = {},
+        options: RequestOptions = {},
+    ) -> Invoice:
+        """
+        Stripe automatically creates and then attempts to collect payment on invoices for customers on subscriptions according to your [subscriptions settings](https://dashboard.stripe.com/account/billing/automatic). However, if you'd like to attempt payment on an invoice out of the normal collection schedule or for some other reason, you can do so.
+        """
+        return cast(
+            Invoice,
+            await self._request_async(
+                "post",
+                "/v1/invoices/{invoice}/pay".format(
+                    invoice=sanitize_id(invoice),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def send_invoice(
         self,
         invoice: str,
@@ -2142,6 +2366,31 @@ class InvoiceService(StripeService):
             ),
         )
 
+    async def send_invoice_async(
+        self,
+        invoice: str,
+        params: "InvoiceService.SendInvoiceParams" = {},
+        options: RequestOptions = {},
+    ) -> Invoice:
+        """
+        Stripe will automatically send invoices to customers according to your [subscriptions settings](https://dashboard.stripe.com/account/billing/automatic). However, if you'd like to manually send an invoice to your customer out of the normal schedule, you can do so. When sending invoices that have already been paid, there will be no reference to the payment in the email.
+
+        Requests made in test-mode result in no emails being sent, despite sending an invoice.sent event.
+        """
+        return cast(
+            Invoice,
+            await self._request_async(
+                "post",
+                "/v1/invoices/{invoice}/send".format(
+                    invoice=sanitize_id(invoice),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def void_invoice(
         self,
         invoice: str,
@@ -2164,3 +2413,26 @@ class InvoiceService(StripeService):
                 options=options,
             ),
         )
+
+    async def void_invoice_async(
+        self,
+        invoice: str,
+        params: "InvoiceService.VoidInvoiceParams" = {},
+        options: RequestOptions = {},
+    ) -> Invoice:
+        """
+        Mark a finalized invoice as void. This cannot be undone. Voiding an invoice is similar to [deletion](https://stripe.com/docs/api#delete_invoice), however it only applies to finalized invoices and maintains a papertrail where the invoice can still be found.
+        """
+        return cast(
+            Invoice,
+            await self._request_async(
+                "post",
+                "/v1/invoices/{invoice}/void".format(
+                    invoice=sanitize_id(invoice),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
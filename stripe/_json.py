@@ -0,0 +1,56 @@
+import json
+from typing import Any, Callable, Dict, Union
+
+# breaking circular dependency
+import stripe  # noqa: IMP101
+
+try:
+    import orjson  # pyright: ignore
+except ImportError:
+    orjson = None
+
+try:
+    import ujson  # pyright: ignore
+except ImportError:
+    ujson = None
+
+_Loads = Callable[[Union[bytes, str]], Any]
+
+# Lazily initialized, by backend name
+_loaders: Dict[str, _Loads] = {}
+
+
+def _load_backend(name: str) -> _Loads:
+    if name == "auto":
+        if orjson is not None:
+            return orjson.loads
+        if ujson is not None:
+            return ujson.loads
+        return json.loads
+    elif name == "json":
+        return json.loads
+    elif name in ("orjson", "ujson"):
+        module = orjson if name == "orjson" else ujson
+        if module is None:
+            raise ImportError(
+                "stripe.json_backend is %r, but %s is not installed."
+                % (name, name)
+            )
+        return module.loads
+    raise ValueError(
+        'Unknown JSON backend %r. Set stripe.json_backend to "json", '
+        '"orjson", "ujson" or "auto".' % (name,)
+    )
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parses a JSON document into plain dicts and lists with the backend
+    chosen by `stripe.json_backend`. Bytes are parsed as they are, without
+    being decoded into a string first.
+    """
+    name = stripe.json_backend
+    loader = _loaders.get(name)
+    if loader is None:
+        loader = _loaders[name] = _load_backend(name)
+    return loader(data)
@@ -5,16 +5,32 @@ from typing_extensions import Self, Unpack
 
 from typing import (
     Any,
+    AsyncIterator,
     Iterator,
     List,
     Generic,
     TypeVar,
     cast,
     Mapping,
+    Optional,
 )
 from stripe._api_requestor import (
     _APIRequestor,  # pyright: ignore[reportPrivateUsage]
 )
+from stripe._any_iterator import AnyIterator
+from stripe._checkpoint_store import (
+    CheckpointStore,
+    _check_checkpoint,  # pyright: ignore[reportPrivateUsage]
+    _checkpointed,  # pyright: ignore[reportPrivateUsage]
+    _checkpointed_async,  # pyright: ignore[reportPrivateUsage]
+)
+from stripe._page_cursor import PageCursor
+from stripe._prefetch import (
+    PREFETCH_LIMIT,
+    _check_prefetch,  # pyright: ignore[reportPrivateUsage]
+    _prefetched,  # pyright: ignore[reportPrivateUsage]
+    _prefetched_async,  # pyright: ignore[reportPrivateUsage]
+)
 from stripe._stripe_object import StripeObject
 from stripe._request_options import RequestOptions, extract_options_from_dict
 
@@ -46,6 +62,23 @@ class ListObject(StripeObject, Generic[T]):
             ),
         )
 
+    async def list_async(self, **params: Mapping[str, Any]) -> Self:
+        url = self.get("url")
+        if not isinstance(url, str):
+            raise ValueError(
+                'Cannot call .list on a list object without a string "url" property'
+            )
+        return cast(
+            Self,
+            await self._request_async(
+                "get",
+                url,
+                params=params,
+                base_address="api",
+                api_mode="V1",
+            ),
+        )
+
     def create(self, **params: Mapping[str, Any]) -> T:
         url = self.get("url")
         if not isinstance(url, str):
@@ -107,25 +140,136 @@ class ListObject(StripeObject, Generic[T]):
     def __reversed__(self) -> Iterator[T]:  # pyright: ignore (see above)
         return getattr(self, "data", []).__reversed__()
 
-    def auto_paging_iter(self) -> Iterator[T]:
+    def auto_paging_iter(
+        self,
+        *,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+    ) -> AnyIterator[T]:
+        """
+        Iterates through the objects on this page and every page after it.
+
+        With `prefetch`, up to that many pages are fetched in the background
+        ahead of the one being iterated through, 100 objects at a time
+        unless the list was made with a `limit`.
+
+        With `checkpoint`, the `cursor` of each page is saved to that
+        `CheckpointStore` under `checkpoint_key` once the page has been
+        iterated through, so the iteration can be resumed from there.
+        """
+        _check_prefetch(prefetch)
+        _check_checkpoint(checkpoint, checkpoint_key)
+        return AnyIterator(
+            self._auto_paging_iter(prefetch, checkpoint, checkpoint_key),
+            self._auto_paging_iter_async(prefetch, checkpoint, checkpoint_key),
+        )
+
+    def _is_backwards_pagination(self) -> bool:
+        return (
+            "ending_before" in self._retrieve_params
+            and "starting_after" not in self._retrieve_params
+        )
+
+    def _auto_paging_iter(
+        self,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+    ) -> Iterator[T]:
+        backwards = self._is_backwards_pagination()
+        for page in _checkpointed(
+            self._pages(prefetch), checkpoint, checkpoint_key
+        ):
+            yield from reversed(page) if backwards else page
+
+    async def _auto_paging_iter_async(
+        self,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+    ) -> AsyncIterator[T]:
+        backwards = self._is_backwards_pagination()
+        async for page in _checkpointed_async(
+            self._pages_async(prefetch), checkpoint, checkpoint_key
+        ):
+            for item in reversed(page) if backwards else page:
+                yield item
+
+    def _pages(self, prefetch: int) -> Iterator[Self]:
+        if prefetch:
+            yield from _prefetched(
+                self, lambda page: page._prefetch_page(), prefetch
+            )
+            return
+
         page = self
 
         while True:
-            if (
-                "ending_before" in self._retrieve_params
-                and "starting_after" not in self._retrieve_params
-            ):
-                for item in reversed(page):
-                    yield item
+            yield page
+            if self._is_backwards_pagination():
                 page = page.previous_page()
             else:
-                for item in page:
-                    yield item
                 page = page.next_page()
 
             if page.is_empty:
                 break
 
+    async def _pages_async(self, prefetch: int) -> AsyncIterator[Self]:
+        if prefetch:
+            async for page in _prefetched_async(
+                self, lambda page: page._prefetch_page_async(), prefetch
+            ):
+                yield page
+            return
+
+        page = self
+
+        while True:
+            yield page
+            if self._is_backwards_pagination():
+                page = await page.previous_page_async()
+            else:
+                page = await page.next_page_async()
+
+            if page.is_empty:
+                break
+
+    @property
+    def cursor(self) -> Optional[PageCursor]:
+        """
+        Where to resume iterating through the list after this page, or None
+        if it's the last.
+        """
+        if self.is_empty or not self.get("has_more"):
+            return None
+        return PageCursor._from_filters(  # pyright: ignore[reportPrivateUsage]
+            self.url, self._get_filters_for_following_page()
+        )
+
+    def _get_filters_for_following_page(self) -> Mapping[str, Any]:
+        if self._is_backwards_pagination():
+            return self._get_filters_for_previous_page({})
+        return self._get_filters_for_next_page({})
+
+    def _get_filters_for_prefetch(self) -> Mapping[str, Any]:
+        return {
+            "limit": PREFETCH_LIMIT,
+            **self._get_filters_for_following_page(),
+        }
+
+    def _prefetch_page(self) -> Optional[Self]:
+        if not self.has_more:
+            return None
+        page = self.list(**self._get_filters_for_prefetch())
+        return None if page.is_empty else page
+
+    async def _prefetch_page_async(self) -> Optional[Self]:
+        if not self.has_more:
+            return None
+        page = await self.list_async(**self._get_filters_for_prefetch())
+        return None if page.is_empty else page
+
     @classmethod
     def _empty_list(
         cls,
@@ -151,6 +295,24 @@ class ListObject(StripeObject, Generic[T]):
                 **request_options,
             )
 
+        return self.list(
+            **self._get_filters_for_next_page(params),
+        )
+
+    async def next_page_async(self, **params: Unpack[RequestOptions]) -> Self:
+        if not self.has_more:
+            request_options, _ = extract_options_from_dict(params)
+            return self._empty_list(
+                **request_options,
+            )
+
+        return await self.list_async(
+            **self._get_filters_for_next_page(params),
+        )
+
+    def _get_filters_for_next_page(
+        self, params: RequestOptions
+    ) -> Mapping[str, Any]:
         last_id = getattr(self.data[-1], "id")
         if not last_id:
             raise ValueError(
@@ -160,18 +322,37 @@ class ListObject(StripeObject, Generic[T]):
         params_with_filters = dict(self._retrieve_params)
         params_with_filters.update({"starting_after": last_id})
         params_with_filters.update(params)
+        return params_with_filters
 
-        return self.list(
-            **params_with_filters,
+    def previous_page(self, **params: Unpack[RequestOptions]) -> Self:
+        if not self.has_more:
+            request_options, _ = extract_options_from_dict(params)
+            return self._empty_list(
+                **request_options,
+            )
+
+        result = self.list(
+            **self._get_filters_for_previous_page(params),
         )
+        return result
 
-    def previous_page(self, **params: Unpack[RequestOptions]) -> Self:
+    async def previous_page_async(
+        self, **params: Unpack[RequestOptions]
+    ) -> Self:
         if not self.has_more:
             request_options, _ = extract_options_from_dict(params)
             return self._empty_list(
                 **request_options,
             )
 
+        result = await self.list_async(
+            **self._get_filters_for_previous_page(params),
+        )
+        return result
+
+    def _get_filters_for_previous_page(
+        self, params: RequestOptions
+    ) -> Mapping[str, Any]:
         first_id = getattr(self.data[0], "id")
         if not first_id:
             raise ValueError(
@@ -181,8 +362,4 @@ class ListObject(StripeObject, Generic[T]):
         params_with_filters = dict(self._retrieve_params)
         params_with_filters.update({"ending_before": first_id})
         params_with_filters.update(params)
-
-        result = self.list(
-            **params_with_filters,
-        )
-        return result
+        return params_with_filters
@@ -1,20 +1,154 @@
 import random
 import io
+import mmap
+import os
+import stat
+from typing import Any, Callable, Iterator, List, Optional, Union
 
 from stripe._encode import _api_encode
 
 
+class _FilePart(object):
+    """
+    A file in a multipart body, read afresh every time the body is sent.
+    Regular files are memory-mapped, so their contents are handed to the
+    socket without being copied into Python objects.
+    """
+
+    def __init__(self, f: Any, chunk_size: int):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._start = f.tell()
+        self._fileno = self._regular_fileno(f)
+        if self._fileno is not None:
+            end = os.fstat(self._fileno).st_size
+        else:
+            f.seek(0, io.SEEK_END)
+            end = f.tell()
+            f.seek(self._start)
+        self.size = max(end - self._start, 0)
+
+    @classmethod
+    def for_file(cls, f: Any, chunk_size: int) -> Optional["_FilePart"]:
+        """
+        A part for `f`, or None if it can't be streamed and has to be read
+        up front: text files have to be encoded, and files that can't seek
+        can only be read once.
+        """
+        if isinstance(f, io.TextIOBase):
+            return None
+        try:
+            return cls(f, chunk_size)
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _regular_fileno(f: Any) -> Optional[int]:
+        try:
+            fileno = f.fileno()
+            if not stat.S_ISREG(os.fstat(fileno).st_mode):
+                return None
+            # Data written through `f` may still be sitting in its buffer.
+            f.flush()
+        except (AttributeError, OSError, ValueError):
+            return None
+        return fileno
+
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:
+        if self.size == 0:
+            return iter(())
+        if self._fileno is not None:
+            return self._iter_mapped(self._fileno)
+        return self._iter_read()
+
+    def _iter_mapped(self, fileno: int) -> Iterator[memoryview]:
+        end = self._start + self.size
+        mapped = mmap.mmap(fileno, end, access=mmap.ACCESS_READ)
+        try:
+            view = memoryview(mapped)
+            for offset in range(self._start, end, self._chunk_size):
+                stop = min(offset + self._chunk_size, end)
+                yield view[offset:stop]
+            view.release()
+        finally:
+            try:
+                mapped.close()
+            except BufferError:
+                # The last chunk is still being used; the mapping is closed
+                # once it's let go of.
+                pass
+
+    def _iter_read(self) -> Iterator[bytes]:
+        self._file.seek(self._start)
+        remaining = self.size
+        while remaining > 0:
+            chunk = self._file.read(min(self._chunk_size, remaining))
+            if not chunk:
+                raise OSError(
+                    "The file being uploaded got shorter while it was being "
+                    "sent."
+                )
+            remaining -= len(chunk)
+            yield chunk
+
+
+class _MultipartBody(object):
+    """
+    A multipart body that's streamed from its files while it's sent, rather
+    than built in memory, with its length known up front. Each pass over it
+    starts from the beginning, so it can be sent again when a request is
+    retried.
+    """
+
+    def __init__(self, parts: List[Union[bytes, _FilePart]]):
+        self._parts = parts
+        self._length = sum(
+            len(part) if isinstance(part, bytes) else part.size
+            for part in parts
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                yield from part
+
+    def reader(self) -> Callable[[int], bytes]:
+        """
+        A `read(size)` function for a fresh pass over the body, e.g. for
+        pycurl's `READFUNCTION`.
+        """
+        chunks = iter(self)
+        pending = memoryview(b"")
+
+        def read(size: int) -> bytes:
+            nonlocal pending
+            while not pending:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return b""
+                pending = memoryview(chunk)
+            data, pending = pending[:size], pending[size:]
+            return bytes(data)
+
+        return read
+
+
 class MultipartDataGenerator(object):
-    data: io.BytesIO
     line_break: str
     boundary: int
     chunk_size: int
 
-    def __init__(self, chunk_size: int = 1028):
-        self.data = io.BytesIO()
+    def __init__(self, chunk_size: int = 1024 * 1024):
         self.line_break = "\r\n"
         self.boundary = self._initialize_boundary()
         self.chunk_size = chunk_size
+        self._parts: List[Union[bytes, _FilePart]] = []
+        self._buffer = bytearray()
 
     def add_params(self, params):
         # Flatten parameters first
@@ -59,29 +193,44 @@ class MultipartDataGenerator(object):
     def param_header(self):
         return "--%s" % self.boundary
 
-    def get_post_data(self):
-        self._write("--%s--" % (self.boundary,))
-        self._write(self.line_break)
-        return self.data.getvalue()
+    def get_post_body(self) -> _MultipartBody:
+        """
+        The body to send, streamed from the files in it as it's sent.
+        """
+        closing = "--%s--%s" % (self.boundary, self.line_break)
+        return _MultipartBody(
+            self._parts + [bytes(self._buffer) + closing.encode("utf-8")]
+        )
+
+    def get_post_data(self) -> bytes:
+        """
+        The whole body to send, read into memory.
+        """
+        return b"".join(self.get_post_body())
 
     def _write(self, value):
         if isinstance(value, bytes):
-            array = bytearray(value)
+            self._buffer += value
         elif isinstance(value, str):
-            array = bytearray(value, encoding="utf-8")
+            self._buffer += value.encode("utf-8")
         else:
             raise TypeError(
                 "unexpected type: {value_type}".format(value_type=type(value))
             )
 
-        self.data.write(array)
-
     def _write_file(self, f):
-        while True:
-            file_contents = f.read(self.chunk_size)
-            if not file_contents:
-                break
-            self._write(file_contents)
+        part = _FilePart.for_file(f, self.chunk_size)
+        if part is None:
+            while True:
+                file_contents = f.read(self.chunk_size)
+                if not file_contents:
+                    break
+                self._write(file_contents)
+            return
+
+        self._parts.append(bytes(self._buffer))
+        self._parts.append(part)
+        self._buffer = bytearray()
 
     def _initialize_boundary(self):
         return random.randint(0, 2**63)
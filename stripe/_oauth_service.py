@@ -82,6 +82,21 @@ class OAuthService(StripeService):
             ),
         )
 
+    async def token_async(
+        self, params: OAuth.OAuthTokenParams, options: RequestOptions = {}
+    ) -> OAuth.OAuthToken:
+        return cast(
+            OAuth.OAuthToken,
+            await self._requestor.request_async(
+                "post",
+                "/oauth/token",
+                params=params,
+                options=options,
+                base_address="connect",
+                api_mode="V1",
+            ),
+        )
+
     def deauthorize(
         self,
         params: OAuth.OAuthDeauthorizeParams,
@@ -99,3 +114,21 @@ class OAuthService(StripeService):
                 api_mode="V1",
             ),
         )
+
+    async def deauthorize_async(
+        self,
+        params: OAuth.OAuthDeauthorizeParams,
+        options: RequestOptions = {},
+    ) -> OAuth.OAuthDeauthorization:
+        self._set_client_id(params)
+        return cast(
+            OAuth.OAuthDeauthorization,
+            await self._requestor.request_async(
+                "post",
+                "/oauth/deauthorize",
+                params=params,
+                options=options,
+                base_address="connect",
+                api_mode="V1",
+            ),
+        )
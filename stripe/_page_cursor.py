@@ -0,0 +1,100 @@
+import json
+from typing import Any, Dict, Mapping, Optional
+
+# Params that say where in a list or search a page starts
+_POSITION_PARAMS = ("starting_after", "ending_before", "page")
+
+
+class PageCursor(object):
+    """
+    Where to resume iterating through a list or search: the URL it was made
+    to, its filters, and the position of the next page, either
+    `starting_after` or, when paginating backwards, `ending_before` an
+    object ID, or a search's `page` token.
+
+    A page's `cursor` is the one for the page after it. Cursors can be
+    turned into JSON and back, so that a long iteration can be saved, for
+    example by a `CheckpointStore`, and later resumed with
+    `StripeClient.resume_list`, or by passing `to_params()` to the same
+    list or search method.
+    """
+
+    __slots__ = ("url", "params", "starting_after", "ending_before", "page")
+
+    url: str
+    params: Dict[str, Any]
+    starting_after: Optional[str]
+    ending_before: Optional[str]
+    page: Optional[str]
+
+    def __init__(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        starting_after: Optional[str] = None,
+        ending_before: Optional[str] = None,
+        page: Optional[str] = None,
+    ):
+        self.url = url
+        self.params = dict(params or {})
+        self.starting_after = starting_after
+        self.ending_before = ending_before
+        self.page = page
+
+    @classmethod
+    def _from_filters(
+        cls, url: str, filters: Mapping[str, Any]
+    ) -> "PageCursor":
+        """
+        The cursor for the page fetched with `filters`, as built by a page
+        for the one after it.
+        """
+        params = dict(filters)
+        position = {name: params.pop(name, None) for name in _POSITION_PARAMS}
+        return cls(url, params, **position)
+
+    def to_params(self) -> Dict[str, Any]:
+        """
+        The params to fetch the page with.
+        """
+        params = dict(self.params)
+        for name in _POSITION_PARAMS:
+            value = getattr(self, name)
+            if value is not None:
+                params[name] = value
+        return params
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "params": self.params,
+            "starting_after": self.starting_after,
+            "ending_before": self.ending_before,
+            "page": self.page,
+        }
+
+    @classmethod
+    def from_dict(cls, values: Mapping[str, Any]) -> "PageCursor":
+        return cls(
+            values["url"],
+            values.get("params"),
+            starting_after=values.get("starting_after"),
+            ending_before=values.get("ending_before"),
+            page=values.get("page"),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, data: str) -> "PageCursor":
+        return cls.from_dict(json.loads(data))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PageCursor):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return "<PageCursor %s %s>" % (self.url, json.dumps(self.to_params()))
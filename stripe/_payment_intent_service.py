@@ -5941,6 +5941,26 @@ class PaymentIntentService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "PaymentIntentService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[PaymentIntent]:
+        """
+        Returns a list of PaymentIntents.
+        """
+        return cast(
+            ListObject[PaymentIntent],
+            await self._request_async(
+                "get",
+                "/v1/payment_intents",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "PaymentIntentService.CreateParams",
@@ -5970,6 +5990,35 @@ class PaymentIntentService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "PaymentIntentService.CreateParams",
+        options: RequestOptions = {},
+    ) -> PaymentIntent:
+        """
+        Creates a PaymentIntent object.
+
+        After the PaymentIntent is created, attach a payment method and [confirm](https://stripe.com/docs/api/payment_intents/confirm)
+        to continue the payment. Learn more about <a href="/docs/payments/payment-intents">the available payment flows
+        with the Payment Intents API.
+
+        When you use confirm=true during creation, it's equivalent to creating
+        and confirming the PaymentIntent in the same call. You can use any parameters
+        available in the [confirm API](https://stripe.com/docs/api/payment_intents/confirm) when you supply
+        confirm=true.
+        """
+        return cast(
+            PaymentIntent,
+            await self._request_async(
+                "post",
+                "/v1/payment_intents",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         intent: str,
@@ -5997,6 +6046,33 @@ class PaymentIntentService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        intent: str,
+        params: "PaymentIntentService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> PaymentIntent:
+        """
+        Retrieves the details of a PaymentIntent that has previously been created.
+
+        You can retrieve a PaymentIntent client-side using a publishable key when the client_secret is in the query string.
+
+        If you retrieve a PaymentIntent with a publishable key, it only returns a subset of properties. Refer to the [payment intent](https://stripe.com/docs/api#payment_intent_object) object reference for more details.
+        """
+        return cast(
+            PaymentIntent,
+            await self._request_async(
+                "get",
+                "/v1/payment_intents/{intent}".format(
+                    intent=sanitize_id(intent),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         intent: str,
@@ -6026,6 +6102,35 @@ class PaymentIntentService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        intent: str,
+        params: "PaymentIntentService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> PaymentIntent:
+        """
+        Updates properties on a PaymentIntent object without confirming.
+
+        Depending on which properties you update, you might need to confirm the
+        PaymentIntent again. For example, updating the payment_method
+        always requires you to confirm the PaymentIntent again. If you prefer to
+        update and confirm at the same time, we recommend updating properties through
+        the [confirm API](https://stripe.com/docs/api/payment_intents/confirm) instead.
+        """
+        return cast(
+            PaymentIntent,
+            await self._request_async(
+                "post",
+                "/v1/payment_intents/{intent}".format(
+                    intent=sanitize_id(intent),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def search(
         self,
         params: "PaymentIntentService.SearchParams",
@@ -6049,6 +6154,29 @@ class PaymentIntentService(StripeService):
             ),
         )
 
+    async def search_async(
+        self,
+        params: "PaymentIntentService.SearchParams",
+        options: RequestOptions = {},
+    ) -> SearchResultObject[PaymentIntent]:
+        """
+        Search for PaymentIntents you've previously created using Stripe's [Search Query Language](https://stripe.com/docs/search#search-query-language).
+        Don't use search in read-after-write flows where strict consistency is necessary. Under normal operating
+        conditions, data is searchable in less than a minute. Occasionally, propagation of new or updated data can be up
+        to an hour behind during outages. Search functionality is not available to merchants in India.
+        """
+        return cast(
+            SearchResultObject[PaymentIntent],
+            await self._request_async(
+                "get",
+                "/v1/payment_intents/search",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def apply_customer_balance(
         self,
         intent: str,
@@ -6072,6 +6200,29 @@ class PaymentIntentService(StripeService):
             ),
         )
 
+    async def apply_customer_balance_async(
+        self,
+        intent: str,
+        params: "PaymentIntentService.ApplyCustomerBalanceParams" = {},
+        options: RequestOptions = {},
+    ) -> PaymentIntent:
+        """
+        Manually reconcile the remaining amount for a customer_balance PaymentIntent.
+        """
+        return cast(
+            PaymentIntent,
+            await self._request_async(
+                "post",
+                "/v1/payment_intents/{intent}/apply_customer_balance".format(
+                    intent=sanitize_id(intent),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def cancel(
         self,
         intent: str,
@@ -6099,6 +6250,33 @@ class PaymentIntentService(StripeService):
             ),
         )
 
+    async def cancel_async(
+        self,
+        intent: str,
+        params: "PaymentIntentService.CancelParams" = {},
+        options: RequestOptions = {},
+    ) -> PaymentIntent:
+        """
+        You can cancel a PaymentIntent object when it's in one of these statuses: requires_payment_method, requires_capture, requires_confirmation, requires_action or, [in rare cases](https://stripe.com/docs/payments/intents), processing.
+
+        After it's canceled, no additional charges are made by the PaymentIntent and any operations on the PaymentIntent fail with an error. For PaymentIntents with a status of requires_capture, the remaining amount_capturable is automatically refunded.
+
+        You can't cancel the PaymentIntent for a Checkout Session. [Expire the Checkout Session](https://stripe.com/docs/api/checkout/sessions/expire) instead.
+        """
+        return cast(
+            PaymentIntent,
+            await self._request_async(
+                "post",
+                "/v1/payment_intents/{intent}/cancel".format(
+                    intent=sanitize_id(intent),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def capture(
         self,
         intent: str,
@@ -6126,6 +6304,33 @@ class PaymentIntentService(StripeService):
             ),
         )
 
+    async def capture_async(
+        self,
+        intent: str,
+        params: "PaymentIntentService.CaptureParams" = {},
+        options: RequestOptions = {},
+    ) -> PaymentIntent:
+        """
+        Capture the funds of an existing uncaptured PaymentIntent when its status is requires_capture.
+
+        Uncaptured PaymentIntents are cancelled a set number of days (7 by default) after their creation.
+
+        Learn more about [separate authorization and capture](https://stripe.com/docs/payments/capture-later).
+        """
+        return cast(
+            PaymentIntent,
+            await self._request_async(
+                "post",
+                "/v1/payment_intents/{intent}/capture".format(
+                    intent=sanitize_id(intent),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def confirm(
         self,
         intent: str,
@@ -6170,6 +6375,50 @@ class PaymentIntentService(StripeService):
             ),
         )
 
+    async def confirm_async(
+        self,
+        intent: str,
+        params: "PaymentIntentService.ConfirmParams" = {},
+        options: RequestOptions = {},
+    ) -> PaymentIntent:
+        """
+        Confirm that your customer intends to pay with current or provided
+        payment method. Upon confirmation, the PaymentIntent will attempt to initiate
+        a payment.
+        If the selected payment method requires additional authentication steps, the
+        PaymentIntent will transition to the requires_action status and
+        suggest additional actions via next_action. If payment fails,
+        the PaymentIntent transitions to the requires_payment_method status or the
+        canceled status if the confirmation limit is reached. If
+        payment succeeds, the PaymentIntent will transition to the succeeded
+        status (or requires_capture, if capture_method is set to manual).
+        If the confirmation_method is automatic, payment may be attempted
+        using our [client SDKs](https://stripe.com/docs/stripe-js/reference#stripe-handle-card-payment)
+        and the PaymentIntent's [client_secret](https://stripe.com/docs/api#payment_intent_object-client_secret).
+        After next_actions are handled by the client, no additional
+        confirmation is required to complete the payment.
+        If the confirmation_method is manual, all payment attempts must be
+        initiated using a secret key.
+        If any actions are required for the payment, the PaymentIntent will
+        return to the requires_confirmation state
+        after those actions are completed. Your server needs to then
+        explicitly re-confirm the PaymentIntent to initiate the next payment
+        attempt.
+        """
+        return cast(
+            PaymentIntent,
+            await self._request_async(
+                "post",
+                "/v1/payment_intents/{intent}/confirm".format(
+                    intent=sanitize_id(intent),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def increment_authorization(
         self,
         intent: str,
@@ -6216,6 +6465,52 @@ class PaymentIntentService(StripeService):
             ),
         )
 
+    async def increment_authorization_async(
+        self,
+        intent: str,
+        params: "PaymentIntentService.IncrementAuthorizationParams",
+        options: RequestOptions = {},
+    ) -> PaymentIntent:
+        """
+        Perform an incremental authorization on an eligible
+        [PaymentIntent](https://stripe.com/docs/api/payment_intents/object). To be eligible, the
+        PaymentIntent's status must be requires_capture and
+        [incremental_authorization_supported](https://stripe.com/docs/api/charges/object#charge_object-payment_method_details-card_present-incremental_authorization_supported)
+        must be true.
+
+        Incremental authorizations attempt to increase the authorized amount on
+        your customer's card to the new, higher amount provided. Similar to the
+        initial authorization, incremental authorizations can be declined. A
+        single PaymentIntent can call this endpoint multiple times to further
+        increase the authorized amount.
+
+        If the incremental authorization succeeds, the PaymentIntent object
+        returns with the updated
+        [amount](https://stripe.com/docs/api/payment_intents/object#payment_intent_object-amount).
+        If the incremental authorization fails, a
+        [card_declined](https://stripe.com/docs/error-codes#card-declined) error returns, and no other
+        fields on the PaymentIntent or Charge update. The PaymentIntent
+        object remains capturable for the previously authorized amount.
+
+        Each PaymentIntent can have a maximum of 10 incremental authorization attempts, including declines.
+        After it's captured, a PaymentIntent can no longer be incremented.
+
+        Learn more about [incremental authorizations](https://stripe.com/docs/terminal/features/incremental-authorizations).
+        """
+        return cast(
+            PaymentIntent,
+            await self._request_async(
+                "post",
+                "/v1/payment_intents/{intent}/increment_authorization".format(
+                    intent=sanitize_id(intent),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def verify_microdeposits(
         self,
         intent: str,
@@ -6238,3 +6533,26 @@ class PaymentIntentService(StripeService):
                 options=options,
             ),
         )
+
+    async def verify_microdeposits_async(
+        self,
+        intent: str,
+        params: "PaymentIntentService.VerifyMicrodepositsParams" = {},
+        options: RequestOptions = {},
+    ) -> PaymentIntent:
+        """
+        Verifies microdeposits on a PaymentIntent object.
+        """
+        return cast(
+            PaymentIntent,
+            await self._request_async(
+                "post",
+                "/v1/payment_intents/{intent}/verify_microdeposits".format(
+                    intent=sanitize_id(intent),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
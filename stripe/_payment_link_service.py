@@ -1640,6 +1640,26 @@ class PaymentLinkService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "PaymentLinkService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[PaymentLink]:
+        """
+        Returns a list of your payment links.
+        """
+        return cast(
+            ListObject[PaymentLink],
+            await self._request_async(
+                "get",
+                "/v1/payment_links",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "PaymentLinkService.CreateParams",
@@ -1660,6 +1680,26 @@ class PaymentLinkService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "PaymentLinkService.CreateParams",
+        options: RequestOptions = {},
+    ) -> PaymentLink:
+        """
+        Creates a payment link.
+        """
+        return cast(
+            PaymentLink,
+            await self._request_async(
+                "post",
+                "/v1/payment_links",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         payment_link: str,
@@ -1683,6 +1723,29 @@ class PaymentLinkService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        payment_link: str,
+        params: "PaymentLinkService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> PaymentLink:
+        """
+        Retrieve a payment link.
+        """
+        return cast(
+            PaymentLink,
+            await self._request_async(
+                "get",
+                "/v1/payment_links/{payment_link}".format(
+                    payment_link=sanitize_id(payment_link),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         payment_link: str,
@@ -1705,3 +1768,26 @@ class PaymentLinkService(StripeService):
                 options=options,
             ),
         )
+
+    async def update_async(
+        self,
+        payment_link: str,
+        params: "PaymentLinkService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> PaymentLink:
+        """
+        Updates a payment link.
+        """
+        return cast(
+            PaymentLink,
+            await self._request_async(
+                "post",
+                "/v1/payment_links/{payment_link}".format(
+                    payment_link=sanitize_id(payment_link),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
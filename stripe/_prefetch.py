@@ -0,0 +1,116 @@
+import asyncio
+import queue
+import threading
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from typing_extensions import Awaitable
+
+P = TypeVar("P")
+
+# Objects per page when prefetching from a list made without a `limit`
+PREFETCH_LIMIT = 100
+
+# A fetched page, None after the last one, or the error fetching it
+_Fetched = Tuple[Optional[P], Optional[Exception]]
+
+
+def _check_prefetch(prefetch: int) -> None:
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+
+
+def _prefetched(
+    page: P, fetch: Callable[[P], Optional[P]], prefetch: int
+) -> Iterator[P]:
+    """
+    Yields `page` and the pages after it, each fetched by `fetch` from the
+    one before, which returns None after the last. A background thread
+    fetches up to `prefetch` pages ahead of the one yielded, and an error
+    fetching a page is raised where that page would have been yielded.
+    """
+    pages: "queue.Queue[_Fetched[P]]" = queue.Queue(maxsize=prefetch)
+    stopped = threading.Event()
+
+    def produce() -> None:
+        current: Optional[P] = page
+        while current is not None and not stopped.is_set():
+            try:
+                current = fetch(current)
+            except Exception as e:
+                pages.put((None, e))
+                return
+            pages.put((current, None))
+
+    # Started before `page` is yielded, so the next page is fetched while
+    # it's being processed.
+    thread = threading.Thread(
+        target=produce, name="stripe-prefetch", daemon=True
+    )
+    thread.start()
+    try:
+        yield page
+        while True:
+            current, error = pages.get()
+            if error is not None:
+                raise error
+            if current is None:
+                return
+            yield current
+    finally:
+        stopped.set()
+        # Makes room for the page being fetched, if any, so that the thread
+        # sees it's been stopped rather than waiting to put it.
+        while True:
+            try:
+                pages.get_nowait()
+            except queue.Empty:
+                break
+
+
+async def _prefetched_async(
+    page: P, fetch: Callable[[P], Awaitable[Optional[P]]], prefetch: int
+) -> AsyncIterator[P]:
+    """
+    Like `_prefetched`, with the pages ahead fetched by an asyncio task.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # Prefetching relies on asyncio tasks, so e.g. with trio each page
+        # is fetched when it's needed.
+        current: Optional[P] = page
+        while current is not None:
+            yield current
+            current = await fetch(current)
+        return
+
+    pages: "asyncio.Queue[_Fetched[P]]" = asyncio.Queue(maxsize=prefetch)
+
+    async def produce() -> None:
+        current: Optional[P] = page
+        while current is not None:
+            try:
+                current = await fetch(current)
+            except Exception as e:
+                await pages.put((None, e))
+                return
+            await pages.put((current, None))
+
+    task = asyncio.ensure_future(produce())
+    try:
+        yield page
+        while True:
+            current, error = await pages.get()
+            if error is not None:
+                raise error
+            if current is None:
+                return
+            yield current
+    finally:
+        task.cancel()
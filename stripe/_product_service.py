@@ -417,6 +417,27 @@ class ProductService(StripeService):
             ),
         )
 
+    async def delete_async(
+        self,
+        id: str,
+        params: "ProductService.DeleteParams" = {},
+        options: RequestOptions = {},
+    ) -> Product:
+        """
+        Delete a product. Deleting a product is only possible if it has no prices associated with it. Additionally, deleting a product with type=good is only possible if it has no SKUs associated with it.
+        """
+        return cast(
+            Product,
+            await self._request_async(
+                "delete",
+                "/v1/products/{id}".format(id=sanitize_id(id)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         id: str,
@@ -438,6 +459,27 @@ class ProductService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        id: str,
+        params: "ProductService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Product:
+        """
+        Retrieves the details of an existing product. Supply the unique product ID from either a product creation request or the product list, and Stripe will return the corresponding product information.
+        """
+        return cast(
+            Product,
+            await self._request_async(
+                "get",
+                "/v1/products/{id}".format(id=sanitize_id(id)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         id: str,
@@ -459,6 +501,27 @@ class ProductService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        id: str,
+        params: "ProductService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> Product:
+        """
+        Updates the specific product by setting the values of the parameters passed. Any parameters not provided will be left unchanged.
+        """
+        return cast(
+            Product,
+            await self._request_async(
+                "post",
+                "/v1/products/{id}".format(id=sanitize_id(id)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def list(
         self,
         params: "ProductService.ListParams" = {},
@@ -479,6 +542,26 @@ class ProductService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "ProductService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Product]:
+        """
+        Returns a list of your products. The products are returned sorted by creation date, with the most recently created products appearing first.
+        """
+        return cast(
+            ListObject[Product],
+            await self._request_async(
+                "get",
+                "/v1/products",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "ProductService.CreateParams",
@@ -499,6 +582,26 @@ class ProductService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "ProductService.CreateParams",
+        options: RequestOptions = {},
+    ) -> Product:
+        """
+        Creates a new product object.
+        """
+        return cast(
+            Product,
+            await self._request_async(
+                "post",
+                "/v1/products",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def search(
         self,
         params: "ProductService.SearchParams",
@@ -521,3 +624,26 @@ class ProductService(StripeService):
                 options=options,
             ),
         )
+
+    async def search_async(
+        self,
+        params: "ProductService.SearchParams",
+        options: RequestOptions = {},
+    ) -> SearchResultObject[Product]:
+        """
+        Search for products you've previously created using Stripe's [Search Query Language](https://stripe.com/docs/search#search-query-language).
+        Don't use search in read-after-write flows where strict consistency is necessary. Under normal operating
+        conditions, data is searchable in less than a minute. Occasionally, propagation of new or updated data can be up
+        to an hour behind during outages. Search functionality is not available to merchants in India.
+        """
+        return cast(
+            SearchResultObject[Product],
+            await self._request_async(
+                "get",
+                "/v1/products/search",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
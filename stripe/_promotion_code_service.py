@@ -192,6 +192,26 @@ class PromotionCodeService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "PromotionCodeService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[PromotionCode]:
+        """
+        Returns a list of your promotion codes.
+        """
+        return cast(
+            ListObject[PromotionCode],
+            await self._request_async(
+                "get",
+                "/v1/promotion_codes",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "PromotionCodeService.CreateParams",
@@ -212,6 +232,26 @@ class PromotionCodeService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "PromotionCodeService.CreateParams",
+        options: RequestOptions = {},
+    ) -> PromotionCode:
+        """
+        A promotion code points to a coupon. You can optionally restrict the code to a specific customer, redemption limit, and expiration date.
+        """
+        return cast(
+            PromotionCode,
+            await self._request_async(
+                "post",
+                "/v1/promotion_codes",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         promotion_code: str,
@@ -235,6 +275,29 @@ class PromotionCodeService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        promotion_code: str,
+        params: "PromotionCodeService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> PromotionCode:
+        """
+        Retrieves the promotion code with the given ID. In order to retrieve a promotion code by the customer-facing code use [list](https://stripe.com/docs/api/promotion_codes/list) with the desired code.
+        """
+        return cast(
+            PromotionCode,
+            await self._request_async(
+                "get",
+                "/v1/promotion_codes/{promotion_code}".format(
+                    promotion_code=sanitize_id(promotion_code),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         promotion_code: str,
@@ -257,3 +320,26 @@ class PromotionCodeService(StripeService):
                 options=options,
             ),
         )
+
+    async def update_async(
+        self,
+        promotion_code: str,
+        params: "PromotionCodeService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> PromotionCode:
+        """
+        Updates the specified promotion code by setting the values of the parameters passed. Most fields are, by design, not editable.
+        """
+        return cast(
+            PromotionCode,
+            await self._request_async(
+                "post",
+                "/v1/promotion_codes/{promotion_code}".format(
+                    promotion_code=sanitize_id(promotion_code),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
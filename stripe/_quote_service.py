@@ -585,6 +585,26 @@ class QuoteService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "QuoteService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Quote]:
+        """
+        Returns a list of your quotes.
+        """
+        return cast(
+            ListObject[Quote],
+            await self._request_async(
+                "get",
+                "/v1/quotes",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "QuoteService.CreateParams" = {},
@@ -605,6 +625,26 @@ class QuoteService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "QuoteService.CreateParams" = {},
+        options: RequestOptions = {},
+    ) -> Quote:
+        """
+        A quote models prices and services for a customer. Default options for header, description, footer, and expires_at can be set in the dashboard via the [quote template](https://dashboard.stripe.com/settings/billing/quote).
+        """
+        return cast(
+            Quote,
+            await self._request_async(
+                "post",
+                "/v1/quotes",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         quote: str,
@@ -626,6 +666,27 @@ class QuoteService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        quote: str,
+        params: "QuoteService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Quote:
+        """
+        Retrieves the quote with the given ID.
+        """
+        return cast(
+            Quote,
+            await self._request_async(
+                "get",
+                "/v1/quotes/{quote}".format(quote=sanitize_id(quote)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         quote: str,
@@ -647,6 +708,27 @@ class QuoteService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        quote: str,
+        params: "QuoteService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> Quote:
+        """
+        A quote models prices and services for a customer.
+        """
+        return cast(
+            Quote,
+            await self._request_async(
+                "post",
+                "/v1/quotes/{quote}".format(quote=sanitize_id(quote)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def accept(
         self,
         quote: str,
@@ -668,6 +750,27 @@ class QuoteService(StripeService):
             ),
         )
 
+    async def accept_async(
+        self,
+        quote: str,
+        params: "QuoteService.AcceptParams" = {},
+        options: RequestOptions = {},
+    ) -> Quote:
+        """
+        Accepts the specified quote.
+        """
+        return cast(
+            Quote,
+            await self._request_async(
+                "post",
+                "/v1/quotes/{quote}/accept".format(quote=sanitize_id(quote)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def cancel(
         self,
         quote: str,
@@ -689,6 +792,27 @@ class QuoteService(StripeService):
             ),
         )
 
+    async def cancel_async(
+        self,
+        quote: str,
+        params: "QuoteService.CancelParams" = {},
+        options: RequestOptions = {},
+    ) -> Quote:
+        """
+        Cancels the quote.
+        """
+        return cast(
+            Quote,
+            await self._request_async(
+                "post",
+                "/v1/quotes/{quote}/cancel".format(quote=sanitize_id(quote)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def finalize_quote(
         self,
         quote: str,
@@ -710,6 +834,27 @@ class QuoteService(StripeService):
             ),
         )
 
+    async def finalize_quote_async(
+        self,
+        quote: str,
+        params: "QuoteService.FinalizeQuoteParams" = {},
+        options: RequestOptions = {},
+    ) -> Quote:
+        """
+        Finalizes the quote.
+        """
+        return cast(
+            Quote,
+            await self._request_async(
+                "post",
+                "/v1/quotes/{quote}/finalize".format(quote=sanitize_id(quote)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def pdf(
         self,
         quote: str,
@@ -730,3 +875,24 @@ class QuoteService(StripeService):
                 options=options,
             ),
         )
+
+    async def pdf_async(
+        self,
+        quote: str,
+        params: "QuoteService.PdfParams" = {},
+        options: RequestOptions = {},
+    ) -> Any:
+        """
+        Download the PDF for a finalized quote
+        """
+        return cast(
+            Any,
+            await self._request_stream_async(
+                "get",
+                "/v1/quotes/{quote}/pdf".format(quote=sanitize_id(quote)),
+                api_mode="V1",
+                base_address="files",
+                params=params,
+                options=options,
+            ),
+        )
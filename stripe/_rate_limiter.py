@@ -0,0 +1,201 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class _TokenBucket(object):
+    def __init__(self, rate: float, burst: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        # When the bucket was last refilled. This is pushed into the future
+        # while requests are paused, so that no tokens accrue until then.
+        self.updated = time.monotonic()
+        # Bumped on every slow down, so that a wave of 429s from requests
+        # that were all sent at the old rate only counts once.
+        self.epoch = 0
+
+    def refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+
+    def reserve(self, now: float) -> float:
+        self.refill(now)
+        self.tokens -= 1
+        wait = max(0.0, self.updated - now)
+        if self.tokens < 0:
+            wait += -self.tokens / self.rate
+        return wait
+
+
+class RateLimiter(object):
+    """
+    A client-side token bucket limiter for an `HTTPClient`, shared by every
+    thread using that client. Reads (`GET` and `HEAD`) and writes are
+    limited separately, mirroring how the API limits them.
+
+    The limiter adapts to feedback from the API: a 429 halves the rate of
+    the kind of request that received it, and each successful request
+    raises it again by `increase`, up to the rate it was configured with.
+    A `Retry-After` header on a 429 pauses all requests until it elapses.
+
+    While a client has a limiter, requests that receive a 429 are retried
+    like other retryable errors.
+    """
+
+    READ_METHODS = ("get", "head")
+
+    def __init__(
+        self,
+        read_rate: float = 100,
+        write_rate: float = 100,
+        burst: Optional[float] = None,
+        min_rate: float = 1,
+        increase: float = 1,
+        decrease_factor: float = 0.5,
+        max_retry_after: float = 60,
+    ):
+        """
+        :param read_rate: the maximum number of reads per second.
+        :param write_rate: the maximum number of writes per second.
+        :param burst: how many requests of each kind may be sent at once
+          after a quiet period. Defaults to one second's worth.
+        :param min_rate: the rate is never reduced below this.
+        :param increase: how much each successful request raises the rate
+          by, in requests per second.
+        :param decrease_factor: what the rate is multiplied by on a 429.
+        :param max_retry_after: `Retry-After` values above this many seconds
+          are ignored.
+        """
+        if min(read_rate, write_rate, min_rate) <= 0:
+            raise ValueError("Rates must be positive")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self._buckets: Dict[str, _TokenBucket] = {
+            "read": _TokenBucket(
+                read_rate, burst if burst is not None else read_rate
+            ),
+            "write": _TokenBucket(
+                write_rate, burst if burst is not None else write_rate
+            ),
+        }
+        self._min_rate = min_rate
+        self._increase = increase
+        self._decrease_factor = decrease_factor
+        self._max_retry_after = max_retry_after
+        self._paused_until = 0.0
+        # Bumped on every pause, so waiting requests can tell they need to
+        # queue up again behind it.
+        self._pauses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def rates(self) -> Dict[str, float]:
+        """
+        The current number of requests per second allowed for reads and
+        writes.
+        """
+        with self._lock:
+            return {kind: b.rate for kind, b in self._buckets.items()}
+
+    @property
+    def paused_until(self) -> Optional[float]:
+        """
+        The `time.monotonic()` time until which requests are paused because
+        of a `Retry-After`, or None if they aren't.
+        """
+        with self._lock:
+            if self._paused_until > time.monotonic():
+                return self._paused_until
+            return None
+
+    def _kind(self, method: str) -> str:
+        return "read" if method.lower() in self.READ_METHODS else "write"
+
+    def reserve(self, method: str) -> Tuple[float, Tuple[str, int]]:
+        """
+        Takes a token for a `method` request without blocking. Returns how
+        many seconds to wait before sending it, and a ticket to pass to
+        `record` along with the response.
+        """
+        wait, ticket, _ = self._reserve(method)
+        return wait, ticket
+
+    def _reserve(self, method: str) -> Tuple[float, Tuple[str, int], int]:
+        kind = self._kind(method)
+        with self._lock:
+            bucket = self._buckets[kind]
+            wait = bucket.reserve(time.monotonic())
+            return wait, (kind, bucket.epoch), self._pauses
+
+    def _paused_since(self, pauses: int) -> bool:
+        # A pause that started after our token was reserved means the wait
+        # we were given is stale, so we queue up again behind it.
+        with self._lock:
+            return self._pauses != pauses
+
+    def acquire(self, method: str) -> Tuple[str, int]:
+        """
+        Blocks until a `method` request may be sent, and returns the ticket
+        to pass to `record`.
+        """
+        while True:
+            wait, ticket, pauses = self._reserve(method)
+            if wait > 0:
+                time.sleep(wait)
+            if not self._paused_since(pauses):
+                return ticket
+
+    async def acquire_async(self, method: str) -> Tuple[str, int]:
+        """
+        Like `acquire`, but waits without blocking the event loop.
+        """
+        while True:
+            wait, ticket, pauses = self._reserve(method)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if not self._paused_since(pauses):
+                return ticket
+
+    def record(
+        self,
+        ticket: Tuple[str, int],
+        status_code: int,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Adjusts the limiter for the response to a request sent with
+        `ticket`.
+        """
+        kind, epoch = ticket
+        with self._lock:
+            bucket = self._buckets[kind]
+            if status_code != 429:
+                bucket.rate = min(
+                    bucket.max_rate, bucket.rate + self._increase
+                )
+                return
+
+            if epoch == bucket.epoch:
+                bucket.epoch += 1
+                bucket.rate = max(
+                    self._min_rate, bucket.rate * self._decrease_factor
+                )
+                # Don't let a full bucket burst straight back into the limit.
+                bucket.tokens = min(bucket.tokens, 1.0)
+
+            if retry_after and 0 < retry_after <= self._max_retry_after:
+                now = time.monotonic()
+                self._pauses += 1
+                self._paused_until = max(self._paused_until, now + retry_after)
+                # Waiting requests queue up again behind the pause, so the
+                # tokens they took are given back.
+                for b in self._buckets.values():
+                    b.tokens = 0.0
+                    b.updated = max(b.updated, self._paused_until)
@@ -0,0 +1,347 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+    cast,
+)
+from typing_extensions import TYPE_CHECKING
+
+from stripe._any_iterator import AnyIterator
+from stripe._api_mode import ApiMode
+from stripe._checkpoint_store import (
+    CheckpointStore,
+    _check_checkpoint,
+    _checkpointed,
+    _checkpointed_async,
+)
+from stripe._page_cursor import PageCursor
+from stripe._prefetch import (
+    PREFETCH_LIMIT,
+    _check_prefetch,
+    _prefetched,
+    _prefetched_async,
+)
+from stripe._request_options import RequestOptions
+
+if TYPE_CHECKING:
+    from stripe._api_requestor import _APIRequestor
+
+# Nested fields to keep, with True for a field that's kept whole
+_FieldTree = Dict[str, Any]
+
+
+class RawPage(object):
+    """
+    A page of a list or search made with `raw=True`: its objects are the
+    dicts they were parsed as, rather than `StripeObject`s. Like a
+    `ListObject`, it can fetch the pages after it, or iterate through the
+    objects on every page with `auto_paging_iter`.
+    """
+
+    __slots__ = (
+        "object",
+        "data",
+        "has_more",
+        "url",
+        "_next_page",
+        "_requestor",
+        "_params",
+        "_options",
+        "_api_mode",
+    )
+
+    object: str
+    data: List[Dict[str, Any]]
+    has_more: bool
+    url: Optional[str]
+    _api_mode: ApiMode
+
+    def __init__(
+        self,
+        values: Mapping[str, Any],
+        *,
+        requestor: "_APIRequestor",
+        params: Optional[Mapping[str, Any]],
+        options: Optional[RequestOptions],
+        api_mode: ApiMode,
+    ):
+        self.object = values.get("object", "list")
+        self.data = values.get("data") or []
+        self.has_more = bool(values.get("has_more"))
+        self.url = values.get("url")
+        self._next_page = values.get("next_page")
+        self._requestor = requestor
+        self._params = dict(params or {})
+        self._options = options
+        self._api_mode = api_mode
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __reversed__(self) -> Iterator[Dict[str, Any]]:
+        return reversed(self.data)
+
+    def __repr__(self) -> str:
+        return "<RawPage %s url=%s len=%d has_more=%s>" % (
+            self.object,
+            self.url,
+            len(self.data),
+            self.has_more,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.data
+
+    def auto_paging_iter(
+        self,
+        *,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+    ) -> AnyIterator[Dict[str, Any]]:
+        """
+        Iterates through the objects on this page and every page after it,
+        with up to `prefetch` pages fetched ahead in the background, and the
+        cursor of each page saved to `checkpoint`, as with
+        `ListObject.auto_paging_iter`.
+        """
+        _check_prefetch(prefetch)
+        _check_checkpoint(checkpoint, checkpoint_key)
+        return AnyIterator(
+            self._auto_paging_iter(prefetch, checkpoint, checkpoint_key),
+            self._auto_paging_iter_async(prefetch, checkpoint, checkpoint_key),
+        )
+
+    def _auto_paging_iter(
+        self,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        backwards = self._is_backwards_pagination()
+        for page in _checkpointed(
+            self._pages(prefetch), checkpoint, checkpoint_key
+        ):
+            yield from reversed(page) if backwards else page
+
+    async def _auto_paging_iter_async(
+        self,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        backwards = self._is_backwards_pagination()
+        async for page in _checkpointed_async(
+            self._pages_async(prefetch), checkpoint, checkpoint_key
+        ):
+            for item in reversed(page) if backwards else page:
+                yield item
+
+    def _pages(self, prefetch: int) -> Iterator["RawPage"]:
+        if prefetch:
+            yield from _prefetched(self, RawPage._prefetch_page, prefetch)
+            return
+
+        page = self
+        while True:
+            yield page
+            if not page.has_more:
+                break
+            page = page.next_page()
+            if page.is_empty:
+                break
+
+    async def _pages_async(self, prefetch: int) -> AsyncIterator["RawPage"]:
+        if prefetch:
+            async for page in _prefetched_async(
+                self, RawPage._prefetch_page_async, prefetch
+            ):
+                yield page
+            return
+
+        page = self
+        while True:
+            yield page
+            if not page.has_more:
+                break
+            page = await page.next_page_async()
+            if page.is_empty:
+                break
+
+    @property
+    def cursor(self) -> Optional[PageCursor]:
+        """
+        Where to resume iterating after this page, or None if it's the
+        last.
+        """
+        if self.is_empty or not self.has_more:
+            return None
+        return PageCursor._from_filters(
+            self._page_url(), self._get_filters_for_next_page()
+        )
+
+    def next_page(self) -> "RawPage":
+        """
+        The page after this one, or before it when paginating backwards
+        with `ending_before`.
+        """
+        if not self.has_more:
+            return self._empty_page()
+        return self._fetch(self._get_filters_for_next_page())
+
+    async def next_page_async(self) -> "RawPage":
+        if not self.has_more:
+            return self._empty_page()
+        return await self._fetch_async(self._get_filters_for_next_page())
+
+    def _fetch(self, params: Mapping[str, Any]) -> "RawPage":
+        page = self._requestor.request(
+            "get",
+            self._page_url(),
+            params,
+            self._options,
+            base_address="api",
+            api_mode=self._api_mode,
+        )
+        return cast("RawPage", page)
+
+    async def _fetch_async(self, params: Mapping[str, Any]) -> "RawPage":
+        page = await self._requestor.request_async(
+            "get",
+            self._page_url(),
+            params,
+            self._options,
+            base_address="api",
+            api_mode=self._api_mode,
+        )
+        return cast("RawPage", page)
+
+    def _prefetch_page(self) -> Optional["RawPage"]:
+        if not self.has_more:
+            return None
+        page = self._fetch(
+            {"limit": PREFETCH_LIMIT, **self._get_filters_for_next_page()}
+        )
+        return None if page.is_empty else page
+
+    async def _prefetch_page_async(self) -> Optional["RawPage"]:
+        if not self.has_more:
+            return None
+        page = await self._fetch_async(
+            {"limit": PREFETCH_LIMIT, **self._get_filters_for_next_page()}
+        )
+        return None if page.is_empty else page
+
+    def _page_url(self) -> str:
+        if not isinstance(self.url, str):
+            raise ValueError(
+                'Cannot fetch the next page of a list without a string "url" '
+                "property"
+            )
+        return self.url
+
+    def _is_backwards_pagination(self) -> bool:
+        return (
+            "ending_before" in self._params
+            and "starting_after" not in self._params
+        )
+
+    def _get_filters_for_next_page(self) -> Dict[str, Any]:
+        params = dict(self._params)
+        if self.object == "search_result":
+            params["page"] = self._next_page
+        elif self._is_backwards_pagination():
+            params["ending_before"] = self._item_id(self.data[0])
+        else:
+            params["starting_after"] = self._item_id(self.data[-1])
+        return params
+
+    @staticmethod
+    def _item_id(item: Mapping[str, Any]) -> str:
+        item_id = item.get("id")
+        if not item_id:
+            raise ValueError(
+                "Unexpected: element in .data of list object had no id"
+            )
+        return item_id
+
+    def _empty_page(self) -> "RawPage":
+        return RawPage(
+            {"object": self.object, "data": [], "url": self.url},
+            requestor=self._requestor,
+            params=self._params,
+            options=self._options,
+            api_mode=self._api_mode,
+        )
+
+
+def _field_tree(fields: Iterable[str]) -> _FieldTree:
+    """
+    Turns field names, with dots for nested ones like
+    "billing_details.email", into a tree of the fields to keep. An object's
+    `id` and `object` are always kept, so that lists can be paginated.
+    """
+    tree: _FieldTree = {"id": True, "object": True}
+    for field in fields:
+        node = tree
+        *parents, leaf = field.split(".")
+        for parent in parents:
+            child = node.setdefault(parent, {})
+            if child is True:
+                break
+            node = child
+        else:
+            node[leaf] = True
+    return tree
+
+
+def _project(value: Any, tree: _FieldTree) -> Any:
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {
+        key: value[key] if subtree is True else _project(value[key], subtree)
+        for key, subtree in tree.items()
+        if key in value
+    }
+
+
+def _raw_result(
+    data: Any,
+    *,
+    fields: Optional[Iterable[str]],
+    requestor: "_APIRequestor",
+    params: Optional[Mapping[str, Any]],
+    options: Optional[RequestOptions],
+    api_mode: ApiMode,
+) -> Union[Dict[str, Any], RawPage]:
+    is_page = isinstance(data, dict) and data.get("object") in (
+        "list",
+        "search_result",
+    )
+    if fields is not None:
+        tree = _field_tree(fields)
+        if is_page:
+            data = dict(data, data=_project(data.get("data") or [], tree))
+        else:
+            data = _project(data, tree)
+    if is_page:
+        return RawPage(
+            data,
+            requestor=requestor,
+            params=params,
+            options=options,
+            api_mode=api_mode,
+        )
+    return data
@@ -148,6 +148,26 @@ class RefundService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "RefundService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Refund]:
+        """
+        Returns a list of all refunds you created. We return the refunds in sorted order, with the most recent refunds appearing first The 10 most recent refunds are always available by default on the Charge object.
+        """
+        return cast(
+            ListObject[Refund],
+            await self._request_async(
+                "get",
+                "/v1/refunds",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "RefundService.CreateParams" = {},
@@ -178,6 +198,36 @@ class RefundService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "RefundService.CreateParams" = {},
+        options: RequestOptions = {},
+    ) -> Refund:
+        """
+        When you create a new refund, you must specify a Charge or a PaymentIntent object on which to create it.
+
+        Creating a new refund will refund a charge that has previously been created but not yet refunded.
+        Funds will be refunded to the credit or debit card that was originally charged.
+
+        You can optionally refund only part of a charge.
+        You can do so multiple times, until the entire charge has been refunded.
+
+        Once entirely refunded, a charge can't be refunded again.
+        This method will raise an error when called on an already-refunded charge,
+        or when trying to refund more money than is left on a charge.
+        """
+        return cast(
+            Refund,
+            await self._request_async(
+                "post",
+                "/v1/refunds",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         refund: str,
@@ -199,6 +249,27 @@ class RefundService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        refund: str,
+        params: "RefundService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Refund:
+        """
+        Retrieves the details of an existing refund.
+        """
+        return cast(
+            Refund,
+            await self._request_async(
+                "get",
+                "/v1/refunds/{refund}".format(refund=sanitize_id(refund)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         refund: str,
@@ -222,6 +293,29 @@ class RefundService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        refund: str,
+        params: "RefundService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> Refund:
+        """
+        Updates the refund that you specify by setting the values of the passed parameters. Any parameters that you don't provide remain unchanged.
+
+        This request only accepts metadata as an argument.
+        """
+        return cast(
+            Refund,
+            await self._request_async(
+                "post",
+                "/v1/refunds/{refund}".format(refund=sanitize_id(refund)),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def cancel(
         self,
         refund: str,
@@ -246,3 +340,28 @@ class RefundService(StripeService):
                 options=options,
             ),
         )
+
+    async def cancel_async(
+        self,
+        refund: str,
+        params: "RefundService.CancelParams" = {},
+        options: RequestOptions = {},
+    ) -> Refund:
+        """
+        Cancels a refund with a status of requires_action.
+
+        You can't cancel refunds in other states. Only refunds for payment methods that require customer action can enter the requires_action state.
+        """
+        return cast(
+            Refund,
+            await self._request_async(
+                "post",
+                "/v1/refunds/{refund}/cancel".format(
+                    refund=sanitize_id(refund),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
@@ -1,8 +1,19 @@
 from stripe._requestor_options import RequestorOptions
-from typing import Mapping, Optional, Dict, Tuple, Any
+from typing import Mapping, Optional, Dict, List, Tuple, Any
 from typing_extensions import NotRequired, TypedDict
 
 
+class RequestTimeout(TypedDict, total=False):
+    connect: float
+    """
+    Seconds to wait for a connection to be established.
+    """
+    read: float
+    """
+    Seconds to wait for the server to send data once connected.
+    """
+
+
 class RequestOptions(TypedDict):
     api_key: NotRequired["str|None"]
     stripe_version: NotRequired["str|None"]
@@ -10,6 +21,27 @@ class RequestOptions(TypedDict):
     max_network_retries: NotRequired["int|None"]
     idempotency_key: NotRequired["str|None"]
     headers: NotRequired["Mapping[str, str]|None"]
+    timeout: NotRequired["float|RequestTimeout|None"]
+    """
+    Timeouts for each attempt at the request, in seconds: either one number
+    for both connecting and reading, or separate `connect` and `read` values.
+    """
+    deadline: NotRequired["float|None"]
+    """
+    Seconds the request may take in total, including any retries.
+    """
+    raw: NotRequired["bool|None"]
+    """
+    Return the response as the dicts and lists it was parsed as, or a
+    `RawPage` of them for lists, rather than as `StripeObject`s. Only for
+    requests made through a `StripeClient`.
+    """
+    fields: NotRequired["List[str]|None"]
+    """
+    With `raw`, the fields of each returned object to keep, with dots for
+    nested ones like "billing_details.email". The rest are dropped as soon
+    as the response is parsed.
+    """
 
 
 def merge_options(
@@ -28,6 +60,8 @@ def merge_options(
             "max_network_retries": requestor.max_network_retries,
             "idempotency_key": None,
             "headers": None,
+            "timeout": None,
+            "deadline": None,
         }
 
     return {
@@ -41,6 +75,8 @@ def merge_options(
         else requestor.max_network_retries,
         "idempotency_key": request.get("idempotency_key"),
         "headers": request.get("headers"),
+        "timeout": request.get("timeout"),
+        "deadline": request.get("deadline"),
     }
 
 
@@ -50,6 +86,10 @@ def extract_options_from_dict(
     """
     Extracts a RequestOptions object from a dict, and returns a tuple of
     the RequestOptions object and the remaining dict.
+
+    The dict holds the keyword params of a resource method, which always
+    returns `StripeObject`s, so `raw` and `fields` are rejected rather than
+    sent to the API as params.
     """
     if not d:
         return {}, {}
@@ -62,8 +102,16 @@ def extract_options_from_dict(
         "max_network_retries",
         "idempotency_key",
         "headers",
+        "timeout",
+        "deadline",
     ]:
         if key in d_copy:
             options[key] = d_copy.pop(key)
+    for key in ["raw", "fields"]:
+        if key in d_copy:
+            raise ValueError(
+                "%s can only be used with StripeClient services, e.g. "
+                'client.customers.list(options={"raw": True})' % (key,)
+            )
 
     return options, d_copy
@@ -0,0 +1,429 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlsplit
+
+from stripe._util import get_object_classes
+
+_Response = Tuple[bytes, int, Mapping[str, str]]
+
+
+class ResponseCache(object):
+    """
+    Caches the API's responses to `GET` requests for resources that rarely
+    change, such as prices and tax rates, so that retrieving or listing them
+    again doesn't go to the network until the response is `ttls` seconds
+    old. Retrieving an object that doesn't exist is cached too, for
+    `negative_ttl` seconds.
+
+    Responses are forgotten early when the bindings update or delete the
+    object they're for, or when the cache is given an `Event` about it
+    through `invalidate`. Objects that another one was expanded into aren't
+    tracked, and stay cached until they expire.
+
+    `MemoryResponseCache` keeps responses in the process, and
+    `SQLiteResponseCache` in a file that several processes can share.
+    """
+
+    DEFAULT_TTLS: ClassVar[Dict[str, float]] = {
+        "country_spec": 24 * 60 * 60,
+        "exchange_rate": 60,
+        "price": 5 * 60,
+        "product": 5 * 60,
+        "shipping_rate": 5 * 60,
+        "tax_code": 24 * 60 * 60,
+        "tax_rate": 5 * 60,
+    }
+
+    ttls: Dict[str, float]
+    negative_ttl: float
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        negative_ttl: float = 30,
+    ):
+        """
+        `ttls` maps the names of the objects to cache, like "price", to how
+        many seconds their responses are used for, replacing
+        `DEFAULT_TTLS`.
+        """
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self.negative_ttl = negative_ttl
+        self._paths: Optional[Dict[str, str]] = None
+
+    def invalidate(self, obj: Mapping[str, Any]) -> None:
+        """
+        Forgets the cached responses that `obj` may have made stale, along
+        with every cached list of its kind. `obj` is either an `Event`, for
+        example from `Webhook.construct_event`, or an object itself.
+        """
+        if obj.get("object") == "event":
+            obj = obj["data"]["object"]
+        name = obj.get("object")
+        if name in self.ttls:
+            self._delete(name, obj.get("id"))
+
+    def clear(self) -> None:
+        """
+        Forgets every cached response.
+        """
+        raise NotImplementedError(
+            "ResponseCache subclasses must implement `clear`"
+        )
+
+    def _get(self, key: str) -> Optional[_Response]:
+        raise NotImplementedError(
+            "ResponseCache subclasses must implement `_get`"
+        )
+
+    def _set(
+        self,
+        key: str,
+        name: str,
+        object_id: Optional[str],
+        response: _Response,
+        ttl: float,
+    ) -> None:
+        raise NotImplementedError(
+            "ResponseCache subclasses must implement `_set`"
+        )
+
+    def _delete(self, name: str, object_id: Optional[str]) -> None:
+        """
+        Forgets every list of the kind of object `name`, and the responses
+        for the object `object_id` if there is one.
+        """
+        raise NotImplementedError(
+            "ResponseCache subclasses must implement `_delete`"
+        )
+
+    def _lookup(
+        self, url: str, key: Optional[Tuple[Any, ...]]
+    ) -> Optional[_Response]:
+        if key is None or self._resource(url) is None:
+            return None
+        return self._get(self._digest(key))
+
+    def _store(
+        self,
+        url: str,
+        key: Optional[Tuple[Any, ...]],
+        response: Tuple[object, int, Mapping[str, str]],
+    ) -> None:
+        """
+        Caches the response to a `GET` request, or forgets the responses
+        that a successful write to `url`, with no `key`, has made stale.
+        """
+        resource = self._resource(url)
+        if resource is None:
+            return
+        name, object_id = resource
+        if key is None:
+            if 200 <= response[1] < 300:
+                self._delete(name, object_id)
+            return
+
+        rbody, rcode, rheaders = response
+        if 200 <= rcode < 300:
+            ttl = self.ttls[name]
+        elif rcode == 404 and object_id is not None:
+            ttl = self.negative_ttl
+        else:
+            return
+        if ttl <= 0:
+            return
+
+        if not isinstance(rbody, bytes):
+            rbody = str(rbody).encode("utf-8")
+        self._set(
+            self._digest(key), name, object_id, (rbody, rcode, rheaders), ttl
+        )
+
+    def _resource(self, url: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        The name of the kind of object `url` is for, and the object's ID if
+        it's for a single one, or None if its responses aren't cached.
+        """
+        if self._paths is None:
+            # Built on first use, as the object classes import the bindings.
+            self._paths = {
+                klass.class_url(): name
+                for name, klass in get_object_classes().items()
+                if name in self.ttls and hasattr(klass, "class_url")
+            }
+
+        path = urlsplit(url).path
+        if path in self._paths:
+            return self._paths[path], None
+        parent, _, object_id = path.rpartition("/")
+        if parent in self._paths:
+            if object_id == "search":
+                return self._paths[parent], None
+            return self._paths[parent], object_id
+        return None
+
+    @staticmethod
+    def _digest(key: Tuple[Any, ...]) -> str:
+        # Keys hold API keys, so only a digest of them is stored.
+        return hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+
+
+class _Entry(object):
+    __slots__ = ("name", "object_id", "response", "expires_at", "size")
+
+    def __init__(
+        self,
+        name: str,
+        object_id: Optional[str],
+        response: _Response,
+        expires_at: float,
+    ):
+        self.name = name
+        self.object_id = object_id
+        self.response = response
+        self.expires_at = expires_at
+        self.size = len(response[0])
+
+
+class MemoryResponseCache(ResponseCache):
+    """
+    A `ResponseCache` kept in memory and shared by the threads in a
+    process. Once the cached bodies add up to more than `max_bytes`, the
+    least recently used responses are evicted.
+    """
+
+    max_bytes: int
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        negative_ttl: float = 30,
+        max_bytes: int = 16 * 1024 * 1024,
+    ):
+        super().__init__(ttls=ttls, negative_ttl=negative_ttl)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _get(self, key: str) -> Optional[_Response]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.response
+
+    def _set(
+        self,
+        key: str,
+        name: str,
+        object_id: Optional[str],
+        response: _Response,
+        ttl: float,
+    ) -> None:
+        entry = _Entry(name, object_id, response, time.monotonic() + ttl)
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _delete(self, name: str, object_id: Optional[str]) -> None:
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.name == name
+                and (entry.object_id is None or entry.object_id == object_id)
+            ]
+            for key in stale:
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        self._size -= self._entries.pop(key).size
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    A `ResponseCache` kept in an SQLite database at `path`, which worker
+    processes on the same machine can share. Once the cached bodies add up
+    to more than `max_bytes`, the least recently used responses are
+    evicted.
+    """
+
+    path: str
+    max_bytes: int
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Optional[Mapping[str, float]] = None,
+        negative_ttl: float = 30,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        super().__init__(ttls=ttls, negative_ttl=negative_ttl)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection can't be used by a process forked after it was
+        # opened, so each process opens its own.
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path,
+                timeout=10,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS stripe_responses ("
+                "key TEXT PRIMARY KEY, "
+                "name TEXT NOT NULL, "
+                "object_id TEXT, "
+                "body BLOB NOT NULL, "
+                "code INTEGER NOT NULL, "
+                "headers TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, "
+                "used_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS stripe_responses_object "
+                "ON stripe_responses (name, object_id)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS stripe_responses_used_at "
+                "ON stripe_responses (used_at)"
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM stripe_responses")
+
+    def _get(self, key: str) -> Optional[_Response]:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT body, code, headers FROM stripe_responses "
+                "WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE stripe_responses SET used_at = ? WHERE key = ?",
+                (now, key),
+            )
+        body, code, headers = row
+        return bytes(body), code, json.loads(headers)
+
+    def _set(
+        self,
+        key: str,
+        name: str,
+        object_id: Optional[str],
+        response: _Response,
+        ttl: float,
+    ) -> None:
+        rbody, rcode, rheaders = response
+        if len(rbody) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO stripe_responses VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        name,
+                        object_id,
+                        sqlite3.Binary(rbody),
+                        rcode,
+                        json.dumps(dict(rheaders)),
+                        len(rbody),
+                        now + ttl,
+                        now,
+                    ),
+                )
+                self._evict(connection, now)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute(
+            "DELETE FROM stripe_responses WHERE expires_at <= ?", (now,)
+        )
+        (size,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM stripe_responses"
+        ).fetchone()
+        if size <= self.max_bytes:
+            return
+
+        evicted: List[Tuple[str]] = []
+        for key, entry_size in connection.execute(
+            "SELECT key, size FROM stripe_responses ORDER BY used_at"
+        ):
+            evicted.append((key,))
+            size -= entry_size
+            if size <= self.max_bytes:
+                break
+        connection.executemany(
+            "DELETE FROM stripe_responses WHERE key = ?", evicted
+        )
+
+    def _delete(self, name: str, object_id: Optional[str]) -> None:
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM stripe_responses WHERE name = ? "
+                "AND (object_id IS NULL OR object_id = ?)",
+                (name, object_id),
+            )
@@ -8,11 +8,27 @@ from typing import (
     Any,
     Mapping,
     Iterator,
+    AsyncIterator,
+    Optional,
 )
 
 from stripe._api_requestor import (
     _APIRequestor,  # pyright: ignore[reportPrivateUsage]
 )
+from stripe._any_iterator import AnyIterator
+from stripe._checkpoint_store import (
+    CheckpointStore,
+    _check_checkpoint,  # pyright: ignore[reportPrivateUsage]
+    _checkpointed,  # pyright: ignore[reportPrivateUsage]
+    _checkpointed_async,  # pyright: ignore[reportPrivateUsage]
+)
+from stripe._page_cursor import PageCursor
+from stripe._prefetch import (
+    PREFETCH_LIMIT,
+    _check_prefetch,  # pyright: ignore[reportPrivateUsage]
+    _prefetched,  # pyright: ignore[reportPrivateUsage]
+    _prefetched_async,  # pyright: ignore[reportPrivateUsage]
+)
 from stripe._stripe_object import StripeObject
 from stripe import _util
 import warnings
@@ -26,6 +42,7 @@ class SearchResultObject(StripeObject, Generic[T]):
     data: List[StripeObject]
     has_more: bool
     next_page: str
+    url: str
 
     def _search(self, **params: Mapping[str, Any]) -> Self:
         with warnings.catch_warnings():
@@ -34,6 +51,23 @@ class SearchResultObject(StripeObject, Generic[T]):
                 **params,
             )
 
+    async def _search_async(self, **params: Mapping[str, Any]) -> Self:
+        url = self.get("url")
+        if not isinstance(url, str):
+            raise ValueError(
+                'Cannot call .list on a list object without a string "url" property'
+            )
+        return cast(
+            Self,
+            await self._request_async(
+                "get",
+                url,
+                params=params,
+                base_address="api",
+                api_mode="V1",
+            ),
+        )
+
     @_util.deprecated(
         "This will be removed in a future version of stripe-python. Please call the `search` method on the corresponding resource directly, instead of the generic search on SearchResultObject."
     )
@@ -74,17 +108,114 @@ class SearchResultObject(StripeObject, Generic[T]):
     def __len__(self) -> int:
         return getattr(self, "data", []).__len__()
 
-    def auto_paging_iter(self) -> Iterator[T]:
-        page = self
+    def auto_paging_iter(
+        self,
+        *,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+    ) -> AnyIterator[T]:
+        """
+        Iterates through the objects on this page and every page after it.
 
-        while True:
+        With `prefetch`, up to that many pages are fetched in the background
+        ahead of the one being iterated through, 100 objects at a time
+        unless the search was made with a `limit`.
+
+        With `checkpoint`, the `cursor` of each page is saved to that
+        `CheckpointStore` under `checkpoint_key` once the page has been
+        iterated through, so the iteration can be resumed from there.
+        """
+        _check_prefetch(prefetch)
+        _check_checkpoint(checkpoint, checkpoint_key)
+        return AnyIterator(
+            self._auto_paging_iter(prefetch, checkpoint, checkpoint_key),
+            self._auto_paging_iter_async(prefetch, checkpoint, checkpoint_key),
+        )
+
+    def _auto_paging_iter(
+        self,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+    ) -> Iterator[T]:
+        for page in _checkpointed(
+            self._pages(prefetch), checkpoint, checkpoint_key
+        ):
+            yield from page
+
+    async def _auto_paging_iter_async(
+        self,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+    ) -> AsyncIterator[T]:
+        async for page in _checkpointed_async(
+            self._pages_async(prefetch), checkpoint, checkpoint_key
+        ):
             for item in page:
                 yield item
+
+    def _pages(self, prefetch: int) -> Iterator[Self]:
+        if prefetch:
+            yield from _prefetched(
+                self, lambda page: page._prefetch_page(), prefetch
+            )
+            return
+
+        page = self
+
+        while True:
+            yield page
             page = page.next_search_result_page()
 
             if page.is_empty:
                 break
 
+    async def _pages_async(self, prefetch: int) -> AsyncIterator[Self]:
+        if prefetch:
+            async for page in _prefetched_async(
+                self, lambda page: page._prefetch_page_async(), prefetch
+            ):
+                yield page
+            return
+
+        page = self
+
+        while True:
+            yield page
+            page = await page.next_search_result_page_async()
+
+            if page.is_empty:
+                break
+
+    @property
+    def cursor(self) -> Optional[PageCursor]:
+        """
+        Where to resume iterating through the search after this page, or
+        None if it's the last.
+        """
+        if self.is_empty or not self.get("has_more"):
+            return None
+        return PageCursor._from_filters(  # pyright: ignore[reportPrivateUsage]
+            self.url, self._get_filters_for_next_page({})
+        )
+
+    def _get_filters_for_prefetch(self) -> Mapping[str, Any]:
+        return {"limit": PREFETCH_LIMIT, **self._get_filters_for_next_page({})}
+
+    def _prefetch_page(self) -> Optional[Self]:
+        if not self.has_more:
+            return None
+        page = self._search(**self._get_filters_for_prefetch())
+        return None if page.is_empty else page
+
+    async def _prefetch_page_async(self) -> Optional[Self]:
+        if not self.has_more:
+            return None
+        page = await self._search_async(**self._get_filters_for_prefetch())
+        return None if page.is_empty else page
+
     @classmethod
     def _empty_search_result(
         cls,
@@ -114,10 +245,29 @@ class SearchResultObject(StripeObject, Generic[T]):
                 stripe_account=options.get("stripe_account"),
             )
 
+        return self._search(
+            **self._get_filters_for_next_page(params),
+        )
+
+    async def next_search_result_page_async(
+        self, **params: Unpack[RequestOptions]
+    ) -> Self:
+        if not self.has_more:
+            options, _ = extract_options_from_dict(params)
+            return self._empty_search_result(
+                api_key=options.get("api_key"),
+                stripe_version=options.get("stripe_version"),
+                stripe_account=options.get("stripe_account"),
+            )
+
+        return await self._search_async(
+            **self._get_filters_for_next_page(params),
+        )
+
+    def _get_filters_for_next_page(
+        self, params: RequestOptions
+    ) -> Mapping[str, Any]:
         params_with_filters = dict(self._retrieve_params)
         params_with_filters.update({"page": self.next_page})
         params_with_filters.update(params)
-
-        return self._search(
-            **params_with_filters,
-        )
+        return params_with_filters
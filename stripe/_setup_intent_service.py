@@ -2897,6 +2897,26 @@ class SetupIntentService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "SetupIntentService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[SetupIntent]:
+        """
+        Returns a list of SetupIntents.
+        """
+        return cast(
+            ListObject[SetupIntent],
+            await self._request_async(
+                "get",
+                "/v1/setup_intents",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "SetupIntentService.CreateParams" = {},
@@ -2920,6 +2940,29 @@ class SetupIntentService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "SetupIntentService.CreateParams" = {},
+        options: RequestOptions = {},
+    ) -> SetupIntent:
+        """
+        Creates a SetupIntent object.
+
+        After you create the SetupIntent, attach a payment method and [confirm](https://stripe.com/docs/api/setup_intents/confirm)
+        it to collect any required permissions to charge the payment method later.
+        """
+        return cast(
+            SetupIntent,
+            await self._request_async(
+                "post",
+                "/v1/setup_intents",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         intent: str,
@@ -2947,6 +2990,33 @@ class SetupIntentService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        intent: str,
+        params: "SetupIntentService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> SetupIntent:
+        """
+        Retrieves the details of a SetupIntent that has previously been created.
+
+        Client-side retrieval using a publishable key is allowed when the client_secret is provided in the query string.
+
+        When retrieved with a publishable key, only a subset of properties will be returned. Please refer to the [SetupIntent](https://stripe.com/docs/api#setup_intent_object) object reference for more details.
+        """
+        return cast(
+            SetupIntent,
+            await self._request_async(
+                "get",
+                "/v1/setup_intents/{intent}".format(
+                    intent=sanitize_id(intent)
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         intent: str,
@@ -2970,6 +3040,29 @@ class SetupIntentService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        intent: str,
+        params: "SetupIntentService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> SetupIntent:
+        """
+        Updates a SetupIntent object.
+        """
+        return cast(
+            SetupIntent,
+            await self._request_async(
+                "post",
+                "/v1/setup_intents/{intent}".format(
+                    intent=sanitize_id(intent)
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def cancel(
         self,
         intent: str,
@@ -2995,6 +3088,31 @@ class SetupIntentService(StripeService):
             ),
         )
 
+    async def cancel_async(
+        self,
+        intent: str,
+        params: "SetupIntentService.CancelParams" = {},
+        options: RequestOptions = {},
+    ) -> SetupIntent:
+        """
+        You can cancel a SetupIntent object when it's in one of these statuses: requires_payment_method, requires_confirmation, or requires_action.
+
+        After you cancel it, setup is abandoned and any operations on the SetupIntent fail with an error.
+        """
+        return cast(
+            SetupIntent,
+            await self._request_async(
+                "post",
+                "/v1/setup_intents/{intent}/cancel".format(
+                    intent=sanitize_id(intent),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def confirm(
         self,
         intent: str,
@@ -3031,6 +3149,42 @@ class SetupIntentService(StripeService):
             ),
         )
 
+    async def confirm_async(
+        self,
+        intent: str,
+        params: "SetupIntentService.ConfirmParams" = {},
+        options: RequestOptions = {},
+    ) -> SetupIntent:
+        """
+        Confirm that your customer intends to set up the current or
+        provided payment method. For example, you would confirm a SetupIntent
+        when a customer hits the “Save” button on a payment method management
+        page on your website.
+
+        If the selected payment method does not require any additional
+        steps from the customer, the SetupIntent will transition to the
+        succeeded status.
+
+        Otherwise, it will transition to the requires_action status and
+        suggest additional actions via next_action. If setup fails,
+        the SetupIntent will transition to the
+        requires_payment_method status or the canceled status if the
+        confirmation limit is reached.
+        """
+        return cast(
+            SetupIntent,
+            await self._request_async(
+                "post",
+                "/v1/setup_intents/{intent}/confirm".format(
+                    intent=sanitize_id(intent),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def verify_microdeposits(
         self,
         intent: str,
@@ -3053,3 +3207,26 @@ class SetupIntentService(StripeService):
                 options=options,
             ),
         )
+
+    async def verify_microdeposits_async(
+        self,
+        intent: str,
+        params: "SetupIntentService.VerifyMicrodepositsParams" = {},
+        options: RequestOptions = {},
+    ) -> SetupIntent:
+        """
+        Verifies microdeposits on a SetupIntent object.
+        """
+        return cast(
+            SetupIntent,
+            await self._request_async(
+                "post",
+                "/v1/setup_intents/{intent}/verify_microdeposits".format(
+                    intent=sanitize_id(intent),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Tuple, TypeVar
+from typing_extensions import Awaitable
+
+T = TypeVar("T")
+_Key = Tuple[Any, ...]
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    """
+    A copy of `error` for one of the callers sharing it, so that raising it
+    doesn't change the traceback the others see.
+    """
+    copied = type(error).__new__(type(error), *error.args)
+    copied.__dict__.update(error.__dict__)
+    return copied
+
+
+class _SingleFlight(object):
+    """
+    Folds concurrent calls with the same key into one: the first caller
+    makes the call, and callers that arrive while it's in flight wait for
+    it and get the same result, or a copy of the same exception each.
+
+    Once the call finishes the key is forgotten, so nothing is cached and a
+    later call is made afresh.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[_Key, "Future[Any]"] = {}
+        self._tasks: Dict[Tuple[Any, _Key], "asyncio.Future[Any]"] = {}
+
+    def do(self, key: _Key, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = Future()
+
+        if not leader:
+            error = call.exception()
+            if error is not None:
+                raise _copy_error(error) from error
+            return call.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(self, key: _Key, fn: Callable[[], Awaitable[T]]) -> T:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Waiting on another caller relies on asyncio tasks, so e.g.
+            # trio goes uncoalesced.
+            return await fn()
+
+        # Tasks can only be awaited from the loop they were started on.
+        task_key = (loop, key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = asyncio.ensure_future(fn())
+                self._tasks[task_key] = task
+                task.add_done_callback(
+                    lambda done: self._forget_task(task_key, done)
+                )
+
+        # Shielded, so that one caller being cancelled doesn't cancel the
+        # request for the others.
+        try:
+            return await asyncio.shield(task)
+        except Exception as e:
+            if task.done() and not task.cancelled() and task.exception() is e:
+                raise _copy_error(e) from e
+            raise
+
+    def _forget_task(
+        self, task_key: Tuple[Any, _Key], task: "asyncio.Future[Any]"
+    ) -> None:
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+        if not task.cancelled():
+            # Every caller may have been cancelled, leaving the exception
+            # unretrieved.
+            task.exception()
@@ -1,8 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import json
-from collections import OrderedDict
-
 from stripe import (
     DEFAULT_API_BASE,
     DEFAULT_CONNECT_API_BASE,
@@ -10,6 +7,7 @@ from stripe import (
 )
 
 from stripe._error import AuthenticationError
+from stripe import _json
 from stripe._api_requestor import _APIRequestor
 from stripe._requestor_options import RequestorOptions, BaseAddresses
 from stripe._client_options import _ClientOptions
@@ -17,8 +15,26 @@ from stripe._http_client import HTTPClient, new_default_http_client
 from stripe._api_version import _ApiVersion
 from stripe._webhook import Webhook, WebhookSignature
 from stripe._event import Event
+from stripe._batch import BatchResult, _run_batch
+from stripe._export import _export_list
+from stripe._file_export import ExportStats, _export_to_file
+from stripe._page_cursor import PageCursor
+from stripe._request_options import RequestOptions
+from stripe._response_cache import ResponseCache
 
-from typing import Optional, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
+from typing_extensions import Literal
 
 # Non-generated services
 from stripe._oauth_service import OAuthService
@@ -91,6 +107,8 @@ from stripe._webhook_endpoint_service import WebhookEndpointService
 
 # services: The end of the section generated from our OpenAPI spec
 
+T = TypeVar("T")
+
 
 class StripeClient(object):
     def __init__(
@@ -105,6 +123,9 @@ class StripeClient(object):
         proxy: Optional[str] = None,
         max_network_retries: Optional[int] = None,
         http_client: Optional[HTTPClient] = None,
+        warm_up: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        raw: bool = False,
     ):
         # The types forbid this, but let's give users without types a friendly error.
         if api_key is None:  # pyright: ignore[reportUnnecessaryComparison]
@@ -148,6 +169,8 @@ class StripeClient(object):
         self._requestor = _APIRequestor(
             options=requestor_options,
             client=http_client,
+            response_cache=response_cache,
+            raw=raw,
         )
 
         self._options = _ClientOptions(
@@ -231,6 +254,174 @@ class StripeClient(object):
         self.webhook_endpoints = WebhookEndpointService(self._requestor)
         # top-level services: The end of the section generated from our OpenAPI spec
 
+        if warm_up:
+            self.warm_up()
+
+    def warm_up(self) -> None:
+        """
+        Opens connections to each of the client's base addresses ahead of
+        the first request, so that it doesn't pay for DNS, TCP and TLS set
+        up on its critical path. Passing `warm_up=True` to the constructor
+        does this on creation.
+        """
+        http_client = self._requestor._get_http_client()
+        warmed = set()
+        for base_address in self._requestor.base_addresses.values():
+            if not isinstance(base_address, str) or not base_address:
+                continue
+            if base_address not in warmed:
+                warmed.add(base_address)
+                http_client.warm_up(base_address)
+
+    def batch(
+        self,
+        calls: Iterable[Callable[[], T]],
+        *,
+        max_in_flight: int = 8,
+        stop_on_error: bool = False,
+        on_progress: Optional[
+            Callable[[int, int, BatchResult[T]], Any]
+        ] = None,
+    ) -> List[BatchResult[T]]:
+        """
+        Makes many independent calls concurrently, at most `max_in_flight`
+        at a time, and returns a `BatchResult` for each in the order given.
+        Each call is a function taking no arguments, e.g.
+        `functools.partial(client.invoices.retrieve, "in_123")`, and they all
+        share the client's HTTP client.
+
+        A call that raises a `StripeError` doesn't stop the others, unless
+        `stop_on_error` is set, in which case calls that haven't started yet
+        are skipped. Any other exception is raised once the calls already in
+        flight finish.
+
+        :param on_progress: called with the number of calls finished, the
+          number of calls, and the `BatchResult` of the one that just
+          finished, on the thread that called `batch`.
+        """
+        return _run_batch(calls, max_in_flight, stop_on_error, on_progress)
+
+    def export_list(
+        self,
+        list_method: Callable[..., Any],
+        *,
+        created_gte: int,
+        created_lt: int,
+        params: Optional[Mapping[str, Any]] = None,
+        windows: int = 8,
+        max_in_flight: int = 8,
+        ordered: bool = False,
+        min_window: int = 60,
+        max_buffered: int = 16,
+    ) -> Iterator[Any]:
+        """
+        Iterates through every object a list method returns that was created
+        from `created_gte` up to but not including `created_lt`, both Unix
+        timestamps, by paging through `windows` slices of that range
+        concurrently, at most `max_in_flight` requests at a time.
+        `list_method` is called with the list's params, e.g.
+        `client.charges.list`, and the list must accept a `created` filter.
+
+        While there's room for more requests, a window with more than a page
+        of objects is split, as long as what's left of it spans at least
+        twice `min_window` seconds.
+
+        Objects are yielded as their pages arrive, or with `ordered`, newest
+        first, as the list itself returns them. This holds back the pages
+        of later windows until the ones before are done, so those windows
+        fetch a page at a time, and only while fewer than `max_buffered`
+        of their pages are held back or being fetched.
+        """
+        return _export_list(
+            list_method,
+            params,
+            created_gte,
+            created_lt,
+            windows,
+            max_in_flight,
+            ordered,
+            min_window,
+            max_buffered,
+        )
+
+    def export_to_file(
+        self,
+        list_method: Callable[..., Any],
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        format: Literal["ndjson", "csv"] = "ndjson",
+        fields: Optional[List[str]] = None,
+        compress: bool = False,
+        prefetch: int = 1,
+        on_progress: Optional[Callable[[ExportStats], Any]] = None,
+    ) -> ExportStats:
+        """
+        Writes every object a list or search method returns to the file at
+        `path`, one page at a time, and returns how much was written and how
+        long it took. `list_method` is called with `params` and the `raw`
+        option, e.g. `client.charges.list`, so objects are written from the
+        parsed JSON without becoming `StripeObject`s.
+
+        With the "ndjson" format each object is a line of JSON, with only
+        `fields` kept if they're given. With "csv" each object is a row with
+        a column for each of `fields`, which may name nested fields like
+        "billing_details.email". Nested objects and lists in a column are
+        written as JSON.
+
+        :param compress: gzips the file.
+        :param prefetch: how many pages to fetch in the background while
+          earlier ones are written, as with `auto_paging_iter`.
+        :param on_progress: called with the `ExportStats` so far after each
+          page is written.
+        """
+        return _export_to_file(
+            list_method,
+            path,
+            params,
+            format,
+            fields,
+            compress,
+            prefetch,
+            on_progress,
+        )
+
+    def resume_list(
+        self,
+        cursor: PageCursor,
+        options: Optional[RequestOptions] = None,
+    ) -> Any:
+        """
+        Fetches the page of a list or search that `cursor` points to, for
+        example one loaded from a `CheckpointStore`, so that iterating
+        through it with `auto_paging_iter` carries on where the iteration
+        the cursor came from stopped.
+        """
+        return self._requestor.request(
+            "get",
+            cursor.url,
+            cursor.to_params(),
+            options,
+            base_address="api",
+            api_mode="V1",
+            _usage=["stripe_client"],
+        )
+
+    async def resume_list_async(
+        self,
+        cursor: PageCursor,
+        options: Optional[RequestOptions] = None,
+    ) -> Any:
+        return await self._requestor.request_async(
+            "get",
+            cursor.url,
+            cursor.to_params(),
+            options,
+            base_address="api",
+            api_mode="V1",
+            _usage=["stripe_client"],
+        )
+
     def construct_event(
         self,
         payload: Union[bytes, str],
@@ -238,12 +429,13 @@ class StripeClient(object):
         secret: str,
         tolerance: int = Webhook.DEFAULT_TOLERANCE,
     ) -> Event:
-        if hasattr(payload, "decode"):
-            payload = cast(bytes, payload).decode("utf-8")
+        text = payload
+        if hasattr(text, "decode"):
+            text = cast(bytes, text).decode("utf-8")
 
-        WebhookSignature.verify_header(payload, sig_header, secret, tolerance)
+        WebhookSignature.verify_header(text, sig_header, secret, tolerance)
 
-        data = json.loads(payload, object_pairs_hook=OrderedDict)
+        data = _json.loads(payload)
         event = Event._construct_from(
             values=data,
             requestor=self._requestor,
@@ -1,11 +1,14 @@
 # pyright: strict
 import datetime
 import json
+import threading
 from copy import deepcopy
+from types import MappingProxyType
 from typing_extensions import TYPE_CHECKING, Type, Literal, Self
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
     Mapping,
@@ -58,6 +61,69 @@ def _compute_diff(
     return current if current is not None else ""
 
 
+# The class to convert the dicts in a value into when they don't name their
+# own "object", and whether the value is a dict of such objects
+_Decoder = Tuple[Optional[Type["StripeObject"]], bool]
+_DEFAULT_DECODER: _Decoder = (None, False)
+
+# Lazily initialized, since the object classes import this module
+_object_classes: Optional[Mapping[str, Type["StripeObject"]]] = None
+
+
+def _decode(
+    value: Any,
+    klass_: Optional[Type["StripeObject"]],
+    requestor: "_APIRequestor",
+    api_mode: ApiMode,
+) -> Any:
+    """
+    Converts a value nested in an object the way
+    `_util._convert_to_stripe_object` does, without the handling of
+    responses and request params that only the top level of a response
+    needs.
+    """
+    global _object_classes
+
+    if isinstance(value, list):
+        return [
+            _decode(item, klass_, requestor, api_mode)
+            for item in cast("List[Any]", value)
+        ]
+    if not isinstance(value, dict) or isinstance(value, StripeObject):
+        return value
+    klass_name = cast("Dict[str, Any]", value).get("object")
+    if isinstance(klass_name, str):
+        if _object_classes is None:
+            _object_classes = cast(
+                "Mapping[str, Type[StripeObject]]",
+                _util.get_object_classes(),
+            )
+        klass = _object_classes.get(klass_name, StripeObject)
+    else:
+        klass = klass_ or StripeObject
+    return klass._construct_from(  # pyright: ignore[reportPrivateUsage]
+        values=cast("Dict[str, Any]", value),
+        requestor=requestor,
+        api_mode=api_mode,
+    )
+
+
+def _copy_parsed(value: Any) -> Any:
+    """
+    Copies the dicts and lists in values given to `construct_from` or
+    `refresh_from`, so that the ones kept to be converted lazily don't change
+    along with the caller's.
+    """
+    if isinstance(value, list):
+        return [_copy_parsed(item) for item in cast("List[Any]", value)]
+    if isinstance(value, dict) and not isinstance(value, StripeObject):
+        return {
+            k: _copy_parsed(v)
+            for k, v in cast("Dict[str, Any]", value).items()
+        }
+    return value
+
+
 def _serialize_list(
     array: Optional[List[Any]], previous: List[Any]
 ) -> Dict[str, Any]:
@@ -84,8 +150,24 @@ class StripeObject(Dict[str, Any]):
                 return _encode_datetime(o)
             return super(StripeObject._ReprJSONEncoder, self).default(o)
 
-    _retrieve_params: Mapping[str, Any]
-    _previous: Optional[Mapping[str, Any]]
+    # Most objects are only ever read, so the state for tracking changes
+    # defaults to these class attributes, and is only set on an instance
+    # once it's changed.
+    _retrieve_params: Mapping[str, Any] = MappingProxyType({})
+    _last_response: Optional[StripeResponse] = None
+    _unsaved_values: Optional[Set[str]] = None
+    _transient_values: Optional[Set[str]] = None
+    # The values that changed keys had before their first change, for
+    # `serialize` to compute what to send
+    _previous: Optional[Dict[str, Any]] = None
+
+    # When `stripe.lazy_objects` is set, the keys whose values are still the
+    # dicts and lists they were parsed as, to be converted on first access,
+    # and the lock that makes threads sharing the object agree on the
+    # converted values.
+    _lazy_keys: Optional[Set[str]] = None
+    _lazy_api_mode: ApiMode = "V1"
+    _lazy_lock: Optional[threading.Lock] = None
 
     def __init__(
         self,
@@ -101,12 +183,10 @@ class StripeObject(Dict[str, Any]):
     ):
         super(StripeObject, self).__init__()
 
-        self._unsaved_values: Set[str] = set()
-        self._transient_values: Set[str] = set()
-        self._last_response = last_response
-
-        self._retrieve_params = params
-        self._previous = None
+        if last_response is not None:
+            self._last_response = last_response
+        if params:
+            self._retrieve_params = params
 
         self._requestor = (
             stripe._APIRequestor._global_with_options(  # pyright: ignore[reportPrivateUsage]
@@ -143,7 +223,9 @@ class StripeObject(Dict[str, Any]):
         self, update_dict: Mapping[str, Any]
     ) -> None:
         for k in update_dict:
-            self._unsaved_values.add(k)
+            self._mark_unsaved(k)
+            if self._lazy_keys:
+                self._lazy_keys.discard(k)
 
         return super(StripeObject, self).update(update_dict)
 
@@ -187,19 +269,19 @@ class StripeObject(Dict[str, Any]):
                 % (k, str(self), k, k)
             )
 
-        # Allows for unpickling in Python 3.x
-        if not hasattr(self, "_unsaved_values"):
-            self._unsaved_values = set()
-
-        self._unsaved_values.add(k)
+        self._mark_unsaved(k)
 
         super(StripeObject, self).__setitem__(k, v)
+        if self._lazy_keys:
+            self._lazy_keys.discard(k)
 
     def __getitem__(self, k: str) -> Any:
+        if self._lazy_keys:
+            self._materialize(k)
         try:
             return super(StripeObject, self).__getitem__(k)
         except KeyError as err:
-            if k in self._transient_values:
+            if self._transient_values and k in self._transient_values:
                 raise KeyError(
                     "%r.  HINT: The %r attribute was set in the past."
                     "It was then wiped when refreshing the object with "
@@ -212,12 +294,40 @@ class StripeObject(Dict[str, Any]):
                 raise err
 
     def __delitem__(self, k: str) -> None:
+        self._remember_previous(k)
         super(StripeObject, self).__delitem__(k)
+        if self._lazy_keys:
+            self._lazy_keys.discard(k)
 
-        # Allows for unpickling in Python 3.x
-        if hasattr(self, "_unsaved_values") and k in self._unsaved_values:
+        if self._unsaved_values and k in self._unsaved_values:
             self._unsaved_values.remove(k)
 
+    def _mark_unsaved(self, k: str) -> None:
+        unsaved = self._unsaved_values
+        if unsaved is None:
+            unsaved = self._unsaved_values = set()
+        elif k in unsaved:
+            return
+        self._remember_previous(k)
+        unsaved.add(k)
+
+    def _remember_previous(self, k: str) -> None:
+        if self._unsaved_values and k in self._unsaved_values:
+            return
+        if super(StripeObject, self).__contains__(k):
+            if self._previous is None:
+                self._previous = {}
+            self._previous.setdefault(
+                k, super(StripeObject, self).__getitem__(k)
+            )
+
+    def _items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        The keys and values of the object, with lazy values converted.
+        """
+        for k in list(self.keys()):
+            yield k, self[k]
+
     # Custom unpickling method that uses `update` to update the dictionary
     # without calling __setitem__, which would fail if any value is an empty
     # string
@@ -236,7 +346,7 @@ class StripeObject(Dict[str, Any]):
                 self.stripe_version,
                 self.stripe_account,
             ),
-            dict(self),  # state
+            dict(self._items()),  # state
         )
         return reduce_value
 
@@ -252,7 +362,7 @@ class StripeObject(Dict[str, Any]):
         api_mode: ApiMode = "V1",
     ) -> Self:
         return cls._construct_from(
-            values=values,
+            values=_copy_parsed(values) if stripe.lazy_objects else values,
             requestor=stripe._APIRequestor._global_with_options(  # pyright: ignore[reportPrivateUsage]
                 api_key=key,
                 stripe_version=stripe_version,
@@ -271,11 +381,8 @@ class StripeObject(Dict[str, Any]):
         requestor: "_APIRequestor",
         api_mode: ApiMode,
     ) -> Self:
-        instance = cls(
-            values.get("id"),
-            last_response=last_response,
-            _requestor=requestor,
-        )
+        # `_refresh_from` sets the id along with the other values.
+        instance = cls(last_response=last_response, _requestor=requestor)
         instance._refresh_from(
             values=values,
             last_response=last_response,
@@ -296,7 +403,7 @@ class StripeObject(Dict[str, Any]):
         api_mode: ApiMode = "V1",
     ) -> None:
         self._refresh_from(
-            values=values,
+            values=_copy_parsed(values) if stripe.lazy_objects else values,
             partial=partial,
             last_response=last_response,
             requestor=self._requestor._replace_options(  # pyright: ignore[reportPrivateUsage]
@@ -319,56 +426,101 @@ class StripeObject(Dict[str, Any]):
         api_mode: ApiMode,
     ) -> None:
         self._requestor = requestor or self._requestor
-        self._last_response = last_response or getattr(
+        last_response = last_response or getattr(
             values, "_last_response", None
         )
+        if last_response is not None or self._last_response is not None:
+            self._last_response = last_response
 
         # Wipe old state before setting new.  This is useful for e.g.
         # updating a customer, where there is no persistent card
         # parameter.  Mark those values which don't persist as transient
         if partial:
-            self._unsaved_values = self._unsaved_values - set(values)
-        else:
+            if self._unsaved_values:
+                self._unsaved_values = self._unsaved_values - set(values)
+        elif self:
             removed = set(self.keys()) - set(values)
-            self._transient_values = self._transient_values | removed
-            self._unsaved_values = set()
+            if removed:
+                self._transient_values = (
+                    self._transient_values or set()
+                ) | removed
+            self._unsaved_values = None
             self.clear()
 
-        self._transient_values = self._transient_values - set(values)
+        if self._transient_values:
+            self._transient_values = self._transient_values - set(values)
 
+        lazy = stripe.lazy_objects
+        lazy_keys: Optional[Set[str]] = self._lazy_keys if partial else None
+        setitem = super(StripeObject, self).__setitem__
         for k, v in values.items():
-            inner_class = self._get_inner_class_type(k)
-            is_dict = self._get_inner_class_is_beneath_dict(k)
-            if is_dict:
-                obj = {
-                    k: None
-                    if v is None
-                    else cast(
-                        StripeObject,
-                        _util._convert_to_stripe_object(  # pyright: ignore[reportPrivateUsage]
-                            resp=v,
-                            params=None,
-                            klass_=inner_class,
-                            requestor=self._requestor,
-                            api_mode=api_mode,
-                        ),
-                    )
-                    for k, v in v.items()
-                }
+            if not isinstance(v, (dict, list)):
+                obj = v
+            elif lazy:
+                if lazy_keys is None:
+                    lazy_keys = set()
+                lazy_keys.add(k)
+                setitem(k, v)
+                continue
             else:
-                obj = cast(
-                    Union[StripeObject, List[StripeObject]],
-                    _util._convert_to_stripe_object(  # pyright: ignore[reportPrivateUsage]
-                        resp=v,
-                        params=None,
-                        klass_=inner_class,
-                        requestor=self._requestor,
-                        api_mode=api_mode,
-                    ),
-                )
-            super(StripeObject, self).__setitem__(k, obj)
+                obj = self._convert_value(k, v, api_mode)
+            if lazy_keys:
+                lazy_keys.discard(k)
+            setitem(k, obj)
+
+        if lazy_keys:
+            self._lazy_keys = lazy_keys
+            self._lazy_api_mode = api_mode
+            if self._lazy_lock is None:
+                self._lazy_lock = threading.Lock()
+        elif self._lazy_keys is not None:
+            self._lazy_keys = None
+        if self._previous is not None:
+            self._previous = None
+
+    def _convert_value(self, k: str, v: Any, api_mode: ApiMode) -> Any:
+        if not isinstance(v, (dict, list)):
+            return v
+        inner_class, is_dict = self._get_decode_plan().get(k, _DEFAULT_DECODER)
+        if is_dict:
+            return {
+                k: None
+                if v is None
+                else _decode(v, inner_class, self._requestor, api_mode)
+                for k, v in cast("Dict[str, Any]", v).items()
+            }
+        else:
+            return _decode(v, inner_class, self._requestor, api_mode)
 
-        self._previous = values
+    @classmethod
+    def _get_decode_plan(cls) -> Dict[str, "_Decoder"]:
+        """
+        How the values of the keys with inner classes are converted, from
+        the class's `_inner_class_types` and `_inner_class_dicts`. It's
+        worked out the first time an object of the class is converted, so
+        that converting each value takes a single lookup.
+        """
+        plan: Optional[Dict[str, _Decoder]] = cls.__dict__.get("_decode_plan")
+        if plan is None:
+            beneath_dict = set(cls._inner_class_dicts)
+            plan = {k: (None, True) for k in beneath_dict}
+            for k, inner_class in cls._inner_class_types.items():
+                plan[k] = (inner_class, k in beneath_dict)
+            cls._decode_plan = plan
+        return plan
+
+    def _materialize(self, k: str) -> None:
+        lazy_keys = self._lazy_keys
+        if not lazy_keys or k not in lazy_keys:
+            return
+        assert self._lazy_lock is not None
+        with self._lazy_lock:
+            if k in lazy_keys:
+                value = super(StripeObject, self).__getitem__(k)
+                super(StripeObject, self).__setitem__(
+                    k, self._convert_value(k, value, self._lazy_api_mode)
+                )
+                lazy_keys.discard(k)
 
     @_util.deprecated(
         "This will be removed in a future version of stripe-python."
@@ -418,6 +570,31 @@ class StripeObject(Dict[str, Any]):
             _usage=_usage,
         )
 
+    async def _request_async(
+        self,
+        method_: Literal["get", "post", "delete"],
+        url_: str,
+        params: Optional[Mapping[str, Any]] = None,
+        _usage: Optional[List[str]] = None,
+        *,
+        base_address: BaseAddress,
+        api_mode: ApiMode,
+    ) -> "StripeObject":
+        if params is None:
+            params = self._retrieve_params
+
+        request_options, request_params = extract_options_from_dict(params)
+
+        return await self._requestor.request_async(
+            method_,
+            url_,
+            params=request_params,
+            options=request_options,
+            base_address=base_address,
+            api_mode=api_mode,
+            _usage=_usage,
+        )
+
     def _request_stream(
         self,
         method: str,
@@ -469,7 +646,7 @@ class StripeObject(Dict[str, Any]):
         "Deprecated. The public interface will be removed in a future version."
     )
     def to_dict(self) -> Dict[str, Any]:
-        return dict(self)
+        return dict(self._items())
 
     def _to_dict_recursive(self) -> Dict[str, Any]:
         def maybe_to_dict_recursive(
@@ -482,6 +659,8 @@ class StripeObject(Dict[str, Any]):
             else:
                 return value
 
+        # Lazy values are left as the dicts and lists they were parsed as,
+        # which is what converting them back would give.
         return {
             key: list(map(maybe_to_dict_recursive, cast(List[Any], value)))
             if isinstance(value, list)
@@ -509,7 +688,7 @@ class StripeObject(Dict[str, Any]):
         unsaved_keys = self._unsaved_values or set()
         previous = previous or self._previous or {}
 
-        for k, v in self.items():
+        for k, v in self._items():
             if k == "id" or k.startswith("_"):
                 continue
             elif isinstance(v, stripe.APIResource):
@@ -540,7 +719,7 @@ class StripeObject(Dict[str, Any]):
 
         copied._retrieve_params = self._retrieve_params
 
-        for k, v in self.items():
+        for k, v in self._items():
             # Call parent's __setitem__ to avoid checks that we've added in the
             # overridden version that can throw exceptions.
             super(StripeObject, copied).__setitem__(k, v)
@@ -556,7 +735,7 @@ class StripeObject(Dict[str, Any]):
         copied = self.__copy__()
         memo[id(self)] = copied
 
-        for k, v in self.items():
+        for k, v in self._items():
             # Call parent's __setitem__ to avoid checks that we've added in the
             # overridden version that can throw exceptions.
             super(StripeObject, copied).__setitem__(k, deepcopy(v, memo))
@@ -567,6 +746,8 @@ class StripeObject(Dict[str, Any]):
 
     _inner_class_types: ClassVar[Dict[str, Type["StripeObject"]]] = {}
     _inner_class_dicts: ClassVar[List[str]] = []
+    # Set on each class by `_get_decode_plan`
+    _decode_plan: ClassVar[Optional[Dict[str, "_Decoder"]]] = None
 
     def _get_inner_class_type(
         self, field_name: str
@@ -1,8 +1,8 @@
 # pyright: strict
 from io import IOBase
-import json
-from collections import OrderedDict
-from typing import Mapping, Optional
+from typing import AsyncIterable, Mapping, Optional, Union
+
+from stripe import _json
 
 
 class StripeResponseBase(object):
@@ -29,13 +29,42 @@ class StripeResponseBase(object):
 
 
 class StripeResponse(StripeResponseBase):
-    body: str
     data: object
+    _body: Union[bytes, str, None]
 
-    def __init__(self, body: str, code: int, headers: Mapping[str, str]):
+    def __init__(
+        self,
+        body: Union[bytes, str],
+        code: int,
+        headers: Mapping[str, str],
+    ):
         StripeResponseBase.__init__(self, code, headers)
-        self.body = body
-        self.data = json.loads(body, object_pairs_hook=OrderedDict)
+        self._body = body
+        self.data = _json.loads(body)
+
+    @property
+    def body(self) -> str:
+        if self._body is None:
+            raise ValueError(
+                "The body of this response wasn't kept, since "
+                'stripe.response_retention was not "full".'
+            )
+        # Bodies are parsed straight from the bytes received, and only
+        # decoded when they're asked for.
+        if isinstance(self._body, bytes):
+            self._body = self._body.decode("utf-8")
+        return self._body
+
+    def _release(self, retention: str) -> None:
+        """
+        Drops what `retention`, a value of `stripe.response_retention`, says
+        not to keep.
+        """
+        if retention == "full":
+            return
+        self._body = None
+        if retention == "headers":
+            self.data = None
 
 
 class StripeStreamResponse(StripeResponseBase):
@@ -44,3 +73,22 @@ class StripeStreamResponse(StripeResponseBase):
     def __init__(self, io: IOBase, code: int, headers: Mapping[str, str]):
         StripeResponseBase.__init__(self, code, headers)
         self.io = io
+
+
+class StripeStreamResponseAsync(StripeResponseBase):
+    _stream: AsyncIterable[bytes]
+
+    def __init__(
+        self,
+        stream: AsyncIterable[bytes],
+        code: int,
+        headers: Mapping[str, str],
+    ):
+        StripeResponseBase.__init__(self, code, headers)
+        self._stream = stream
+
+    def stream(self) -> AsyncIterable[bytes]:
+        return self._stream
+
+    async def read_async(self) -> bytes:
+        return b"".join([chunk async for chunk in self._stream])
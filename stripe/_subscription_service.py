@@ -1427,6 +1427,35 @@ class SubscriptionService(StripeService):
             ),
         )
 
+    async def cancel_async(
+        self,
+        subscription_exposed_id: str,
+        params: "SubscriptionService.CancelParams" = {},
+        options: RequestOptions = {},
+    ) -> Subscription:
+        """
+        Cancels a customer's subscription immediately. The customer will not be charged again for the subscription.
+
+        Note, however, that any pending invoice items that you've created will still be charged for at the end of the period, unless manually [deleted](https://stripe.com/docs/api#delete_invoiceitem). If you've set the subscription to cancel at the end of the period, any pending prorations will also be left in place and collected at the end of the period. But if the subscription is set to cancel immediately, pending prorations will be removed.
+
+        By default, upon subscription cancellation, Stripe will stop automatic collection of all finalized invoices for the customer. This is intended to prevent unexpected payment attempts after the customer has canceled a subscription. However, you can resume automatic collection of the invoices manually after subscription cancellation to have us proceed. Or, you could check for unpaid invoices before allowing the customer to cancel the subscription at all.
+        """
+        return cast(
+            Subscription,
+            await self._request_async(
+                "delete",
+                "/v1/subscriptions/{subscription_exposed_id}".format(
+                    subscription_exposed_id=sanitize_id(
+                        subscription_exposed_id
+                    ),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         subscription_exposed_id: str,
@@ -1452,6 +1481,31 @@ class SubscriptionService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        subscription_exposed_id: str,
+        params: "SubscriptionService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Subscription:
+        """
+        Retrieves the subscription with the given ID.
+        """
+        return cast(
+            Subscription,
+            await self._request_async(
+                "get",
+                "/v1/subscriptions/{subscription_exposed_id}".format(
+                    subscription_exposed_id=sanitize_id(
+                        subscription_exposed_id
+                    ),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         subscription_exposed_id: str,
@@ -1497,6 +1551,51 @@ class SubscriptionService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        subscription_exposed_id: str,
+        params: "SubscriptionService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> Subscription:
+        """
+        Updates an existing subscription to match the specified parameters.
+        When changing prices or quantities, we optionally prorate the price we charge next month to make up for any price changes.
+        To preview how the proration is calculated, use the [upcoming invoice](https://stripe.com/docs/api/invoices/upcoming) endpoint.
+
+        By default, we prorate subscription changes. For example, if a customer signs up on May 1 for a 100 price, they'll be billed 100 immediately. If on May 15 they switch to a 200 price, then on June 1 they'll be billed 250 (200 for a renewal of her subscription, plus a 50 prorating adjustment for half of the previous month's 100 difference). Similarly, a downgrade generates a credit that is applied to the next invoice. We also prorate when you make quantity changes.
+
+        Switching prices does not normally change the billing date or generate an immediate charge unless:
+
+
+        The billing interval is changed (for example, from monthly to yearly).
+        The subscription moves from free to paid, or paid to free.
+        A trial starts or ends.
+
+
+        In these cases, we apply a credit for the unused time on the previous price, immediately charge the customer using the new price, and reset the billing date.
+
+        If you want to charge for an upgrade immediately, pass proration_behavior as always_invoice to create prorations, automatically invoice the customer for those proration adjustments, and attempt to collect payment. If you pass create_prorations, the prorations are created but not automatically invoiced. If you want to bill the customer for the prorations before the subscription's renewal date, you need to manually [invoice the customer](https://stripe.com/docs/api/invoices/create).
+
+        If you don't want to prorate, set the proration_behavior option to none. With this option, the customer is billed 100 on May 1 and 200 on June 1. Similarly, if you set proration_behavior to none when switching between different billing intervals (for example, from monthly to yearly), we don't generate any credits for the old subscription's unused time. We still reset the billing date and bill immediately for the new subscription.
+
+        Updating the quantity on a subscription many times in an hour may result in [rate limiting. If you need to bill for a frequently changing quantity, consider integrating <a href="/docs/billing/subscriptions/usage-based">usage-based billing](https://stripe.com/docs/rate-limits) instead.
+        """
+        return cast(
+            Subscription,
+            await self._request_async(
+                "post",
+                "/v1/subscriptions/{subscription_exposed_id}".format(
+                    subscription_exposed_id=sanitize_id(
+                        subscription_exposed_id
+                    ),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def delete_discount(
         self,
         subscription_exposed_id: str,
@@ -1522,6 +1621,31 @@ class SubscriptionService(StripeService):
             ),
         )
 
+    async def delete_discount_async(
+        self,
+        subscription_exposed_id: str,
+        params: "SubscriptionService.DeleteDiscountParams" = {},
+        options: RequestOptions = {},
+    ) -> Discount:
+        """
+        Removes the currently applied discount on a subscription.
+        """
+        return cast(
+            Discount,
+            await self._request_async(
+                "delete",
+                "/v1/subscriptions/{subscription_exposed_id}/discount".format(
+                    subscription_exposed_id=sanitize_id(
+                        subscription_exposed_id
+                    ),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def list(
         self,
         params: "SubscriptionService.ListParams" = {},
@@ -1542,6 +1666,26 @@ class SubscriptionService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "SubscriptionService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Subscription]:
+        """
+        By default, returns a list of subscriptions that have not been canceled. In order to list canceled subscriptions, specify status=canceled.
+        """
+        return cast(
+            ListObject[Subscription],
+            await self._request_async(
+                "get",
+                "/v1/subscriptions",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "SubscriptionService.CreateParams",
@@ -1568,6 +1712,32 @@ class SubscriptionService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "SubscriptionService.CreateParams",
+        options: RequestOptions = {},
+    ) -> Subscription:
+        """
+        Creates a new subscription on an existing customer. Each customer can have up to 500 active or scheduled subscriptions.
+
+        When you create a subscription with collection_method=charge_automatically, the first invoice is finalized as part of the request.
+        The payment_behavior parameter determines the exact behavior of the initial payment.
+
+        To start subscriptions where the first invoice always begins in a draft status, use [subscription schedules](https://stripe.com/docs/billing/subscriptions/subscription-schedules#managing) instead.
+        Schedules provide the flexibility to model more complex billing configurations that change over time.
+        """
+        return cast(
+            Subscription,
+            await self._request_async(
+                "post",
+                "/v1/subscriptions",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def search(
         self,
         params: "SubscriptionService.SearchParams",
@@ -1591,6 +1761,29 @@ class SubscriptionService(StripeService):
             ),
         )
 
+    async def search_async(
+        self,
+        params: "SubscriptionService.SearchParams",
+        options: RequestOptions = {},
+    ) -> SearchResultObject[Subscription]:
+        """
+        Search for subscriptions you've previously created using Stripe's [Search Query Language](https://stripe.com/docs/search#search-query-language).
+        Don't use search in read-after-write flows where strict consistency is necessary. Under normal operating
+        conditions, data is searchable in less than a minute. Occasionally, propagation of new or updated data can be up
+        to an hour behind during outages. Search functionality is not available to merchants in India.
+        """
+        return cast(
+            SearchResultObject[Subscription],
+            await self._request_async(
+                "get",
+                "/v1/subscriptions/search",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def resume(
         self,
         subscription: str,
@@ -1613,3 +1806,26 @@ class SubscriptionService(StripeService):
                 options=options,
             ),
         )
+
+    async def resume_async(
+        self,
+        subscription: str,
+        params: "SubscriptionService.ResumeParams" = {},
+        options: RequestOptions = {},
+    ) -> Subscription:
+        """
+        Initiates resumption of a paused subscription, optionally resetting the billing cycle anchor and creating prorations. If a resumption invoice is generated, it must be paid or marked uncollectible before the subscription will be unpaused. If payment succeeds the subscription will become active, and if payment fails the subscription will be past_due. The resumption invoice will void automatically if not paid by the expiration date.
+        """
+        return cast(
+            Subscription,
+            await self._request_async(
+                "post",
+                "/v1/subscriptions/{subscription}/resume".format(
+                    subscription=sanitize_id(subscription),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
@@ -1,13 +1,11 @@
 import hmac
-import json
 import time
-from collections import OrderedDict
 from hashlib import sha256
 
 # Used for global variables
 import stripe  # noqa: IMP101
 from stripe._event import Event
-from stripe import _util
+from stripe import _json, _util
 from stripe._error import SignatureVerificationError
 from stripe._api_requestor import _APIRequestor
 
@@ -19,12 +17,13 @@ class Webhook(object):
     def construct_event(
         payload, sig_header, secret, tolerance=DEFAULT_TOLERANCE, api_key=None
     ):
-        if hasattr(payload, "decode"):
-            payload = payload.decode("utf-8")
+        text = payload
+        if hasattr(text, "decode"):
+            text = text.decode("utf-8")
 
-        WebhookSignature.verify_header(payload, sig_header, secret, tolerance)
+        WebhookSignature.verify_header(text, sig_header, secret, tolerance)
 
-        data = json.loads(payload, object_pairs_hook=OrderedDict)
+        data = _json.loads(payload)
         event = Event._construct_from(
             values=data,
             requestor=_APIRequestor._global_with_options(
@@ -139,6 +139,24 @@ class SecretService(StripeService):
             ),
         )
 
+    async def list_async(
+        self, params: "SecretService.ListParams", options: RequestOptions = {}
+    ) -> ListObject[Secret]:
+        """
+        List all secrets stored on the given scope.
+        """
+        return cast(
+            ListObject[Secret],
+            await self._request_async(
+                "get",
+                "/v1/apps/secrets",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "SecretService.CreateParams",
@@ -159,6 +177,26 @@ class SecretService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "SecretService.CreateParams",
+        options: RequestOptions = {},
+    ) -> Secret:
+        """
+        Create or replace a secret in the secret store.
+        """
+        return cast(
+            Secret,
+            await self._request_async(
+                "post",
+                "/v1/apps/secrets",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def find(
         self, params: "SecretService.FindParams", options: RequestOptions = {}
     ) -> Secret:
@@ -177,6 +215,24 @@ class SecretService(StripeService):
             ),
         )
 
+    async def find_async(
+        self, params: "SecretService.FindParams", options: RequestOptions = {}
+    ) -> Secret:
+        """
+        Finds a secret in the secret store by name and scope.
+        """
+        return cast(
+            Secret,
+            await self._request_async(
+                "get",
+                "/v1/apps/secrets/find",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def delete_where(
         self,
         params: "SecretService.DeleteWhereParams",
@@ -196,3 +252,23 @@ class SecretService(StripeService):
                 options=options,
             ),
         )
+
+    async def delete_where_async(
+        self,
+        params: "SecretService.DeleteWhereParams",
+        options: RequestOptions = {},
+    ) -> Secret:
+        """
+        Deletes a secret from the secret store by name and scope.
+        """
+        return cast(
+            Secret,
+            await self._request_async(
+                "post",
+                "/v1/apps/secrets/delete",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
@@ -449,6 +449,26 @@ class ConfigurationService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "ConfigurationService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Configuration]:
+        """
+        Returns a list of configurations that describe the functionality of the customer portal.
+        """
+        return cast(
+            ListObject[Configuration],
+            await self._request_async(
+                "get",
+                "/v1/billing_portal/configurations",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "ConfigurationService.CreateParams",
@@ -469,6 +489,26 @@ class ConfigurationService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "ConfigurationService.CreateParams",
+        options: RequestOptions = {},
+    ) -> Configuration:
+        """
+        Creates a configuration that describes the functionality and behavior of a PortalSession
+        """
+        return cast(
+            Configuration,
+            await self._request_async(
+                "post",
+                "/v1/billing_portal/configurations",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         configuration: str,
@@ -492,6 +532,29 @@ class ConfigurationService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        configuration: str,
+        params: "ConfigurationService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Configuration:
+        """
+        Retrieves a configuration that describes the functionality of the customer portal.
+        """
+        return cast(
+            Configuration,
+            await self._request_async(
+                "get",
+                "/v1/billing_portal/configurations/{configuration}".format(
+                    configuration=sanitize_id(configuration),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         configuration: str,
@@ -514,3 +577,26 @@ class ConfigurationService(StripeService):
                 options=options,
             ),
         )
+
+    async def update_async(
+        self,
+        configuration: str,
+        params: "ConfigurationService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> Configuration:
+        """
+        Updates a configuration that describes the functionality of the customer portal.
+        """
+        return cast(
+            Configuration,
+            await self._request_async(
+                "post",
+                "/v1/billing_portal/configurations/{configuration}".format(
+                    configuration=sanitize_id(configuration),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
@@ -2060,6 +2060,26 @@ class SessionService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "SessionService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Session]:
+        """
+        Returns a list of Checkout Sessions.
+        """
+        return cast(
+            ListObject[Session],
+            await self._request_async(
+                "get",
+                "/v1/checkout/sessions",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "SessionService.CreateParams" = {},
@@ -2080,6 +2100,26 @@ class SessionService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "SessionService.CreateParams" = {},
+        options: RequestOptions = {},
+    ) -> Session:
+        """
+        Creates a Session object.
+        """
+        return cast(
+            Session,
+            await self._request_async(
+                "post",
+                "/v1/checkout/sessions",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         session: str,
@@ -2103,6 +2143,29 @@ class SessionService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        session: str,
+        params: "SessionService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Session:
+        """
+        Retrieves a Session object.
+        """
+        return cast(
+            Session,
+            await self._request_async(
+                "get",
+                "/v1/checkout/sessions/{session}".format(
+                    session=sanitize_id(session),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def expire(
         self,
         session: str,
@@ -2127,3 +2190,28 @@ class SessionService(StripeService):
                 options=options,
             ),
         )
+
+    async def expire_async(
+        self,
+        session: str,
+        params: "SessionService.ExpireParams" = {},
+        options: RequestOptions = {},
+    ) -> Session:
+        """
+        A Session can be expired when it is in one of these statuses: open
+
+        After it expires, a customer can't complete a Session and customers loading the Session see a message saying the Session is expired.
+        """
+        return cast(
+            Session,
+            await self._request_async(
+                "post",
+                "/v1/checkout/sessions/{session}/expire".format(
+                    session=sanitize_id(session),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
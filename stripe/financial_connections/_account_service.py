@@ -115,6 +115,26 @@ class AccountService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "AccountService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Account]:
+        """
+        Returns a list of Financial Connections Account objects.
+        """
+        return cast(
+            ListObject[Account],
+            await self._request_async(
+                "get",
+                "/v1/financial_connections/accounts",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         account: str,
@@ -138,6 +158,29 @@ class AccountService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        account: str,
+        params: "AccountService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Account:
+        """
+        Retrieves the details of an Financial Connections Account.
+        """
+        return cast(
+            Account,
+            await self._request_async(
+                "get",
+                "/v1/financial_connections/accounts/{account}".format(
+                    account=sanitize_id(account),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def disconnect(
         self,
         account: str,
@@ -161,6 +204,29 @@ class AccountService(StripeService):
             ),
         )
 
+    async def disconnect_async(
+        self,
+        account: str,
+        params: "AccountService.DisconnectParams" = {},
+        options: RequestOptions = {},
+    ) -> Account:
+        """
+        Disables your access to a Financial Connections Account. You will no longer be able to access data associated with the account (e.g. balances, transactions).
+        """
+        return cast(
+            Account,
+            await self._request_async(
+                "post",
+                "/v1/financial_connections/accounts/{account}/disconnect".format(
+                    account=sanitize_id(account),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def refresh(
         self,
         account: str,
@@ -184,6 +250,29 @@ class AccountService(StripeService):
             ),
         )
 
+    async def refresh_async(
+        self,
+        account: str,
+        params: "AccountService.RefreshParams",
+        options: RequestOptions = {},
+    ) -> Account:
+        """
+        Refreshes the data associated with a Financial Connections Account.
+        """
+        return cast(
+            Account,
+            await self._request_async(
+                "post",
+                "/v1/financial_connections/accounts/{account}/refresh".format(
+                    account=sanitize_id(account),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def subscribe(
         self,
         account: str,
@@ -207,6 +296,29 @@ class AccountService(StripeService):
             ),
         )
 
+    async def subscribe_async(
+        self,
+        account: str,
+        params: "AccountService.SubscribeParams",
+        options: RequestOptions = {},
+    ) -> Account:
+        """
+        Subscribes to periodic refreshes of data associated with a Financial Connections Account.
+        """
+        return cast(
+            Account,
+            await self._request_async(
+                "post",
+                "/v1/financial_connections/accounts/{account}/subscribe".format(
+                    account=sanitize_id(account),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def unsubscribe(
         self,
         account: str,
@@ -229,3 +341,26 @@ class AccountService(StripeService):
                 options=options,
             ),
         )
+
+    async def unsubscribe_async(
+        self,
+        account: str,
+        params: "AccountService.UnsubscribeParams",
+        options: RequestOptions = {},
+    ) -> Account:
+        """
+        Unsubscribes from periodic refreshes of data associated with a Financial Connections Account.
+        """
+        return cast(
+            Account,
+            await self._request_async(
+                "post",
+                "/v1/financial_connections/accounts/{account}/unsubscribe".format(
+                    account=sanitize_id(account),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
@@ -524,6 +524,26 @@ class CardholderService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "CardholderService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Cardholder]:
+        """
+        Returns a list of Issuing Cardholder objects. The objects are sorted in descending order by creation date, with the most recently created object appearing first.
+        """
+        return cast(
+            ListObject[Cardholder],
+            await self._request_async(
+                "get",
+                "/v1/issuing/cardholders",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "CardholderService.CreateParams",
@@ -544,6 +564,26 @@ class CardholderService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "CardholderService.CreateParams",
+        options: RequestOptions = {},
+    ) -> Cardholder:
+        """
+        Creates a new Issuing Cardholder object that can be issued cards.
+        """
+        return cast(
+            Cardholder,
+            await self._request_async(
+                "post",
+                "/v1/issuing/cardholders",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         cardholder: str,
@@ -567,6 +607,29 @@ class CardholderService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        cardholder: str,
+        params: "CardholderService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Cardholder:
+        """
+        Retrieves an Issuing Cardholder object.
+        """
+        return cast(
+            Cardholder,
+            await self._request_async(
+                "get",
+                "/v1/issuing/cardholders/{cardholder}".format(
+                    cardholder=sanitize_id(cardholder),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         cardholder: str,
@@ -589,3 +652,26 @@ class CardholderService(StripeService):
                 options=options,
             ),
         )
+
+    async def update_async(
+        self,
+        cardholder: str,
+        params: "CardholderService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> Cardholder:
+        """
+        Updates the specified Issuing Cardholder object by setting the values of the parameters passed. Any parameters not provided will be left unchanged.
+        """
+        return cast(
+            Cardholder,
+            await self._request_async(
+                "post",
+                "/v1/issuing/cardholders/{cardholder}".format(
+                    cardholder=sanitize_id(cardholder),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
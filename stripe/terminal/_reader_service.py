@@ -253,6 +253,29 @@ class ReaderService(StripeService):
             ),
         )
 
+    async def delete_async(
+        self,
+        reader: str,
+        params: "ReaderService.DeleteParams" = {},
+        options: RequestOptions = {},
+    ) -> Reader:
+        """
+        Deletes a Reader object.
+        """
+        return cast(
+            Reader,
+            await self._request_async(
+                "delete",
+                "/v1/terminal/readers/{reader}".format(
+                    reader=sanitize_id(reader),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         reader: str,
@@ -276,6 +299,29 @@ class ReaderService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        reader: str,
+        params: "ReaderService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> Reader:
+        """
+        Retrieves a Reader object.
+        """
+        return cast(
+            Reader,
+            await self._request_async(
+                "get",
+                "/v1/terminal/readers/{reader}".format(
+                    reader=sanitize_id(reader),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def update(
         self,
         reader: str,
@@ -299,6 +345,29 @@ class ReaderService(StripeService):
             ),
         )
 
+    async def update_async(
+        self,
+        reader: str,
+        params: "ReaderService.UpdateParams" = {},
+        options: RequestOptions = {},
+    ) -> Reader:
+        """
+        Updates a Reader object by setting the values of the parameters passed. Any parameters not provided will be left unchanged.
+        """
+        return cast(
+            Reader,
+            await self._request_async(
+                "post",
+                "/v1/terminal/readers/{reader}".format(
+                    reader=sanitize_id(reader),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def list(
         self,
         params: "ReaderService.ListParams" = {},
@@ -319,6 +388,26 @@ class ReaderService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "ReaderService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[Reader]:
+        """
+        Returns a list of Reader objects.
+        """
+        return cast(
+            ListObject[Reader],
+            await self._request_async(
+                "get",
+                "/v1/terminal/readers",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "ReaderService.CreateParams",
@@ -339,6 +428,26 @@ class ReaderService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "ReaderService.CreateParams",
+        options: RequestOptions = {},
+    ) -> Reader:
+        """
+        Creates a new Reader object.
+        """
+        return cast(
+            Reader,
+            await self._request_async(
+                "post",
+                "/v1/terminal/readers",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def cancel_action(
         self,
         reader: str,
@@ -362,6 +471,29 @@ class ReaderService(StripeService):
             ),
         )
 
+    async def cancel_action_async(
+        self,
+        reader: str,
+        params: "ReaderService.CancelActionParams" = {},
+        options: RequestOptions = {},
+    ) -> Reader:
+        """
+        Cancels the current reader action.
+        """
+        return cast(
+            Reader,
+            await self._request_async(
+                "post",
+                "/v1/terminal/readers/{reader}/cancel_action".format(
+                    reader=sanitize_id(reader),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def process_payment_intent(
         self,
         reader: str,
@@ -385,6 +517,29 @@ class ReaderService(StripeService):
             ),
         )
 
+    async def process_payment_intent_async(
+        self,
+        reader: str,
+        params: "ReaderService.ProcessPaymentIntentParams",
+        options: RequestOptions = {},
+    ) -> Reader:
+        """
+        Initiates a payment flow on a Reader.
+        """
+        return cast(
+            Reader,
+            await self._request_async(
+                "post",
+                "/v1/terminal/readers/{reader}/process_payment_intent".format(
+                    reader=sanitize_id(reader),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def process_setup_intent(
         self,
         reader: str,
@@ -408,6 +563,29 @@ class ReaderService(StripeService):
             ),
         )
 
+    async def process_setup_intent_async(
+        self,
+        reader: str,
+        params: "ReaderService.ProcessSetupIntentParams",
+        options: RequestOptions = {},
+    ) -> Reader:
+        """
+        Initiates a setup intent flow on a Reader.
+        """
+        return cast(
+            Reader,
+            await self._request_async(
+                "post",
+                "/v1/terminal/readers/{reader}/process_setup_intent".format(
+                    reader=sanitize_id(reader),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def refund_payment(
         self,
         reader: str,
@@ -431,6 +609,29 @@ class ReaderService(StripeService):
             ),
         )
 
+    async def refund_payment_async(
+        self,
+        reader: str,
+        params: "ReaderService.RefundPaymentParams" = {},
+        options: RequestOptions = {},
+    ) -> Reader:
+        """
+        Initiates a refund on a Reader
+        """
+        return cast(
+            Reader,
+            await self._request_async(
+                "post",
+                "/v1/terminal/readers/{reader}/refund_payment".format(
+                    reader=sanitize_id(reader),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def set_reader_display(
         self,
         reader: str,
@@ -453,3 +654,26 @@ class ReaderService(StripeService):
                 options=options,
             ),
         )
+
+    async def set_reader_display_async(
+        self,
+        reader: str,
+        params: "ReaderService.SetReaderDisplayParams",
+        options: RequestOptions = {},
+    ) -> Reader:
+        """
+        Sets reader display to show cart details.
+        """
+        return cast(
+            Reader,
+            await self._request_async(
+                "post",
+                "/v1/terminal/readers/{reader}/set_reader_display".format(
+                    reader=sanitize_id(reader),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
@@ -84,6 +84,29 @@ class TestClockService(StripeService):
             ),
         )
 
+    async def delete_async(
+        self,
+        test_clock: str,
+        params: "TestClockService.DeleteParams" = {},
+        options: RequestOptions = {},
+    ) -> TestClock:
+        """
+        Deletes a test clock.
+        """
+        return cast(
+            TestClock,
+            await self._request_async(
+                "delete",
+                "/v1/test_helpers/test_clocks/{test_clock}".format(
+                    test_clock=sanitize_id(test_clock),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         test_clock: str,
@@ -107,6 +130,29 @@ class TestClockService(StripeService):
             ),
         )
 
+    async def retrieve_async(
+        self,
+        test_clock: str,
+        params: "TestClockService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> TestClock:
+        """
+        Retrieves a test clock.
+        """
+        return cast(
+            TestClock,
+            await self._request_async(
+                "get",
+                "/v1/test_helpers/test_clocks/{test_clock}".format(
+                    test_clock=sanitize_id(test_clock),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def list(
         self,
         params: "TestClockService.ListParams" = {},
@@ -127,6 +173,26 @@ class TestClockService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "TestClockService.ListParams" = {},
+        options: RequestOptions = {},
+    ) -> ListObject[TestClock]:
+        """
+        Returns a list of your test clocks.
+        """
+        return cast(
+            ListObject[TestClock],
+            await self._request_async(
+                "get",
+                "/v1/test_helpers/test_clocks",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "TestClockService.CreateParams",
@@ -147,6 +213,26 @@ class TestClockService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "TestClockService.CreateParams",
+        options: RequestOptions = {},
+    ) -> TestClock:
+        """
+        Creates a new test clock that can be attached to new customers and quotes.
+        """
+        return cast(
+            TestClock,
+            await self._request_async(
+                "post",
+                "/v1/test_helpers/test_clocks",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def advance(
         self,
         test_clock: str,
@@ -169,3 +255,26 @@ class TestClockService(StripeService):
                 options=options,
             ),
         )
+
+    async def advance_async(
+        self,
+        test_clock: str,
+        params: "TestClockService.AdvanceParams",
+        options: RequestOptions = {},
+    ) -> TestClock:
+        """
+        Starts advancing a test clock to a specified time in the future. Advancement is done when status changes to Ready.
+        """
+        return cast(
+            TestClock,
+            await self._request_async(
+                "post",
+                "/v1/test_helpers/test_clocks/{test_clock}/advance".format(
+                    test_clock=sanitize_id(test_clock),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
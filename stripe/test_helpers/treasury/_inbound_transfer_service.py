@@ -64,6 +64,29 @@ class InboundTransferService(StripeService):
             ),
         )
 
+    async def fail_async(
+        self,
+        id: str,
+        params: "InboundTransferService.FailParams" = {},
+        options: RequestOptions = {},
+    ) -> InboundTransfer:
+        """
+        Transitions a test mode created InboundTransfer to the failed status. The InboundTransfer must already be in the processing state.
+        """
+        return cast(
+            InboundTransfer,
+            await self._request_async(
+                "post",
+                "/v1/test_helpers/treasury/inbound_transfers/{id}/fail".format(
+                    id=sanitize_id(id),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def return_inbound_transfer(
         self,
         id: str,
@@ -87,6 +110,29 @@ class InboundTransferService(StripeService):
             ),
         )
 
+    async def return_inbound_transfer_async(
+        self,
+        id: str,
+        params: "InboundTransferService.ReturnInboundTransferParams" = {},
+        options: RequestOptions = {},
+    ) -> InboundTransfer:
+        """
+        Marks the test mode InboundTransfer object as returned and links the InboundTransfer to a ReceivedDebit. The InboundTransfer must already be in the succeeded state.
+        """
+        return cast(
+            InboundTransfer,
+            await self._request_async(
+                "post",
+                "/v1/test_helpers/treasury/inbound_transfers/{id}/return".format(
+                    id=sanitize_id(id),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def succeed(
         self,
         id: str,
@@ -109,3 +155,26 @@ class InboundTransferService(StripeService):
                 options=options,
             ),
         )
+
+    async def succeed_async(
+        self,
+        id: str,
+        params: "InboundTransferService.SucceedParams" = {},
+        options: RequestOptions = {},
+    ) -> InboundTransfer:
+        """
+        Transitions a test mode created InboundTransfer to the succeeded status. The InboundTransfer must already be in the processing state.
+        """
+        return cast(
+            InboundTransfer,
+            await self._request_async(
+                "post",
+                "/v1/test_helpers/treasury/inbound_transfers/{id}/succeed".format(
+                    id=sanitize_id(id),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
@@ -84,6 +84,26 @@ class DebitReversalService(StripeService):
             ),
         )
 
+    async def list_async(
+        self,
+        params: "DebitReversalService.ListParams",
+        options: RequestOptions = {},
+    ) -> ListObject[DebitReversal]:
+        """
+        Returns a list of DebitReversals.
+        """
+        return cast(
+            ListObject[DebitReversal],
+            await self._request_async(
+                "get",
+                "/v1/treasury/debit_reversals",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def create(
         self,
         params: "DebitReversalService.CreateParams",
@@ -104,6 +124,26 @@ class DebitReversalService(StripeService):
             ),
         )
 
+    async def create_async(
+        self,
+        params: "DebitReversalService.CreateParams",
+        options: RequestOptions = {},
+    ) -> DebitReversal:
+        """
+        Reverses a ReceivedDebit and creates a DebitReversal object.
+        """
+        return cast(
+            DebitReversal,
+            await self._request_async(
+                "post",
+                "/v1/treasury/debit_reversals",
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
+
     def retrieve(
         self,
         debit_reversal: str,
@@ -126,3 +166,26 @@ class DebitReversalService(StripeService):
                 options=options,
             ),
         )
+
+    async def retrieve_async(
+        self,
+        debit_reversal: str,
+        params: "DebitReversalService.RetrieveParams" = {},
+        options: RequestOptions = {},
+    ) -> DebitReversal:
+        """
+        Retrieves a DebitReversal object.
+        """
+        return cast(
+            DebitReversal,
+            await self._request_async(
+                "get",
+                "/v1/treasury/debit_reversals/{debit_reversal}".format(
+                    debit_reversal=sanitize_id(debit_reversal),
+                ),
+                api_mode="V1",
+                base_address="api",
+                params=params,
+                options=options,
+            ),
+        )
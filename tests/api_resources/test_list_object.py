@@ -1,4 +1,6 @@
 import json
+import threading
+import time
 
 import pytest
 
@@ -296,6 +298,63 @@ class TestAutoPaging:
 
         assert seen == ["pm_123", "pm_124", "pm_125", "pm_126"]
 
+    @pytest.mark.anyio
+    async def test_iter_two_pages_async(self, http_client_mock_async):
+        lo = stripe.ListObject.construct_from(
+            self.pageable_model_response(["pm_123", "pm_124"], True), "mykey"
+        )
+        lo._retrieve_params = {"foo": "bar"}
+
+        http_client_mock_async.stub_request(
+            "get",
+            path="/v1/pageablemodels",
+            query_string="starting_after=pm_124&foo=bar",
+            rbody=json.dumps(
+                self.pageable_model_response(["pm_125", "pm_126"], False)
+            ),
+        )
+
+        seen = [item["id"] async for item in lo.auto_paging_iter()]
+
+        http_client_mock_async.assert_requested(
+            "get",
+            path="/v1/pageablemodels",
+            query_string="starting_after=pm_124&foo=bar",
+        )
+
+        assert seen == ["pm_123", "pm_124", "pm_125", "pm_126"]
+
+    @pytest.mark.anyio
+    async def test_iter_reverse_async(self, http_client_mock_async):
+        lo = stripe.ListObject.construct_from(
+            self.pageable_model_response(["pm_125", "pm_126"], True), "mykey"
+        )
+        lo._retrieve_params = {"foo": "bar", "ending_before": "pm_127"}
+
+        http_client_mock_async.stub_request(
+            "get",
+            path="/v1/pageablemodels",
+            query_string="ending_before=pm_125&foo=bar",
+            rbody=json.dumps(
+                self.pageable_model_response(["pm_123", "pm_124"], False)
+            ),
+        )
+
+        seen = [item["id"] async for item in lo.auto_paging_iter()]
+
+        assert seen == ["pm_126", "pm_125", "pm_124", "pm_123"]
+
+    @pytest.mark.anyio
+    async def test_iter_cannot_mix_sync_and_async(self):
+        lo = stripe.ListObject.construct_from(
+            self.pageable_model_response(["pm_123", "pm_124"], False), "mykey"
+        )
+        it = lo.auto_paging_iter()
+        next(it)
+
+        with pytest.raises(RuntimeError):
+            await it.__anext__()
+
     def test_iter_reverse(self, http_client_mock):
         lo = stripe.ListObject.construct_from(
             self.pageable_model_response(["pm_125", "pm_126"], True), "mykey"
@@ -321,6 +380,178 @@ class TestAutoPaging:
 
         assert seen == ["pm_126", "pm_125", "pm_124", "pm_123"]
 
+    def stub_pages(self, http_client_mock, query_strings):
+        ids = iter(range(123, 200))
+        pages = []
+        for i, query_string in enumerate(query_strings + [None]):
+            page = self.pageable_model_response(
+                ["pm_%d" % next(ids), "pm_%d" % next(ids)],
+                i < len(query_strings),
+            )
+            if i > 0:
+                http_client_mock.stub_request(
+                    "get",
+                    path="/v1/pageablemodels",
+                    query_string=query_strings[i - 1],
+                    rbody=json.dumps(page),
+                )
+            pages.append(page)
+        lo = stripe.ListObject.construct_from(pages[0], "mykey")
+        lo._retrieve_params = {"foo": "bar"}
+        return lo
+
+    def test_iter_prefetch(self, http_client_mock):
+        lo = self.stub_pages(
+            http_client_mock,
+            [
+                "foo=bar&limit=100&starting_after=pm_124",
+                "foo=bar&limit=100&starting_after=pm_126",
+            ],
+        )
+
+        seen = [item["id"] for item in lo.auto_paging_iter(prefetch=2)]
+
+        assert seen == [
+            "pm_123",
+            "pm_124",
+            "pm_125",
+            "pm_126",
+            "pm_127",
+            "pm_128",
+        ]
+
+    def test_iter_prefetch_fetches_while_first_page_is_used(
+        self, http_client_mock
+    ):
+        lo = self.stub_pages(
+            http_client_mock, ["foo=bar&limit=100&starting_after=pm_124"]
+        )
+
+        items = lo.auto_paging_iter(prefetch=1)
+        assert next(items)["id"] == "pm_123"
+        # Still on the first page, whose next page is already on its way.
+        for _ in range(50):
+            if http_client_mock.get_all_calls():
+                break
+            time.sleep(0.01)
+        http_client_mock.assert_requested(
+            "get",
+            path="/v1/pageablemodels",
+            query_string="foo=bar&limit=100&starting_after=pm_124",
+        )
+        assert [item["id"] for item in items] == ["pm_124", "pm_125", "pm_126"]
+
+    def test_iter_prefetch_keeps_limit(self, http_client_mock):
+        lo = self.stub_pages(
+            http_client_mock, ["foo=bar&limit=2&starting_after=pm_124"]
+        )
+        lo._retrieve_params = {"foo": "bar", "limit": 2}
+
+        seen = [item["id"] for item in lo.auto_paging_iter(prefetch=1)]
+
+        assert seen == ["pm_123", "pm_124", "pm_125", "pm_126"]
+
+    def test_iter_prefetch_reverse(self, http_client_mock):
+        lo = stripe.ListObject.construct_from(
+            self.pageable_model_response(["pm_125", "pm_126"], True), "mykey"
+        )
+        lo._retrieve_params = {"ending_before": "pm_127"}
+        http_client_mock.stub_request(
+            "get",
+            path="/v1/pageablemodels",
+            query_string="ending_before=pm_125&limit=100",
+            rbody=json.dumps(
+                self.pageable_model_response(["pm_123", "pm_124"], False)
+            ),
+        )
+
+        seen = [item["id"] for item in lo.auto_paging_iter(prefetch=1)]
+
+        assert seen == ["pm_126", "pm_125", "pm_124", "pm_123"]
+
+    def test_iter_prefetch_raises_errors_in_order(self, http_client_mock):
+        lo = self.stub_pages(
+            http_client_mock,
+            [
+                "foo=bar&limit=100&starting_after=pm_124",
+                "foo=bar&limit=100&starting_after=pm_126",
+            ],
+        )
+        http_client_mock.stub_request(
+            "get",
+            path="/v1/pageablemodels",
+            query_string="foo=bar&limit=100&starting_after=pm_126",
+            rbody='{"error": {"message": "Boom"}}',
+            rcode=500,
+        )
+
+        seen = []
+        with pytest.raises(stripe.APIError):
+            for item in lo.auto_paging_iter(prefetch=3):
+                seen.append(item["id"])
+
+        assert seen == ["pm_123", "pm_124", "pm_125", "pm_126"]
+
+    def test_iter_prefetch_stops_when_abandoned(self, http_client_mock):
+        lo = self.stub_pages(
+            http_client_mock,
+            [
+                "foo=bar&limit=100&starting_after=pm_124",
+                "foo=bar&limit=100&starting_after=pm_126",
+                "foo=bar&limit=100&starting_after=pm_128",
+            ],
+        )
+
+        seen = [
+            item["id"]
+            for _, item in zip(range(3), lo.auto_paging_iter(prefetch=1))
+        ]
+
+        assert seen == ["pm_123", "pm_124", "pm_125"]
+        for thread in threading.enumerate():
+            if thread.name == "stripe-prefetch":
+                thread.join(timeout=5)
+                assert not thread.is_alive()
+
+    def test_iter_prefetch_must_not_be_negative(self):
+        lo = stripe.ListObject.construct_from(
+            self.pageable_model_response(["pm_123"], False), "mykey"
+        )
+
+        with pytest.raises(ValueError):
+            lo.auto_paging_iter(prefetch=-1)
+
+    def test_cursor_reverse(self):
+        lo = stripe.ListObject.construct_from(
+            self.pageable_model_response(["pm_125", "pm_126"], True), "mykey"
+        )
+        lo._retrieve_params = {"foo": "bar", "ending_before": "pm_127"}
+
+        assert lo.cursor == stripe.PageCursor(
+            "/v1/pageablemodels", {"foo": "bar"}, ending_before="pm_125"
+        )
+
+    @pytest.mark.anyio
+    async def test_iter_prefetch_async(self, http_client_mock_async):
+        lo = self.stub_pages(
+            http_client_mock_async,
+            [
+                "foo=bar&limit=100&starting_after=pm_124",
+                "foo=bar&limit=100&starting_after=pm_126",
+            ],
+        )
+
+        seen = [item["id"] async for item in lo.auto_paging_iter(prefetch=2)]
+
+        assert seen == [
+            "pm_123",
+            "pm_124",
+            "pm_125",
+            "pm_126",
+            "pm_127",
+            "pm_128",
+        ]
+
     def test_class_method_two_pages(self, http_client_mock):
         http_client_mock.stub_request(
             "get",
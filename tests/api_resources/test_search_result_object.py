@@ -101,6 +101,40 @@ class TestSearchResultObject(object):
         assert not next_sro.is_empty
         assert next_sro.data[0].id == 2
 
+    @pytest.mark.anyio
+    async def test_auto_paging_iter_async(self, http_client_mock_async):
+        sro = stripe.SearchResultObject.construct_from(
+            {
+                "object": "search_result",
+                "data": [{"id": 1}],
+                "has_more": True,
+                "next_page": "next_page_token",
+                "url": "/things",
+            },
+            None,
+        )
+
+        http_client_mock_async.stub_request(
+            "get",
+            path="/things",
+            query_string="page=next_page_token",
+            rbody=json.dumps(
+                {
+                    "object": "search_result",
+                    "data": [{"id": 2}],
+                    "has_more": False,
+                    "url": "/things",
+                }
+            ),
+        )
+
+        seen = [item.id async for item in sro.auto_paging_iter()]
+
+        http_client_mock_async.assert_requested(
+            "get", path="/things", query_string="page=next_page_token"
+        )
+        assert seen == [1, 2]
+
     def test_next_search_result_page_with_filters(self, http_client_mock):
         sro = stripe.SearchResultObject.construct_from(
             {
@@ -225,3 +259,44 @@ class TestAutoPaging:
         )
 
         assert seen == ["pm_123", "pm_124", "pm_125", "pm_126"]
+
+    def test_iter_prefetch(self, http_client_mock):
+        sro = stripe.SearchResultObject.construct_from(
+            self.pageable_model_response(["pm_123", "pm_124"], True, "token"),
+            "mykey",
+        )
+        sro._retrieve_params = {"foo": "bar"}
+
+        http_client_mock.stub_request(
+            "get",
+            path="/v1/pageablemodels",
+            query_string="page=token&foo=bar&limit=100",
+            rbody=json.dumps(
+                self.pageable_model_response(
+                    ["pm_125", "pm_126"], True, "token_2"
+                )
+            ),
+        )
+        http_client_mock.stub_request(
+            "get",
+            path="/v1/pageablemodels",
+            query_string="page=token_2&foo=bar&limit=100",
+            rbody=json.dumps(
+                self.pageable_model_response(["pm_127"], False, None)
+            ),
+        )
+
+        seen = [item["id"] for item in sro.auto_paging_iter(prefetch=2)]
+
+        assert seen == ["pm_123", "pm_124", "pm_125", "pm_126", "pm_127"]
+
+    def test_cursor(self):
+        sro = stripe.SearchResultObject.construct_from(
+            self.pageable_model_response(["pm_123", "pm_124"], True, "token"),
+            "mykey",
+        )
+        sro._retrieve_params = {"foo": "bar", "page": "token_0"}
+
+        assert sro.cursor == stripe.PageCursor(
+            "/v1/pageablemodels", {"foo": "bar"}, page="token"
+        )
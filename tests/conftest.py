@@ -99,6 +99,15 @@ def http_client_mock_streaming(mocker):
     stripe.default_http_client = old_client
 
 
+@pytest.fixture
+def http_client_mock_async(mocker):
+    mock_client = HTTPClientMock(mocker, is_async=True)
+    old_client = stripe.default_http_client
+    stripe.default_http_client = mock_client.get_mock_http_client()
+    yield mock_client
+    stripe.default_http_client = old_client
+
+
 @pytest.fixture
 def stripe_mock_stripe_client(http_client_mock):
     return StripeClient(
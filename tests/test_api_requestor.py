@@ -1,6 +1,8 @@
 import datetime
 import json
 import tempfile
+import threading
+import time
 import uuid
 from collections import OrderedDict
 
@@ -90,6 +92,7 @@ class TestAPIRequestor(object):
             "api_version": stripe.api_version,
             "default_http_client": stripe.default_http_client,
             "enable_telemetry": stripe.enable_telemetry,
+            "enable_compression": stripe.enable_compression,
         }
         stripe.api_key = "sk_test_123"
         stripe.api_version = "2017-12-14"
@@ -100,6 +103,7 @@ class TestAPIRequestor(object):
         stripe.api_version = orig_attrs["api_version"]
         stripe.default_http_client = orig_attrs["default_http_client"]
         stripe.enable_telemetry = orig_attrs["enable_telemetry"]
+        stripe.enable_compression = orig_attrs["enable_compression"]
 
     @pytest.fixture
     def requestor(self, http_client_mock):
@@ -391,6 +395,31 @@ class TestAPIRequestor(object):
         )
         http_client_mock.assert_requested("get", extra_headers={"foo": "bar"})
 
+    def test_does_not_ask_for_compression_by_default(
+        self, requestor, http_client_mock
+    ):
+        http_client_mock.stub_request(
+            "get", path=self.valid_path, rbody="{}", rcode=200
+        )
+        requestor.request(
+            "get", self.valid_path, {}, base_address="api", api_mode="V1"
+        )
+        last_call = http_client_mock.get_last_call()
+        assert "Accept-Encoding" not in last_call.headers
+
+    def test_asks_for_compression_when_enabled(
+        self, requestor, http_client_mock
+    ):
+        stripe.enable_compression = True
+        http_client_mock.stub_request(
+            "get", path=self.valid_path, rbody="{}", rcode=200
+        )
+        requestor.request(
+            "get", self.valid_path, {}, base_address="api", api_mode="V1"
+        )
+        last_call = http_client_mock.get_last_call()
+        assert last_call.headers["Accept-Encoding"].startswith("gzip, deflate")
+
     def test_uses_api_version(self, requestor, http_client_mock):
         http_client_mock.stub_request(
             "get", path=self.valid_path, rbody="{}", rcode=200
@@ -566,6 +595,28 @@ class TestAPIRequestor(object):
             meth, idempotency_key="123abc", post_data=""
         )
 
+    def test_passes_timeout_and_deadline(self, requestor, http_client_mock):
+        http_client_mock.stub_request(
+            "get", path=self.valid_path, rbody="{}", rcode=200
+        )
+        request_options: RequestOptions = {
+            "timeout": {"connect": 2, "read": 10},
+            "deadline": 30,
+        }
+        requestor.request(
+            "get",
+            self.valid_path,
+            {},
+            options=request_options,
+            base_address="api",
+            api_mode="V1",
+        )
+
+        client = http_client_mock.get_mock_http_client()
+        kwargs = client.request_with_retries.call_args[1]
+        assert kwargs["timeout"] == {"connect": 2, "read": 10}
+        assert kwargs["deadline"] == 30
+
     def test_uuid4_idempotency_key_when_not_given(
         self, requestor, http_client_mock
     ):
@@ -828,3 +879,201 @@ class TestDefaultClient(object):
         last_call.assert_method("get")
         last_call.assert_abs_url("https://api.stripe.com/v1/charges?limit=3")
         last_call.assert_post_data(None)
+
+
+class TestCoalescing(object):
+    price = b'{"id": "price_123", "object": "price", "metadata": {}}'
+
+    @pytest.fixture(autouse=True)
+    def setup_stripe(self):
+        orig_attrs = {
+            "api_key": stripe.api_key,
+            "enable_telemetry": stripe.enable_telemetry,
+            "coalesce_requests": stripe.coalesce_requests,
+        }
+        stripe.api_key = "sk_test_123"
+        stripe.enable_telemetry = False
+        stripe.coalesce_requests = True
+        yield
+        stripe.api_key = orig_attrs["api_key"]
+        stripe.enable_telemetry = orig_attrs["enable_telemetry"]
+        stripe.coalesce_requests = orig_attrs["coalesce_requests"]
+
+    @pytest.fixture
+    def release(self):
+        return threading.Event()
+
+    @pytest.fixture
+    def client(self, mocker, release):
+        def request_with_retries(method, abs_url, *args, **kwargs):
+            release.wait(5)
+            if "price_missing" in abs_url:
+                return (
+                    b'{"error": {"type": "invalid_request_error"}}',
+                    404,
+                    {},
+                )
+            return self.price, 200, {}
+
+        client = mocker.Mock()
+        client.name = "mockclient"
+        client.request_with_retries.side_effect = request_with_retries
+        return client
+
+    def request_concurrently(self, client, release, calls):
+        requestor = _APIRequestor(
+            client=client, options=_GlobalRequestorOptions()
+        )
+        results = [None] * len(calls)
+
+        def run(i, method, url, options):
+            try:
+                results[i] = requestor.request(
+                    method,
+                    url,
+                    {"expand": ["product"]},
+                    options=options,
+                    base_address="api",
+                    api_mode="V1",
+                )
+            except stripe.StripeError as e:
+                results[i] = e
+
+        threads = [
+            threading.Thread(target=run, args=(i,) + call)
+            for i, call in enumerate(calls)
+        ]
+        for thread in threads:
+            thread.start()
+        # Give every thread the chance to join the first one's request.
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_coalesces_identical_gets(self, client, release):
+        results = self.request_concurrently(
+            client, release, [("get", "/v1/prices/price_123", None)] * 5
+        )
+
+        assert client.request_with_retries.call_count == 1
+        assert len(set(map(id, results))) == 5
+        assert all(isinstance(r, stripe.Price) for r in results)
+        assert all(r.id == "price_123" for r in results)
+
+        results[0].metadata["order_id"] = "6735"
+        assert results[1].metadata == {}
+
+    def test_waiters_get_errors_of_their_own(self, client, release):
+        results = self.request_concurrently(
+            client, release, [("get", "/v1/prices/price_missing", None)] * 3
+        )
+
+        assert client.request_with_retries.call_count == 1
+        assert all(isinstance(r, stripe.InvalidRequestError) for r in results)
+        assert len(set(map(id, results))) == 3
+
+    def test_keeps_different_requests_apart(self, client, release):
+        results = self.request_concurrently(
+            client,
+            release,
+            [
+                ("get", "/v1/prices/price_123", None),
+                ("get", "/v1/prices/price_456", None),
+                ("get", "/v1/prices/price_123", {"stripe_account": "acct_1"}),
+                ("get", "/v1/prices/price_123", {"api_key": "sk_test_456"}),
+                ("get", "/v1/prices/price_123", {"stripe_version": "2024"}),
+                ("post", "/v1/prices/price_123", None),
+                ("post", "/v1/prices/price_123", None),
+            ],
+        )
+
+        assert client.request_with_retries.call_count == 7
+        assert all(isinstance(r, stripe.Price) for r in results)
+
+    def test_keeps_requests_with_own_limits_apart(self, client, release):
+        results = self.request_concurrently(
+            client,
+            release,
+            [
+                ("get", "/v1/prices/price_123", None),
+                ("get", "/v1/prices/price_123", {"deadline": 10}),
+                ("get", "/v1/prices/price_123", {"deadline": 10}),
+                ("get", "/v1/prices/price_123", {"timeout": 5}),
+                ("get", "/v1/prices/price_123", {"max_network_retries": 3}),
+            ],
+        )
+
+        assert client.request_with_retries.call_count == 5
+        assert all(isinstance(r, stripe.Price) for r in results)
+
+    def test_waiters_get_connection_errors_of_their_own(self, client, release):
+        def request_with_retries(*args, **kwargs):
+            release.wait(5)
+            raise stripe.APIConnectionError("Boom", should_retry=True)
+
+        client.request_with_retries.side_effect = request_with_retries
+
+        results = self.request_concurrently(
+            client, release, [("get", "/v1/prices/price_123", None)] * 3
+        )
+
+        assert client.request_with_retries.call_count == 1
+        assert all(isinstance(r, stripe.APIConnectionError) for r in results)
+        assert len(set(map(id, results))) == 3
+        assert all(r.should_retry for r in results)
+
+    def test_is_opt_in(self, client, release):
+        stripe.coalesce_requests = False
+
+        self.request_concurrently(
+            client, release, [("get", "/v1/prices/price_123", None)] * 3
+        )
+
+        assert client.request_with_retries.call_count == 3
+
+    def test_does_not_key_requests_when_off(self, mocker, client, release):
+        stripe.coalesce_requests = False
+        request_key = mocker.spy(_APIRequestor, "_request_key")
+
+        self.request_concurrently(
+            client, release, [("get", "/v1/prices/price_123", None)]
+        )
+
+        assert not request_key.called
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("anyio_backend", ["asyncio"])
+    async def test_async_coalesces_identical_gets(self, mocker, anyio_backend):
+        import asyncio
+
+        calls = []
+
+        async def request_with_retries_async(*args, **kwargs):
+            calls.append(args)
+            await asyncio.sleep(0.05)
+            return self.price, 200, {}
+
+        client = mocker.Mock()
+        client.name = "mockclient"
+        client.request_with_retries_async = request_with_retries_async
+        requestor = _APIRequestor(
+            client=client, options=_GlobalRequestorOptions()
+        )
+
+        results = await asyncio.gather(
+            *(
+                requestor.request_async(
+                    "get",
+                    "/v1/prices/price_123",
+                    base_address="api",
+                    api_mode="V1",
+                )
+                for _ in range(3)
+            )
+        )
+
+        assert len(calls) == 1
+        assert len(set(map(id, results))) == 3
+        assert all(r.id == "price_123" for r in results)
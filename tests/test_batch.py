@@ -0,0 +1,114 @@
+import functools
+import threading
+import time
+
+import pytest
+
+import stripe
+from stripe import BatchResult
+
+
+class TestBatch(object):
+    @pytest.fixture
+    def client(self):
+        return stripe.StripeClient("sk_test_123")
+
+    def test_returns_results_in_order(self, client):
+        def call(i):
+            time.sleep(0.01 * (5 - i))
+            return i * 10
+
+        results = client.batch(
+            [functools.partial(call, i) for i in range(5)], max_in_flight=5
+        )
+
+        assert [r.result for r in results] == [0, 10, 20, 30, 40]
+        assert [r.index for r in results] == list(range(5))
+        assert all(r.ok for r in results)
+
+    def test_bounds_calls_in_flight(self, client):
+        lock = threading.Lock()
+        in_flight = [0]
+        most_in_flight = [0]
+
+        def call():
+            with lock:
+                in_flight[0] += 1
+                most_in_flight[0] = max(most_in_flight[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+
+        client.batch([call] * 20, max_in_flight=3)
+
+        assert most_in_flight[0] == 3
+
+    def test_collects_errors(self, client):
+        error = stripe.InvalidRequestError("No such invoice", "id")
+
+        def fail():
+            raise error
+
+        results = client.batch([lambda: 1, fail, lambda: 3])
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[1].error is error
+        assert results[1].result is None
+        assert results[2].result == 3
+
+    def test_stops_on_first_error(self, client):
+        def fail():
+            raise stripe.APIConnectionError("boom")
+
+        calls = [fail] + [lambda: "done"] * 5
+
+        results = client.batch(calls, max_in_flight=1, stop_on_error=True)
+
+        assert isinstance(results[0].error, stripe.APIConnectionError)
+        assert all(r.skipped and not r.ok for r in results[1:])
+
+    def test_raises_other_exceptions(self, client):
+        def fail():
+            raise KeyError("oops")
+
+        with pytest.raises(KeyError):
+            client.batch([lambda: 1, fail])
+
+    def test_reports_progress(self, client):
+        progress = []
+        caller = threading.current_thread()
+
+        def on_progress(completed, total, item):
+            assert threading.current_thread() is caller
+            progress.append((completed, total, item.index))
+
+        client.batch(
+            [lambda: 1, lambda: 2], max_in_flight=1, on_progress=on_progress
+        )
+
+        assert progress == [(1, 2, 0), (2, 2, 1)]
+
+    def test_makes_service_calls(self, http_client_mock):
+        http_client_mock.stub_request(
+            "get",
+            path="/v1/invoices/in_123",
+            rbody='{"id": "in_123", "object": "invoice"}',
+        )
+        client = stripe.StripeClient(
+            "sk_test_123", http_client=http_client_mock.get_mock_http_client()
+        )
+
+        (result,) = client.batch(
+            [functools.partial(client.invoices.retrieve, "in_123")]
+        )
+
+        assert isinstance(result, BatchResult)
+        assert isinstance(result.result, stripe.Invoice)
+        assert result.result.id == "in_123"
+
+    def test_empty_batch(self, client):
+        assert client.batch([]) == []
+
+    def test_rejects_invalid_max_in_flight(self, client):
+        with pytest.raises(ValueError):
+            client.batch([lambda: 1], max_in_flight=0)
@@ -0,0 +1,151 @@
+import json
+
+import pytest
+
+import stripe
+from stripe import (
+    FileCheckpointStore,
+    PageCursor,
+    SQLiteCheckpointStore,
+)
+
+
+def customers(*ids, has_more=False):
+    return json.dumps(
+        {
+            "object": "list",
+            "url": "/v1/customers",
+            "has_more": has_more,
+            "data": [{"id": id, "object": "customer"} for id in ids],
+        }
+    )
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        yield FileCheckpointStore(str(tmp_path / "checkpoints"))
+    else:
+        store = SQLiteCheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+        yield store
+        store.close()
+
+
+class TestPageCursor(object):
+    def test_to_params(self):
+        cursor = PageCursor(
+            "/v1/customers", {"limit": 2}, starting_after="cus_2"
+        )
+
+        assert cursor.to_params() == {"limit": 2, "starting_after": "cus_2"}
+
+    def test_json(self):
+        cursor = PageCursor(
+            "/v1/customers/search",
+            {"query": "email:'jenny'", "expand": ["data.address"]},
+            page="page_2",
+        )
+
+        assert PageCursor.from_json(cursor.to_json()) == cursor
+
+
+class TestCheckpointStore(object):
+    def test_saves_cursors(self, store):
+        cursor = PageCursor("/v1/customers", starting_after="cus_2")
+
+        assert store.load("customers") is None
+        store.save("customers", cursor)
+        assert store.load("customers") == cursor
+
+        cursor = PageCursor("/v1/customers", starting_after="cus_4")
+        store.save("customers", cursor)
+        assert store.load("customers") == cursor
+        assert store.load("charges") is None
+
+        store.delete("customers")
+        store.delete("customers")
+        assert store.load("customers") is None
+
+    def test_keys_are_opaque(self, store):
+        cursor = PageCursor("/v1/customers", starting_after="cus_2")
+
+        store.save("../acct_1/customers", cursor)
+
+        assert store.load("../acct_1/customers") == cursor
+        assert store.load("customers") is None
+
+
+class TestCheckpointing(object):
+    @pytest.fixture
+    def client(self, http_client_mock):
+        for query_string, rbody in [
+            ("limit=2", customers("cus_1", "cus_2", has_more=True)),
+            (
+                "limit=2&starting_after=cus_2",
+                customers("cus_3", "cus_4", has_more=True),
+            ),
+            ("limit=2&starting_after=cus_4", customers("cus_5")),
+        ]:
+            http_client_mock.stub_request(
+                "get",
+                path="/v1/customers",
+                query_string=query_string,
+                rbody=rbody,
+            )
+        return stripe.StripeClient(
+            "sk_test_123",
+            http_client=http_client_mock.get_mock_http_client(),
+        )
+
+    def test_page_cursor(self, client):
+        page = client.customers.list({"limit": 2})
+
+        assert page.cursor == PageCursor(
+            "/v1/customers", {"limit": 2}, starting_after="cus_2"
+        )
+        assert page.next_page().next_page().cursor is None
+
+    def test_resumes(self, client, store):
+        page = client.customers.list({"limit": 2})
+        seen = []
+        for customer in page.auto_paging_iter(
+            checkpoint=store, checkpoint_key="customers"
+        ):
+            seen.append(customer.id)
+            if customer.id == "cus_3":
+                break
+
+        # cus_3 is seen again, as its page wasn't done
+        cursor = store.load("customers")
+        assert cursor.starting_after == "cus_2"
+
+        page = client.resume_list(cursor)
+        for customer in page.auto_paging_iter(
+            checkpoint=store, checkpoint_key="customers"
+        ):
+            seen.append(customer.id)
+
+        assert seen == ["cus_1", "cus_2", "cus_3", "cus_3", "cus_4", "cus_5"]
+        assert store.load("customers") is None
+
+    def test_resumes_raw(self, client, store):
+        page = client.customers.list({"limit": 2}, options={"raw": True})
+        it = page.auto_paging_iter(
+            prefetch=1, checkpoint=store, checkpoint_key="customers"
+        )
+        seen = [next(it)["id"] for _ in range(5)]
+
+        assert seen == ["cus_1", "cus_2", "cus_3", "cus_4", "cus_5"]
+        assert store.load("customers").starting_after == "cus_4"
+
+        page = client.resume_list(
+            store.load("customers"), options={"raw": True}
+        )
+        assert isinstance(page, stripe.RawPage)
+        assert [c["id"] for c in page] == ["cus_5"]
+
+    def test_requires_key(self, client, store):
+        page = client.customers.list({"limit": 2})
+
+        with pytest.raises(ValueError):
+            page.auto_paging_iter(checkpoint=store)
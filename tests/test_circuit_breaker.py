@@ -0,0 +1,130 @@
+import pytest
+
+from stripe import CircuitBreaker, CircuitBreakerOpenError
+
+API = "https://api.stripe.com"
+URL = API + "/v1/charges"
+
+
+class TestCircuitBreaker(object):
+    @pytest.fixture
+    def clock(self, mocker):
+        now = [1000.0]
+        mocker.patch(
+            "stripe._circuit_breaker.time.monotonic",
+            side_effect=lambda: now[0],
+        )
+        return now
+
+    def fail(self, breaker, times, status=None, url=URL):
+        for _ in range(times):
+            breaker.record(breaker.before_request(url), status)
+
+    def test_opens_after_consecutive_connection_errors(self):
+        breaker = CircuitBreaker(failure_threshold=3)
+
+        self.fail(breaker, 2)
+        breaker.record(breaker.before_request(URL), 200)
+        self.fail(breaker, 2)
+        assert breaker.state(API) == "closed"
+
+        self.fail(breaker, 1)
+        assert breaker.state(API) == "open"
+        with pytest.raises(CircuitBreakerOpenError) as excinfo:
+            breaker.before_request(URL)
+        assert excinfo.value.base_address == API
+        assert excinfo.value.should_retry is False
+
+    def test_opens_on_error_rate(self):
+        breaker = CircuitBreaker(
+            failure_threshold=100,
+            error_rate_threshold=0.5,
+            window_size=10,
+            min_requests=4,
+        )
+
+        self.fail(breaker, 3, status=200)
+        self.fail(breaker, 2, status=503)
+        assert breaker.state(API) == "closed"
+
+        self.fail(breaker, 1, status=500)
+        assert breaker.state(API) == "open"
+
+    def test_client_errors_are_not_failures(self):
+        breaker = CircuitBreaker(window_size=2, min_requests=2)
+
+        self.fail(breaker, 10, status=404)
+
+        assert breaker.state(API) == "closed"
+
+    def test_circuits_are_per_base_address(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        self.fail(breaker, 1, url="https://files.stripe.com/v1/files")
+
+        assert breaker.state("https://files.stripe.com") == "open"
+        assert breaker.state(API) == "closed"
+        breaker.before_request(URL)
+
+    def test_half_open_probe_closes_on_success(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        self.fail(breaker, 1)
+
+        clock[0] += 10
+        assert breaker.state(API) == "half_open"
+        probe = breaker.before_request(URL)
+        # Only one probe is let through at a time.
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.before_request(URL)
+
+        breaker.record(probe, 200)
+        assert breaker.state(API) == "closed"
+
+    def test_half_open_probe_reopens_on_failure(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        self.fail(breaker, 1)
+
+        clock[0] += 10
+        self.fail(breaker, 1, status=502)
+
+        assert breaker.state(API) == "open"
+        clock[0] += 9
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.before_request(URL)
+
+    def test_ignores_outcomes_from_an_earlier_state(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        slow = breaker.before_request(URL)
+        self.fail(breaker, 1)
+
+        breaker.record(slow, 200)
+
+        assert breaker.state(API) == "open"
+
+    def test_stats_and_state_changes(self, clock, mocker):
+        on_state_change = mocker.Mock()
+        breaker = CircuitBreaker(
+            failure_threshold=2,
+            recovery_timeout=5,
+            on_state_change=on_state_change,
+        )
+        self.fail(breaker, 1, status=200)
+        self.fail(breaker, 1)
+
+        stats = breaker.stats()[API]
+        assert stats["state"] == "closed"
+        assert stats["consecutive_failures"] == 1
+        assert stats["error_rate"] == 0.5
+        assert stats["window_requests"] == 2
+        assert stats["opened_at"] is None
+
+        self.fail(breaker, 1)
+        assert breaker.stats()[API]["opened_at"] is not None
+        clock[0] += 5
+        breaker.record(breaker.before_request(URL), 200)
+
+        assert on_state_change.call_args_list == [
+            mocker.call(API, "closed", "open"),
+            mocker.call(API, "open", "half_open"),
+            mocker.call(API, "half_open", "closed"),
+        ]
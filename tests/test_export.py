@@ -0,0 +1,202 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import stripe
+
+
+def charges(*created, has_more=False):
+    return json.dumps(
+        {
+            "object": "list",
+            "url": "/v1/charges",
+            "has_more": has_more,
+            "data": [
+                {"id": "ch_%d" % c, "object": "charge", "created": c}
+                for c in created
+            ],
+        }
+    )
+
+
+class TestExportList(object):
+    @pytest.fixture
+    def client(self, http_client_mock):
+        return stripe.StripeClient(
+            "sk_test_123",
+            http_client=http_client_mock.get_mock_http_client(),
+        )
+
+    @staticmethod
+    def stub(http_client_mock, gte, lt, rbody, **params):
+        query = "created[gte]=%d&created[lt]=%d&limit=%d" % (
+            gte,
+            lt,
+            params.pop("limit", 100),
+        )
+        for key, value in params.items():
+            query += "&%s=%s" % (key, value)
+        http_client_mock.stub_request(
+            "get", path="/v1/charges", query_string=query, rbody=rbody
+        )
+
+    @pytest.fixture
+    def two_windows(self, http_client_mock):
+        self.stub(http_client_mock, 50, 100, charges(90, 60))
+        self.stub(http_client_mock, 0, 50, charges(40, 10))
+
+    @pytest.mark.usefixtures("two_windows")
+    def test_exports_windows_concurrently(self, client):
+        seen = client.export_list(
+            client.charges.list, created_gte=0, created_lt=100, windows=2
+        )
+
+        assert sorted(c.id for c in seen) == [
+            "ch_10",
+            "ch_40",
+            "ch_60",
+            "ch_90",
+        ]
+
+    @pytest.mark.usefixtures("two_windows")
+    def test_exports_in_order(self, client):
+        seen = client.export_list(
+            client.charges.list,
+            created_gte=0,
+            created_lt=100,
+            windows=2,
+            ordered=True,
+        )
+
+        assert [c.created for c in seen] == [90, 60, 40, 10]
+
+    def test_splits_dense_windows(self, client, http_client_mock):
+        self.stub(
+            http_client_mock,
+            0,
+            1000,
+            charges(900, 800, has_more=True),
+            limit=2,
+        )
+        # Objects created the same second as the last one on the page
+        self.stub(
+            http_client_mock,
+            800,
+            801,
+            charges(),
+            limit=2,
+            starting_after="ch_800",
+        )
+        self.stub(http_client_mock, 400, 800, charges(700, 500), limit=2)
+        self.stub(http_client_mock, 0, 400, charges(300), limit=2)
+
+        seen = client.export_list(
+            client.charges.list,
+            params={"limit": 2},
+            created_gte=0,
+            created_lt=1000,
+            windows=1,
+            ordered=True,
+            min_window=10,
+        )
+
+        assert [c.created for c in seen] == [900, 800, 700, 500, 300]
+
+    def test_pages_through_windows(self, client, http_client_mock):
+        self.stub(
+            http_client_mock, 0, 100, charges(90, 80, has_more=True), limit=2
+        )
+        self.stub(
+            http_client_mock,
+            0,
+            100,
+            charges(70),
+            limit=2,
+            starting_after="ch_80",
+        )
+
+        seen = client.export_list(
+            client.charges.list,
+            params={"limit": 2},
+            created_gte=0,
+            created_lt=100,
+            windows=1,
+            min_window=100,
+        )
+
+        assert [c.created for c in seen] == [90, 80, 70]
+
+    def test_limits_pages_held_back(self):
+        release = threading.Event()
+        calls = []
+
+        def list_method(params):
+            gte, lt = params["created"]["gte"], params["created"]["lt"]
+            calls.append(gte)
+            if lt == 400:
+                release.wait(5)
+            fetched = calls.count(gte)
+            created = lt - fetched
+            return SimpleNamespace(
+                data=[{"id": "ch_%d" % created, "created": created}],
+                has_more=fetched < 3,
+            )
+
+        seen = []
+        exporter = threading.Thread(
+            target=lambda: seen.extend(
+                stripe.StripeClient("sk_test_123").export_list(
+                    list_method,
+                    created_gte=0,
+                    created_lt=400,
+                    windows=4,
+                    max_in_flight=4,
+                    ordered=True,
+                    min_window=1000,
+                    max_buffered=2,
+                )
+            )
+        )
+        exporter.start()
+        try:
+            time.sleep(0.2)
+            # The first window is stuck, so the others stop after the pages
+            # there's room for.
+            assert len(calls) == 3
+        finally:
+            release.set()
+            exporter.join(5)
+
+        assert [c["created"] for c in seen] == [
+            created
+            for lt in (400, 300, 200, 100)
+            for created in (lt - 1, lt - 2, lt - 3)
+        ]
+
+    def test_raises_errors(self, client, http_client_mock):
+        http_client_mock.stub_request(
+            "get",
+            path="/v1/charges",
+            query_string="created[gte]=0&created[lt]=100&limit=100",
+            rbody='{"error": {"message": "Boom"}}',
+            rcode=500,
+        )
+
+        with pytest.raises(stripe.APIError):
+            list(
+                client.export_list(
+                    client.charges.list,
+                    created_gte=0,
+                    created_lt=100,
+                    windows=1,
+                )
+            )
+
+    def test_rejects_no_windows(self, client):
+        with pytest.raises(ValueError):
+            client.export_list(
+                client.charges.list, created_gte=0, created_lt=100, windows=0
+            )
@@ -0,0 +1,137 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+import stripe
+
+
+def charge(i):
+    return {
+        "id": "ch_%d" % i,
+        "object": "charge",
+        "amount": 1000 + i,
+        "paid": True,
+        "description": None,
+        "billing_details": {
+            "email": "jenny%d@example.com" % i,
+            "name": "Jenny, %d" % i,
+        },
+        "metadata": {"order_id": str(i)},
+    }
+
+
+def stub_charges(http_client_mock):
+    pages = [([charge(1), charge(2)], True), ([charge(3)], False)]
+    for i, (data, has_more) in enumerate(pages):
+        query = "limit=2"
+        if i:
+            query += "&starting_after=ch_2"
+        http_client_mock.stub_request(
+            "get",
+            path="/v1/charges",
+            query_string=query,
+            rbody=json.dumps(
+                {
+                    "object": "list",
+                    "url": "/v1/charges",
+                    "has_more": has_more,
+                    "data": data,
+                }
+            ),
+        )
+
+
+class TestExportToFile(object):
+    @pytest.fixture
+    def client(self, http_client_mock):
+        stub_charges(http_client_mock)
+        return stripe.StripeClient(
+            "sk_test_123",
+            http_client=http_client_mock.get_mock_http_client(),
+        )
+
+    def test_ndjson(self, client, tmp_path):
+        path = str(tmp_path / "charges.ndjson")
+
+        stats = client.export_to_file(
+            client.charges.list, path, params={"limit": 2}
+        )
+
+        with open(path, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        assert lines == [charge(1), charge(2), charge(3)]
+        assert stats.objects == 3
+        assert stats.pages == 2
+        assert stats.bytes == len(open(path, "rb").read())
+
+    def test_ndjson_fields(self, client, tmp_path):
+        path = str(tmp_path / "charges.ndjson")
+
+        client.export_to_file(
+            client.charges.list,
+            path,
+            params={"limit": 2},
+            fields=["amount", "billing_details.email"],
+            prefetch=0,
+        )
+
+        with open(path, encoding="utf-8") as f:
+            first = json.loads(f.readline())
+        assert first == {
+            "id": "ch_1",
+            "object": "charge",
+            "amount": 1001,
+            "billing_details": {"email": "jenny1@example.com"},
+        }
+
+    def test_csv(self, client, tmp_path):
+        path = str(tmp_path / "charges.csv.gz")
+        progress = []
+
+        client.export_to_file(
+            client.charges.list,
+            path,
+            params={"limit": 2},
+            format="csv",
+            fields=[
+                "id",
+                "paid",
+                "description",
+                "billing_details.name",
+                "metadata",
+                "missing.field",
+            ],
+            compress=True,
+            on_progress=lambda stats: progress.append(stats.objects),
+        )
+
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == [
+            "id",
+            "paid",
+            "description",
+            "billing_details.name",
+            "metadata",
+            "missing.field",
+        ]
+        assert rows[1] == [
+            "ch_1",
+            "true",
+            "",
+            "Jenny, 1",
+            '{"order_id":"1"}',
+            "",
+        ]
+        assert len(rows) == 4
+        assert progress == [2, 3]
+
+    def test_csv_requires_fields(self, client, tmp_path):
+        with pytest.raises(ValueError):
+            client.export_to_file(
+                client.charges.list,
+                str(tmp_path / "charges.csv"),
+                format="csv",
+            )
@@ -0,0 +1,84 @@
+import pytest
+
+from stripe import HedgingPolicy
+from stripe import _http_client
+
+
+class TestHedgingPolicy(object):
+    def test_uses_initial_delay_until_enough_samples(self):
+        policy = HedgingPolicy(initial_delay=0.5, min_samples=3)
+        policy.record_latency(0.1)
+        policy.record_latency(0.1)
+
+        assert policy.delay() == 0.5
+
+        policy.record_latency(0.1)
+        assert policy.delay() == 0.1
+
+    def test_delay_is_latency_percentile(self):
+        policy = HedgingPolicy(percentile=90, min_samples=1, max_delay=100)
+        for ms in range(1, 101):
+            policy.record_latency(ms / 1000)
+
+        assert policy.delay() == 0.091
+
+    def test_delay_is_bounded(self):
+        policy = HedgingPolicy(min_samples=1, min_delay=0.05, max_delay=1)
+
+        policy.record_latency(0.001)
+        assert policy.delay() == 0.05
+
+        for _ in range(10):
+            policy.record_latency(10)
+        assert policy.delay() == 1
+
+    def test_hedges_are_limited_by_budget(self):
+        policy = HedgingPolicy(budget_ratio=0.25, budget_burst=2)
+
+        for _ in range(3):
+            policy._start_request()
+        assert not policy._try_hedge()
+
+        policy._start_request()
+        assert policy._try_hedge()
+        assert not policy._try_hedge()
+
+        for _ in range(100):
+            policy._start_request()
+        assert policy._try_hedge()
+        assert policy._try_hedge()
+        assert not policy._try_hedge()
+
+        stats = policy.stats()
+        assert stats["requests"] == 104
+        assert stats["hedges"] == 3
+
+    def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=100)
+        with pytest.raises(ValueError):
+            HedgingPolicy(budget_ratio=2)
+
+
+class TestHedgedRequests(object):
+    def test_primary_gets_attempt_timeout(self):
+        calls = []
+
+        class TestClient(_http_client.HTTPClient):
+            def request(self, method, url, headers, post_data=None, **kwargs):
+                calls.append(kwargs)
+                return ("{}", 200, {})
+
+        hedging = HedgingPolicy(initial_delay=5)
+        client = TestClient(hedging=hedging)
+
+        client.request_with_retries(
+            "get", "http://fake.url", {}, None, timeout=3, deadline=10
+        )
+
+        assert len(calls) == 1
+        timeout = calls[0]["timeout"]
+        assert timeout.connect == 3
+        assert timeout.read == 3
+        assert 0 < timeout.total <= 10
+        hedging.close()
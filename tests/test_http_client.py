@@ -1,15 +1,25 @@
 from typing import Any
 from typing_extensions import Type
 from unittest.mock import call
+import asyncio
+import datetime
 import pytest
+import gzip
 import json
+import ssl
+import threading
+import time
+import zlib
 
 import stripe
 from stripe import _http_client
-from stripe._encode import _api_encode
+from stripe._encode import _api_encode, _api_encode_form
+from stripe._multipart_data_generator import MultipartDataGenerator
 from stripe import APIConnectionError
 import urllib3
+import httpx
 from stripe import _util
+from urllib.parse import urlencode, urlparse
 
 VALID_API_METHODS = ("get", "post", "delete")
 
@@ -179,6 +189,23 @@ class TestRetryConditionsDefaultHttpClient(StripeClientTestCase):
             is True
         )
 
+    def test_should_retry_on_rate_limit_with_rate_limiter(self):
+        client = _http_client.new_default_http_client()
+        assert (
+            client._should_retry(
+                (None, 429, None), None, 0, max_network_retries=1
+            )
+            is False
+        )
+
+        client = _http_client.RequestsClient(rate_limiter=stripe.RateLimiter())
+        assert (
+            client._should_retry(
+                (None, 429, None), None, 0, max_network_retries=1
+            )
+            is True
+        )
+
     def test_should_retry_on_error(self, mocker):
         client = _http_client.new_default_http_client()
         api_connection_error = mocker.Mock()
@@ -297,6 +324,449 @@ class TestHTTPClient(object):
         telemetry = json.loads(args[2]["X-Stripe-Client-Telemetry"])
         assert telemetry["last_request_metrics"]["request_id"] == "req_123"
 
+    @pytest.mark.anyio
+    async def test_async_retries_sleep_with_asyncio(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        client = TestClient()
+        request_async = mocker.patch.object(
+            client,
+            "request_async",
+            side_effect=[("", 500, {}), ("{}", 200, {})],
+        )
+        sleep_mock = mocker.patch(
+            "stripe._http_client.asyncio.sleep", new=mocker.AsyncMock()
+        )
+
+        _, code, _ = await client.request_with_retries_async(
+            "get", "http://fake.url", {}, None, max_network_retries=1
+        )
+
+        assert code == 200
+        assert request_async.call_count == 2
+        sleep_mock.assert_awaited_once()
+
+    def test_feeds_responses_to_rate_limiter(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        limiter = stripe.RateLimiter(read_rate=100, write_rate=100)
+        client = TestClient(rate_limiter=limiter)
+        request = mocker.patch.object(
+            client,
+            "request",
+            side_effect=[
+                ("", 429, {"retry-after": "1"}),
+                ("{}", 200, {}),
+            ],
+        )
+        mocker.patch.object(client, "_sleep_time_seconds", return_value=0)
+        sleep_mock = mocker.patch("stripe._rate_limiter.time.sleep")
+
+        _, code, _ = client.request_with_retries(
+            "post", "http://fake.url", {}, None, max_network_retries=1
+        )
+
+        assert code == 200
+        assert request.call_count == 2
+        assert limiter.rates == {"read": 100, "write": 51}
+        # The retry waited out the Retry-After before it was sent.
+        ((wait,), _) = sleep_mock.call_args
+        assert 0.9 < wait < 1.1
+
+    def test_circuit_breaker_stops_retries(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        breaker = stripe.CircuitBreaker(failure_threshold=2)
+        client = TestClient(circuit_breaker=breaker)
+        request = mocker.patch.object(
+            client,
+            "request",
+            side_effect=APIConnectionError("boom", should_retry=True),
+        )
+        mocker.patch.object(client, "_sleep_time_seconds", return_value=0)
+
+        with pytest.raises(stripe.CircuitBreakerOpenError):
+            client.request_with_retries(
+                "get", "http://fake.url/v1", {}, None, max_network_retries=5
+            )
+        assert request.call_count == 2
+        assert breaker.state("http://fake.url") == "open"
+
+        with pytest.raises(stripe.CircuitBreakerOpenError):
+            client.request_with_retries("get", "http://fake.url/v1", {}, None)
+        assert request.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_async_circuit_breaker_fails_fast(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        breaker = stripe.CircuitBreaker(window_size=1, min_requests=1)
+        client = TestClient(circuit_breaker=breaker)
+        request_async = mocker.patch.object(
+            client, "request_async", return_value=("", 500, {})
+        )
+        mocker.patch.object(client, "sleep_async", new=mocker.AsyncMock())
+
+        with pytest.raises(stripe.CircuitBreakerOpenError):
+            await client.request_with_retries_async(
+                "get", "http://fake.url/v1", {}, None, max_network_retries=1
+            )
+        request_async.assert_awaited_once()
+
+    def test_hedges_slow_gets(self):
+        release = threading.Event()
+        calls = []
+
+        class TestClient(_http_client.HTTPClient):
+            def request(self, method, url, headers, post_data=None, **kwargs):
+                calls.append(method)
+                if len(calls) == 1:
+                    release.wait(5)
+                    return ("slow", 200, {})
+                return ("fast", 200, {})
+
+        hedging = stripe.HedgingPolicy(
+            initial_delay=0.01, budget_ratio=1, budget_burst=1
+        )
+        client = TestClient(hedging=hedging)
+
+        body, _, _ = client.request_with_retries(
+            "get", "http://fake.url", {}, None
+        )
+        release.set()
+
+        assert body == "fast"
+        assert calls == ["get", "get"]
+        assert hedging.stats()["hedge_wins"] == 1
+        hedging.close()
+
+    def test_does_not_hedge_writes(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        hedging = stripe.HedgingPolicy(
+            initial_delay=0.001, budget_ratio=1, budget_burst=10
+        )
+        client = TestClient(hedging=hedging)
+        request = mocker.patch.object(
+            client,
+            "request",
+            side_effect=lambda *args: time.sleep(0.05) or ("{}", 200, {}),
+        )
+
+        client.request_with_retries("post", "http://fake.url", {}, None)
+
+        assert request.call_count == 1
+        assert hedging.stats()["requests"] == 0
+
+    def test_hedge_without_budget_waits_for_first_request(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        hedging = stripe.HedgingPolicy(initial_delay=0.001, budget_ratio=0)
+        client = TestClient(hedging=hedging)
+        request = mocker.patch.object(
+            client,
+            "request",
+            side_effect=lambda *args: time.sleep(0.05) or ("{}", 200, {}),
+        )
+
+        client.request_with_retries("get", "http://fake.url", {}, None)
+
+        assert request.call_count == 1
+        hedging.close()
+
+    def test_hedge_falls_back_to_other_request_on_error(self):
+        calls = []
+
+        class TestClient(_http_client.HTTPClient):
+            def request(self, method, url, headers, post_data=None, **kwargs):
+                calls.append(method)
+                if len(calls) == 1:
+                    time.sleep(0.05)
+                    return ("first", 200, {})
+                raise APIConnectionError("boom")
+
+        hedging = stripe.HedgingPolicy(
+            initial_delay=0.001, budget_ratio=1, budget_burst=1
+        )
+        client = TestClient(hedging=hedging)
+
+        body, _, _ = client.request_with_retries(
+            "get", "http://fake.url", {}, None
+        )
+
+        assert body == "first"
+        assert len(calls) == 2
+        hedging.close()
+
+    @pytest.mark.parametrize("anyio_backend", ["asyncio"])
+    @pytest.mark.anyio
+    async def test_async_hedges_slow_gets(self, anyio_backend):
+        cancelled = []
+
+        class TestClient(_http_client.HTTPClient):
+            calls = 0
+
+            async def request_async(
+                self, method, url, headers, post_data=None, **kwargs
+            ):
+                TestClient.calls += 1
+                if TestClient.calls == 1:
+                    try:
+                        await asyncio.sleep(5)
+                    except asyncio.CancelledError:
+                        cancelled.append(True)
+                        raise
+                return (b"fast", 200, {})
+
+        hedging = stripe.HedgingPolicy(
+            initial_delay=0.01, budget_ratio=1, budget_burst=1
+        )
+        client = TestClient(hedging=hedging)
+
+        body, _, _ = await client.request_with_retries_async(
+            "get", "http://fake.url", {}, None
+        )
+        await asyncio.sleep(0)
+
+        assert body == b"fast"
+        assert TestClient.calls == 2
+        assert cancelled == [True]
+
+    @pytest.mark.anyio
+    async def test_async_waits_for_rate_limiter(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        limiter = stripe.RateLimiter(read_rate=10, burst=1)
+        client = TestClient(rate_limiter=limiter)
+        client.request_async = mocker.AsyncMock(return_value=("{}", 200, {}))
+        sleep_mock = mocker.patch(
+            "stripe._rate_limiter.asyncio.sleep", new=mocker.AsyncMock()
+        )
+
+        for _ in range(2):
+            await client.request_with_retries_async(
+                "get", "http://fake.url", {}, None
+            )
+
+        sleep_mock.assert_awaited_once()
+
+    def test_passes_per_attempt_timeouts(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        client = TestClient()
+        request = mocker.patch.object(
+            client, "request", return_value=("{}", 200, {})
+        )
+
+        client.request_with_retries(
+            "get",
+            "http://fake.url",
+            {},
+            None,
+            timeout={"connect": 2, "read": 30},
+            deadline=10,
+        )
+
+        timeout = request.call_args[1]["timeout"]
+        assert timeout.connect == 2
+        assert 9 < timeout.read <= 10
+        assert timeout.read == timeout.total
+
+    def test_deadline_stops_retries(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        client = TestClient()
+        request = mocker.patch.object(
+            client, "request", return_value=("", 500, {})
+        )
+        mocker.patch.object(client, "_sleep_time_seconds", return_value=1)
+        sleep_mock = mocker.patch("stripe._http_client.time.sleep")
+
+        _, code, _ = client.request_with_retries(
+            "get",
+            "http://fake.url",
+            {},
+            None,
+            max_network_retries=3,
+            deadline=0.5,
+        )
+
+        assert code == 500
+        request.assert_called_once()
+        sleep_mock.assert_not_called()
+
+    def test_passed_deadline_raises(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        client = TestClient()
+        request = mocker.patch.object(client, "request")
+
+        with pytest.raises(APIConnectionError):
+            client.request_with_retries(
+                "get", "http://fake.url", {}, None, deadline=0
+            )
+        request.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_async_passes_per_attempt_timeouts(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        client = TestClient()
+        request_async = mocker.patch.object(
+            client, "request_async", return_value=("{}", 200, {})
+        )
+
+        await client.request_with_retries_async(
+            "get", "http://fake.url", {}, None, timeout=5
+        )
+
+        timeout = request_async.call_args[1]["timeout"]
+        assert (timeout.connect, timeout.read, timeout.total) == (5, 5, None)
+
+    @pytest.mark.anyio
+    async def test_async_falls_back_to_async_client(self, mocker):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        fallback = TestClient()
+        request_async = mocker.patch.object(
+            fallback, "request_async", return_value=("{}", 200, {})
+        )
+        client = TestClient(async_fallback_client=fallback)
+
+        _, code, _ = await client.request_with_retries_async(
+            "get", "http://fake.url", {}, None
+        )
+
+        assert code == 200
+        request_async.assert_awaited_once_with(
+            "get", "http://fake.url", {}, None
+        )
+
+    @pytest.mark.anyio
+    async def test_async_without_fallback_raises(self):
+        class TestClient(_http_client.HTTPClient):
+            pass
+
+        with pytest.raises(NotImplementedError):
+            await TestClient().request_with_retries_async(
+                "get", "http://fake.url", {}, None
+            )
+
+
+class TestTimeout(object):
+    def test_capped_by_deadline(self):
+        timeout = _http_client._Timeout(connect=5, read=None, total=2)
+
+        assert (timeout.connect, timeout.read) == (2, 2)
+
+    def test_split_fills_in_defaults(self):
+        timeout = _http_client._Timeout(connect=3)
+
+        assert timeout.split(80) == (3, 80)
+        assert timeout.split((10, 20)) == (3, 20)
+
+    def test_none_without_timeout_or_deadline(self):
+        assert _http_client._Timeout.for_attempt(None, None) is None
+
+
+class TestSharedSSLContext(object):
+    def test_cached_per_verification_mode(self):
+        verified = _http_client._shared_ssl_context()
+
+        assert _http_client._shared_ssl_context(True) is verified
+        assert verified.verify_mode == ssl.CERT_REQUIRED
+        assert verified.check_hostname
+
+        unverified = _http_client._shared_ssl_context(False)
+        assert unverified is not verified
+        assert unverified.verify_mode == ssl.CERT_NONE
+
+    def test_loads_ca_bundle_once(self, mocker):
+        context = _http_client._SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        load = mocker.patch.object(ssl.SSLContext, "load_verify_locations")
+
+        context.load_verify_locations(cafile=stripe.ca_bundle_path)
+        context.load_verify_locations(cafile=stripe.ca_bundle_path)
+
+        load.assert_called_once_with(stripe.ca_bundle_path, None, None)
+
+    def test_clients_share_context(self):
+        context = _http_client._shared_ssl_context()
+
+        assert _http_client.Urllib2Client()._get_ssl_context() is context
+        session = _http_client.RequestsClient()._get_session()
+        adapter: Any = session.get_adapter("https://api.stripe.com")
+        assert adapter.poolmanager.connection_pool_kw["ssl_context"] is context
+
+
+class TestWarmUp(object):
+    def test_sends_head_request(self, mocker):
+        client = _http_client.RequestsClient()
+        request = mocker.patch.object(client, "request")
+
+        client.warm_up("https://api.stripe.com")
+
+        request.assert_called_once_with("head", "https://api.stripe.com", {})
+
+    def test_ignores_connection_errors(self, mocker):
+        client = _http_client.RequestsClient()
+        mocker.patch.object(
+            client, "request", side_effect=APIConnectionError("boom")
+        )
+
+        client.warm_up("https://api.stripe.com")
+
+
+class TestContentDecoder(object):
+    BODY = b'{"object": "list", "data": []}' * 50
+
+    def decode(self, encoding, data):
+        decoder = _http_client._ContentDecoder.for_headers(
+            {"content-encoding": encoding}
+        )
+        assert decoder is not None
+        half = len(data) // 2
+        head, tail = data[:half], data[half:]
+        return (
+            decoder.decompress(head)
+            + decoder.decompress(tail)
+            + (decoder.flush())
+        )
+
+    def test_gzip(self):
+        data = gzip.compress(self.BODY)
+        assert self.decode("gzip", data) == self.BODY
+
+    def test_deflate(self):
+        assert self.decode("deflate", zlib.compress(self.BODY)) == self.BODY
+
+    def test_raw_deflate(self):
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        data = compressor.compress(self.BODY) + compressor.flush()
+        assert self.decode("deflate", data) == self.BODY
+
+    def test_chained_encodings(self):
+        data = gzip.compress(zlib.compress(self.BODY))
+        assert self.decode("deflate, gzip", data) == self.BODY
+
+    def test_identity_and_unknown_encodings(self):
+        for_headers = _http_client._ContentDecoder.for_headers
+        assert for_headers({}) is None
+        assert for_headers({"content-encoding": "identity"}) is None
+        assert for_headers({"content-encoding": "zstd"}) is None
+
 
 class ClientTestBase(object):
     REQUEST_CLIENT: Type[_http_client.HTTPClient]
@@ -504,6 +974,19 @@ class TestRequestsClient(StripeClientTestCase, ClientTestBase):
 
         check_call(None, "POST", self.valid_url, data, headers, timeout=5)
 
+    def test_per_request_timeout(
+        self, request_mock, mock_response, check_call
+    ):
+        mock_response(request_mock, '{"foo": "baz"}', 200)
+        client = self.REQUEST_CLIENT(
+            verify_ssl_certs=True, timeout=80, proxy="http://slap/"
+        )
+        client.request_with_retries(
+            "GET", self.valid_url, {}, None, timeout={"connect": 2}
+        )
+
+        check_call(None, "GET", self.valid_url, None, {}, timeout=(2, 80))
+
     def test_request_stream_forwards_stream_param(
         self, mocker, request_mock, mock_response, check_call
     ):
@@ -738,6 +1221,79 @@ class TestRequestClientRetryBehavior(TestRequestsClient):
         pass
 
 
+class TestRequestsClientPool(object):
+    def test_threads_share_one_session(self):
+        client = _http_client.RequestsClient()
+        sessions = []
+
+        threads = [
+            threading.Thread(
+                target=lambda: sessions.append(client._get_session())
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(sessions) == 4
+        assert all(session is sessions[0] for session in sessions)
+
+    def test_mounts_pool_limits(self):
+        client = _http_client.RequestsClient(
+            pool_maxsize=4,
+            pool_block=True,
+            pool_limits={"https://files.stripe.com": 2},
+        )
+        session = client._get_session()
+
+        api_adapter: Any = session.get_adapter(
+            "https://api.stripe.com/v1/charges"
+        )
+        assert api_adapter._pool_maxsize == 4
+        assert api_adapter._pool_block is True
+
+        files_adapter: Any = session.get_adapter(
+            "https://files.stripe.com/v1/files"
+        )
+        assert files_adapter._pool_maxsize == 2
+        assert files_adapter._pool_block is True
+
+    def test_expires_idle_connections_per_host(self, mocker):
+        client = _http_client.RequestsClient(pool_keepalive_expiry=10)
+        session = client._get_session()
+        api = "https://api.stripe.com/v1/charges"
+        files = "https://files.stripe.com/v1/files"
+        # Both hosts share the default adapter.
+        adapter: Any = session.get_adapter(api)
+        idle = {}
+        for url in (api, files):
+            pool = adapter.poolmanager.connection_from_url(url)
+            pool.pool.get_nowait()
+            idle[url] = mocker.Mock()
+            pool.pool.put_nowait(idle[url])
+        now = mocker.patch("stripe._http_client.time.monotonic")
+
+        for url, t in [(files, 0), (api, 0), (api, 6), (api, 12), (api, 18)]:
+            now.return_value = t
+            client._expire_idle_connections(session, url)
+        assert not idle[files].close.called
+
+        now.return_value = 20
+        client._expire_idle_connections(session, files)
+
+        idle[files].close.assert_called_once_with()
+        assert not idle[api].close.called
+
+    def test_supplied_session_is_used_as_is(self, mocker):
+        session = mocker.Mock()
+        client = _http_client.RequestsClient(session=session, pool_maxsize=4)
+
+        assert client._get_session() is session
+        session.mount.assert_not_called()
+
+
 class TestUrlFetchClient(StripeClientTestCase, ClientTestBase):
     REQUEST_CLIENT = _http_client.UrlFetchClient
 
@@ -784,7 +1340,7 @@ class TestUrllib2Client(StripeClientTestCase, ClientTestBase):
         _http_client.Urllib2Client
     ] = _http_client.Urllib2Client
 
-    request_object: Any
+    connection_classes: Any
 
     def make_client(self, proxy):
         self.client = self.REQUEST_CLIENT(verify_ssl_certs=True, proxy=proxy)
@@ -802,35 +1358,41 @@ class TestUrllib2Client(StripeClientTestCase, ClientTestBase):
             method, url, headers, post_data
         )
 
+    @pytest.fixture
+    def request_mock(self, mocker):
+        connection = mocker.Mock()
+        self.connection_classes = {
+            "http": mocker.patch(
+                "stripe._http_client.httpclient.HTTPConnection",
+                return_value=connection,
+            ),
+            "https": mocker.patch(
+                "stripe._http_client.httpclient.HTTPSConnection",
+                return_value=connection,
+            ),
+        }
+        mocker.patch(
+            "stripe._http_client.urllibrequest.getproxies", return_value={}
+        )
+        return connection
+
     @pytest.fixture
     def mock_response(self, mocker):
         def mock_response(mock, body, code):
             response = mocker.Mock()
             response.read = mocker.MagicMock(return_value=body)
-            response.code = code
-            response.info = mocker.Mock(return_value={})
-
-            self.request_object = mocker.Mock()
-            mock.Request = mocker.Mock(return_value=self.request_object)
-
-            mock.urlopen = mocker.Mock(return_value=response)
-
-            opener = mocker.Mock()
-            opener.open = mocker.Mock(return_value=response)
-            mock.build_opener = mocker.Mock(return_value=opener)
-            mock.build_opener.open = opener.open
-            mock.ProxyHandler = mocker.Mock(return_value=opener)
+            response.status = code
+            response.getheaders = mocker.Mock(return_value=[])
+            response.will_close = False
 
-            mock.urlopen = mocker.Mock(return_value=response)
+            mock.getresponse = mocker.Mock(return_value=response)
 
         return mock_response
 
     @pytest.fixture
     def mock_error(self):
         def mock_error(mock):
-            mock.urlopen.side_effect = ValueError
-            mock.build_opener().open.side_effect = ValueError
-            mock.build_opener.reset_mock()
+            mock.request.side_effect = ValueError
 
         return mock_error
 
@@ -842,22 +1404,86 @@ class TestUrllib2Client(StripeClientTestCase, ClientTestBase):
             if isinstance(post_data, str):
                 post_data = post_data.encode("utf-8")
 
-            mock.Request.assert_called_with(url, post_data, headers)
-
             if self.client._proxy:
-                assert isinstance(self.client._proxy, dict)
-                mock.ProxyHandler.assert_called_with(self.client._proxy)
-                mock.build_opener.open.assert_called_with(self.request_object)
-                assert not mock.urlopen.called
+                proxy = urlparse(self.client._proxy["https"])
+                self.connection_classes["https"].assert_called_with(
+                    proxy.hostname,
+                    proxy.port or 80,
+                    context=self.client._get_ssl_context(),
+                )
+                mock.set_tunnel.assert_called_with(
+                    "api.stripe.com", 443, headers={}
+                )
+            else:
+                self.connection_classes["https"].assert_called_with(
+                    "api.stripe.com",
+                    443,
+                    context=self.client._get_ssl_context(),
+                )
+                assert not mock.set_tunnel.called
 
-            if not self.client._proxy:
-                mock.urlopen.assert_called_with(self.request_object)
-                assert not mock.build_opener.called
-                assert not mock.build_opener.open.called
+            path = url.replace("https://api.stripe.com", "", 1)
+            mock.request.assert_called_with(
+                method.upper(), path, body=post_data, headers=headers
+            )
 
         return check_call
 
 
+class TestUrllib2ClientConnectionReuse(object):
+    @pytest.fixture
+    def connections(self, mocker):
+        mocker.patch(
+            "stripe._http_client.urllibrequest.getproxies", return_value={}
+        )
+        mocker.patch.object(
+            _http_client._HTTPConnectionPool,
+            "_is_dropped",
+            return_value=False,
+        )
+        fresh = mocker.Mock()
+        response = fresh.getresponse.return_value
+        response.read.return_value = b"{}"
+        response.status = 200
+        response.getheaders.return_value = []
+        response.will_close = False
+        mocker.patch(
+            "stripe._http_client.httpclient.HTTPSConnection",
+            return_value=fresh,
+        )
+
+        idle = mocker.Mock()
+        client = _http_client.Urllib2Client()
+        client._pool.put(("https", "api.stripe.com", 443, None), idle)
+        return client, idle, fresh
+
+    def test_retries_request_refused_by_idle_connection(self, connections):
+        client, idle, fresh = connections
+        idle.request.side_effect = BrokenPipeError
+
+        body, code, _ = client.request(
+            "post", "https://api.stripe.com/v1/charges", {}, "amount=100"
+        )
+
+        assert (body, code) == (b"{}", 200)
+        idle.close.assert_called_once_with()
+        assert fresh.request.call_count == 1
+
+    def test_does_not_retry_lost_response(self, connections):
+        client, idle, fresh = connections
+        idle.getresponse.side_effect = (
+            _http_client.httpclient.RemoteDisconnected
+        )
+
+        with pytest.raises(APIConnectionError):
+            client.request(
+                "post", "https://api.stripe.com/v1/charges", {}, "amount=100"
+            )
+
+        assert idle.request.call_count == 1
+        assert not fresh.request.called
+
+
 class TestUrllib2ClientHttpsProxy(TestUrllib2Client):
     def make_request(self, method, url, headers, post_data, proxy=None):
         return super(TestUrllib2ClientHttpsProxy, self).make_request(
@@ -927,14 +1553,29 @@ class TestPycurlClient(StripeClientTestCase, ClientTestBase):
         return bio_mock
 
     @pytest.fixture
-    def mock_response(self, mocker, bio_mock):
+    def mock_response(self, mocker, bio_mock, request_mocks):
         def mock_response(mock, body, code):
             bio_mock.getvalue = mocker.MagicMock(
                 return_value=body.encode("utf-8")
             )
-            bio_mock.read = mocker.MagicMock(return_value=body.encode("utf-8"))
             mock.getinfo.return_value = code
 
+            # Streamed responses are driven through a CurlMulti, which feeds
+            # the callbacks set on the handle.
+            lib_mock = request_mocks[self.REQUEST_CLIENT.name]
+            options = {}
+            mock.setopt.side_effect = options.__setitem__
+
+            def perform():
+                options[lib_mock.HEADERFUNCTION](b"HTTP/1.1 %d OK\r\n" % code)
+                options[lib_mock.HEADERFUNCTION](b"\r\n")
+                options[lib_mock.WRITEFUNCTION](body.encode("utf-8"))
+                return (0, 0)
+
+            multi = lib_mock.CurlMulti.return_value
+            multi.perform.side_effect = perform
+            multi.info_read.return_value = (0, [mock], [])
+
         return mock_response
 
     @pytest.fixture
@@ -991,6 +1632,72 @@ class TestPycurlClient(StripeClientTestCase, ClientTestBase):
 
         return check_call
 
+    def test_per_request_timeout(
+        self, request_mock, mock_response, request_mocks
+    ):
+        mock_response(request_mock, "{}", 200)
+        self.make_client(None)
+        self.client.request_with_retries(
+            "get",
+            self.valid_url,
+            {},
+            None,
+            timeout={"connect": 2.5, "read": 10},
+            deadline=30,
+        )
+
+        lib_mock = request_mocks[self.REQUEST_CLIENT.name]
+        request_mock.setopt.assert_any_call(lib_mock.CONNECTTIMEOUT_MS, 2500)
+        request_mock.setopt.assert_any_call(lib_mock.LOW_SPEED_LIMIT, 1)
+        request_mock.setopt.assert_any_call(lib_mock.LOW_SPEED_TIME, 10)
+        (timeout_ms,) = [
+            c[0][1]
+            for c in request_mock.setopt.call_args_list
+            if c[0][0] == lib_mock.TIMEOUT_MS
+        ]
+        assert 29000 < timeout_ms <= 30000
+
+    def test_deadline_longer_than_default_timeout(
+        self, request_mock, mock_response, request_mocks
+    ):
+        mock_response(request_mock, "{}", 200)
+        self.make_client(None)
+        self.client.request_with_retries(
+            "get", self.valid_url, {}, None, deadline=300
+        )
+
+        lib_mock = request_mocks[self.REQUEST_CLIENT.name]
+        (timeout_ms,) = [
+            c[0][1]
+            for c in request_mock.setopt.call_args_list
+            if c[0][0] == lib_mock.TIMEOUT_MS
+        ]
+        assert 299000 < timeout_ms <= 300000
+
+    def test_streams_multipart_body(
+        self, request_mock, mock_response, request_mocks, tmp_path
+    ):
+        mock_response(request_mock, "{}", 200)
+        path = tmp_path / "evidence.pdf"
+        path.write_bytes(b"contents")
+        lib_mock = request_mocks[self.REQUEST_CLIENT.name]
+        self.make_client(None)
+
+        with open(str(path), "rb") as f:
+            generator = MultipartDataGenerator()
+            generator.add_params({"file": f})
+            body = generator.get_post_body()
+            self.client.request_with_retries("post", self.valid_url, {}, body)
+
+            options = dict(c[0] for c in request_mock.setopt.call_args_list)
+            read = options[lib_mock.READFUNCTION]
+            sent = b"".join(iter(lambda: read(16384), b""))
+            assert sent == generator.get_post_data()
+
+        assert lib_mock.POSTFIELDS not in options
+        assert options[lib_mock.POSTFIELDSIZE_LARGE] == len(body)
+        assert "Expect: " in options[lib_mock.HTTPHEADER]
+
 
 class TestPycurlClientHttpProxy(TestPycurlClient):
     def make_request(self, method, url, headers, post_data, proxy=None):
@@ -1032,6 +1739,273 @@ class TestPycurlClientHttpsProxy(TestPycurlClient):
         )
 
 
+class TestPycurlClientConcurrency(StripeClientTestCase):
+    @pytest.fixture
+    def lib_mock(self, mocker, request_mocks):
+        lib_mock = request_mocks["pycurl"]
+        lib_mock.Curl = mocker.Mock(side_effect=lambda: mocker.Mock())
+        lib_mock.error = Exception
+        return lib_mock
+
+    @pytest.fixture
+    def bio_mock(self, mocker):
+        bio_patcher = mocker.patch("stripe.util.io.BytesIO")
+        bio_mock = mocker.Mock()
+        bio_mock.getvalue = mocker.Mock(return_value=b"{}")
+        bio_patcher.return_value = bio_mock
+        return bio_mock
+
+    def test_one_shared_handle_per_thread(self, lib_mock):
+        client = _http_client.PycurlClient()
+
+        handle: Any = client._get_curl()
+        assert client._get_curl() is handle
+
+        other_handles = []
+        thread = threading.Thread(
+            target=lambda: other_handles.append(client._get_curl())
+        )
+        thread.start()
+        thread.join()
+
+        assert other_handles[0] is not handle
+        share: Any = client._share
+        for curl in (handle, other_handles[0]):
+            curl.setopt.assert_any_call(lib_mock.SHARE, share)
+        share.setopt.assert_any_call(
+            lib_mock.SH_SHARE, lib_mock.LOCK_DATA_SSL_SESSION
+        )
+
+    def test_close_only_closes_current_thread_handle(self, lib_mock):
+        client = _http_client.PycurlClient()
+        handle: Any = client._get_curl()
+
+        client.close()
+
+        handle.close.assert_called_once_with()
+        assert client._get_curl() is not handle
+
+    def test_request_many_with_retries(self, lib_mock, bio_mock, mocker):
+        handles = [mocker.Mock(), mocker.Mock()]
+        for handle in handles:
+            handle.getinfo.return_value = 200
+        lib_mock.Curl = mocker.Mock(side_effect=handles)
+        multi = lib_mock.CurlMulti.return_value
+        multi.perform.return_value = (0, 0)
+        multi.info_read.side_effect = [
+            (0, [handles[0]], [(handles[1], lib_mock.E_COULDNT_CONNECT, "")]),
+            (0, [handles[1]], []),
+        ]
+
+        client = _http_client.PycurlClient()
+        mocker.patch.object(client, "_sleep_time_seconds", return_value=0)
+        results = client.request_many_with_retries(
+            [
+                ("get", "https://api.stripe.com/v1/a", {}, None),
+                ("post", "https://api.stripe.com/v1/b", {}, "foo=bar"),
+            ],
+            max_network_retries=1,
+        )
+
+        assert [r[:2] for r in results if isinstance(r, tuple)] == [
+            ("{}", 200),
+            ("{}", 200),
+        ]
+        handles[1].setopt.assert_any_call(lib_mock.POSTFIELDS, "foo=bar")
+        assert multi.add_handle.call_count == 3
+        for handle in handles:
+            handle.close.assert_called_once_with()
+
+    def test_request_many_returns_connection_errors(
+        self, lib_mock, bio_mock, mocker
+    ):
+        handle = mocker.Mock()
+        lib_mock.Curl = mocker.Mock(return_value=handle)
+        multi = lib_mock.CurlMulti.return_value
+        multi.perform.return_value = (0, 0)
+        multi.info_read.return_value = (
+            0,
+            [],
+            [(handle, lib_mock.E_COULDNT_CONNECT, "refused")],
+        )
+
+        client = _http_client.PycurlClient()
+        results = client.request_many_with_retries(
+            [("get", "https://api.stripe.com/v1/a", {}, None)]
+        )
+
+        assert isinstance(results[0], APIConnectionError)
+        assert results[0].should_retry
+
+    def test_request_many_applies_timeouts(self, lib_mock, bio_mock, mocker):
+        handle = mocker.Mock()
+        handle.getinfo.return_value = 200
+        lib_mock.Curl = mocker.Mock(return_value=handle)
+        multi = lib_mock.CurlMulti.return_value
+        multi.perform.return_value = (0, 0)
+        multi.info_read.return_value = (0, [handle], [])
+
+        client = _http_client.PycurlClient()
+        client.request_many_with_retries(
+            [("get", "https://api.stripe.com/v1/a", {}, None)],
+            timeout={"connect": 2},
+            deadline=30,
+        )
+
+        handle.setopt.assert_any_call(lib_mock.CONNECTTIMEOUT_MS, 2000)
+        (timeout_ms,) = [
+            c[0][1]
+            for c in handle.setopt.call_args_list
+            if c[0][0] == lib_mock.TIMEOUT_MS
+        ]
+        assert 29000 < timeout_ms <= 30000
+
+    def test_request_many_stops_retrying_at_deadline(
+        self, lib_mock, bio_mock, mocker
+    ):
+        handle = mocker.Mock()
+        lib_mock.Curl = mocker.Mock(return_value=handle)
+        multi = lib_mock.CurlMulti.return_value
+        multi.perform.return_value = (0, 0)
+        multi.info_read.return_value = (
+            0,
+            [],
+            [(handle, lib_mock.E_COULDNT_CONNECT, "refused")],
+        )
+
+        client = _http_client.PycurlClient()
+        mocker.patch.object(client, "_sleep_time_seconds", return_value=10)
+        results = client.request_many_with_retries(
+            [("get", "https://api.stripe.com/v1/a", {}, None)],
+            max_network_retries=3,
+            deadline=5,
+        )
+
+        assert isinstance(results[0], APIConnectionError)
+        assert multi.add_handle.call_count == 1
+
+
+class TestPycurlStream(StripeClientTestCase):
+    @pytest.fixture
+    def lib_mock(self, request_mocks):
+        return request_mocks["pycurl"]
+
+    def test_pauses_transfer_when_buffer_is_full(self, lib_mock, mocker):
+        curl = mocker.Mock()
+        client = _http_client.PycurlClient()
+        stream = _http_client._PycurlStream(client, curl, max_buffer_size=4)
+        multi = stream._multi = lib_mock.CurlMulti.return_value
+        multi.perform.return_value = (0, 0)
+        multi.info_read.return_value = (0, [curl], [])
+
+        assert stream._write(b"abcd") is None
+        assert stream._write(b"ef") == lib_mock.WRITEFUNC_PAUSE
+
+        curl.pause.side_effect = lambda _: stream._write(b"ef")
+        assert stream.read(4) == b"abcd"
+        curl.pause.assert_not_called()
+
+        assert stream.read() == b"ef"
+        curl.pause.assert_called_once_with(lib_mock.PAUSE_CONT)
+        multi.remove_handle.assert_called_once_with(curl)
+        curl.close.assert_called_once_with()
+
+    def test_raises_transfer_errors_after_buffered_data(
+        self, lib_mock, mocker
+    ):
+        lib_mock.error = Exception
+        curl = mocker.Mock()
+        client = _http_client.PycurlClient()
+        stream = _http_client._PycurlStream(client, curl, max_buffer_size=4)
+        multi = stream._multi = lib_mock.CurlMulti.return_value
+        multi.perform.return_value = (0, 0)
+        multi.info_read.return_value = (
+            0,
+            [],
+            [(curl, lib_mock.E_OPERATION_TIMEOUTED, "timed out")],
+        )
+
+        stream._write(b"ab")
+        assert stream.read(4) == b"ab"
+        with pytest.raises(APIConnectionError):
+            stream.read(4)
+
+
+class TestHTTPXClient(object):
+    @pytest.fixture
+    def make_client(self):
+        def make_client(handler):
+            client = _http_client.HTTPXClient()
+            client._client_async = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            return client
+
+        return make_client
+
+    @pytest.mark.anyio
+    async def test_request_async(self, make_client):
+        def handler(request):
+            assert request.method == "POST"
+            assert request.headers["my-header"] == "header val"
+            assert request.content == b"foo=bar"
+            return httpx.Response(200, content=b'{"foo": "baz"}')
+
+        client = make_client(handler)
+        body, code, _ = await client.request_with_retries_async(
+            "post",
+            "https://api.stripe.com/foo",
+            {"my-header": "header val"},
+            "foo=bar",
+        )
+
+        assert code == 200
+        assert body == b'{"foo": "baz"}'
+
+    @pytest.mark.anyio
+    async def test_request_stream_async(self, make_client):
+        def handler(request):
+            return httpx.Response(200, content=b"some streamed content")
+
+        client = make_client(handler)
+        stream, code, _ = await client.request_stream_with_retries_async(
+            "get", "https://api.stripe.com/foo", {}, None
+        )
+
+        assert code == 200
+        assert b"".join([c async for c in stream]) == b"some streamed content"
+
+    @pytest.mark.anyio
+    async def test_connect_error_is_retryable(self, make_client):
+        def handler(request):
+            raise httpx.ConnectError("boom", request=request)
+
+        client = make_client(handler)
+        with pytest.raises(APIConnectionError) as excinfo:
+            await client.request_async(
+                "get", "https://api.stripe.com/foo", {}, None
+            )
+
+        assert excinfo.value.should_retry is True
+
+    def test_sync_request_not_supported(self):
+        with pytest.raises(NotImplementedError):
+            _http_client.HTTPXClient().request(
+                "get", "https://api.stripe.com/foo", {}, None
+            )
+
+
+class TestNoImportFoundAsyncClient(object):
+    @pytest.mark.anyio
+    async def test_request_with_timeout_raises_import_error(self):
+        client = _http_client.NoImportFoundAsyncClient()
+
+        with pytest.raises(ImportError):
+            await client.request_with_retries_async(
+                "get", "https://api.stripe.com/foo", {}, timeout=1
+            )
+
+
 class TestAPIEncode(StripeClientTestCase):
     def test_encode_dict(self):
         body = {"foo": {"dob": {"month": 1}, "name": "bat"}}
@@ -1048,3 +2022,30 @@ class TestAPIEncode(StripeClientTestCase):
 
         assert ("foo[0][dob][month]", 1) in values
         assert ("foo[0][name]", "bat") in values
+
+    def test_encode_form(self):
+        body = {"foo": [{"dob": {"month": 1}, "name": "bat"}], "baz": None}
+
+        assert (
+            _api_encode_form(body) == "foo[0][dob][month]=1&foo[0][name]=bat"
+        )
+
+    def test_encode_form_matches_urlencode(self):
+        class Customer(object):
+            stripe_id = "cus 123"
+
+        body = {
+            "text": "a b&c=d+ü[%5B]",
+            "list": [1, "2", None, {"nested": [True, {"deep": 1.5e20}]}],
+            "dict": {"a b": {3: b"\xff ok"}, "skip": None},
+            "customer": Customer(),
+            "at": datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc),
+            "tuple": (-1, ""),
+        }
+        expected = (
+            urlencode(list(_api_encode(body)))
+            .replace("%5B", "[")
+            .replace("%5D", "]")
+        )
+
+        assert _api_encode_form(body) == expected
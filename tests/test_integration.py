@@ -4,6 +4,7 @@ from threading import Thread, Lock
 import json
 import warnings
 import time
+import gzip
 
 import stripe
 import pytest
@@ -326,3 +327,182 @@ class TestIntegration(object):
 
         usage = telemetry["last_request_metrics"]["usage"]
         assert usage == ["stripe_client"]
+
+    def test_requests_client_pools_connections(self):
+        class MockServerRequestHandler(MyTestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_request(self, n):
+                return (
+                    200,
+                    {
+                        "Content-Type": "application/json; charset=utf-8",
+                        "Content-Length": str(len(self.default_body)),
+                    },
+                    None,
+                )
+
+        self.setup_mock_server(MockServerRequestHandler)
+        base = "http://localhost:%s" % self.mock_server_port
+
+        client = stripe.http_client.RequestsClient(pool_maxsize=2)
+        for _ in range(3):
+            client.request("get", base + "/v1/balance", {})
+
+        stats = client.pool_stats()
+        assert stats["in_flight"] == 0
+        assert stats["peak_in_flight"] == 1
+        (host_stats,) = stats["hosts"].values()
+        assert host_stats["maxsize"] == 2
+        assert host_stats["num_connections"] == 1
+        assert host_stats["num_requests"] == 3
+        assert host_stats["idle"] == 1
+        client.close()
+
+    def test_requests_client_expires_idle_connections(self):
+        class MockServerRequestHandler(MyTestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_request(self, n):
+                return (
+                    200,
+                    {
+                        "Content-Type": "application/json; charset=utf-8",
+                        "Content-Length": str(len(self.default_body)),
+                    },
+                    None,
+                )
+
+        self.setup_mock_server(MockServerRequestHandler)
+        base = "http://localhost:%s" % self.mock_server_port
+
+        client = stripe.http_client.RequestsClient(pool_keepalive_expiry=0.05)
+        client.request("get", base + "/v1/balance", {})
+        time.sleep(0.1)
+        client.request("get", base + "/v1/balance", {})
+
+        (host_stats,) = client.pool_stats()["hosts"].values()
+        assert host_stats["num_connections"] == 2
+        client.close()
+
+    def test_urllib2_client_reuses_connections(self):
+        class MockServerRequestHandler(MyTestHandler):
+            protocol_version = "HTTP/1.1"
+            # Drop idle keep-alive connections quickly.
+            timeout = 0.2
+
+            def do_request(self, n):
+                return (
+                    200,
+                    {
+                        "Content-Type": "application/json; charset=utf-8",
+                        "Content-Length": str(len(self.default_body)),
+                    },
+                    None,
+                )
+
+        self.setup_mock_server(MockServerRequestHandler)
+        base = "http://localhost:%s" % self.mock_server_port
+
+        client = stripe.http_client.Urllib2Client()
+        client.request("get", base + "/v1/balance", {})
+        stream, _, _ = client.request_stream("get", base + "/v1/balance", {})
+        assert stream.read() == b"{}"
+        client.request("get", base + "/v1/balance", {})
+
+        time.sleep(0.4)
+        client.request("get", base + "/v1/balance", {})
+
+        reqs = MockServerRequestHandler.get_requests(4)
+        ports = [req.client_address[1] for req in reqs]
+        assert ports[0] == ports[1] == ports[2]
+        assert ports[3] != ports[0]
+        client.close()
+
+    @pytest.mark.parametrize(
+        "client_class",
+        [
+            stripe.http_client.RequestsClient,
+            stripe.http_client.Urllib2Client,
+            stripe.http_client.PycurlClient,
+        ],
+    )
+    def test_decodes_compressed_responses(self, client_class):
+        body = json.dumps({"object": "balance", "livemode": False}).encode()
+
+        class MockServerRequestHandler(MyTestHandler):
+            def do_request(self, n):
+                encoding = self.headers.get("Accept-Encoding", "")
+                if "gzip" not in encoding:
+                    return (200, None, body)
+                return (
+                    200,
+                    {
+                        "Content-Type": "application/json; charset=utf-8",
+                        "Content-Encoding": "gzip",
+                    },
+                    gzip.compress(body),
+                )
+
+        self.setup_mock_server(MockServerRequestHandler)
+        stripe.api_base = "http://localhost:%s" % self.mock_server_port
+        stripe.default_http_client = client_class()
+        stripe.enable_compression = True
+        try:
+            balance = stripe.Balance.retrieve()
+            client = stripe.default_http_client
+            stream, _, _ = client.request_stream(
+                "get", stripe.api_base + "/v1/balance", {}
+            )
+            streamed = (
+                stream.read()
+                if hasattr(stream, "read")
+                else b"".join(stream.iter_content(chunk_size=4))
+            )
+        finally:
+            stripe.enable_compression = False
+
+        assert balance.object == "balance"
+        assert streamed == body
+        reqs = MockServerRequestHandler.get_requests(2)
+        assert "gzip" in reqs[0].headers["Accept-Encoding"]
+
+    @pytest.mark.parametrize(
+        "client_class",
+        [
+            stripe.http_client.RequestsClient,
+            stripe.http_client.Urllib2Client,
+            stripe.http_client.PycurlClient,
+        ],
+    )
+    def test_streams_file_uploads(self, client_class, tmp_path):
+        contents = bytes(range(256)) * 8192
+        path = tmp_path / "evidence.pdf"
+        path.write_bytes(contents)
+        received = []
+
+        class MockServerRequestHandler(MyTestHandler):
+            def do_request(self, n):
+                length = int(self.headers["Content-Length"])
+                received.append(self.rfile.read(length))
+                return (
+                    200,
+                    None,
+                    json.dumps({"object": "file", "id": "file_123"}).encode(),
+                )
+
+        self.setup_mock_server(MockServerRequestHandler)
+        orig_upload_api_base = stripe.upload_api_base
+        stripe.upload_api_base = "http://localhost:%s" % self.mock_server_port
+        stripe.default_http_client = client_class()
+        try:
+            with open(str(path), "rb") as f:
+                file = stripe.File.create(purpose="dispute_evidence", file=f)
+        finally:
+            stripe.upload_api_base = orig_upload_api_base
+
+        assert file.id == "file_123"
+        (body,) = received
+        assert contents in body
+        assert body.endswith(b"--\r\n")
+        assert b'name="purpose"\r\n\r\ndispute_evidence' in body
@@ -87,3 +87,44 @@ class TestMultipartDataGenerator(object):
         string = io.StringIO("foo")
         string.name = "паспорт.png"
         self.run_test_multipart_data_with_file(string)
+
+    def test_streams_files(self, tmp_path):
+        path = tmp_path / "evidence.bin"
+        path.write_bytes(b"0123456789" * 100)
+        with open(str(path), "rb") as f:
+            f.seek(10)
+            generator = MultipartDataGenerator(chunk_size=64)
+            generator.add_params({"purpose": "dispute_evidence", "file": f})
+            body = generator.get_post_body()
+
+            chunks = list(body)
+            assert sum(len(c) for c in chunks) == len(body)
+            assert b"".join(chunks) == generator.get_post_data()
+            # The file is read again on each pass, from where it was.
+            assert b"".join(body) == b"".join(chunks)
+            assert b"".join(chunks).count(b"0123456789") == 99
+
+    def test_streams_seekable_file_objects(self):
+        contents = b"x" * 1000
+        generator = MultipartDataGenerator(chunk_size=100)
+        generator.add_params({"file": io.BytesIO(contents)})
+        body = generator.get_post_body()
+
+        assert len(body) == len(generator.get_post_data())
+        assert contents in b"".join(body)
+
+    def test_body_reader(self):
+        generator = MultipartDataGenerator(chunk_size=7)
+        generator.add_params({"file": io.BytesIO(b"abc" * 20)})
+        body = generator.get_post_body()
+
+        read = body.reader()
+        chunks = []
+        while True:
+            chunk = read(5)
+            if not chunk:
+                break
+            assert len(chunk) <= 5
+            chunks.append(chunk)
+
+        assert b"".join(chunks) == generator.get_post_data()
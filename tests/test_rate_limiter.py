@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from stripe import RateLimiter
+
+
+class TestRateLimiter(object):
+    def test_allows_a_burst_then_paces_requests(self):
+        limiter = RateLimiter(read_rate=10, burst=2)
+
+        assert limiter.reserve("get")[0] == 0
+        assert limiter.reserve("get")[0] == 0
+        wait, _ = limiter.reserve("get")
+        assert 0.09 < wait <= 0.1
+        wait, _ = limiter.reserve("get")
+        assert 0.19 < wait <= 0.2
+
+    def test_limits_reads_and_writes_separately(self):
+        limiter = RateLimiter(read_rate=10, write_rate=10, burst=1)
+
+        assert limiter.reserve("get")[0] == 0
+        assert limiter.reserve("post")[0] == 0
+        assert limiter.reserve("head")[0] > 0
+        assert limiter.reserve("delete")[0] > 0
+
+    def test_slows_down_once_per_wave_of_rate_limits(self):
+        limiter = RateLimiter(read_rate=100, write_rate=100)
+        tickets = [limiter.acquire("get") for _ in range(5)]
+
+        for ticket in tickets:
+            limiter.record(ticket, 429)
+        assert limiter.rates == {"read": 50, "write": 100}
+
+        limiter.record(limiter.acquire("get"), 429)
+        assert limiter.rates["read"] == 25
+
+    def test_never_slows_below_min_rate(self):
+        limiter = RateLimiter(read_rate=4, min_rate=3)
+
+        limiter.record(limiter.reserve("get")[1], 429)
+
+        assert limiter.rates["read"] == 3
+
+    def test_speeds_back_up_on_success(self):
+        limiter = RateLimiter(read_rate=100, increase=10)
+        limiter.record(limiter.reserve("get")[1], 429)
+
+        for _ in range(4):
+            limiter.record(limiter.reserve("get")[1], 200)
+        assert limiter.rates["read"] == 90
+
+        for _ in range(4):
+            limiter.record(limiter.reserve("get")[1], 200)
+        assert limiter.rates["read"] == 100
+
+    def test_retry_after_pauses_all_requests(self):
+        limiter = RateLimiter()
+
+        limiter.record(limiter.reserve("post")[1], 429, retry_after=1)
+
+        paused_until = limiter.paused_until
+        assert paused_until is not None
+        assert paused_until - time.monotonic() > 0.9
+        assert limiter.reserve("get")[0] > 0.9
+        assert limiter.reserve("post")[0] > 0.9
+
+    def test_ignores_unreasonable_retry_after(self):
+        limiter = RateLimiter(max_retry_after=5)
+
+        limiter.record(limiter.reserve("get")[1], 429, retry_after=10)
+
+        assert limiter.paused_until is None
+
+    def test_waiting_threads_queue_up_behind_a_pause(self):
+        limiter = RateLimiter(read_rate=5, burst=1)
+        limiter.acquire("get")
+        acquired_at = []
+
+        def acquire():
+            limiter.acquire("get")
+            acquired_at.append(time.monotonic())
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        # The thread is now waiting for its turn at 5 requests per second.
+        time.sleep(0.05)
+        paused_at = time.monotonic()
+        limiter.record(("write", 0), 429, retry_after=0.5)
+        thread.join()
+
+        assert acquired_at[0] - paused_at >= 0.5
+
+    def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError):
+            RateLimiter(read_rate=0)
+        with pytest.raises(ValueError):
+            RateLimiter(decrease_factor=1)
@@ -0,0 +1,210 @@
+import json
+
+import pytest
+
+import stripe
+from stripe import RawPage
+
+
+def customer(i):
+    return {
+        "id": "cus_%d" % i,
+        "object": "customer",
+        "email": "jenny%d@example.com" % i,
+        "metadata": {"order_id": str(i)},
+        "address": {"city": "San Francisco", "country": "US"},
+    }
+
+
+def stub_list(http_client_mock):
+    http_client_mock.stub_request(
+        "get",
+        path="/v1/customers",
+        query_string="limit=2",
+        rbody=json.dumps(
+            {
+                "object": "list",
+                "data": [customer(1), customer(2)],
+                "has_more": True,
+                "url": "/v1/customers",
+            }
+        ),
+    )
+    http_client_mock.stub_request(
+        "get",
+        path="/v1/customers",
+        query_string="limit=2&starting_after=cus_2",
+        rbody=json.dumps(
+            {
+                "object": "list",
+                "data": [customer(3)],
+                "has_more": False,
+                "url": "/v1/customers",
+            }
+        ),
+    )
+
+
+def stub_customers(http_client_mock):
+    stub_list(http_client_mock)
+    http_client_mock.stub_request(
+        "get",
+        path="/v1/customers/cus_1",
+        rbody=json.dumps(customer(1)),
+    )
+    http_client_mock.stub_request(
+        "get",
+        path="/v1/customers/search",
+        query_string="query=email%3A%27jenny%27",
+        rbody=json.dumps(
+            {
+                "object": "search_result",
+                "data": [customer(1)],
+                "has_more": True,
+                "next_page": "page_2",
+                "url": "/v1/customers/search",
+            }
+        ),
+    )
+    http_client_mock.stub_request(
+        "get",
+        path="/v1/customers/search",
+        query_string="page=page_2&query=email%3A%27jenny%27",
+        rbody=json.dumps(
+            {
+                "object": "search_result",
+                "data": [customer(2)],
+                "has_more": False,
+                "next_page": None,
+                "url": "/v1/customers/search",
+            }
+        ),
+    )
+
+
+def make_client(http_client_mock, **kwargs):
+    return stripe.StripeClient(
+        "sk_test_123",
+        http_client=http_client_mock.get_mock_http_client(),
+        **kwargs,
+    )
+
+
+class TestRawPage(object):
+    @pytest.fixture
+    def client(self, http_client_mock):
+        stub_customers(http_client_mock)
+        return make_client(http_client_mock)
+
+    def test_returns_dicts(self, client):
+        cus = client.customers.retrieve("cus_1", options={"raw": True})
+
+        assert type(cus) is dict
+        assert cus == customer(1)
+
+    def test_raw_client(self, http_client_mock):
+        stub_customers(http_client_mock)
+        raw_client = make_client(http_client_mock, raw=True)
+
+        assert type(raw_client.customers.retrieve("cus_1")) is dict
+        assert isinstance(
+            raw_client.customers.retrieve("cus_1", options={"raw": False}),
+            stripe.Customer,
+        )
+
+    def test_returns_pages(self, client):
+        page = client.customers.list({"limit": 2}, options={"raw": True})
+
+        assert isinstance(page, RawPage)
+        assert page.has_more
+        assert page.url == "/v1/customers"
+        assert [c["id"] for c in page] == ["cus_1", "cus_2"]
+        assert type(page.data[0]) is dict
+
+        next_page = page.next_page()
+        assert isinstance(next_page, RawPage)
+        assert [c["id"] for c in next_page] == ["cus_3"]
+        assert next_page.next_page().is_empty
+
+    def test_auto_paging_iter(self, client, http_client_mock):
+        page = client.customers.list({"limit": 2}, options={"raw": True})
+
+        assert [c["id"] for c in page.auto_paging_iter()] == [
+            "cus_1",
+            "cus_2",
+            "cus_3",
+        ]
+        http_client_mock.assert_requested(
+            "get",
+            path="/v1/customers",
+            query_string="limit=2&starting_after=cus_2",
+        )
+
+    def test_auto_paging_iter_prefetch(self, client):
+        page = client.customers.list({"limit": 2}, options={"raw": True})
+
+        seen = [c["id"] for c in page.auto_paging_iter(prefetch=2)]
+
+        assert seen == ["cus_1", "cus_2", "cus_3"]
+
+    def test_auto_paging_iter_search(self, client):
+        page = client.customers.search(
+            {"query": "email:'jenny'"}, options={"raw": True}
+        )
+
+        assert page.object == "search_result"
+        assert [c["id"] for c in page.auto_paging_iter()] == [
+            "cus_1",
+            "cus_2",
+        ]
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("anyio_backend", ["asyncio"])
+    async def test_auto_paging_iter_async(self, http_client_mock_async):
+        stub_list(http_client_mock_async)
+        client = make_client(http_client_mock_async)
+        page = await client.customers.list_async(
+            {"limit": 2}, options={"raw": True}
+        )
+
+        ids = [c["id"] async for c in page.auto_paging_iter()]
+        assert ids == ["cus_1", "cus_2", "cus_3"]
+
+    def test_fields(self, client):
+        cus = client.customers.retrieve(
+            "cus_1",
+            options={"raw": True, "fields": ["email", "address.city"]},
+        )
+
+        assert cus == {
+            "id": "cus_1",
+            "object": "customer",
+            "email": "jenny1@example.com",
+            "address": {"city": "San Francisco"},
+        }
+
+    def test_fields_apply_to_every_page(self, client):
+        page = client.customers.list(
+            {"limit": 2}, options={"raw": True, "fields": ["email"]}
+        )
+
+        assert list(page.auto_paging_iter()) == [
+            {
+                "id": "cus_%d" % i,
+                "object": "customer",
+                "email": "jenny%d@example.com" % i,
+            }
+            for i in (1, 2, 3)
+        ]
+
+    def test_fields_require_raw(self, client):
+        with pytest.raises(ValueError, match="raw=True"):
+            client.customers.retrieve("cus_1", options={"fields": ["email"]})
+
+    def test_resource_methods_reject_raw(self, http_client_mock):
+        with pytest.raises(ValueError, match="StripeClient"):
+            stripe.Customer.list(raw=True)
+        with pytest.raises(ValueError, match="StripeClient"):
+            stripe.Customer.retrieve("cus_1", fields=["email"])
+
+        http_client_mock.assert_no_request()
@@ -17,12 +17,15 @@ class TestRequestOptions(object):
             "api_key": "sk_test_456",
             "stripe_version": "2020-01-01",
             "headers": {"foo": "bar"},
+            "timeout": {"connect": 2},
         }
         merged = merge_options(options, other)
         assert merged.get("api_key") == "sk_test_456"
         assert merged.get("stripe_version") == "2020-01-01"
         assert merged.get("stripe_account") == "acct_123"
         assert merged.get("headers") == {"foo": "bar"}
+        assert merged.get("timeout") == {"connect": 2}
+        assert merged.get("deadline") is None
 
     def test_merge_none(self):
         options = RequestorOptions(
@@ -46,6 +49,7 @@ class TestRequestOptions(object):
                 "headers": {
                     "X-Stripe-Header": "Some-Value",
                 },
+                "deadline": 30,
                 "foo": "bar",
             }
         )
@@ -54,4 +58,5 @@ class TestRequestOptions(object):
         assert options.get("stripe_account") == "acct_123"
         assert options.get("idempotency_key") == "idemp_123"
         assert options.get("headers") == {"X-Stripe-Header": "Some-Value"}
+        assert options.get("deadline") == 30
         assert remaining == {"foo": "bar"}
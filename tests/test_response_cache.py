@@ -0,0 +1,249 @@
+import json
+import time
+
+import pytest
+
+import stripe
+from stripe import MemoryResponseCache, SQLiteResponseCache
+
+PRICE = '{"id": "price_123", "object": "price", "unit_amount": 1000}'
+MISSING = (
+    '{"error": {"type": "invalid_request_error", "message": "No such price"}}'
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    caches = []
+
+    def make_cache(**kwargs):
+        if request.param == "memory":
+            cache = MemoryResponseCache(**kwargs)
+        else:
+            cache = SQLiteResponseCache(
+                str(tmp_path / "responses.sqlite3"), **kwargs
+            )
+        caches.append(cache)
+        return cache
+
+    yield make_cache
+    for cache in caches:
+        if isinstance(cache, SQLiteResponseCache):
+            cache.close()
+
+
+class TestResponseCache(object):
+    @pytest.fixture
+    def cache(self, make_cache):
+        return make_cache()
+
+    @pytest.fixture
+    def client(self, http_client_mock, cache):
+        http_client_mock.stub_request(
+            "get", path="/v1/prices/price_123", rbody=PRICE
+        )
+        http_client_mock.stub_request(
+            "get", path="/v1/prices/price_missing", rbody=MISSING, rcode=404
+        )
+        http_client_mock.stub_request(
+            "get",
+            path="/v1/prices",
+            query_string="limit=3",
+            rbody='{"object": "list", "data": [%s]}' % PRICE,
+        )
+        http_client_mock.stub_request(
+            "post", path="/v1/prices/price_123", rbody=PRICE
+        )
+        http_client_mock.stub_request(
+            "get", path="/v1/customers/cus_123", rbody='{"id": "cus_123"}'
+        )
+        return stripe.StripeClient(
+            "sk_test_123",
+            http_client=http_client_mock.get_mock_http_client(),
+            response_cache=cache,
+        )
+
+    @staticmethod
+    def count(http_client_mock, method, path):
+        return sum(
+            1
+            for call in http_client_mock.get_all_calls()
+            if call.method == method
+            and call.abs_url.split("?")[0].endswith(path)
+        )
+
+    def test_caches_retrieves(self, client, http_client_mock):
+        first = client.prices.retrieve("price_123")
+        second = client.prices.retrieve("price_123")
+
+        assert self.count(http_client_mock, "get", "/v1/prices/price_123") == 1
+        assert first is not second
+        assert second.unit_amount == 1000
+        assert isinstance(second, stripe.Price)
+
+    def test_caches_lists(self, client, http_client_mock):
+        client.prices.list({"limit": 3})
+        prices = client.prices.list({"limit": 3})
+
+        assert self.count(http_client_mock, "get", "/v1/prices") == 1
+        assert prices.data[0].id == "price_123"
+
+    def test_keys_on_the_request(self, client, http_client_mock):
+        client.prices.retrieve("price_123")
+        client.prices.retrieve(
+            "price_123", options={"stripe_account": "acct_123"}
+        )
+
+        assert self.count(http_client_mock, "get", "/v1/prices/price_123") == 2
+
+    def test_skips_other_resources(self, client, http_client_mock):
+        client.customers.retrieve("cus_123")
+        client.customers.retrieve("cus_123")
+
+        assert (
+            self.count(http_client_mock, "get", "/v1/customers/cus_123") == 2
+        )
+
+    def test_caches_missing_objects(self, client, http_client_mock):
+        for _ in range(2):
+            with pytest.raises(stripe.InvalidRequestError) as e:
+                client.prices.retrieve("price_missing")
+            assert e.value.http_status == 404
+
+        assert (
+            self.count(http_client_mock, "get", "/v1/prices/price_missing")
+            == 1
+        )
+
+    def test_expires_responses(self, make_cache, http_client_mock):
+        http_client_mock.stub_request(
+            "get", path="/v1/prices/price_123", rbody=PRICE
+        )
+        client = stripe.StripeClient(
+            "sk_test_123",
+            http_client=http_client_mock.get_mock_http_client(),
+            response_cache=make_cache(ttls={"price": 0.05}),
+        )
+
+        client.prices.retrieve("price_123")
+        time.sleep(0.1)
+        client.prices.retrieve("price_123")
+
+        assert self.count(http_client_mock, "get", "/v1/prices/price_123") == 2
+
+    def test_invalidates_on_updates(self, client, http_client_mock):
+        client.prices.retrieve("price_123")
+        client.prices.list({"limit": 3})
+        client.prices.update("price_123", {"active": False})
+        client.prices.retrieve("price_123")
+        client.prices.list({"limit": 3})
+
+        assert self.count(http_client_mock, "get", "/v1/prices/price_123") == 2
+        assert self.count(http_client_mock, "get", "/v1/prices") == 2
+
+    def test_invalidates_from_events(self, client, cache, http_client_mock):
+        payload = json.dumps(
+            {
+                "id": "evt_123",
+                "object": "event",
+                "type": "price.updated",
+                "data": {"object": json.loads(PRICE)},
+            }
+        )
+        timestamp = int(time.time())
+        signature = stripe.WebhookSignature._compute_signature(
+            "%d.%s" % (timestamp, payload), "whsec_123"
+        )
+        event = stripe.Webhook.construct_event(
+            payload, "t=%d,v1=%s" % (timestamp, signature), "whsec_123"
+        )
+
+        client.prices.retrieve("price_123")
+        cache.invalidate(event)
+        client.prices.retrieve("price_123")
+
+        assert self.count(http_client_mock, "get", "/v1/prices/price_123") == 2
+
+    def test_invalidation_spares_other_objects(
+        self, client, cache, http_client_mock
+    ):
+        client.prices.retrieve("price_123")
+        cache.invalidate({"object": "price", "id": "price_456"})
+        client.prices.retrieve("price_123")
+
+        assert self.count(http_client_mock, "get", "/v1/prices/price_123") == 1
+
+    def test_clear(self, client, cache, http_client_mock):
+        client.prices.retrieve("price_123")
+        cache.clear()
+        client.prices.retrieve("price_123")
+
+        assert self.count(http_client_mock, "get", "/v1/prices/price_123") == 2
+
+    def test_global_cache(self, http_client_mock, cache):
+        http_client_mock.stub_request(
+            "get", path="/v1/prices/price_123", rbody=PRICE
+        )
+        old_cache = stripe.response_cache
+        stripe.response_cache = cache
+        try:
+            stripe.Price.retrieve("price_123", api_key="sk_test_123")
+            stripe.Price.retrieve("price_123", api_key="sk_test_123")
+        finally:
+            stripe.response_cache = old_cache
+
+        assert self.count(http_client_mock, "get", "/v1/prices/price_123") == 1
+
+
+class TestResponseCacheStorage(object):
+    def store(self, cache, object_id, body=b"{}"):
+        url = "/v1/prices/%s" % object_id
+        cache._store(url, (url,), (body, 200, {"Request-Id": "req_123"}))
+
+    def lookup(self, cache, object_id):
+        url = "/v1/prices/%s" % object_id
+        return cache._lookup(url, (url,))
+
+    def test_round_trips_responses(self, make_cache):
+        cache = make_cache()
+        self.store(cache, "price_1", b'{"id": "price_1"}')
+
+        assert self.lookup(cache, "price_1") == (
+            b'{"id": "price_1"}',
+            200,
+            {"Request-Id": "req_123"},
+        )
+        assert self.lookup(cache, "price_2") is None
+
+    def test_evicts_least_recently_used(self, make_cache):
+        cache = make_cache(max_bytes=30)
+        self.store(cache, "price_1", b"a" * 10)
+        self.store(cache, "price_2", b"b" * 10)
+        self.store(cache, "price_3", b"c" * 10)
+        self.lookup(cache, "price_1")
+        self.store(cache, "price_4", b"d" * 10)
+
+        assert self.lookup(cache, "price_1") is not None
+        assert self.lookup(cache, "price_2") is None
+        assert self.lookup(cache, "price_3") is not None
+        assert self.lookup(cache, "price_4") is not None
+
+    def test_skips_responses_larger_than_the_cache(self, make_cache):
+        cache = make_cache(max_bytes=5)
+        self.store(cache, "price_1", b"a" * 10)
+
+        assert self.lookup(cache, "price_1") is None
+
+    def test_sqlite_cache_is_shared(self, tmp_path):
+        path = str(tmp_path / "responses.sqlite3")
+        writer = SQLiteResponseCache(path)
+        reader = SQLiteResponseCache(path)
+        try:
+            self.store(writer, "price_1")
+            assert self.lookup(reader, "price_1") is not None
+
+            reader.invalidate({"object": "price", "id": "price_1"})
+            assert self.lookup(writer, "price_1") is None
+        finally:
+            writer.close()
+            reader.close()
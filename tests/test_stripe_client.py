@@ -3,6 +3,7 @@ import stripe
 import pytest
 
 from stripe._http_client import new_default_http_client
+from tests.http_client_mock import HTTPClientMock
 
 
 class TestStripeClient(object):
@@ -28,6 +29,29 @@ class TestStripeClient(object):
         http_client_mock.assert_requested(method, path=path)
         assert customer.id is not None
 
+    @pytest.mark.anyio
+    async def test_v1_customers_retrieve_async(self, mocker):
+        http_client_mock = HTTPClientMock(mocker, is_async=True)
+        method = "get"
+        path = "/v1/customers/cus_xxxxxxxxxxxxx"
+        http_client_mock.stub_request(
+            method,
+            path=path,
+            rbody='{"id": "cus_xxxxxxxxxxxxx","object": "customer"}',
+            rcode=200,
+            rheaders={},
+        )
+        client = stripe.StripeClient(
+            "sk_test_123",
+            http_client=http_client_mock.get_mock_http_client(),
+        )
+        customer = await client.customers.retrieve_async("cus_xxxxxxxxxxxxx")
+        http_client_mock.assert_requested(
+            method, path=path, usage=["stripe_client"]
+        )
+        assert isinstance(customer, stripe.Customer)
+        assert customer.id == "cus_xxxxxxxxxxxxx"
+
     def test_no_api_key(self):
         with pytest.raises(stripe.error.AuthenticationError):
             stripe.StripeClient(None)  # type: ignore
@@ -403,3 +427,31 @@ class TestStripeClient(object):
 
         customer.delete()
         http_client_mock.assert_requested("delete", path=path, usage=None)
+
+    def test_warm_up_opens_each_base_address_once(self, mocker):
+        http_client = mocker.Mock()
+
+        stripe.StripeClient(
+            "sk_test_123",
+            http_client=http_client,
+            base_addresses={
+                "api": "https://api.example.com",
+                "connect": "https://api.example.com",
+                "files": "https://files.example.com",
+            },
+            warm_up=True,
+        )
+
+        assert http_client.warm_up.call_args_list == [
+            mocker.call("https://api.example.com"),
+            mocker.call("https://files.example.com"),
+        ]
+
+    def test_does_not_warm_up_by_default(self, mocker):
+        http_client = mocker.Mock()
+
+        client = stripe.StripeClient("sk_test_123", http_client=http_client)
+        http_client.warm_up.assert_not_called()
+
+        client.warm_up()
+        assert http_client.warm_up.call_count == 3
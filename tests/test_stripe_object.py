@@ -377,6 +377,51 @@ class TestStripeObject(object):
 
         assert obj.serialize(None) == {"nested": ""}
 
+    def test_converts_inner_classes(self):
+        obj = stripe.ShippingRate.construct_from(
+            {
+                "id": "shr_123",
+                "object": "shipping_rate",
+                "delivery_estimate": {"maximum": {"unit": "day", "value": 5}},
+                "fixed_amount": {
+                    "amount": 500,
+                    "currency": "usd",
+                    "currency_options": {
+                        "eur": {"amount": 450},
+                        "gbp": None,
+                    },
+                },
+            },
+            "mykey",
+        )
+
+        assert isinstance(
+            obj.delivery_estimate.maximum,
+            stripe.ShippingRate.DeliveryEstimate.Maximum,
+        )
+        options = obj.fixed_amount.currency_options
+        assert type(options) is dict
+        assert isinstance(
+            options["eur"], stripe.ShippingRate.FixedAmount.CurrencyOptions
+        )
+        assert options["gbp"] is None
+
+    def test_decode_plans_are_per_class(self):
+        class Inner(stripe.stripe_object.StripeObject):
+            pass
+
+        class Foo(stripe.stripe_object.StripeObject):
+            _inner_class_types = {"inner": Inner}
+
+        class Bar(Foo):
+            _inner_class_types = {}
+
+        foo = Foo.construct_from({"inner": {"a": 1}}, "mykey")
+        bar = Bar.construct_from({"inner": {"a": 1}}, "mykey")
+
+        assert type(foo.inner) is Inner
+        assert type(bar.inner) is stripe.stripe_object.StripeObject
+
     def test_field_name_remapping(self):
         class Foo(stripe.stripe_object.StripeObject):
             _field_remappings = {"getter_name": "data_name"}
@@ -431,3 +476,134 @@ class TestStripeObject(object):
             api_key="key2",
             stripe_account=None,
         )
+
+
+class TestLazyStripeObject(object):
+    @pytest.fixture(autouse=True)
+    def lazy_objects(self):
+        stripe.lazy_objects = True
+        yield
+        stripe.lazy_objects = False
+
+    def construct(self, values=SAMPLE_INVOICE):
+        return stripe.Invoice.construct_from(values, "key")
+
+    def test_converts_nested_values_on_access(self):
+        obj = self.construct()
+
+        assert type(dict.__getitem__(obj, "lines")) is dict
+
+        lines = obj.lines
+        assert isinstance(lines, stripe.ListObject)
+        assert obj.lines is lines
+        assert type(dict.__getitem__(lines, "data")) is list
+
+        line = lines.data[0]
+        assert isinstance(line, stripe.InvoiceLineItem)
+        assert isinstance(line.price, stripe.Price)
+        assert isinstance(line.period, stripe.InvoiceLineItem.Period)
+        assert line.period.end == 1659537295
+
+    def test_converts_values_when_copied(self):
+        for read in (
+            lambda obj: obj["lines"],
+            lambda obj: copy(obj)["lines"],
+            lambda obj: deepcopy(obj)["lines"],
+        ):
+            assert isinstance(read(self.construct()), stripe.StripeObject)
+
+    def test_does_not_share_the_values_given(self):
+        values = deepcopy(SAMPLE_INVOICE)
+        obj = self.construct(values)
+        values["lines"]["data"][0]["price"]["id"] = "price_changed"
+
+        assert obj.lines.data[0].price.id != "price_changed"
+
+    def test_setting_a_value_replaces_the_lazy_one(self):
+        obj = self.construct()
+        obj.lines = {"replaced": True}
+
+        assert obj.lines == {"replaced": True}
+        assert type(obj.lines) is dict
+
+    def test_matches_eager_objects(self):
+        lazy = self.construct()
+        stripe.lazy_objects = False
+        eager = self.construct()
+
+        assert lazy == eager
+        assert str(lazy) == str(eager)
+        assert lazy._to_dict_recursive() == eager._to_dict_recursive()
+
+    def test_serialize(self):
+        values = dict(SAMPLE_INVOICE, metadata={"cart": "1"})
+        lazy = self.construct(values)
+        stripe.lazy_objects = False
+        eager = self.construct(values)
+        for obj in (lazy, eager):
+            obj.metadata["order_id"] = "6735"
+            obj.description = "Gift wrap"
+
+        assert lazy.serialize(None) == eager.serialize(None)
+        assert lazy.serialize(None) == {
+            "description": "Gift wrap",
+            "metadata": {"order_id": "6735"},
+        }
+
+    def test_pickling(self):
+        obj = pickle.loads(pickle.dumps(self.construct()))
+
+        assert isinstance(obj, stripe.Invoice)
+        assert isinstance(obj.lines.data[0].price, stripe.Price)
+        assert str(obj) == str(self.construct())
+
+    def test_refresh_from_replaces_lazy_values(self):
+        obj = self.construct()
+        obj.refresh_from({"id": "in_123", "lines": None}, partial=True)
+
+        assert obj.lines is None
+        assert obj.total == 10000
+
+        obj.refresh_from({"id": "in_123"})
+        assert obj._lazy_keys is None
+
+
+class TestChangeTracking(object):
+    def construct(self, values=SAMPLE_INVOICE):
+        return stripe.Invoice.construct_from(values, "key")
+
+    def test_unchanged_objects_hold_no_tracking_state(self):
+        obj = self.construct()
+
+        for attr in ("_unsaved_values", "_transient_values", "_previous"):
+            assert attr not in obj.__dict__
+            assert attr not in obj.lines.data[0].__dict__
+
+    def test_keeps_the_values_changed_keys_had(self):
+        obj = self.construct(dict(SAMPLE_INVOICE, metadata={"cart": "1"}))
+        obj.metadata = {"order_id": "6735"}
+        obj.metadata = {"order_id": "6736"}
+        obj.description = "Gift wrap"
+
+        assert obj._previous == {"metadata": {"cart": "1"}}
+        assert obj.serialize(None) == {
+            "description": "Gift wrap",
+            "metadata": {"cart": "", "order_id": "6736"},
+        }
+
+    def test_keeps_the_values_deleted_keys_had(self):
+        obj = self.construct(dict(SAMPLE_INVOICE, metadata={"cart": "1"}))
+        del obj["metadata"]
+        obj.metadata = {"order_id": "6735"}
+
+        assert obj.serialize(None) == {
+            "metadata": {"cart": "", "order_id": "6735"}
+        }
+
+    def test_refresh_from_forgets_changes(self):
+        obj = self.construct()
+        obj.description = "Gift wrap"
+        obj.refresh_from(SAMPLE_INVOICE)
+
+        assert obj._previous is None
+        assert obj.serialize(None) == {}
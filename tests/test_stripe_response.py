@@ -3,7 +3,8 @@ from collections import OrderedDict
 
 import pytest
 
-
+import stripe
+from stripe import _json
 from stripe._stripe_response import StripeResponseBase, StripeResponse
 
 
@@ -65,3 +66,136 @@ class TestStripeResponse(ResponseTestBase):
         "five": "5"
     }
 }"""
+
+    def test_parses_bytes(self, mock_headers, mock_body):
+        response = StripeResponse(mock_body.encode("utf-8"), 200, mock_headers)
+
+        assert response.data == json.loads(mock_body)
+        assert type(response.data) is dict
+        assert response.body == mock_body
+
+
+class TestResponseRetention(object):
+    @pytest.fixture(autouse=True)
+    def restore_retention(self):
+        yield
+        stripe.response_retention = "full"
+
+    @pytest.fixture
+    def client(self, http_client_mock):
+        http_client_mock.stub_request(
+            "get",
+            path="/v1/customers/cus_123",
+            rbody='{"id": "cus_123", "object": "customer"}',
+            rheaders={"request-id": "req_123"},
+        )
+        return stripe.StripeClient(
+            "sk_test_123",
+            http_client=http_client_mock.get_mock_http_client(),
+        )
+
+    def test_keeps_everything_by_default(self, client):
+        resp = client.customers.retrieve("cus_123").last_response
+
+        assert resp.body == '{"id": "cus_123", "object": "customer"}'
+        assert resp.data == {"id": "cus_123", "object": "customer"}
+
+    def test_drops_the_body(self, client):
+        stripe.response_retention = "data"
+        cus = client.customers.retrieve("cus_123")
+
+        assert cus.id == "cus_123"
+        assert cus.last_response.data == {
+            "id": "cus_123",
+            "object": "customer",
+        }
+        with pytest.raises(ValueError, match="response_retention"):
+            cus.last_response.body
+
+    def test_keeps_only_headers(self, client):
+        stripe.response_retention = "headers"
+        cus = client.customers.retrieve("cus_123")
+
+        assert cus.id == "cus_123"
+        assert cus.last_response.data is None
+        assert cus.last_response.request_id == "req_123"
+        assert cus.last_response.code == 200
+
+    def test_keeps_only_headers_of_lazy_objects(self, http_client_mock):
+        http_client_mock.stub_request(
+            "get",
+            path="/v1/customers/cus_123",
+            rbody=json.dumps(
+                {
+                    "id": "cus_123",
+                    "object": "customer",
+                    "invoice_settings": {"footer": "Thanks"},
+                    "subscriptions": {
+                        "object": "list",
+                        "url": "/v1/customers/cus_123/subscriptions",
+                        "has_more": False,
+                        "data": [{"id": "sub_123", "object": "subscription"}],
+                    },
+                }
+            ),
+        )
+        client = stripe.StripeClient(
+            "sk_test_123",
+            http_client=http_client_mock.get_mock_http_client(),
+        )
+        stripe.response_retention = "headers"
+        stripe.lazy_objects = True
+        try:
+            cus = client.customers.retrieve("cus_123")
+        finally:
+            stripe.lazy_objects = False
+
+        assert cus.last_response.data is None
+        # Still as parsed, to be converted now.
+        assert type(dict.__getitem__(cus, "invoice_settings")) is dict
+        assert isinstance(
+            cus.invoice_settings, stripe.Customer.InvoiceSettings
+        )
+        assert cus.invoice_settings.footer == "Thanks"
+        assert isinstance(cus.subscriptions.data[0], stripe.Subscription)
+        assert cus.subscriptions.data[0].id == "sub_123"
+
+
+class TestJSONBackend(object):
+    @pytest.fixture(autouse=True)
+    def restore_backend(self):
+        backend = stripe.json_backend
+        yield
+        stripe.json_backend = backend
+
+    @pytest.mark.parametrize("backend", ["json", "orjson", "ujson", "auto"])
+    def test_parses_with_backend(self, backend):
+        if backend in ("orjson", "ujson"):
+            pytest.importorskip(backend)
+        stripe.json_backend = backend
+
+        data = _json.loads(
+            b'{"id": "ch_123", "amount": 100, "refunded": false}'
+        )
+
+        assert data == {"id": "ch_123", "amount": 100, "refunded": False}
+
+    def test_rejects_unknown_backend(self):
+        stripe.json_backend = "simplejson"  # type: ignore
+
+        with pytest.raises(ValueError):
+            _json.loads(b"{}")
+
+    def test_raises_when_backend_is_missing(self, mocker):
+        mocker.patch.object(_json, "ujson", None)
+        mocker.patch.dict(_json._loaders, clear=True)
+        stripe.json_backend = "ujson"
+
+        with pytest.raises(ImportError):
+            _json.loads(b"{}")
+
+    def test_invalid_json_raises_value_error(self):
+        stripe.json_backend = "auto"
+
+        with pytest.raises(ValueError):
+            _json.loads(b"{not json")